@@ -0,0 +1,138 @@
+"""Import-time benchmark for Graph-Mesh entry points.
+
+Every target is imported in a fresh interpreter with ``python -X importtime``,
+and the cumulative time of the target module is reported. The heavyweight
+libraries pulled in along the way are listed as well, so a new eager import
+is easy to spot::
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 5 --json > import-times.json
+    python benchmarks/import_time.py --budget graph_mesh_orchestrator.cli=50
+
+``--budget MODULE=MS`` exits with status 1 when a module's median import time
+exceeds the budget, for use in CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+#: Modules whose import cost users notice: the CLI, planning and preflight
+#: paths, the full pipeline, and the package roots
+TARGETS: Tuple[str, ...] = (
+    "graph_mesh_orchestrator.cli",
+    "graph_mesh_orchestrator.validation",
+    "graph_mesh_orchestrator.planner",
+    "graph_mesh_orchestrator.pipeline",
+    "graph_mesh_core",
+    "graph_mesh_ingest",
+    "graph_mesh_aligner",
+)
+
+#: Third-party libraries worth calling out when a target drags them in
+HEAVY_MODULES: Tuple[str, ...] = (
+    "docker", "pandas", "xmlschema", "rdflib", "owlready2", "urllib3", "boto3",
+    "yaml", "pydantic", "structlog",
+)
+
+
+def measure_import(module: str) -> Tuple[float, List[str]]:
+    """Import ``module`` in a fresh interpreter.
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        Cumulative import time in milliseconds and the heavy libraries loaded
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    cumulative_us = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if not cumulative.isdigit():
+            continue  # header line
+        loaded.add(name.split(".")[0])
+        if name == module:
+            cumulative_us = int(cumulative)
+    if cumulative_us is None:
+        raise RuntimeError(f"{module} did not appear in the -X importtime output")
+    return cumulative_us / 1000.0, sorted(loaded.intersection(HEAVY_MODULES))
+
+
+def run_benchmark(targets: Sequence[str], repeat: int) -> Dict[str, Dict[str, object]]:
+    """Measure every target ``repeat`` times and keep the median."""
+    results: Dict[str, Dict[str, object]] = {}
+    for module in targets:
+        samples = []
+        heavy: List[str] = []
+        for _ in range(repeat):
+            milliseconds, heavy = measure_import(module)
+            samples.append(milliseconds)
+        results[module] = {
+            "median_ms": round(statistics.median(samples), 1),
+            "min_ms": round(min(samples), 1),
+            "heavy_modules": heavy,
+        }
+    return results
+
+
+def _parse_budgets(values: Sequence[str]) -> Dict[str, float]:
+    budgets = {}
+    for value in values:
+        module, sep, milliseconds = value.partition("=")
+        if not sep:
+            raise SystemExit(f"--budget expects MODULE=MS, got {value!r}")
+        budgets[module] = float(milliseconds)
+    return budgets
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", help=f"Modules to import (default: {', '.join(TARGETS)})")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per module (default: 3)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--budget", action="append", default=[], metavar="MODULE=MS",
+                        help="Fail if MODULE's median import time exceeds MS milliseconds")
+    args = parser.parse_args(argv)
+
+    budgets = _parse_budgets(args.budget)
+    targets = list(dict.fromkeys([*(args.modules or TARGETS), *budgets]))
+    results = run_benchmark(targets, max(args.repeat, 1))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        width = max(len(module) for module in results)
+        for module, result in results.items():
+            heavy = ", ".join(result["heavy_modules"]) or "-"
+            print(f"{module:<{width}}  {result['median_ms']:>8.1f} ms  {heavy}")
+
+    over = [module for module, budget in budgets.items() if results[module]["median_ms"] > budget]
+    for module in over:
+        print(f"{module}: {results[module]['median_ms']} ms exceeds budget of {budgets[module]} ms",
+              file=sys.stderr)
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
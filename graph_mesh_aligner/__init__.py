@@ -1,73 +1,61 @@
-"""Alignment utilities for Graph-Mesh."""
+"""Alignment utilities for Graph-Mesh.
 
-from .matchers import (
-    AlignmentMatcher,
-    ContainerMatcher,
-    DEFAULT_MATCHERS,
-    MatcherResult,
-    run_alignment,
-    run_alignment_async,
-    run_alignment_parallel,
-)
-from .fusion import (
-    Mapping,
-    FusedMapping,
-    load_sssom_mappings,
-    fuse_mappings,
-    filter_by_support,
-    filter_by_consensus_confidence,
-    export_fused_mappings,
-    identify_conflicts,
-)
-from .voting import (
-    VotingStrategy,
-    VotingConfig,
-    VotingResult,
-    vote,
-    calculate_matcher_agreement,
-    suggest_matcher_weights,
-)
-from .quality import (
-    QualityMetrics,
-    ConflictReport,
-    calculate_quality_metrics,
-    resolve_conflicts,
-    filter_by_confidence,
-    generate_quality_report,
-    compare_with_reference,
-)
+Submodules are imported on first access, so ``import graph_mesh_aligner``
+does not load docker or pandas.
+"""
 
-__all__ = [
+from graph_mesh_core.lazy import lazy_exports
+
+_EXPORTS = {
     # Matchers
-    "AlignmentMatcher",
-    "ContainerMatcher",
-    "DEFAULT_MATCHERS",
-    "MatcherResult",
-    "run_alignment",
-    "run_alignment_async",
-    "run_alignment_parallel",
+    "AlignmentMatcher": ".matchers",
+    "ContainerMatcher": ".matchers",
+    "DEFAULT_MATCHERS": ".matchers",
+    "MatcherResult": ".matchers",
+    "run_alignment": ".matchers",
+    "run_alignment_async": ".matchers",
+    "run_alignment_batch": ".matchers",
+    "run_alignment_parallel": ".matchers",
+    # Native lexical matcher
+    "LexicalMatcher": ".lexical",
+    "LexicalIndex": ".lexical",
+    "normalize": ".lexical",
+    # Candidate blocking
+    "MinHashBlocker": ".blocking",
+    "BlockingResult": ".blocking",
+    # Matcher pool
+    "MatcherPool": ".pool",
+    "configure_matcher_pool": ".pool",
+    "default_matcher_pool": ".pool",
+    # Warm matcher containers
+    "WarmContainerPool": ".warm",
+    "default_warm_pool": ".warm",
     # Fusion
-    "Mapping",
-    "FusedMapping",
-    "load_sssom_mappings",
-    "fuse_mappings",
-    "filter_by_support",
-    "filter_by_consensus_confidence",
-    "export_fused_mappings",
-    "identify_conflicts",
+    "Mapping": ".fusion",
+    "FusedMapping": ".fusion",
+    "load_sssom_mappings": ".fusion",
+    "fuse_mappings": ".fusion",
+    "filter_by_support": ".fusion",
+    "filter_by_consensus_confidence": ".fusion",
+    "export_fused_mappings": ".fusion",
+    "identify_conflicts": ".fusion",
     # Voting
-    "VotingStrategy",
-    "VotingConfig",
-    "VotingResult",
-    "vote",
-    "calculate_matcher_agreement",
-    "suggest_matcher_weights",
+    "VotingStrategy": ".voting",
+    "VotingConfig": ".voting",
+    "VotingResult": ".voting",
+    "vote": ".voting",
+    "calculate_matcher_agreement": ".voting",
+    "suggest_matcher_weights": ".voting",
     # Quality
-    "QualityMetrics",
-    "ConflictReport",
-    "calculate_quality_metrics",
-    "resolve_conflicts",
-    "filter_by_confidence",
-    "generate_quality_report",
-    "compare_with_reference",
-]
+    "QualityMetrics": ".quality",
+    "ConflictReport": ".quality",
+    "calculate_quality_metrics": ".quality",
+    "resolve_conflicts": ".quality",
+    "filter_by_confidence": ".quality",
+    "generate_quality_report": ".quality",
+    "compare_with_reference": ".quality",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
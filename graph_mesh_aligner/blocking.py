@@ -0,0 +1,336 @@
+"""Candidate blocking with character n-gram MinHash and LSH.
+
+Matchers compare every source entity with every target entity, so aligning
+against a large meta-ontology such as FIBO costs ``sources x targets``
+comparisons per matcher, most of them between entities that share nothing.
+Blocking finds, in time roughly linear in the number of entities, the pairs
+worth comparing:
+
+1. Each class and property is reduced to the character n-grams (shingles)
+   of its normalized labels and local name (see :mod:`.lexical`).
+2. A MinHash signature of ``num_perm`` values estimates the Jaccard
+   similarity of two shingle sets; signatures are computed with numpy for
+   all entities at once.
+3. Signatures are cut into ``bands`` bands. Target entities are hashed into
+   one bucket per band, and a source entity's candidates are the target
+   entities of the same kind sharing at least one of its buckets. With the
+   defaults (64 permutations, 16 bands of 4 rows) pairs with a Jaccard
+   similarity of about 0.5 or more are very likely to become candidates.
+
+:meth:`MinHashBlocker.block` writes the result as a candidate list and as a
+pruned target sub-ontology holding the candidate entities, their ancestors
+and their descriptions; any matcher can align against that file instead of
+the full target. :class:`~graph_mesh_aligner.lexical.LexicalMatcher` can
+also restrict its scoring to the candidate pairs directly.
+
+Example:
+    >>> blocker = MinHashBlocker()
+    >>> result = blocker.block([Path("orders.owl")], Path("fibo.ttl"), Path("blocking/orders.nt"))
+    >>> result.pair_count, result.reduction
+    (412, 0.998)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from graph_mesh_core.artifact_cache import hash_paths
+from graph_mesh_core.graph_store import new_graph
+from graph_mesh_core.lazy import LazyModule
+from graph_mesh_core.telemetry import annotate
+from graph_mesh_core.tracing import span
+
+from .lexical import DEFAULT_SYNONYMS, LexicalEntity, extract_entities
+
+LOGGER = logging.getLogger(__name__)
+
+np = LazyModule("numpy")
+
+# Prime above 2**32 for the hash family (a * x + b) mod p over 32-bit shingle hashes
+_PRIME = 4294967311
+
+# Shingles hashed per numpy pass, bounding memory to num_perm * _CHUNK values
+_CHUNK = 65536
+
+
+def shingles(entity: LexicalEntity, n: int = 3) -> Set[str]:
+    """Return the character n-grams of an entity's normalized labels, padded with spaces."""
+    grams: Set[str] = set()
+    for key in entity.keys:
+        padded = f" {key} "
+        if len(padded) <= n:
+            grams.add(padded)
+        else:
+            grams.update(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return grams
+
+
+@dataclass
+class LSHIndex:
+    """Target entities hashed into one bucket per signature band."""
+
+    entities: List[LexicalEntity]
+    buckets: Dict[Tuple[str, int, bytes], List[int]]
+    graph: Any = None
+
+
+@dataclass
+class BlockingResult:
+    """Candidate pairs found by blocking sources against a target.
+
+    Attributes:
+        candidates: Target IRIs each source IRI may match
+        source_entities: Number of source entities considered
+        target_entities: Number of target entities considered
+        target_path: Pruned target sub-ontology, if one was written
+    """
+
+    candidates: Dict[str, Set[str]]
+    source_entities: int
+    target_entities: int
+    target_path: Optional[Path] = None
+
+    @property
+    def pair_count(self) -> int:
+        """Number of candidate (source, target) pairs."""
+        return sum(len(targets) for targets in self.candidates.values())
+
+    @property
+    def target_iris(self) -> Set[str]:
+        """Target IRIs that are a candidate for at least one source entity."""
+        return set().union(*self.candidates.values()) if self.candidates else set()
+
+    @property
+    def reduction(self) -> float:
+        """Fraction of all source x target pairs that blocking ruled out."""
+        total = self.source_entities * self.target_entities
+        return round(1 - self.pair_count / total, 4) if total else 0.0
+
+    def write_tsv(self, path: Path) -> Path:
+        """Write the candidate pairs as a two-column TSV file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write("subject_id\tobject_id\n")
+            for source in sorted(self.candidates):
+                for target in sorted(self.candidates[source]):
+                    handle.write(f"{source}\t{target}\n")
+        return path
+
+
+class MinHashBlocker:
+    """Find candidate entity pairs with MinHash signatures and LSH banding.
+
+    Indexed targets are kept (up to ``max_cached_targets``, keyed by content)
+    so that blocking many sources against the same meta-ontology parses and
+    hashes it once.
+    """
+
+    def __init__(
+        self,
+        ngram: int = 3,
+        num_perm: int = 64,
+        bands: int = 16,
+        seed: int = 1,
+        synonyms: Optional[Mapping[str, str]] = None,
+        max_cached_targets: int = 2,
+    ) -> None:
+        """Initialize blocker.
+
+        Args:
+            ngram: Shingle length in characters
+            num_perm: MinHash signature length
+            bands: LSH bands; more bands find less similar pairs
+            seed: Seed of the hash functions, fixed so results are reproducible
+            synonyms: Word replacements used when normalizing labels
+            max_cached_targets: Indexed targets kept between calls
+
+        Raises:
+            ValueError: If ``num_perm`` is not a multiple of ``bands``
+        """
+        if bands < 1 or num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a positive multiple of bands ({bands})")
+        self.ngram = ngram
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.synonyms = dict(synonyms) if synonyms is not None else DEFAULT_SYNONYMS
+        self.max_cached_targets = max_cached_targets
+        rng = np.random.default_rng(seed)
+        # a < 2**31 and x < 2**32 keep a * x + b within uint64
+        self._a = rng.integers(1, 2 ** 31, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 2 ** 31, num_perm, dtype=np.uint64)
+        self._lock = threading.Lock()
+        self._targets: OrderedDict[str, LSHIndex] = OrderedDict()
+
+    def signatures(self, entities: Sequence[LexicalEntity]) -> Any:
+        """Return the MinHash signature of each entity as a ``(len(entities), num_perm)`` array."""
+        offsets: List[int] = []
+        hashes: List[int] = []
+        for entity in entities:
+            offsets.append(len(hashes))
+            hashes.extend(zlib.crc32(gram.encode("utf-8")) for gram in shingles(entity, self.ngram))
+        signatures = np.empty((len(entities), self.num_perm), dtype=np.uint64)
+        values = np.asarray(hashes, dtype=np.uint64)
+        ends = offsets[1:] + [len(hashes)]
+
+        start = 0
+        while start < len(entities):
+            stop = start + 1
+            while stop < len(entities) and ends[stop] - offsets[start] <= _CHUNK:
+                stop += 1
+            low, high = offsets[start], ends[stop - 1]
+            permuted = (self._a[:, None] * values[None, low:high] + self._b[:, None]) % _PRIME
+            starts = np.asarray(offsets[start:stop], dtype=np.int64) - low
+            signatures[start:stop] = np.minimum.reduceat(permuted, starts, axis=1).T
+            start = stop
+        return signatures
+
+    def _band_keys(self, entity: LexicalEntity, signature: Any) -> List[Tuple[str, int, bytes]]:
+        bands = signature.reshape(self.bands, self.rows)
+        return [(entity.kind, band, bands[band].tobytes()) for band in range(self.bands)]
+
+    def index(self, entities: Sequence[LexicalEntity], graph: Any = None) -> LSHIndex:
+        """Hash target entities into LSH buckets."""
+        buckets: Dict[Tuple[str, int, bytes], List[int]] = {}
+        for position, (entity, signature) in enumerate(zip(entities, self.signatures(entities))):
+            for key in self._band_keys(entity, signature):
+                buckets.setdefault(key, []).append(position)
+        return LSHIndex(list(entities), buckets, graph)
+
+    def query(self, index: LSHIndex, sources: Sequence[LexicalEntity]) -> Dict[str, Set[str]]:
+        """Return the target IRIs sharing a bucket with each source entity.
+
+        Source entities without candidates are left out.
+        """
+        candidates: Dict[str, Set[str]] = {}
+        for entity, signature in zip(sources, self.signatures(sources)):
+            found: Set[int] = set()
+            for key in self._band_keys(entity, signature):
+                found.update(index.buckets.get(key, ()))
+            if found:
+                candidates.setdefault(entity.iri, set()).update(index.entities[p].iri for p in found)
+        return candidates
+
+    def candidate_pairs(
+        self, sources: Sequence[LexicalEntity], targets: Sequence[LexicalEntity]
+    ) -> Dict[str, Set[str]]:
+        """Block two entity lists against each other without caching the target."""
+        return self.query(self.index(targets), sources)
+
+    def index_target(self, target_path: Path) -> LSHIndex:
+        """Parse and index a target ontology, reusing the index for unchanged content."""
+        key = hash_paths(target_path)
+        with self._lock:
+            cached = self._targets.get(key)
+            if cached is not None:
+                self._targets.move_to_end(key)
+                return cached
+        with span("blocking.index", "alignment", path=str(target_path)):
+            graph = _parse(target_path)
+            index = self.index(extract_entities(graph, self.synonyms), graph)
+        with self._lock:
+            self._targets[key] = index
+            while len(self._targets) > self.max_cached_targets:
+                self._targets.popitem(last=False)
+        return index
+
+    def block(
+        self,
+        source_paths: Iterable[Path],
+        target_path: Path,
+        output_path: Optional[Path] = None,
+    ) -> BlockingResult:
+        """Find the candidate pairs of one or more sources against a target.
+
+        Args:
+            source_paths: Source ontology files; several sources aligned
+                together share one pruned target
+            target_path: Target ontology file
+            output_path: Where to write the pruned target as sorted N-Triples;
+                a ``.candidates.tsv`` file is written next to it
+
+        Returns:
+            Candidate pairs and, with ``output_path``, the pruned target path
+        """
+        index = self.index_target(target_path)
+        sources: List[LexicalEntity] = []
+        for path in source_paths:
+            sources.extend(extract_entities(_parse(path), self.synonyms))
+        with span("blocking.query", "alignment", sources=len(sources), targets=len(index.entities)):
+            result = BlockingResult(self.query(index, sources), len(sources), len(index.entities))
+        annotate(candidate_pairs=result.pair_count, blocking_reduction=result.reduction)
+        LOGGER.info(f"Blocking kept {result.pair_count} of {result.source_entities * result.target_entities} "
+                    f"candidate pairs ({len(result.target_iris)} of {result.target_entities} target entities)")
+
+        if output_path is not None:
+            pruned = prune_graph(index.graph, result.target_iris)
+            result.target_path = write_canonical_ntriples(pruned, output_path)
+            result.write_tsv(output_path.with_suffix(".candidates.tsv"))
+        return result
+
+
+def _parse(path: Path) -> Any:
+    graph = new_graph()
+    graph.parse(str(path))
+    return graph
+
+
+def prune_graph(graph: Any, iris: Iterable[str]) -> Any:
+    """Return the part of a graph describing the given entities.
+
+    Keeps the ontology header, every triple about the entities and about
+    their ancestors (``rdfs:subClassOf``, ``rdfs:subPropertyOf``) and the
+    classes used as their domain or range, and the blank nodes (such as
+    restrictions) those triples reference, so structural matchers still see
+    the hierarchy around each candidate.
+    """
+    from rdflib import OWL, RDF, RDFS, BNode, URIRef
+
+    keep = {URIRef(iri) for iri in iris}
+    frontier = list(keep)
+    while frontier:
+        node = frontier.pop()
+        for predicate in (RDFS.subClassOf, RDFS.subPropertyOf, RDFS.domain, RDFS.range):
+            for related in graph.objects(node, predicate):
+                if isinstance(related, URIRef) and related not in keep:
+                    keep.add(related)
+                    frontier.append(related)
+    keep.update(graph.subjects(RDF.type, OWL.Ontology))
+
+    pruned = new_graph()
+    for prefix, namespace in graph.namespaces():
+        pruned.bind(prefix, namespace)
+    queue = list(keep)
+    seen = set(keep)
+    while queue:
+        subject = queue.pop()
+        for predicate, obj in graph.predicate_objects(subject):
+            pruned.add((subject, predicate, obj))
+            if isinstance(obj, BNode) and obj not in seen:
+                seen.add(obj)
+                queue.append(obj)
+    return pruned
+
+
+def write_canonical_ntriples(graph: Any, output_path: Path) -> Path:
+    """Serialize a graph as sorted N-Triples with canonical blank node labels.
+
+    The same triples always produce the same bytes, so alignment cache keys,
+    which hash the target file, stay stable across runs.
+    """
+    from rdflib.compare import to_canonical_graph
+
+    lines = to_canonical_graph(graph).serialize(format="nt").splitlines()
+    content = "\n".join(sorted(line for line in lines if line.strip())) + "\n"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if not output_path.exists() or output_path.read_text(encoding="utf-8") != content:
+        tmp = output_path.with_name(output_path.name + ".tmp")
+        tmp.write_text(content, encoding="utf-8")
+        tmp.replace(output_path)
+    return output_path
@@ -10,6 +10,8 @@ from typing import Dict, List, Set
 
 import pandas as pd
 
+from graph_mesh_core.tracing import traced
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -51,6 +53,7 @@ class FusedMapping:
         return (self.subject_id, self.object_id, self.predicate_id)
 
 
+@traced("sssom.load", "alignment")
 def load_sssom_mappings(file_path: Path, matcher_name: str) -> List[Mapping]:
     """Load mappings from SSSOM TSV file.
 
@@ -98,6 +101,7 @@ def load_sssom_mappings(file_path: Path, matcher_name: str) -> List[Mapping]:
         return []
 
 
+@traced("mappings.fuse", "fusion")
 def fuse_mappings(
     mapping_files: Dict[str, Path],
     min_confidence: float = 0.0,
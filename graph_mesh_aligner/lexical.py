@@ -0,0 +1,538 @@
+"""Native lexical matcher running in the pipeline process.
+
+The container matchers pay for a container start and a JVM or model load on
+every alignment, and cannot run at all where Docker is unavailable. The
+:class:`LexicalMatcher` aligns two ontologies in-process from their labels
+alone, which makes it a fast baseline for small sources and a fallback
+where only Python is available.
+
+Every class and property is described by its labels (``rdfs:label``,
+``skos:prefLabel``, ``skos:altLabel``) and its IRI's local name. Each of these
+is split into words (``customerID`` -> ``customer id``, ``order_line`` ->
+``order line``), lower-cased, mapped through a synonym table
+(``id`` -> ``identifier``), stripped of stop words and stemmed. The target's
+words go into an inverted index; each source entity is scored against all
+target entities sharing at least one word in one pass, by accumulating
+IDF-weighted cosine similarity into a numpy array. Entities whose normalized
+labels are identical match with confidence 1.0 as ``skos:exactMatch``; the
+best remaining candidates above ``threshold`` become ``skos:closeMatch``.
+Classes are only matched to classes and properties to properties.
+
+Example:
+    >>> matcher = LexicalMatcher(threshold=0.8)
+    >>> matcher.align(Path("source.owl"), Path("meta.ttl"), Path("mappings"))
+    PosixPath('mappings/lexical.sssom.tsv')
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import logging
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from graph_mesh_core.graph_store import new_graph
+from graph_mesh_core.lazy import LazyModule
+from graph_mesh_core.telemetry import annotate
+from graph_mesh_core.tracing import span
+
+from .matchers import MatcherResult
+
+LOGGER = logging.getLogger(__name__)
+
+np = LazyModule("numpy")
+
+# Bumped whenever normalization or scoring changes, so cached mappings are not reused
+LEXICAL_VERSION = "1"
+
+# Words dropped from labels before matching
+STOP_WORDS: FrozenSet[str] = frozenset({
+    "a", "an", "and", "as", "at", "by", "for", "from", "has", "in", "is", "of", "on", "or", "the", "to", "with",
+})
+
+# Abbreviations common in schema element names, mapped to the word they stand for
+DEFAULT_SYNONYMS: Dict[str, str] = {
+    "acct": "account",
+    "addr": "address",
+    "amt": "amount",
+    "ccy": "currency",
+    "cd": "code",
+    "cust": "customer",
+    "desc": "description",
+    "dob": "birthdate",
+    "dt": "date",
+    "id": "identifier",
+    "ident": "identifier",
+    "nbr": "number",
+    "nm": "name",
+    "no": "number",
+    "num": "number",
+    "org": "organization",
+    "organisation": "organization",
+    "qty": "quantity",
+    "ref": "reference",
+    "tel": "telephone",
+    "phone": "telephone",
+    "txn": "transaction",
+}
+
+_WORD_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+# (suffix, replacement, minimum stem length) tried in order; the first that applies wins
+_SUFFIXES: Tuple[Tuple[str, str, int], ...] = (
+    ("ational", "ate", 3),
+    ("ization", "ize", 3),
+    ("ations", "ate", 3),
+    ("ation", "ate", 3),
+    ("ings", "", 4),
+    ("ing", "", 4),
+    ("ies", "y", 2),
+    ("sses", "ss", 2),
+    ("ed", "", 3),
+    ("s", "", 3),
+)
+
+_CLASS_TYPES = ("http://www.w3.org/2002/07/owl#Class", "http://www.w3.org/2000/01/rdf-schema#Class")
+_PROPERTY_TYPES = (
+    "http://www.w3.org/2002/07/owl#ObjectProperty",
+    "http://www.w3.org/2002/07/owl#DatatypeProperty",
+    "http://www.w3.org/2002/07/owl#AnnotationProperty",
+    "http://www.w3.org/1999/02/22-rdf-syntax-ns#Property",
+)
+_LABEL_PREDICATES = (
+    "http://www.w3.org/2000/01/rdf-schema#label",
+    "http://www.w3.org/2004/02/skos/core#prefLabel",
+    "http://www.w3.org/2004/02/skos/core#altLabel",
+)
+
+SSSOM_COLUMNS = (
+    "subject_id",
+    "subject_label",
+    "predicate_id",
+    "object_id",
+    "object_label",
+    "mapping_justification",
+    "confidence",
+    "mapping_tool",
+)
+
+
+def split_words(text: str) -> List[str]:
+    """Split a label or identifier into words at case changes, digits and punctuation.
+
+    Example:
+        >>> split_words("XMLSchemaID_value2")
+        ['XML', 'Schema', 'ID', 'value', '2']
+    """
+    return _WORD_RE.findall(text)
+
+
+def stem(word: str) -> str:
+    """Strip common English inflectional and derivational suffixes.
+
+    A light, dictionary-free stemmer: it only needs to map variants of a word
+    to the same key (``addresses``/``address``, ``created``/``creation``),
+    not to produce a linguistic root.
+    """
+    if word.endswith(("ss", "us", "is")):
+        return word
+    for suffix, replacement, min_stem in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= min_stem:
+            word = word[: len(word) - len(suffix)] + replacement
+            break
+    # "create", "created" and "creation" all end up as "creat"
+    if word.endswith("e") and len(word) > 4:
+        word = word[:-1]
+    return word
+
+
+def normalize(text: str, synonyms: Mapping[str, str] = DEFAULT_SYNONYMS) -> Tuple[str, ...]:
+    """Return the normalized words of a label: split, lower-cased, de-abbreviated, stemmed.
+
+    Args:
+        text: Label or local name
+        synonyms: Word replacements applied before stemming
+    """
+    words = []
+    for word in split_words(text):
+        word = word.lower()
+        word = synonyms.get(word, word)
+        for part in word.split():
+            if part not in STOP_WORDS:
+                words.append(stem(part))
+    return tuple(words)
+
+
+def local_name(iri: str) -> str:
+    """Return the part of an IRI after its last ``#`` or ``/``."""
+    return re.split(r"[#/]", iri.rstrip("#/"))[-1]
+
+
+@dataclass(frozen=True)
+class LexicalEntity:
+    """A class or property and its normalized labels.
+
+    Attributes:
+        iri: Entity IRI
+        kind: ``"class"`` or ``"property"``
+        label: Preferred display label
+        keys: Each normalized label, with its words sorted and joined by spaces
+        words: Every normalized word of every label
+    """
+
+    iri: str
+    kind: str
+    label: str
+    keys: FrozenSet[str]
+    words: FrozenSet[str]
+
+
+def extract_entities(graph: Any, synonyms: Mapping[str, str] = DEFAULT_SYNONYMS) -> List[LexicalEntity]:
+    """Collect the named classes and properties of a graph with their normalized labels.
+
+    Args:
+        graph: rdflib graph
+        synonyms: Word replacements applied before stemming
+
+    Returns:
+        Entities sorted by IRI
+    """
+    from rdflib import RDF, URIRef
+
+    kinds: Dict[str, str] = {}
+    for kind, types in (("property", _PROPERTY_TYPES), ("class", _CLASS_TYPES)):
+        for rdf_type in types:
+            for subject in graph.subjects(RDF.type, URIRef(rdf_type)):
+                if isinstance(subject, URIRef):
+                    kinds[str(subject)] = kind
+
+    entities = []
+    for iri in sorted(kinds):
+        labels = [label for predicate in _LABEL_PREDICATES
+                  for label in sorted(str(value) for value in graph.objects(URIRef(iri), URIRef(predicate)))]
+        labels.append(local_name(iri))
+        keys = set()
+        words = set()
+        for label in labels:
+            normalized = normalize(label, synonyms)
+            if normalized:
+                keys.add(" ".join(sorted(normalized)))
+                words.update(normalized)
+        if words:
+            entities.append(LexicalEntity(iri, kinds[iri], labels[0], frozenset(keys), frozenset(words)))
+    return entities
+
+
+class LexicalIndex:
+    """Inverted index from normalized words to the target entities using them.
+
+    Each entity is a binary bag of words weighted by inverse document
+    frequency, so rare words ("iban") count for more than common ones
+    ("identifier").
+    """
+
+    def __init__(self, entities: Sequence[LexicalEntity]) -> None:
+        """Index entities.
+
+        Args:
+            entities: Target entities
+        """
+        self.entities = list(entities)
+        postings: Dict[str, List[int]] = {}
+        self._keys: Dict[Tuple[str, str], List[int]] = {}
+        for position, entity in enumerate(self.entities):
+            for word in entity.words:
+                postings.setdefault(word, []).append(position)
+            for key in entity.keys:
+                self._keys.setdefault((entity.kind, key), []).append(position)
+
+        count = len(self.entities)
+        # Words missing from the target get the weight of a word used once
+        self._unseen_idf = math.log(1 + count)
+        self._idf = {word: math.log(1 + count / len(ids)) for word, ids in postings.items()}
+        self._postings = {word: np.asarray(ids, dtype=np.int64) for word, ids in postings.items()}
+        self._norms = np.asarray(
+            [math.sqrt(sum(self._idf[word] ** 2 for word in entity.words)) for entity in self.entities],
+            dtype=np.float64,
+        )
+        self._kinds = np.asarray([entity.kind == "class" for entity in self.entities], dtype=bool)
+        self._positions = {entity.iri: position for position, entity in enumerate(self.entities)}
+
+    def positions(self, iris: Iterable[str]) -> List[int]:
+        """Return the positions of the indexed entities with the given IRIs."""
+        return sorted(self._positions[iri] for iri in iris if iri in self._positions)
+
+    def exact(self, entity: LexicalEntity) -> List[int]:
+        """Return positions of target entities of the same kind sharing a normalized label."""
+        found = set()
+        for key in entity.keys:
+            found.update(self._keys.get((entity.kind, key), ()))
+        return sorted(found)
+
+    def scores(self, entity: LexicalEntity, allowed: Optional[Sequence[int]] = None) -> Tuple[Any, Any]:
+        """Score every target entity of the same kind sharing a word with ``entity``.
+
+        Args:
+            entity: Source entity
+            allowed: Only score these target positions (e.g. blocking
+                candidates); the work is then proportional to their number
+                instead of the index size
+
+        Returns:
+            Positions of candidate target entities and their cosine similarity
+        """
+        source_norm = math.sqrt(sum(self._idf.get(word, self._unseen_idf) ** 2 for word in entity.words))
+        if allowed is not None:
+            dots = np.asarray([sum(self._idf[word] ** 2 for word in entity.words & self.entities[p].words)
+                               for p in allowed], dtype=np.float64)
+            candidates = np.asarray(allowed, dtype=np.int64)
+            keep = (dots > 0) & (self._kinds[candidates] == (entity.kind == "class"))
+            candidates = candidates[keep]
+            return candidates, dots[keep] / (self._norms[candidates] * source_norm)
+
+        accumulated = np.zeros(len(self.entities), dtype=np.float64)
+        for word in entity.words:
+            idf = self._idf.get(word)
+            if idf is not None:
+                accumulated[self._postings[word]] += idf * idf
+        mask = accumulated > 0
+        mask &= self._kinds == (entity.kind == "class")
+        candidates = np.nonzero(mask)[0]
+        similarity = accumulated[candidates] / (self._norms[candidates] * source_norm)
+        return candidates, similarity
+
+
+@dataclass(frozen=True)
+class LexicalMatch:
+    """One correspondence found by the lexical matcher."""
+
+    subject: LexicalEntity
+    object: LexicalEntity
+    predicate_id: str
+    confidence: float
+
+
+def match_entities(
+    sources: Sequence[LexicalEntity],
+    index: LexicalIndex,
+    threshold: float = 0.75,
+    max_matches: int = 1,
+    candidates: Optional[Mapping[str, Iterable[str]]] = None,
+) -> List[LexicalMatch]:
+    """Match source entities against an indexed target.
+
+    Args:
+        sources: Source entities
+        index: Index of the target entities
+        threshold: Minimum confidence of a close match
+        max_matches: Matches kept per source entity, best first
+        candidates: Target IRIs each source IRI may match (see
+            :mod:`.blocking`); source IRIs missing from it match nothing
+
+    Returns:
+        Matches ordered by source IRI and descending confidence
+    """
+    matches = []
+    for entity in sources:
+        allowed = None
+        exact = index.exact(entity)
+        if candidates is not None:
+            allowed = index.positions(candidates.get(entity.iri, ()))
+            permitted = set(allowed)
+            exact = [position for position in exact if position in permitted]
+        if exact:
+            matches.extend(LexicalMatch(entity, index.entities[position], "skos:exactMatch", 1.0)
+                           for position in exact[:max_matches])
+            continue
+        positions, similarity = index.scores(entity, allowed)
+        if len(positions) == 0:
+            continue
+        order = np.argsort(-similarity, kind="stable")[:max_matches]
+        for rank in order:
+            confidence = float(similarity[rank])
+            if confidence < threshold:
+                break
+            matches.append(LexicalMatch(entity, index.entities[int(positions[rank])], "skos:closeMatch",
+                                        round(confidence, 4)))
+    return matches
+
+
+def namespace_of(iri: str) -> str:
+    """Return an IRI up to and including its last ``#`` or ``/``."""
+    return iri[: max(iri.rfind("#"), iri.rfind("/")) + 1]
+
+
+def build_curie_map(iris: Iterable[str], bindings: Optional[Mapping[str, str]] = None) -> Dict[str, str]:
+    """Assign a prefix to the namespace of every IRI.
+
+    Prefixes bound in the ontologies (``bindings``, namespace to prefix) are
+    kept where they are unique; other namespaces get ``ns1``, ``ns2``, ...
+
+    Returns:
+        Namespace of each prefix
+    """
+    curie_map: Dict[str, str] = {}
+    assigned: Dict[str, str] = {}
+    for iri in iris:
+        namespace = namespace_of(iri)
+        if namespace in assigned:
+            continue
+        prefix = (bindings or {}).get(namespace)
+        if not prefix or prefix in curie_map:
+            number = len(curie_map) + 1
+            while f"ns{number}" in curie_map:
+                number += 1
+            prefix = f"ns{number}"
+        curie_map[prefix] = namespace
+        assigned[namespace] = prefix
+    return curie_map
+
+
+def write_sssom(
+    matches: Sequence[LexicalMatch],
+    output_path: Path,
+    bindings: Optional[Mapping[str, str]] = None,
+    tool: str = "graph-mesh-lexical",
+) -> int:
+    """Write matches as an SSSOM TSV file with CURIEs and a ``curie_map`` header.
+
+    Identifiers are written as CURIEs: full IRIs usually contain ``#``, which
+    SSSOM readers that treat ``#`` as a comment marker (such as
+    :func:`~graph_mesh_aligner.fusion.load_sssom_mappings`) would cut off.
+
+    Args:
+        matches: Matches to write
+        output_path: SSSOM TSV file
+        bindings: Prefixes bound in the aligned ontologies, by namespace
+        tool: Value of the ``mapping_tool`` column
+
+    Returns:
+        Number of mappings written
+    """
+    curie_map = build_curie_map(
+        (iri for match in matches for iri in (match.subject.iri, match.object.iri)), bindings)
+    prefixes = {namespace: prefix for prefix, namespace in curie_map.items()}
+
+    def curie(iri: str) -> str:
+        namespace = namespace_of(iri)
+        return f"{prefixes[namespace]}:{iri[len(namespace):]}"
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", newline="", encoding="utf-8") as handle:
+        handle.write("# curie_map:\n")
+        for prefix, namespace in curie_map.items():
+            handle.write(f"#   {prefix}: {namespace}\n")
+        handle.write(f"# mapping_tool: {tool}\n")
+        handle.write(f"# mapping_tool_version: {LEXICAL_VERSION}\n")
+        writer = csv.writer(handle, delimiter="\t", lineterminator="\n")
+        writer.writerow(SSSOM_COLUMNS)
+        for match in matches:
+            writer.writerow((
+                curie(match.subject.iri),
+                match.subject.label,
+                match.predicate_id,
+                curie(match.object.iri),
+                match.object.label,
+                "semapv:LexicalMatching",
+                match.confidence,
+                tool,
+            ))
+    return len(matches)
+
+
+@dataclass
+class LexicalMatcher:
+    """In-process matcher scoring label similarity; needs no Docker.
+
+    Satisfies :class:`~graph_mesh_aligner.matchers.AlignmentMatcher`, so it
+    can be listed in a manifest's ``matchers`` (as ``Lexical``) next to the
+    container matchers and is cached, pooled and fused like them.
+
+    ``synonyms`` extends :data:`DEFAULT_SYNONYMS`; a value may hold several
+    words (``{"dob": "date of birth"}``). With ``blocking``, only the pairs
+    found by :class:`~graph_mesh_aligner.blocking.MinHashBlocker` are scored.
+    """
+
+    name: str = "Lexical"
+    output_filename: str = "lexical.sssom.tsv"
+    threshold: float = 0.75
+    max_matches: int = 1
+    synonyms: Dict[str, str] = field(default_factory=dict)
+    blocking: bool = False
+    timeout: int = 300
+
+    def cache_options(self) -> Dict[str, Any]:
+        """Return the settings that change this matcher's output, for its cache key."""
+        return {
+            "version": LEXICAL_VERSION,
+            "threshold": self.threshold,
+            "max_matches": self.max_matches,
+            "synonyms": sorted(self.synonyms.items()),
+            "blocking": self.blocking,
+        }
+
+    def _synonyms(self) -> Dict[str, str]:
+        return {**DEFAULT_SYNONYMS, **{k.lower(): v.lower() for k, v in self.synonyms.items()}}
+
+    def _load(self, path: Path, bindings: Dict[str, str]) -> List[LexicalEntity]:
+        """Parse an ontology, collect its namespace bindings and return its entities."""
+        with span("lexical.load", "alignment", path=str(path)):
+            graph = new_graph()
+            graph.parse(str(path))
+            for prefix, namespace in graph.namespaces():
+                if prefix:
+                    bindings.setdefault(str(namespace), prefix)
+            return extract_entities(graph, self._synonyms())
+
+    def align(self, source_ontology: Path, target_ontology: Path, output_dir: Path) -> Path:
+        """Align two ontologies and write the SSSOM mapping to ``output_dir``.
+
+        Args:
+            source_ontology: Source ontology file
+            target_ontology: Target ontology file
+            output_dir: Directory for the mapping file
+
+        Returns:
+            Path of the written mapping
+        """
+        output_dir = Path(output_dir)
+        bindings: Dict[str, str] = {}
+        sources = self._load(Path(source_ontology), bindings)
+        targets = self._load(Path(target_ontology), bindings)
+        with span("lexical.match", "alignment", sources=len(sources), targets=len(targets)):
+            candidates = None
+            if self.blocking:
+                from .blocking import MinHashBlocker
+
+                candidates = MinHashBlocker(synonyms=self._synonyms()).candidate_pairs(sources, targets)
+            index = LexicalIndex(targets)
+            matches = match_entities(sources, index, self.threshold, self.max_matches, candidates)
+        mapping_path = output_dir / self.output_filename
+        count = write_sssom(matches, mapping_path, bindings)
+        annotate(source_entities=len(sources), target_entities=len(targets))
+        LOGGER.info(f"{self.name} found {count} mappings: {mapping_path}")
+        return mapping_path
+
+    async def align_async(
+        self, source_ontology: Path, target_ontology: Path, output_dir: Path
+    ) -> MatcherResult:
+        """Asynchronous alignment in a worker thread with timeout and error handling."""
+        start_time = time.time()
+        mapping_path = Path(output_dir) / self.output_filename
+        try:
+            await asyncio.wait_for(
+                asyncio.to_thread(self.align, source_ontology, target_ontology, output_dir),
+                timeout=self.timeout,
+            )
+            return MatcherResult(self.name, mapping_path, True, time.time() - start_time)
+        except asyncio.TimeoutError:
+            error_msg = f"Timeout after {self.timeout}s"
+        except Exception as exc:
+            error_msg = str(exc)
+        LOGGER.error(f"✗ {self.name} failed: {error_msg}")
+        return MatcherResult(self.name, mapping_path, False, time.time() - start_time, error_msg)
@@ -4,16 +4,31 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 import time
+import uuid
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Protocol
+from typing import Any, Callable, Iterable, Iterator, Mapping, Protocol
 
-import docker
-from docker.errors import DockerException
+from graph_mesh_core.artifact_cache import ArtifactCache, cache_key, hash_paths
+from graph_mesh_core.docker_session import default_docker_session
+from graph_mesh_core.lazy import LazyModule
+from graph_mesh_core.telemetry import UnitMetrics, annotate, measure
+from graph_mesh_core.tracing import span
+
+from .pool import MatcherPool
+from .warm import default_warm_pool
 
 LOGGER = logging.getLogger(__name__)
 
+# The Docker SDK (and requests under it) loads when a container is first run
+docker = LazyModule("docker")
+
+# Seconds between samples of a running matcher container's resource usage
+USAGE_SAMPLE_INTERVAL = 1.0
+
 
 class AlignmentMatcher(Protocol):
     """Common protocol for ontology matchers."""
@@ -42,6 +57,19 @@ class ContainerMatcher:
     Each matcher is executed inside its dedicated Docker container. The class
     stores the container image name and the expected output file name used when
     invoking the matcher CLI inside the container.
+
+    ``cpus`` and ``memory_mb`` are the matcher's resource request: the
+    container is started with matching CPU and memory limits, and a
+    :class:`~graph_mesh_aligner.pool.MatcherPool` reserves them while it runs.
+
+    With ``warm`` the matcher runs in a long-lived container of the
+    process-wide :class:`~graph_mesh_aligner.warm.WarmContainerPool` instead
+    of a new container per alignment; the container is stopped after
+    ``warm_idle_seconds`` without work.
+
+    ``max_batch`` above 1 lets :func:`run_alignment_batch` align up to that
+    many sources to the same target in one matcher invocation (see
+    :meth:`align_batch`), so the target is loaded and indexed once per batch.
     """
 
     name: str
@@ -49,19 +77,124 @@ class ContainerMatcher:
     output_filename: str
     timeout: int = 300  # Default 5 minutes timeout
     health_check_enabled: bool = True
+    cpus: float | None = None
+    memory_mb: int | None = None
+    warm: bool = False
+    warm_idle_seconds: float = 300.0
+    max_batch: int = 1
+
+    def resource_limits(self) -> dict[str, Any]:
+        """Return the Docker run arguments enforcing the resource request."""
+        limits: dict[str, Any] = {}
+        if self.cpus:
+            limits["nano_cpus"] = int(self.cpus * 1e9)
+        if self.memory_mb:
+            limits["mem_limit"] = f"{self.memory_mb}m"
+        return limits
+
+    def _run_container(
+        self,
+        client: docker.DockerClient,
+        command: list[str],
+        volumes: dict[str, dict[str, str]],
+    ) -> Any:
+        """Run the matcher container to completion and return its logs.
+
+        The container's peak memory and CPU time are sampled while it runs and
+        reported to the active telemetry unit.
+        """
+        container_name = f"graph-mesh-{self.name.lower()}-{uuid.uuid4().hex[:12]}"
+        monitor = _UsageMonitor(client, container_name)
+        with span("container.run", "container", image=self.image, **self.resource_limits()):
+            monitor.start()
+            try:
+                logs = client.containers.run(
+                    image=self.image,
+                    command=command,
+                    volumes=volumes,
+                    name=container_name,
+                    remove=True,
+                    detach=False,
+                    **self.resource_limits(),
+                )
+            finally:
+                monitor.stop()
+        if monitor.peak_memory_bytes or monitor.cpu_seconds:
+            annotate(
+                container_peak_memory_bytes=monitor.peak_memory_bytes,
+                container_cpu_seconds=monitor.cpu_seconds,
+            )
+        return logs
+
+    def _run_cold(self, resolved_source: Path, resolved_target: Path, output_dir: Path) -> Any:
+        """Run the alignment in a new container and return its logs."""
+        command = [
+            "--source",
+            "/data/source.owl",
+            "--target",
+            "/data/target.owl",
+            "--output",
+            f"/data/output/{self.output_filename}",
+        ]
+        volumes = {
+            str(resolved_source): {"bind": "/data/source.owl", "mode": "ro"},
+            str(resolved_target): {"bind": "/data/target.owl", "mode": "ro"},
+            str(output_dir): {"bind": "/data/output", "mode": "rw"},
+        }
+        return self._guarded(self._run_container, default_docker_session().client, command, volumes)
+
+    def _run_cold_batch(
+        self,
+        resolved_sources: Mapping[str, Path],
+        resolved_target: Path,
+        output_dirs: Mapping[str, Path],
+    ) -> Any:
+        """Run a batch alignment in a new container and return its logs.
+
+        Sources are mounted by position (``/data/sources/<i>.owl``) and each
+        gets its own output mount, since source IDs need not be valid paths.
+        """
+        command = ["--target", "/data/target.owl"]
+        volumes = {str(resolved_target): {"bind": "/data/target.owl", "mode": "ro"}}
+        for index, (source_id, source) in enumerate(resolved_sources.items()):
+            command += [
+                "--source",
+                f"/data/sources/{index}.owl",
+                "--output",
+                f"/data/output/{index}/{self.output_filename}",
+            ]
+            volumes[str(source)] = {"bind": f"/data/sources/{index}.owl", "mode": "ro"}
+            volumes[str(output_dirs[source_id])] = {"bind": f"/data/output/{index}", "mode": "rw"}
+        return self._guarded(self._run_container, default_docker_session().client, command, volumes)
+
+    def _guarded(self, run: Callable[..., Any], *args: Any) -> Any:
+        """Health-check the image, then run, reporting Docker failures as RuntimeError."""
+        from docker.errors import DockerException
 
-    def _check_image_health(self, client: docker.DockerClient) -> bool:
-        """Check if the Docker image is available and healthy."""
         try:
-            client.images.get(self.image)
-            LOGGER.debug(f"Health check passed for {self.name} image: {self.image}")
-            return True
-        except docker.errors.ImageNotFound:
-            LOGGER.warning(f"Health check failed: Image not found for {self.name}: {self.image}")
-            return False
+            # Health check before running
+            if self.health_check_enabled and not self._check_image_health():
+                raise RuntimeError(f"Health check failed for {self.name}")
+            return run(*args)
         except DockerException as exc:
-            LOGGER.warning(f"Health check failed for {self.name}: {exc}")
-            return False
+            raise RuntimeError(
+                f"Failed to run matcher container '{self.image}' for {self.name}"
+            ) from exc
+
+    def _run_warm(self, resolved_source: Path, resolved_target: Path, output_dir: Path) -> Any:
+        """Run the alignment in a warm container and return its output."""
+        pool = default_warm_pool()
+        return self._guarded(pool.run, self, resolved_source, resolved_target, output_dir)
+
+    def _check_image_health(self) -> bool:
+        """Check if the Docker image is available, using the session's cached status."""
+        with span("container.health_check", "container", image=self.image):
+            status = default_docker_session().image_status(self.image)
+        if status.available:
+            LOGGER.debug(f"Health check passed for {self.name} image: {self.image}")
+        else:
+            LOGGER.warning(f"Health check failed for {self.name} ({self.image}): {status.error}")
+        return status.available
 
     def align(self, source_ontology: Path, target_ontology: Path, output_dir: Path) -> Path:
         """Synchronous alignment (backward compatible)."""
@@ -71,39 +204,10 @@ class ContainerMatcher:
         output_dir.mkdir(parents=True, exist_ok=True)
         mapping_path = output_dir / self.output_filename
 
-        client = docker.from_env()
-        try:
-            # Health check before running
-            if self.health_check_enabled and not self._check_image_health(client):
-                raise RuntimeError(f"Health check failed for {self.name}")
-
-            logs = client.containers.run(
-                image=self.image,
-                command=[
-                    "--source",
-                    "/data/source.owl",
-                    "--target",
-                    "/data/target.owl",
-                    "--output",
-                    f"/data/output/{self.output_filename}",
-                ],
-                volumes={
-                    str(resolved_source): {"bind": "/data/source.owl", "mode": "ro"},
-                    str(resolved_target): {"bind": "/data/target.owl", "mode": "ro"},
-                    str(output_dir): {"bind": "/data/output", "mode": "rw"},
-                },
-                remove=True,
-                detach=False,
-            )
-        except DockerException as exc:
-            raise RuntimeError(
-                f"Failed to run matcher container '{self.image}' for {self.name}"
-            ) from exc
-        finally:
-            try:
-                client.close()
-            except DockerException:
-                pass
+        if self.warm:
+            logs = self._run_warm(resolved_source, resolved_target, output_dir)
+        else:
+            logs = self._run_cold(resolved_source, resolved_target, output_dir)
 
         if logs:
             # The Docker SDK returns container logs as bytes when detach=False.
@@ -111,6 +215,46 @@ class ContainerMatcher:
 
         return mapping_path
 
+    def align_batch(
+        self,
+        source_ontologies: Mapping[str, Path],
+        target_ontology: Path,
+        output_dirs: Mapping[str, Path],
+    ) -> dict[str, Path]:
+        """Align several sources to one target in a single matcher invocation.
+
+        The matcher CLI receives ``--target`` once followed by one
+        ``--source``/``--output`` pair per source and writes one SSSOM file
+        per pair, loading and indexing the target only once.
+
+        Args:
+            source_ontologies: Source ontology paths by source ID
+            target_ontology: Target ontology shared by all sources
+            output_dirs: Output directory for each source ID
+
+        Returns:
+            Expected mapping path for each source ID; a matcher that does not
+            support batches may leave some of them unwritten
+        """
+        resolved_sources = {sid: Path(path).resolve() for sid, path in source_ontologies.items()}
+        resolved_target = target_ontology.resolve()
+        resolved_dirs = {}
+        for sid in resolved_sources:
+            resolved_dirs[sid] = Path(output_dirs[sid]).resolve()
+            resolved_dirs[sid].mkdir(parents=True, exist_ok=True)
+
+        if self.warm:
+            pool = default_warm_pool()
+            logs = self._guarded(pool.run_batch, self, resolved_sources, resolved_target, resolved_dirs)
+        else:
+            logs = self._run_cold_batch(resolved_sources, resolved_target, resolved_dirs)
+
+        if logs:
+            log_str = logs.decode("utf-8") if isinstance(logs, (bytes, bytearray)) else logs
+            LOGGER.debug(f"{self.name} batch output:\n{log_str}")
+
+        return {sid: resolved_dirs[sid] / self.output_filename for sid in resolved_sources}
+
     async def align_async(
         self, source_ontology: Path, target_ontology: Path, output_dir: Path
     ) -> MatcherResult:
@@ -177,48 +321,61 @@ class ContainerMatcher:
         mapping_path: Path,
     ) -> Path:
         """Synchronous container execution (called from async context)."""
-        client = docker.from_env()
-        try:
-            # Health check before running
-            if self.health_check_enabled and not self._check_image_health(client):
-                raise RuntimeError(f"Health check failed for {self.name}")
+        LOGGER.info(f"→ Starting {self.name}...")
 
-            LOGGER.info(f"→ Starting {self.name}...")
-
-            logs = client.containers.run(
-                image=self.image,
-                command=[
-                    "--source",
-                    "/data/source.owl",
-                    "--target",
-                    "/data/target.owl",
-                    "--output",
-                    f"/data/output/{self.output_filename}",
-                ],
-                volumes={
-                    str(resolved_source): {"bind": "/data/source.owl", "mode": "ro"},
-                    str(resolved_target): {"bind": "/data/target.owl", "mode": "ro"},
-                    str(output_dir): {"bind": "/data/output", "mode": "rw"},
-                },
-                remove=True,
-                detach=False,
-            )
+        if self.warm:
+            logs = self._run_warm(resolved_source, resolved_target, output_dir)
+        else:
+            logs = self._run_cold(resolved_source, resolved_target, output_dir)
+
+        if logs:
+            log_str = logs.decode("utf-8") if isinstance(logs, (bytes, bytearray)) else logs
+            LOGGER.debug(f"{self.name} output:\n{log_str}")
 
-            if logs:
-                log_str = logs.decode("utf-8") if isinstance(logs, (bytes, bytearray)) else logs
-                LOGGER.debug(f"{self.name} output:\n{log_str}")
+        return mapping_path
 
-            return mapping_path
 
-        except DockerException as exc:
-            raise RuntimeError(
-                f"Failed to run matcher container '{self.image}' for {self.name}"
-            ) from exc
-        finally:
-            try:
-                client.close()
-            except DockerException:
-                pass
+class _UsageMonitor:
+    """Sample a running container's memory and CPU usage from a background thread.
+
+    ``containers.run(detach=False)`` blocks until the container exits, so its
+    statistics are polled by name through the same client. Samples that fail
+    (the container has not started yet or is already gone) are skipped.
+    """
+
+    def __init__(self, client: docker.DockerClient, container_name: str, interval: float | None = None) -> None:
+        self.client = client
+        self.container_name = container_name
+        self.interval = interval or USAGE_SAMPLE_INTERVAL
+        self.peak_memory_bytes = 0
+        self.cpu_seconds = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"stats-{container_name}", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=self.interval + 5)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """Take one sample of the container's statistics."""
+        try:
+            stats = self.client.containers.get(self.container_name).stats(stream=False)
+        except Exception:  # noqa: BLE001 - the container may not exist yet or any more
+            return
+        if not isinstance(stats, dict):
+            return
+        memory = stats.get("memory_stats") or {}
+        usage = memory.get("max_usage") or memory.get("usage") or 0
+        self.peak_memory_bytes = max(self.peak_memory_bytes, int(usage))
+        cpu_total = (stats.get("cpu_stats") or {}).get("cpu_usage", {}).get("total_usage") or 0
+        self.cpu_seconds = max(self.cpu_seconds, cpu_total / 1e9)
 
 
 DEFAULT_MATCHERS: tuple[ContainerMatcher, ...] = (
@@ -240,23 +397,277 @@ DEFAULT_MATCHERS: tuple[ContainerMatcher, ...] = (
 )
 
 
+def alignment_cache_key(matcher: AlignmentMatcher, source_ontology: Path, target_ontology: Path) -> str:
+    """Derive the artifact cache key for one matcher run.
+
+    The key covers both ontologies' bytes and the matcher's identity (name,
+    image and output file name, plus ``cache_options()`` for matchers that
+    define it). Rebuilding an image under the same tag does not change the
+    key.
+    """
+    matcher_id = {
+        "name": matcher.name,
+        "image": getattr(matcher, "image", None),
+        "output_filename": getattr(matcher, "output_filename", None),
+    }
+    # In-process matchers have no image; their settings identify the output instead
+    cache_options = getattr(matcher, "cache_options", None)
+    if cache_options is not None:
+        matcher_id["options"] = cache_options()
+    return cache_key("alignment", matcher_id, hash_paths(source_ontology), hash_paths(target_ontology))
+
+
 def run_alignment(
     matchers: Iterable[AlignmentMatcher],
     source_ontology: Path,
     target_ontology: Path,
     output_dir: Path,
+    cache: ArtifactCache | None = None,
+    pool: MatcherPool | None = None,
+    on_result: Callable[[AlignmentMatcher, Path, UnitMetrics | None], None] | None = None,
 ) -> list[Path]:
     """Execute all configured matchers sequentially (backward compatible).
 
     For parallel execution with better performance, use run_alignment_parallel().
+
+    When a cache is given, matchers whose inputs are unchanged since an earlier
+    run have their mapping restored from it instead of being executed, and
+    identical runs requested concurrently execute only once. When a pool is
+    given, each matcher run holds one of its slots. ``on_result`` is called
+    after each matcher with its mapping path and, when a metrics recorder is
+    active, the matcher's unit metrics.
     """
     results: list[Path] = []
     for matcher in matchers:
-        mapping = matcher.align(source_ontology, target_ontology, output_dir)
+        with measure("matcher", matcher=matcher.name) as unit:
+            mapping = _run_matcher(matcher, source_ontology, target_ontology, output_dir, cache, pool)
         results.append(mapping)
+        if on_result is not None:
+            on_result(matcher, mapping, unit)
     return results
 
 
+def _run_matcher(
+    matcher: AlignmentMatcher,
+    source_ontology: Path,
+    target_ontology: Path,
+    output_dir: Path,
+    cache: ArtifactCache | None,
+    pool: MatcherPool | None = None,
+) -> Path:
+    """Run one matcher, restoring its mapping from the cache when possible."""
+    if cache is None:
+        return _execute_matcher(matcher, source_ontology, target_ontology, output_dir, pool)
+
+    key = alignment_cache_key(matcher, source_ontology, target_ontology)
+    with cache.lock(key):
+        mapping = _restore_mapping(matcher, key, output_dir, cache)
+        if mapping is not None:
+            return mapping
+
+        mapping = _execute_matcher(matcher, source_ontology, target_ontology, output_dir, pool)
+        _store_mapping(matcher, key, mapping, cache)
+    return mapping
+
+
+def _restore_mapping(matcher: AlignmentMatcher, key: str, output_dir: Path, cache: ArtifactCache) -> Path | None:
+    """Restore a cached mapping into ``output_dir``, returning its path if there was one."""
+    entry = cache.metadata(key)
+    if entry:
+        mapping = output_dir / entry["metadata"]["filename"]
+        if cache.restore(key, {"mapping": mapping}):
+            LOGGER.info(f"Restored cached {matcher.name} mapping: {mapping}")
+            annotate(cached=True, mapping_count=count_mappings(mapping))
+            return mapping
+    return None
+
+
+def _store_mapping(matcher: AlignmentMatcher, key: str, mapping: Path, cache: ArtifactCache) -> None:
+    """Store a produced mapping in the cache."""
+    if Path(mapping).exists():
+        cache.store(key, {"mapping": mapping}, metadata={"matcher": matcher.name, "filename": Path(mapping).name})
+
+
+def _execute_matcher(
+    matcher: AlignmentMatcher,
+    source_ontology: Path,
+    target_ontology: Path,
+    output_dir: Path,
+    pool: MatcherPool | None,
+) -> Path:
+    """Run a matcher, holding a pool slot (and its resource request) if a pool is given."""
+    if pool is None:
+        mapping = matcher.align(source_ontology, target_ontology, output_dir)
+    else:
+        with pool.slot(
+            matcher.name,
+            cpus=getattr(matcher, "cpus", None),
+            memory_mb=getattr(matcher, "memory_mb", None),
+        ):
+            mapping = matcher.align(source_ontology, target_ontology, output_dir)
+    if Path(mapping).exists():
+        annotate(mapping_count=count_mappings(mapping))
+    return mapping
+
+
+def run_alignment_batch(
+    matchers: Iterable[AlignmentMatcher],
+    source_ontologies: Mapping[str, Path],
+    target_ontology: Path,
+    output_dirs: Mapping[str, Path],
+    cache: ArtifactCache | None = None,
+    pool: MatcherPool | None = None,
+    on_result: Callable[[str, AlignmentMatcher, Path, UnitMetrics | None], None] | None = None,
+) -> dict[str, list[Path]]:
+    """Align many sources to one target, batching sources per matcher.
+
+    For each matcher, sources whose mapping is in the cache are restored
+    first. The rest are split into batches of the matcher's ``max_batch``
+    and each batch is aligned in one :meth:`ContainerMatcher.align_batch`
+    call holding one pool slot. Matchers without batch support, and batches
+    of one, run per source as in :func:`run_alignment`. Sources for which a
+    batch wrote no mapping (a matcher CLI that honours only one
+    ``--source``/``--output`` pair) are aligned again on their own. Each
+    batch holds the cache locks of its sources' keys, so identical runs
+    requested concurrently execute only once, and mappings produced in a
+    batch are stored in the cache per source, so later single-source runs
+    restore them.
+
+    Args:
+        matchers: Matchers to run
+        source_ontologies: Source ontology paths by source ID
+        target_ontology: Target ontology shared by all sources
+        output_dirs: Mapping output directory for each source ID
+        cache: Artifact cache for mappings
+        pool: Pool bounding concurrent matcher invocations
+        on_result: Called per source and matcher with the source ID, matcher,
+            mapping path and unit metrics (shared by a batch's sources)
+
+    Returns:
+        Mapping paths per source ID, in matcher order
+    """
+    results: dict[str, list[Path]] = {sid: [] for sid in source_ontologies}
+    for matcher in matchers:
+        produced: dict[str, Path] = {}
+        keys: dict[str, str] = {}
+        pending: dict[str, Path] = {}
+        for sid, source in source_ontologies.items():
+            if cache is None:
+                pending[sid] = source
+                continue
+            keys[sid] = alignment_cache_key(matcher, source, target_ontology)
+            mapping = None
+            if cache.contains(keys[sid]):
+                with measure("matcher", source_id=sid, matcher=matcher.name) as unit:
+                    mapping = _restore_mapping(matcher, keys[sid], Path(output_dirs[sid]), cache)
+            if mapping is None:
+                pending[sid] = source
+                continue
+            produced[sid] = mapping
+            if on_result is not None:
+                on_result(sid, matcher, mapping, unit)
+
+        batch_size = max(1, getattr(matcher, "max_batch", 1)) if hasattr(matcher, "align_batch") else 1
+        pending_ids = list(pending)
+        for start in range(0, len(pending_ids), batch_size):
+            batch = {sid: pending[sid] for sid in pending_ids[start:start + batch_size]}
+            with _batch_locks(cache, [keys[sid] for sid in batch] if cache is not None else []):
+                if cache is not None:
+                    # Another run may have produced some of these while we waited for the locks
+                    for sid in list(batch):
+                        with measure("matcher", source_id=sid, matcher=matcher.name) as unit:
+                            mapping = _restore_mapping(matcher, keys[sid], Path(output_dirs[sid]), cache)
+                        if mapping is not None:
+                            del batch[sid]
+                            produced[sid] = mapping
+                            if on_result is not None:
+                                on_result(sid, matcher, mapping, unit)
+                if not batch:
+                    continue
+
+                if len(batch) == 1:
+                    sid, source = next(iter(batch.items()))
+                    with measure("matcher", source_id=sid, matcher=matcher.name) as unit:
+                        mapping = _execute_matcher(matcher, source, target_ontology, Path(output_dirs[sid]), pool)
+                    mappings = {sid: (mapping, unit)}
+                else:
+                    with measure("matcher", matcher=matcher.name) as unit:
+                        batch_mappings = _execute_matcher_batch(matcher, batch, target_ontology, output_dirs, pool)
+                    mappings = {sid: (mapping, unit) for sid, mapping in batch_mappings.items()}
+                    for sid in batch:
+                        if sid in batch_mappings and Path(batch_mappings[sid]).exists():
+                            continue
+                        # The matcher accepted the batch but wrote no mapping for this source
+                        LOGGER.warning(
+                            f"{matcher.name} batch produced no mapping for {sid}; aligning it on its own"
+                        )
+                        with measure("matcher", source_id=sid, matcher=matcher.name) as source_unit:
+                            mapping = _execute_matcher(
+                                matcher, batch[sid], target_ontology, Path(output_dirs[sid]), pool
+                            )
+                        mappings[sid] = (mapping, source_unit)
+
+                for sid, (mapping, mapping_unit) in mappings.items():
+                    if cache is not None:
+                        _store_mapping(matcher, keys[sid], mapping, cache)
+                    produced[sid] = mapping
+                    if on_result is not None:
+                        on_result(sid, matcher, mapping, mapping_unit)
+
+        for sid in source_ontologies:
+            results[sid].append(produced[sid])
+    return results
+
+
+@contextmanager
+def _batch_locks(cache: ArtifactCache | None, keys: Iterable[str]) -> Iterator[None]:
+    """Hold the cache locks of a batch's keys, acquired in sorted order to avoid deadlocks.
+
+    Sources with identical content share a key, so each distinct key is locked once.
+    """
+    with ExitStack() as stack:
+        if cache is not None:
+            for key in sorted(set(keys)):
+                stack.enter_context(cache.lock(key))
+        yield
+
+
+def _execute_matcher_batch(
+    matcher: AlignmentMatcher,
+    source_ontologies: Mapping[str, Path],
+    target_ontology: Path,
+    output_dirs: Mapping[str, Path],
+    pool: MatcherPool | None,
+) -> dict[str, Path]:
+    """Run one batch alignment, holding a single pool slot if a pool is given."""
+    LOGGER.info(f"Aligning {len(source_ontologies)} sources with {matcher.name} in one batch")
+    annotate(batch_size=len(source_ontologies))
+    dirs = {sid: Path(output_dirs[sid]) for sid in source_ontologies}
+    if pool is None:
+        mappings = matcher.align_batch(source_ontologies, target_ontology, dirs)
+    else:
+        with pool.slot(
+            matcher.name,
+            cpus=getattr(matcher, "cpus", None),
+            memory_mb=getattr(matcher, "memory_mb", None),
+        ):
+            mappings = matcher.align_batch(source_ontologies, target_ontology, dirs)
+    existing = [Path(m) for m in mappings.values() if Path(m).exists()]
+    if existing:
+        annotate(mapping_count=sum(count_mappings(m) for m in existing))
+    return mappings
+
+
+def count_mappings(mapping_path: Path) -> int:
+    """Count mapping rows in an SSSOM TSV file (excluding metadata and header)."""
+    rows = 0
+    with open(mapping_path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line.strip() and not line.startswith("#"):
+                rows += 1
+    return max(rows - 1, 0)
+
+
 async def run_alignment_async(
     matchers: Iterable[ContainerMatcher],
     source_ontology: Path,
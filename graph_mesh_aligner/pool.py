@@ -0,0 +1,241 @@
+"""Process-wide bound on concurrent matcher runs.
+
+Each matcher run starts a container (a JVM for LogMap and AML, a transformer
+model for BERTMap), so running one per source on every worker of every
+pipeline quickly oversubscribes the host. A :class:`MatcherPool` caps how
+many matcher runs are in flight at once and packs them onto the host's CPUs
+and memory: a run requesting ``cpus`` and ``memory_mb`` (see
+``pipeline.matcher_resources``) starts only once both fit next to the runs
+already holding slots, and otherwise queues. All pipelines in a process share
+the default pool returned by :func:`default_matcher_pool`, so several
+manifests run together (see ``graph_mesh_orchestrator.batch``) draw from the
+same budget instead of each bringing its own.
+
+Queued runs start in arrival order where they fit; a smaller run may start
+ahead of a larger one that does not fit yet, but only ``max_bypass`` times,
+so large requests are not starved.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+from graph_mesh_core.telemetry import annotate
+from graph_mesh_core.tracing import span
+
+LOGGER = logging.getLogger(__name__)
+
+
+def default_pool_size() -> int:
+    """Return the default number of concurrent matcher runs (half the CPUs, at least 1)."""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def host_memory_mb() -> Optional[int]:
+    """Return the host's physical memory in megabytes, if it can be determined."""
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+@dataclass
+class _Request:
+    """A matcher run waiting for, or holding, a slot."""
+
+    matcher_name: str
+    cpus: float
+    memory_mb: int
+    bypassed: int = 0
+
+
+class MatcherPool:
+    """Bounded pool of matcher run slots with CPU and memory capacity.
+
+    Example:
+        >>> pool = MatcherPool(max_concurrent=4, cpus=8, memory_mb=16384)
+        >>> with pool.slot("BERTMap", cpus=2, memory_mb=8192):
+        ...     matcher.align(source, target, output_dir)
+    """
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        cpus: Optional[float] = None,
+        memory_mb: Optional[int] = None,
+        max_bypass: Optional[int] = None,
+    ) -> None:
+        """Initialize pool.
+
+        Args:
+            max_concurrent: Maximum matcher runs in flight (default:
+                :func:`default_pool_size`)
+            cpus: CPUs available to matcher containers (default: the host's)
+            memory_mb: Memory available to matcher containers (default: the
+                host's physical memory, or unbounded if unknown)
+            max_bypass: Times a queued run may be overtaken by later, smaller
+                runs (default: ``max_concurrent``)
+
+        Raises:
+            ValueError: If max_concurrent is less than 1
+        """
+        max_concurrent = max_concurrent or default_pool_size()
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self.cpus = float(cpus or os.cpu_count() or 1)
+        self.memory_mb = memory_mb if memory_mb is not None else host_memory_mb()
+        self.max_bypass = max_concurrent if max_bypass is None else max_bypass
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._waiting: List[_Request] = []
+        self._active = 0
+        self._cpus_used = 0.0
+        self._memory_used = 0
+        self._peak = 0
+        self._peak_cpus = 0.0
+        self._peak_memory = 0
+        self._runs: Dict[str, int] = {}
+        self._wait_seconds = 0.0
+
+    def _fits(self, request: _Request) -> bool:
+        if self._active >= self.max_concurrent:
+            return False
+        if self._cpus_used + request.cpus > self.cpus + 1e-9:
+            return False
+        return self.memory_mb is None or self._memory_used + request.memory_mb <= self.memory_mb
+
+    def _admissible(self, request: _Request) -> bool:
+        if not self._fits(request):
+            return False
+        for earlier in self._waiting:
+            if earlier is request:
+                return True
+            if earlier.bypassed >= self.max_bypass:
+                return False
+        return True
+
+    def _request(self, matcher_name: str, cpus: Optional[float], memory_mb: Optional[int]) -> _Request:
+        """Build a request, clamped to the pool's capacity so it can always run."""
+        cpus = float(cpus or 0.0)
+        memory_mb = int(memory_mb or 0)
+        if cpus > self.cpus or (self.memory_mb is not None and memory_mb > self.memory_mb):
+            LOGGER.warning("%s requests %.1f CPUs / %d MB, more than the pool's %.1f CPUs / %s MB; "
+                           "it will run alone", matcher_name, cpus, memory_mb, self.cpus, self.memory_mb)
+            cpus = min(cpus, self.cpus)
+            memory_mb = min(memory_mb, self.memory_mb) if self.memory_mb is not None else memory_mb
+        return _Request(matcher_name, cpus, memory_mb)
+
+    @contextmanager
+    def slot(
+        self,
+        matcher_name: str,
+        cpus: Optional[float] = None,
+        memory_mb: Optional[int] = None,
+    ) -> Iterator[None]:
+        """Hold one slot, and the requested resources, for a matcher run.
+
+        The time spent waiting for the slot is reported to the active
+        telemetry unit as ``pool_wait_seconds``.
+
+        Args:
+            matcher_name: Matcher being run (for statistics)
+            cpus: CPUs the run needs (default: none reserved)
+            memory_mb: Memory the run needs (default: none reserved)
+        """
+        request = self._request(matcher_name, cpus, memory_mb)
+        started = time.perf_counter()
+        with span("matcher_pool.wait", "wait", matcher=matcher_name):
+            with self._changed:
+                self._waiting.append(request)
+                try:
+                    self._changed.wait_for(lambda: self._admissible(request))
+                finally:
+                    position = self._waiting.index(request)
+                    self._waiting.remove(request)
+                for earlier in self._waiting[:position]:
+                    earlier.bypassed += 1
+                waited = time.perf_counter() - started
+                self._active += 1
+                self._cpus_used += request.cpus
+                self._memory_used += request.memory_mb
+                self._peak = max(self._peak, self._active)
+                self._peak_cpus = max(self._peak_cpus, self._cpus_used)
+                self._peak_memory = max(self._peak_memory, self._memory_used)
+                self._runs[matcher_name] = self._runs.get(matcher_name, 0) + 1
+                self._wait_seconds += waited
+        annotate(pool_wait_seconds=waited)
+        try:
+            yield
+        finally:
+            with self._changed:
+                self._active -= 1
+                self._cpus_used -= request.cpus
+                self._memory_used -= request.memory_mb
+                self._changed.notify_all()
+
+    def stats(self) -> Dict[str, object]:
+        """Return pool statistics.
+
+        Returns:
+            Dictionary with the pool size and capacity, runs per matcher,
+            peak concurrency and reserved resources, runs queued, and total
+            time spent waiting for a slot
+        """
+        with self._lock:
+            return {
+                "max_concurrent": self.max_concurrent,
+                "cpus": self.cpus,
+                "memory_mb": self.memory_mb,
+                "active": self._active,
+                "queued": len(self._waiting),
+                "peak_concurrent": self._peak,
+                "peak_cpus": self._peak_cpus,
+                "peak_memory_mb": self._peak_memory,
+                "runs": dict(self._runs),
+                "wait_seconds": self._wait_seconds,
+            }
+
+
+_default_pool: Optional[MatcherPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def default_matcher_pool() -> MatcherPool:
+    """Return the process-wide matcher pool, creating it on first use."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = MatcherPool()
+        return _default_pool
+
+
+def configure_matcher_pool(
+    max_concurrent: Optional[int] = None,
+    cpus: Optional[float] = None,
+    memory_mb: Optional[int] = None,
+) -> MatcherPool:
+    """Replace the process-wide matcher pool.
+
+    Runs already holding a slot in the previous pool are unaffected.
+
+    Args:
+        max_concurrent: Maximum matcher runs in flight
+        cpus: CPUs available to matcher containers (default: the host's)
+        memory_mb: Memory available to matcher containers (default: the host's)
+
+    Returns:
+        The new default pool
+    """
+    global _default_pool
+    pool = MatcherPool(max_concurrent, cpus=cpus, memory_mb=memory_mb)
+    with _default_pool_lock:
+        _default_pool = pool
+    LOGGER.info("Matcher pool configured with %d slots", pool.max_concurrent)
+    return pool
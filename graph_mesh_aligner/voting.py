@@ -8,6 +8,7 @@ from enum import Enum
 from typing import Dict, List
 
 from graph_mesh_aligner.fusion import FusedMapping
+from graph_mesh_core.tracing import traced
 
 LOGGER = logging.getLogger(__name__)
 
@@ -192,6 +193,7 @@ def apply_threshold_voting(
     return accepted
 
 
+@traced("voting", "fusion")
 def vote(
     fused_mappings: List[FusedMapping],
     config: VotingConfig,
@@ -0,0 +1,423 @@
+"""Long-lived matcher containers that alignment jobs are executed in.
+
+Starting a matcher with ``containers.run`` creates a container for every
+source and target pair, so each alignment pays container creation and
+start-up before the matcher does any work. A :class:`WarmContainerPool`
+keeps matcher containers running between alignments instead: a container
+is started once per image and resource limits with a keep-alive command,
+and each alignment is executed inside it with ``exec`` using the image's
+entrypoint.
+
+A running container cannot gain bind mounts, so every container mounts the
+pool's staging directory at ``/data/jobs``. An alignment gets its own job
+directory there holding the source and target (hard links where possible)
+and an output directory; the mapping is moved to the caller's output
+directory once the matcher exits.
+
+A container runs one alignment at a time. Containers idle for longer than
+their matcher's ``warm_idle_seconds``, or that have run ``max_jobs``
+alignments, are stopped and removed, as is a container whose alignment
+failed. All pipelines in a process share the pool returned by
+:func:`default_warm_pool`, which stops its containers at interpreter exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
+
+from graph_mesh_core.docker_session import default_docker_session
+from graph_mesh_core.lazy import LazyModule
+from graph_mesh_core.telemetry import annotate
+from graph_mesh_core.tracing import span
+
+if TYPE_CHECKING:
+    from .matchers import ContainerMatcher
+
+LOGGER = logging.getLogger(__name__)
+
+docker = LazyModule("docker")
+
+# Command keeping an idle matcher container alive (available in Alpine and Debian images)
+KEEPALIVE_COMMAND = ["tail", "-f", "/dev/null"]
+
+# Label on warm containers, so ones left behind by a killed process can be found
+WARM_LABEL = "graph-mesh.warm"
+
+JOBS_MOUNT = "/data/jobs"
+
+
+@dataclass
+class _WarmContainer:
+    """A running matcher container and its usage."""
+
+    key: Tuple[str, Tuple[Tuple[str, Any], ...]]
+    container: Any
+    idle_seconds: float
+    jobs: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class WarmContainerPool:
+    """Pool of running matcher containers reused across alignments.
+
+    Example:
+        >>> pool = WarmContainerPool(max_jobs=50)
+        >>> logs = pool.run(matcher, source, target, output_dir)
+        >>> pool.close()
+    """
+
+    def __init__(
+        self,
+        client: Optional[docker.DockerClient] = None,
+        staging_dir: Optional[Path] = None,
+        max_jobs: int = 100,
+        reap_interval: float = 30.0,
+    ) -> None:
+        """Initialize pool.
+
+        Args:
+            client: Docker client to start containers with (default: the
+                process-wide Docker session's)
+            staging_dir: Host directory mounted into every container for job
+                inputs and outputs (default: a temporary directory)
+            max_jobs: Alignments a container runs before it is replaced
+            reap_interval: Seconds between checks for idle containers
+
+        Raises:
+            ValueError: If max_jobs is less than 1
+        """
+        if max_jobs < 1:
+            raise ValueError("max_jobs must be at least 1")
+        self.max_jobs = max_jobs
+        self.reap_interval = reap_interval
+        self._client = client
+        self._staging_dir = Path(staging_dir).resolve() if staging_dir else None
+        self._owns_staging_dir = staging_dir is None
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], List[_WarmContainer]] = {}
+        self._busy: Dict[str, _WarmContainer] = {}
+        self._entrypoints: Dict[str, List[str]] = {}
+        self._started = 0
+        self._reused = 0
+        self._recycled = 0
+        self._closed = False
+        self._stop = threading.Event()
+        self._reaper: Optional[threading.Thread] = None
+
+    @property
+    def client(self) -> docker.DockerClient:
+        """Docker client the pool's containers are managed with."""
+        return self._client if self._client is not None else default_docker_session().client
+
+    @property
+    def staging_dir(self) -> Path:
+        """Host directory holding job inputs and outputs."""
+        with self._lock:
+            if self._staging_dir is None:
+                self._staging_dir = Path(tempfile.mkdtemp(prefix="graph-mesh-warm-")).resolve()
+            self._staging_dir.mkdir(parents=True, exist_ok=True)
+            return self._staging_dir
+
+    def run(
+        self,
+        matcher: ContainerMatcher,
+        resolved_source: Path,
+        resolved_target: Path,
+        output_dir: Path,
+    ) -> bytes:
+        """Run one alignment in a warm container and return the matcher's output.
+
+        Args:
+            matcher: Matcher whose image runs the alignment
+            resolved_source: Absolute path of the source ontology
+            resolved_target: Absolute path of the target ontology
+            output_dir: Directory the mapping file is moved to
+
+        Returns:
+            Combined stdout and stderr of the matcher
+
+        Raises:
+            RuntimeError: If the matcher exits with a non-zero status
+            TimeoutError: If the matcher runs longer than its timeout
+            docker.errors.DockerException: If the container cannot be started
+        """
+        job_id = uuid.uuid4().hex[:12]
+        job_dir = self.staging_dir / job_id
+        (job_dir / "output").mkdir(parents=True)
+        try:
+            _stage(resolved_source, job_dir / "source.owl")
+            _stage(resolved_target, job_dir / "target.owl")
+            command = self._entrypoint(matcher.image) + [
+                "--source",
+                f"{JOBS_MOUNT}/{job_id}/source.owl",
+                "--target",
+                f"{JOBS_MOUNT}/{job_id}/target.owl",
+                "--output",
+                f"{JOBS_MOUNT}/{job_id}/output/{matcher.output_filename}",
+            ]
+            output = self._exec(matcher, command, job_id)
+
+            produced = job_dir / "output" / matcher.output_filename
+            if produced.exists():
+                shutil.move(str(produced), str(output_dir / matcher.output_filename))
+            return output
+        finally:
+            shutil.rmtree(job_dir, ignore_errors=True)
+
+    def run_batch(
+        self,
+        matcher: ContainerMatcher,
+        resolved_sources: Mapping[str, Path],
+        resolved_target: Path,
+        output_dirs: Mapping[str, Path],
+    ) -> bytes:
+        """Align several sources to one target in a single matcher execution.
+
+        The matcher is given the target once followed by one ``--source`` and
+        ``--output`` pair per source (see :meth:`ContainerMatcher.align_batch`).
+
+        Args:
+            matcher: Matcher whose image runs the alignment
+            resolved_sources: Absolute path of each source ontology, by source ID
+            resolved_target: Absolute path of the target ontology
+            output_dirs: Directory each source's mapping file is moved to
+
+        Returns:
+            Combined stdout and stderr of the matcher
+
+        Raises:
+            RuntimeError: If the matcher exits with a non-zero status
+            TimeoutError: If the matcher runs longer than its timeout
+            docker.errors.DockerException: If the container cannot be started
+        """
+        job_id = uuid.uuid4().hex[:12]
+        job_dir = self.staging_dir / job_id
+        (job_dir / "sources").mkdir(parents=True)
+        try:
+            _stage(resolved_target, job_dir / "target.owl")
+            command = self._entrypoint(matcher.image) + ["--target", f"{JOBS_MOUNT}/{job_id}/target.owl"]
+            slots = {}
+            for index, (source_id, source) in enumerate(resolved_sources.items()):
+                _stage(source, job_dir / "sources" / f"{index}.owl")
+                (job_dir / "output" / str(index)).mkdir(parents=True)
+                slots[source_id] = index
+                command += [
+                    "--source",
+                    f"{JOBS_MOUNT}/{job_id}/sources/{index}.owl",
+                    "--output",
+                    f"{JOBS_MOUNT}/{job_id}/output/{index}/{matcher.output_filename}",
+                ]
+            output = self._exec(matcher, command, job_id)
+
+            for source_id, index in slots.items():
+                produced = job_dir / "output" / str(index) / matcher.output_filename
+                if produced.exists():
+                    shutil.move(str(produced), str(Path(output_dirs[source_id]) / matcher.output_filename))
+            return output
+        finally:
+            shutil.rmtree(job_dir, ignore_errors=True)
+
+    def _exec(self, matcher: ContainerMatcher, command: List[str], job_id: str) -> bytes:
+        """Execute a matcher command in a warm container and return its output.
+
+        The command gets ``matcher.timeout`` seconds. A job still running then
+        has its container killed, which frees the slot, and raises
+        TimeoutError.
+        """
+        warm = self._acquire(matcher)
+        healthy = False
+        try:
+            with span("container.exec", "container", image=matcher.image, job=job_id, reused=warm.jobs > 0):
+                result = self._exec_with_deadline(warm, command, matcher.timeout)
+            if result is None:
+                raise TimeoutError(f"{matcher.name} timed out after {matcher.timeout}s in warm container")
+            annotate(warm_container=True, container_reused=warm.jobs > 0)
+            if result.exit_code != 0:
+                output = result.output.decode("utf-8", "replace") if result.output else ""
+                raise RuntimeError(
+                    f"{matcher.name} exited with status {result.exit_code} in warm container: {output.strip()}"
+                )
+            healthy = True
+        finally:
+            self._release(warm, matcher, healthy)
+        return result.output
+
+    @staticmethod
+    def _exec_with_deadline(warm: _WarmContainer, command: List[str], timeout: float) -> Any:
+        """Run ``exec_run`` in a helper thread, returning its result or None on timeout.
+
+        docker-py's exec has no time limit of its own; the thread is left to
+        finish once the container is killed.
+        """
+        outcome: Dict[str, Any] = {}
+
+        def run() -> None:
+            try:
+                outcome["result"] = warm.container.exec_run(command)
+            except BaseException as exc:  # re-raised in the calling thread
+                outcome["error"] = exc
+
+        thread = threading.Thread(target=run, name=f"warm-exec-{warm.container.id}", daemon=True)
+        thread.start()
+        thread.join(timeout)
+        if thread.is_alive():
+            return None
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["result"]
+
+    def _entrypoint(self, image: str) -> List[str]:
+        """Return the image's entrypoint, which the keep-alive command replaces."""
+        with self._lock:
+            cached = self._entrypoints.get(image)
+        if cached is not None:
+            return list(cached)
+        config = self.client.images.get(image).attrs.get("Config") or {}
+        entrypoint = list(config.get("Entrypoint") or config.get("Cmd") or [])
+        if not entrypoint:
+            raise RuntimeError(f"Image {image} has no entrypoint to run the matcher with")
+        with self._lock:
+            self._entrypoints[image] = entrypoint
+        return list(entrypoint)
+
+    def _acquire(self, matcher: ContainerMatcher) -> _WarmContainer:
+        """Take an idle container for the matcher, starting one if there is none."""
+        key = (matcher.image, tuple(sorted(matcher.resource_limits().items())))
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Warm container pool is closed")
+            idle = self._idle.get(key)
+            if idle:
+                warm = idle.pop()
+                self._busy[warm.container.id] = warm
+                self._reused += 1
+                return warm
+
+        name = f"graph-mesh-warm-{matcher.name.lower()}-{uuid.uuid4().hex[:12]}"
+        with span("container.start", "container", image=matcher.image, **matcher.resource_limits()):
+            container = self.client.containers.run(
+                image=matcher.image,
+                entrypoint=KEEPALIVE_COMMAND,
+                volumes={str(self.staging_dir): {"bind": JOBS_MOUNT, "mode": "rw"}},
+                name=name,
+                labels={WARM_LABEL: "1"},
+                auto_remove=True,
+                detach=True,
+                **matcher.resource_limits(),
+            )
+        LOGGER.info(f"Started warm {matcher.name} container {name}")
+        warm = _WarmContainer(key=key, container=container, idle_seconds=matcher.warm_idle_seconds)
+        with self._lock:
+            self._busy[container.id] = warm
+            self._started += 1
+            if self._reaper is None:
+                self._reaper = threading.Thread(target=self._reap_loop, name="warm-container-reaper", daemon=True)
+                self._reaper.start()
+        return warm
+
+    def _release(self, warm: _WarmContainer, matcher: ContainerMatcher, healthy: bool) -> None:
+        """Return a container to the idle list, or retire it."""
+        with self._lock:
+            self._busy.pop(warm.container.id, None)
+            warm.jobs += 1
+            warm.last_used = time.monotonic()
+            warm.idle_seconds = matcher.warm_idle_seconds
+            retire = self._closed or not healthy or warm.jobs >= self.max_jobs
+            if not retire:
+                self._idle.setdefault(warm.key, []).append(warm)
+                return
+            self._recycled += 1
+        self._remove(warm)
+
+    def reap_idle(self) -> int:
+        """Stop containers idle for longer than their matcher's idle timeout.
+
+        Returns:
+            Number of containers stopped
+        """
+        now = time.monotonic()
+        expired: List[_WarmContainer] = []
+        with self._lock:
+            for key, idle in self._idle.items():
+                keep = [w for w in idle if now - w.last_used < w.idle_seconds]
+                expired.extend(w for w in idle if now - w.last_used >= w.idle_seconds)
+                self._idle[key] = keep
+            self._recycled += len(expired)
+        for warm in expired:
+            self._remove(warm)
+        return len(expired)
+
+    def _reap_loop(self) -> None:
+        while not self._stop.wait(self.reap_interval):
+            try:
+                self.reap_idle()
+            except Exception as exc:  # noqa: BLE001 - keep reaping
+                LOGGER.warning(f"Reaping idle matcher containers failed: {exc}")
+
+    def _remove(self, warm: _WarmContainer) -> None:
+        """Kill a container; it was started with auto_remove, so Docker deletes it."""
+        try:
+            warm.container.kill()
+        except Exception as exc:  # noqa: BLE001 - the container may already be gone
+            LOGGER.debug(f"Removing warm container {warm.container.id} failed: {exc}")
+
+    def stats(self) -> Dict[str, object]:
+        """Return pool statistics.
+
+        Returns:
+            Dictionary with containers started, alignments served by an
+            already running container, containers recycled, and containers
+            currently idle and busy
+        """
+        with self._lock:
+            return {
+                "started": self._started,
+                "reused": self._reused,
+                "recycled": self._recycled,
+                "idle": sum(len(idle) for idle in self._idle.values()),
+                "busy": len(self._busy),
+            }
+
+    def close(self) -> None:
+        """Stop all idle containers; busy ones are stopped when their alignment ends."""
+        with self._lock:
+            self._closed = True
+            idle = [w for containers in self._idle.values() for w in containers]
+            self._idle.clear()
+        self._stop.set()
+        for warm in idle:
+            self._remove(warm)
+        if self._owns_staging_dir and self._staging_dir is not None and not self._busy:
+            shutil.rmtree(self._staging_dir, ignore_errors=True)
+
+
+def _stage(path: Path, staged: Path) -> None:
+    """Place an input file in a job directory, hard-linking when possible."""
+    try:
+        os.link(path, staged)
+    except OSError:
+        shutil.copy2(path, staged)
+
+
+_default_pool: Optional[WarmContainerPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def default_warm_pool() -> WarmContainerPool:
+    """Return the process-wide warm container pool, creating it on first use."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = WarmContainerPool()
+            atexit.register(_default_pool.close)
+        return _default_pool
@@ -1,35 +1,28 @@
-"""Graph-Mesh core meta-ontology utilities."""
+"""Graph-Mesh core meta-ontology utilities.
 
-# Backward compatibility exports
-from .meta_ontology import (
-    GM,
-    META_CLASSES,
-    META_DATA_PROPERTIES,
-    META_OBJECT_PROPERTIES,
-    MetaClass,
-    MetaProperty,
-    add_domain_classes,
-    build_meta_graph,
-    serialize_meta_graph,
-)
+Public names are imported on first access (see :mod:`graph_mesh_core.lazy`),
+so ``import graph_mesh_core`` does not load rdflib or any provider.
+"""
 
-# New pluggable architecture exports
-from .meta_ontology_base import MetaOntologyInfo, MetaOntologyProvider
-from .meta_ontology_registry import MetaOntologyRegistry
+from graph_mesh_core.lazy import lazy_exports
 
-__all__ = [
+_EXPORTS = {
     # Backward compatibility (generic ontology)
-    "GM",
-    "META_CLASSES",
-    "META_DATA_PROPERTIES",
-    "META_OBJECT_PROPERTIES",
-    "MetaClass",
-    "MetaProperty",
-    "add_domain_classes",
-    "build_meta_graph",
-    "serialize_meta_graph",
+    "GM": ".meta_ontology",
+    "META_CLASSES": ".meta_ontology",
+    "META_DATA_PROPERTIES": ".meta_ontology",
+    "META_OBJECT_PROPERTIES": ".meta_ontology",
+    "MetaClass": ".meta_ontology",
+    "MetaProperty": ".meta_ontology",
+    "add_domain_classes": ".meta_ontology",
+    "build_meta_graph": ".meta_ontology",
+    "serialize_meta_graph": ".meta_ontology",
     # Pluggable architecture
-    "MetaOntologyProvider",
-    "MetaOntologyInfo",
-    "MetaOntologyRegistry",
-]
+    "MetaOntologyProvider": ".meta_ontology_base",
+    "MetaOntologyInfo": ".meta_ontology_base",
+    "MetaOntologyRegistry": ".meta_ontology_registry",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
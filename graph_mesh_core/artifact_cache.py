@@ -0,0 +1,263 @@
+"""Content-addressed artifact cache shared across pipeline runs.
+
+Artifacts (converted OWL files, serialized meta-ontologies, SSSOM mappings)
+are stored under a key derived from everything that determines their content:
+the bytes of the inputs, the tool that produced them, its version and its
+options. Because the key never depends on the working directory or the
+manifest, a fresh workdir or a different manifest that processes the same
+inputs reuses the stored artifacts.
+
+Layout::
+
+    <root>/objects/<key[:2]>/<key>/
+        entry.json          # metadata: key, files, creation time, extras
+        <file name>         # one file per stored artifact
+
+Entries are written to a temporary directory and renamed into place, so a
+reader never observes a partially written entry. Producers that may run
+concurrently in one process (e.g., several manifests of a batch converting the
+same source) hold :meth:`ArtifactCache.lock` for the key while they check,
+compute and store, so the artifact is computed once and the others hit it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+LOGGER = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "GRAPH_MESH_CACHE_DIR"
+
+_ENTRY_FILE = "entry.json"
+_CHUNK_SIZE = 1024 * 1024
+
+# (resolved path, size, mtime_ns) -> sha256 hex digest
+_file_digests: Dict[Tuple[str, int, int], str] = {}
+_file_digests_lock = threading.Lock()
+
+# (cache root, key) -> [lock, holders + waiters]
+_key_locks: Dict[Tuple[str, str], List[Any]] = {}
+_key_locks_lock = threading.Lock()
+
+
+def hash_file(path: Union[str, Path]) -> str:
+    """Return the SHA-256 digest of a file's contents.
+
+    Digests are memoized per process on (path, size, mtime), so repeated
+    lookups of unchanged files do not re-read them.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest string
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    memo_key = (str(resolved), stat.st_size, stat.st_mtime_ns)
+
+    with _file_digests_lock:
+        cached = _file_digests.get(memo_key)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha256()
+    with open(resolved, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    result = digest.hexdigest()
+
+    with _file_digests_lock:
+        _file_digests[memo_key] = result
+    return result
+
+
+def hash_paths(paths: Union[str, Path, Iterable[Union[str, Path]]]) -> str:
+    """Return a combined digest for one or more files, in the given order.
+
+    Args:
+        paths: A single path or an iterable of paths
+
+    Returns:
+        Hex digest string
+    """
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(hash_file(path).encode("ascii"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def cache_key(namespace: str, *parts: Any) -> str:
+    """Derive a cache key from a namespace and JSON-serializable parts.
+
+    Args:
+        namespace: Kind of artifact (e.g., 'ingest', 'alignment')
+        *parts: Values that determine the artifact's content
+
+    Returns:
+        Hex digest string
+    """
+    payload = json.dumps([namespace, *parts], sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def default_cache_dir() -> Optional[Path]:
+    """Return the cache directory configured via ``GRAPH_MESH_CACHE_DIR``, if any."""
+    value = os.environ.get(CACHE_DIR_ENV)
+    return Path(value).expanduser() if value else None
+
+
+class ArtifactCache:
+    """Content-addressed store for pipeline artifacts.
+
+    Example:
+        >>> cache = ArtifactCache(Path("~/.cache/graph-mesh").expanduser())
+        >>> key = cache_key("ingest", "xsd", {}, hash_paths("schema.xsd"))
+        >>> if not cache.restore(key, {"output.owl": out_path}):
+        ...     convert(...)
+        ...     cache.store(key, {"output.owl": out_path})
+    """
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        """Initialize cache.
+
+        Args:
+            root: Cache root directory (created if missing)
+        """
+        self.root = Path(root).expanduser().resolve()
+        (self.root / "objects").mkdir(parents=True, exist_ok=True)
+        (self.root / "tmp").mkdir(parents=True, exist_ok=True)
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / "objects" / key[:2] / key
+
+    def contains(self, key: str) -> bool:
+        """Check whether a complete entry exists for a key."""
+        return (self._entry_dir(key) / _ENTRY_FILE).exists()
+
+    def entry_path(self, key: str, name: str) -> Optional[Path]:
+        """Return the stored path of one entry file, or None on a miss.
+
+        The file belongs to the cache and must not be modified; use
+        :meth:`restore` to obtain a working copy.
+        """
+        path = self._entry_dir(key) / name
+        return path if self.contains(key) and path.exists() else None
+
+    def metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the metadata stored with an entry, or None on a miss."""
+        entry_file = self._entry_dir(key) / _ENTRY_FILE
+        try:
+            return json.loads(entry_file.read_text())
+        except (OSError, ValueError):
+            return None
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Serialize producers of one key within this process.
+
+        The lock is shared by all ArtifactCache instances with the same root.
+
+        Args:
+            key: Cache key
+        """
+        lock_id = (str(self.root), key)
+        with _key_locks_lock:
+            entry = _key_locks.setdefault(lock_id, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with _key_locks_lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del _key_locks[lock_id]
+
+    def store(
+        self,
+        key: str,
+        files: Mapping[str, Union[str, Path]],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Path:
+        """Store artifact files under a key.
+
+        If another writer stored the same key first, the existing entry is kept.
+
+        Args:
+            key: Cache key
+            files: Mapping of entry file name to source path
+            metadata: Optional extra metadata stored with the entry
+
+        Returns:
+            Path to the entry directory
+        """
+        entry_dir = self._entry_dir(key)
+        if self.contains(key):
+            return entry_dir
+
+        staging = Path(tempfile.mkdtemp(prefix=f"{key[:12]}-", dir=self.root / "tmp"))
+        try:
+            for name, source in files.items():
+                shutil.copy2(source, staging / name)
+            entry = {
+                "key": key,
+                "files": sorted(files),
+                "created": time.time(),
+                "metadata": metadata or {},
+            }
+            (staging / _ENTRY_FILE).write_text(json.dumps(entry, indent=2, default=str))
+
+            entry_dir.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.rename(staging, entry_dir)
+            except OSError:
+                # Lost a race with a concurrent writer; their entry is equivalent.
+                if not self.contains(key):
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        LOGGER.debug("Stored cache entry %s (%d files)", key[:12], len(files))
+        return entry_dir
+
+    def restore(self, key: str, destinations: Mapping[str, Union[str, Path]]) -> bool:
+        """Materialize stored files at the given destinations.
+
+        Files are copied rather than linked: converters and serializers
+        truncate their output paths in place, which would otherwise rewrite
+        the cached copy too.
+
+        Args:
+            key: Cache key
+            destinations: Mapping of entry file name to destination path
+
+        Returns:
+            True on a hit (all files restored), False on a miss
+        """
+        entry_dir = self._entry_dir(key)
+        if not self.contains(key):
+            return False
+        if not all((entry_dir / name).exists() for name in destinations):
+            return False
+
+        for name, destination in destinations.items():
+            destination = Path(destination)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(entry_dir / name, destination)
+
+        LOGGER.debug("Restored cache entry %s", key[:12])
+        return True
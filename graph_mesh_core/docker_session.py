@@ -0,0 +1,285 @@
+"""Process-wide Docker client with cached image health.
+
+Matchers, the warm container pool, the Ontmalizer converter and the
+preflight checks all need the Docker daemon. Connecting for every call and
+asking the daemon whether an image exists before every container run adds a
+round trip (or, when shelling out to the ``docker`` CLI, a process) to each
+alignment and conversion. A :class:`DockerSession` keeps one client, whose
+connection pool is shared by all threads of the process, and remembers each
+image's status for ``ttl_seconds``.
+
+:meth:`DockerSession.prepare_images` checks, and optionally pulls, a set of
+images concurrently in the background. The pipeline calls it when a run
+starts so that images are ready by the time the first matcher needs one; a
+status lookup for an image that is still being prepared waits for it instead
+of reporting the image as missing.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Optional
+
+from graph_mesh_core.lazy import LazyModule
+from graph_mesh_core.tracing import span
+
+LOGGER = logging.getLogger(__name__)
+
+docker = LazyModule("docker")
+
+# Seconds an image status is trusted before the daemon is asked again
+DEFAULT_TTL_SECONDS = 300.0
+
+
+@dataclass
+class ImageStatus:
+    """Whether an image is present locally, and its ID.
+
+    ``not_found`` tells a daemon that answered without the image apart from
+    one that could not be asked.
+    """
+
+    image: str
+    available: bool
+    image_id: Optional[str] = None
+    error: Optional[str] = None
+    not_found: bool = False
+    pulled: bool = False
+    checked_at: float = field(default_factory=time.monotonic)
+
+
+class DockerSession:
+    """Shared Docker client and image status cache.
+
+    Example:
+        >>> session = DockerSession(ttl_seconds=60)
+        >>> session.prepare_images(["graph-mesh/logmap:latest"], pull=True)
+        >>> session.image_available("graph-mesh/logmap:latest")
+        True
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_pool_size: int = 16,
+        max_workers: int = 4,
+        client_factory: Optional[Callable[[], docker.DockerClient]] = None,
+    ) -> None:
+        """Initialize session.
+
+        Args:
+            ttl_seconds: Seconds an image status is cached
+            max_pool_size: HTTP connections the client keeps to the daemon
+            max_workers: Images checked or pulled at the same time
+            client_factory: Creates the client (default: ``docker.from_env``)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_pool_size = max_pool_size
+        self.max_workers = max_workers
+        self._client_factory = client_factory
+        self._client: Optional[docker.DockerClient] = None
+        # Reentrant: a done callback runs inline when its future has already finished
+        self._lock = threading.RLock()
+        self._statuses: Dict[str, ImageStatus] = {}
+        self._pending: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._connects = 0
+        self._lookups = 0
+        self._hits = 0
+
+    @property
+    def client(self) -> docker.DockerClient:
+        """The shared client, connected on first use."""
+        with self._lock:
+            if self._client is None:
+                with span("docker.connect", "container"):
+                    if self._client_factory is not None:
+                        self._client = self._client_factory()
+                    else:
+                        self._client = docker.from_env(max_pool_size=self.max_pool_size)
+                self._connects += 1
+            return self._client
+
+    def ping(self) -> None:
+        """Check that the daemon answers.
+
+        Raises:
+            docker.errors.DockerException: If the daemon cannot be reached
+        """
+        self.client.ping()
+
+    def image_status(self, image: str, refresh: bool = False) -> ImageStatus:
+        """Return an image's status, from the cache while it is fresh.
+
+        Waits for the image if :meth:`prepare_images` is still checking or
+        pulling it.
+
+        Args:
+            image: Image reference
+            refresh: Ask the daemon even if a fresh status is cached
+        """
+        with self._lock:
+            self._lookups += 1
+            pending = self._pending.get(image)
+        if pending is not None:
+            return pending.result()
+        with self._lock:
+            cached = self._statuses.get(image)
+            if not refresh and cached is not None and time.monotonic() - cached.checked_at < self.ttl_seconds:
+                self._hits += 1
+                return cached
+        return self._check(image, pull=False)
+
+    def image_available(self, image: str) -> bool:
+        """Return whether an image is present locally."""
+        return self.image_status(image).available
+
+    def prepare_images(self, images: Iterable[str], pull: bool = False) -> Dict[str, Future]:
+        """Check, and optionally pull, images concurrently in the background.
+
+        Args:
+            images: Image references
+            pull: Pull images that are not present locally
+
+        Returns:
+            Future of each image's status
+        """
+        futures: Dict[str, Future] = {}
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="docker-images")
+            for image in dict.fromkeys(images):
+                future = self._pending.get(image)
+                if future is None:
+                    future = self._executor.submit(self._check, image, pull)
+                    self._pending[image] = future
+                    future.add_done_callback(lambda _, image=image: self._done(image))
+                futures[image] = future
+        return futures
+
+    def ensure_images(self, images: Iterable[str], pull: bool = False) -> Dict[str, ImageStatus]:
+        """Check, and optionally pull, images concurrently and wait for the result.
+
+        Args:
+            images: Image references
+            pull: Pull images that are not present locally
+
+        Returns:
+            Status of each image
+        """
+        return {image: future.result() for image, future in self.prepare_images(images, pull).items()}
+
+    def _done(self, image: str) -> None:
+        with self._lock:
+            self._pending.pop(image, None)
+
+    def _check(self, image: str, pull: bool) -> ImageStatus:
+        """Ask the daemon for an image, pulling it if requested, and cache the result."""
+        from docker.errors import DockerException, ImageNotFound
+
+        pulled = False
+        try:
+            with span("docker.image_check", "container", image=image):
+                try:
+                    found = self.client.images.get(image)
+                except ImageNotFound:
+                    if not pull:
+                        raise
+                    LOGGER.info(f"Pulling image {image}")
+                    with span("docker.image_pull", "container", image=image):
+                        found = self.client.images.pull(image)
+                    pulled = True
+            status = ImageStatus(image, available=True, image_id=getattr(found, "id", None), pulled=pulled)
+        except ImageNotFound:
+            status = ImageStatus(image, available=False, error="image not found", not_found=True)
+        except DockerException as exc:
+            status = ImageStatus(image, available=False, error=str(exc))
+        with self._lock:
+            self._statuses[image] = status
+        if not status.available:
+            LOGGER.warning(f"Image {image} is not available: {status.error}")
+        return status
+
+    def invalidate(self, image: Optional[str] = None) -> None:
+        """Forget the cached status of one image, or of all images."""
+        with self._lock:
+            if image is None:
+                self._statuses.clear()
+            else:
+                self._statuses.pop(image, None)
+
+    def stats(self) -> Dict[str, object]:
+        """Return session statistics.
+
+        Returns:
+            Dictionary with connections made, image status lookups, lookups
+            answered from the cache, and images cached or being prepared
+        """
+        with self._lock:
+            return {
+                "connects": self._connects,
+                "lookups": self._lookups,
+                "cache_hits": self._hits,
+                "cached_images": len(self._statuses),
+                "pending_images": len(self._pending),
+            }
+
+    def close(self) -> None:
+        """Close the client; the next use connects again."""
+        with self._lock:
+            client, self._client = self._client, None
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if client is not None:
+            try:
+                client.close()
+            except Exception:  # noqa: BLE001
+                pass
+
+
+_default_session: Optional[DockerSession] = None
+_default_session_lock = threading.Lock()
+
+
+def default_docker_session() -> DockerSession:
+    """Return the process-wide Docker session, creating it on first use."""
+    global _default_session
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = DockerSession()
+            atexit.register(_default_session.close)
+        return _default_session
+
+
+def configure_docker_session(
+    ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    max_pool_size: int = 16,
+    max_workers: int = 4,
+    client_factory: Optional[Callable[[], docker.DockerClient]] = None,
+) -> DockerSession:
+    """Replace the process-wide Docker session, closing the previous one.
+
+    Args:
+        ttl_seconds: Seconds an image status is cached
+        max_pool_size: HTTP connections the client keeps to the daemon
+        max_workers: Images checked or pulled at the same time
+        client_factory: Creates the client (default: ``docker.from_env``)
+
+    Returns:
+        The new default session
+    """
+    global _default_session
+    session = DockerSession(ttl_seconds, max_pool_size, max_workers, client_factory)
+    atexit.register(session.close)
+    with _default_session_lock:
+        previous, _default_session = _default_session, session
+    if previous is not None:
+        previous.close()
+    return session
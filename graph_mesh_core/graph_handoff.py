@@ -0,0 +1,240 @@
+"""In-process handoff of converted graphs from ingest to fusion.
+
+Converters build an rdflib graph, serialize it to RDF/XML, and fusion parses
+the file straight back. In a run that converts in its own process that
+round trip is wasted work, and RDF/XML parsing is among the most expensive
+steps of a run. With a :class:`GraphHandoff` active, :func:`write_graph`
+(behind :meth:`~graph_mesh_ingest.converter_base.BaseConverter.serialize_graph`)
+registers the graph under its output path and writes the file on a
+background thread instead; :func:`load_graph` and :func:`take_graph` then
+return that graph object rather than parsing the file.
+
+The files are still written, because matchers run in containers that read
+them and the artifact cache stores them. Anything that needs the file calls
+:func:`wait_for_file` first. A graph is handed out once: :func:`take_graph`
+removes it from the handoff, so its memory is released by the consumer.
+Files are written to a temporary name and renamed, so a crash never leaves a
+truncated converted ontology behind.
+
+The handoff is held in a context variable, like the memory budget, and is
+never active in ingest worker processes, which keep writing files
+synchronously. Every handed-off graph stays in memory until fusion takes
+it, so the pipeline does not activate a handoff for runs with a memory
+budget or streaming fusion.
+
+Example:
+    >>> with GraphHandoff().activate():
+    ...     convert_jsonschema_to_owl("users.json", "users.owl")   # returns before the file is written
+    ...     graph = load_graph("users.owl")                         # no parse
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+from rdflib import Graph
+
+from graph_mesh_core.graph_store import new_graph
+from graph_mesh_core.tracing import span
+
+LOGGER = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+_active_handoff: contextvars.ContextVar[Optional["GraphHandoff"]] = contextvars.ContextVar(
+    "graph_mesh_graph_handoff", default=None
+)
+
+
+def _key(path: PathLike) -> str:
+    return str(Path(path).resolve())
+
+
+def _serialize(graph: Graph, path: Path, format: str) -> None:
+    """Serialize ``graph`` to ``path`` atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".partial")
+    with span("serialize", "converter", format=format, triples=len(graph)):
+        graph.serialize(destination=str(partial), format=format)
+    os.replace(partial, path)
+
+
+class GraphHandoff:
+    """Graphs handed from converters to fusion, written to disk in the background.
+
+    Example:
+        >>> with GraphHandoff().activate() as handoff:
+        ...     run_ingest(sources, fetched, workdir)
+        ...     fuse_graphs(converted.values(), meta_graph, merged_path)
+        ...     handoff.flush()
+    """
+
+    def __init__(self, max_writers: int = 1) -> None:
+        """Initialize handoff.
+
+        Args:
+            max_writers: Threads serializing graphs to their files
+        """
+        self._lock = threading.Lock()
+        self._graphs: Dict[str, Graph] = {}
+        self._writes: Dict[str, Future] = {}
+        self._writer = ThreadPoolExecutor(max_workers=max_writers, thread_name_prefix="graph-writer")
+        self.published = 0
+        self.taken = 0
+
+    @contextmanager
+    def activate(self) -> Iterator["GraphHandoff"]:
+        """Make converters in the current context hand their graphs to this handoff.
+
+        Leaving the block waits for pending writes and releases graphs that
+        were never taken.
+        """
+        token = _active_handoff.set(self)
+        try:
+            yield self
+        finally:
+            _active_handoff.reset(token)
+            self.close()
+
+    def publish(self, graph: Graph, path: PathLike, format: str = "xml") -> None:
+        """Register ``graph`` as the content of ``path`` and write it in the background.
+
+        The graph must not be modified afterwards; reading it is fine.
+
+        Args:
+            graph: Converted graph
+            path: File the graph is written to
+            format: RDF serialization format of the file
+        """
+        key = _key(path)
+        # Counting flushes a disk-backed store's pending inserts, so the writer
+        # and the publishing thread (which may still read the graph) only read
+        triples = len(graph)
+        # Spans of the write go to the publishing context
+        context = contextvars.copy_context()
+        with self._lock:
+            self._graphs[key] = graph
+            self._writes[key] = self._writer.submit(context.run, _serialize, graph, Path(key), format)
+            self.published += 1
+        LOGGER.debug("Handed off %s (%d triples)", key, triples)
+
+    def pending(self, path: PathLike) -> bool:
+        """Return True if ``path`` was published and may not be written yet."""
+        with self._lock:
+            return _key(path) in self._writes
+
+    def wait(self, path: PathLike) -> None:
+        """Block until ``path`` is written, if it was published.
+
+        Raises:
+            Exception: Whatever serializing the graph raised
+        """
+        with self._lock:
+            write = self._writes.get(_key(path))
+        if write is not None:
+            write.result()
+
+    def take(self, path: PathLike) -> Optional[Graph]:
+        """Remove and return the graph published for ``path``, if any.
+
+        Waits for its file to be written first, so the graph is never read
+        while it is being serialized: a caller taking a graph right after
+        conversion still pays for the background RDF/XML serialize.
+        """
+        key = _key(path)
+        self.wait(key)
+        with self._lock:
+            graph = self._graphs.pop(key, None)
+            if graph is not None:
+                self.taken += 1
+        return graph
+
+    def flush(self) -> None:
+        """Wait for every pending write.
+
+        Raises:
+            Exception: The first error raised while serializing a graph
+        """
+        with self._lock:
+            writes = list(self._writes.values())
+        for write in writes:
+            write.result()
+
+    def close(self) -> None:
+        """Wait for pending writes and release graphs that were never taken."""
+        self._writer.shutdown(wait=True)
+        with self._lock:
+            self._graphs.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many graphs were handed off and how many were taken."""
+        with self._lock:
+            return {"published": self.published, "taken": self.taken, "held": len(self._graphs)}
+
+
+def active_handoff() -> Optional[GraphHandoff]:
+    """Return the graph handoff active in the current context, if any."""
+    return _active_handoff.get()
+
+
+def write_graph(graph: Graph, path: PathLike, format: str = "xml") -> bool:
+    """Write ``graph`` to ``path``, through the active handoff if there is one.
+
+    Args:
+        graph: Graph to write (not to be modified afterwards)
+        path: Output file
+        format: RDF serialization format
+
+    Returns:
+        True if the graph was handed off and the file is written in the background
+    """
+    handoff = _active_handoff.get()
+    if handoff is None:
+        _serialize(graph, Path(path), format)
+        return False
+    handoff.publish(graph, path, format)
+    return True
+
+
+def wait_for_file(path: PathLike) -> None:
+    """Block until ``path`` exists on disk, if the active handoff is still writing it."""
+    handoff = _active_handoff.get()
+    if handoff is not None:
+        handoff.wait(path)
+
+
+def file_pending(path: PathLike) -> bool:
+    """Return True if the active handoff is responsible for writing ``path``."""
+    handoff = _active_handoff.get()
+    return handoff is not None and handoff.pending(path)
+
+
+def take_graph(path: PathLike) -> Optional[Graph]:
+    """Take the graph handed off for ``path``, or None if there is none."""
+    handoff = _active_handoff.get()
+    return handoff.take(path) if handoff is not None else None
+
+
+def load_graph(path: PathLike) -> Graph:
+    """Return the graph for ``path``, parsing the file only if it was not handed off.
+
+    The caller owns the returned graph either way.
+
+    Args:
+        path: RDF file
+
+    Returns:
+        The handed-off graph, or a new graph parsed from the file
+    """
+    graph = take_graph(path)
+    if graph is None:
+        graph = new_graph()
+        graph.parse(str(path))
+    return graph
@@ -0,0 +1,339 @@
+"""Memory-budgeted RDF graphs that spill to disk.
+
+rdflib's default store keeps every triple in nested dictionaries, roughly a
+kilobyte per triple, so one oversized source (e.g., every MISMO XSD in a
+single ``paths`` list) can exhaust the memory of the whole orchestrator.
+With a :class:`MemoryBudget` active, :func:`new_graph` returns graphs backed
+by a :class:`SpillingStore`: triples stay in rdflib's in-memory store until
+the graph grows past the budget, then move to a :class:`SQLiteStore` file
+under the budget's spill directory. The graph object stays the same, so
+converters, providers and fusion code keep using the ordinary rdflib API;
+only speed changes once a graph has spilled.
+
+Without an active budget, :func:`new_graph` returns a plain ``Graph()``.
+The budget is held in a context variable, like the active metrics recorder,
+so it reaches every stage of a run (and is passed explicitly to ingest
+worker processes).
+
+Example:
+    >>> with MemoryBudget(limit_mb=2048, spill_dir="artifacts/spill").activate():
+    ...     graph = new_graph()      # spills past ~2 million triples
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import shutil
+import sqlite3
+import tempfile
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.plugins.stores.memory import Memory
+from rdflib.store import Store
+from rdflib.util import from_n3
+
+from graph_mesh_core.telemetry import annotate
+
+LOGGER = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+#: Resident memory of one triple in rdflib's in-memory store (indexes included)
+DEFAULT_BYTES_PER_TRIPLE = 1024
+
+_active_budget: contextvars.ContextVar[Optional["MemoryBudget"]] = contextvars.ContextVar(
+    "graph_mesh_memory_budget", default=None
+)
+
+
+@dataclass(frozen=True)
+class MemoryBudget:
+    """Memory allowed to any single in-memory graph.
+
+    Attributes:
+        limit_mb: Budget in megabytes
+        spill_dir: Directory for spilled graphs (default: system temp)
+        bytes_per_triple: Estimated memory per in-memory triple
+    """
+
+    limit_mb: int
+    spill_dir: Optional[str] = None
+    bytes_per_triple: int = DEFAULT_BYTES_PER_TRIPLE
+
+    @property
+    def limit_bytes(self) -> int:
+        """Budget in bytes."""
+        return self.limit_mb * MB
+
+    @property
+    def max_triples(self) -> int:
+        """Triples a graph may hold in memory before it spills."""
+        return max(self.limit_bytes // self.bytes_per_triple, 1)
+
+    @contextmanager
+    def activate(self) -> Iterator["MemoryBudget"]:
+        """Make this budget apply to :func:`new_graph` in the current context."""
+        token = _active_budget.set(self)
+        try:
+            yield self
+        finally:
+            _active_budget.reset(token)
+
+
+def active_budget() -> Optional[MemoryBudget]:
+    """Return the memory budget active in the current context, if any."""
+    return _active_budget.get()
+
+
+def new_graph(identifier: Any = None, budget: Optional[MemoryBudget] = None) -> Graph:
+    """Create a graph that respects the active memory budget.
+
+    Args:
+        identifier: Graph identifier (default: a new blank node)
+        budget: Budget to apply (default: the active budget)
+
+    Returns:
+        A plain in-memory graph when no budget applies, otherwise a graph
+        backed by a :class:`SpillingStore`
+    """
+    budget = budget or _active_budget.get()
+    if budget is None:
+        return Graph(identifier=identifier)
+    return Graph(store=SpillingStore(budget.max_triples, budget.spill_dir), identifier=identifier)
+
+
+def is_spilled(graph: Graph) -> bool:
+    """Return True if ``graph`` has moved its triples to disk."""
+    return isinstance(graph.store, SpillingStore) and graph.store.spilled
+
+
+# -- Term encoding ----------------------------------------------------------
+
+def _encode(term: Any) -> str:
+    if isinstance(term, URIRef):
+        return "U" + term
+    if isinstance(term, BNode):
+        return "B" + term
+    if isinstance(term, Literal):
+        datatype = str(term.datatype) if term.datatype is not None else None
+        return "L" + json.dumps([str(term), term.language, datatype], ensure_ascii=False, separators=(",", ":"))
+    return "N" + term.n3()
+
+
+@lru_cache(maxsize=65536)
+def _decode(text: str) -> Any:
+    kind, value = text[0], text[1:]
+    if kind == "U":
+        return URIRef(value)
+    if kind == "B":
+        return BNode(value)
+    if kind == "L":
+        lexical, language, datatype = json.loads(value)
+        return Literal(lexical, lang=language, datatype=datatype)
+    return from_n3(value)
+
+
+class SQLiteStore(Store):
+    """Disk-backed, context-unaware rdflib store in a temporary SQLite file.
+
+    Triples are kept in one table indexed three ways (SPO, POS, OSP), so
+    every triple pattern is an index lookup. Additions are buffered and
+    written in batches. The database lives in its own temporary directory,
+    removed when the store is closed or garbage collected.
+
+    Args:
+        spill_dir: Parent directory for the database (default: system temp)
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    _BATCH_SIZE = 10_000
+
+    def __init__(self, spill_dir: Optional[Union[str, Path]] = None) -> None:
+        super().__init__()
+        if spill_dir is not None:
+            Path(spill_dir).mkdir(parents=True, exist_ok=True)
+        self.path = Path(tempfile.mkdtemp(prefix="graph-mesh-graph-", dir=spill_dir))
+        self._db = sqlite3.connect(str(self.path / "graph.sqlite"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=OFF")
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+        self._db.execute("CREATE TABLE triples (s TEXT, p TEXT, o TEXT, PRIMARY KEY (s, p, o)) WITHOUT ROWID")
+        self._db.execute("CREATE INDEX triples_pos ON triples (p, o, s)")
+        self._db.execute("CREATE INDEX triples_osp ON triples (o, s, p)")
+        self._pending: List[Tuple[str, str, str]] = []
+        self._count = 0
+        self._namespaces: dict[str, URIRef] = {}
+        self._prefixes: dict[URIRef, str] = {}
+        self._finalizer = weakref.finalize(self, SQLiteStore._cleanup, self._db, self.path)
+
+    @staticmethod
+    def _cleanup(db: sqlite3.Connection, path: Path) -> None:
+        db.close()
+        shutil.rmtree(path, ignore_errors=True)
+
+    def _flush(self) -> None:
+        if self._pending:
+            cursor = self._db.executemany("INSERT OR IGNORE INTO triples VALUES (?, ?, ?)", self._pending)
+            self._count += cursor.rowcount
+            self._pending = []
+
+    def add(self, triple: Tuple[Any, Any, Any], context: Any = None, quoted: bool = False) -> None:
+        s, p, o = triple
+        self._pending.append((_encode(s), _encode(p), _encode(o)))
+        if len(self._pending) >= self._BATCH_SIZE:
+            self._flush()
+
+    def addN(self, quads: Iterable[Tuple[Any, Any, Any, Any]]) -> None:
+        for s, p, o, _ in quads:
+            self.add((s, p, o))
+
+    def _where(self, pattern: Tuple[Any, Any, Any]) -> Tuple[str, List[str]]:
+        clauses, params = [], []
+        for column, term in zip("spo", pattern):
+            if term is not None:
+                clauses.append(f"{column} = ?")
+                params.append(_encode(term))
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def remove(self, triple_pattern: Tuple[Any, Any, Any], context: Any = None) -> None:
+        self._flush()
+        where, params = self._where(triple_pattern)
+        cursor = self._db.execute(f"DELETE FROM triples{where}", params)
+        self._count -= cursor.rowcount
+
+    def triples(self, triple_pattern: Tuple[Any, Any, Any], context: Any = None) -> Iterator[Tuple[Tuple[Any, Any, Any], Iterator[Any]]]:
+        self._flush()
+        where, params = self._where(triple_pattern)
+        # fetchmany keeps memory bounded and lets callers add while iterating
+        cursor = self._db.execute(f"SELECT s, p, o FROM triples{where}", params)
+        while True:
+            batch = cursor.fetchmany(self._BATCH_SIZE)
+            if not batch:
+                break
+            for s, p, o in batch:
+                yield (_decode(s), _decode(p), _decode(o)), iter(())
+
+    def __len__(self, context: Any = None) -> int:
+        self._flush()
+        return self._count
+
+    def contexts(self, triple: Any = None) -> Iterator[Any]:
+        return iter(())
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        namespace = URIRef(namespace)
+        if not override and (prefix in self._namespaces or namespace in self._prefixes):
+            return
+        previous = self._namespaces.pop(prefix, None)
+        if previous is not None:
+            self._prefixes.pop(previous, None)
+        old_prefix = self._prefixes.pop(namespace, None)
+        if old_prefix is not None:
+            self._namespaces.pop(old_prefix, None)
+        self._namespaces[prefix] = namespace
+        self._prefixes[namespace] = prefix
+
+    def namespace(self, prefix: str) -> Optional[URIRef]:
+        return self._namespaces.get(prefix)
+
+    def prefix(self, namespace: URIRef) -> Optional[str]:
+        return self._prefixes.get(URIRef(namespace))
+
+    def namespaces(self) -> Iterator[Tuple[str, URIRef]]:
+        return iter(list(self._namespaces.items()))
+
+    def commit(self) -> None:
+        self._flush()
+        self._db.commit()
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        self._pending = []
+        self._finalizer()
+
+
+class SpillingStore(Store):
+    """rdflib store that moves from memory to SQLite once it grows too large.
+
+    Triples are added to rdflib's default in-memory store. When the store
+    holds more than ``max_triples``, its contents are copied to a
+    :class:`SQLiteStore` and every later operation goes there.
+
+    Args:
+        max_triples: Triples held in memory before spilling
+        spill_dir: Parent directory for the spilled database
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self, max_triples: int, spill_dir: Optional[Union[str, Path]] = None) -> None:
+        super().__init__()
+        self.max_triples = max_triples
+        self.spill_dir = spill_dir
+        self.spilled = False
+        self._store: Store = Memory()
+
+    def _spill(self) -> None:
+        disk = SQLiteStore(self.spill_dir)
+        disk.addN((s, p, o, None) for (s, p, o), _ in self._store.triples((None, None, None)))
+        for prefix, namespace in self._store.namespaces():
+            disk.bind(prefix, namespace)
+        self._store, self.spilled = disk, True
+        count = len(disk)
+        LOGGER.info("Graph exceeded the memory budget (%d triples); spilled %d triples to %s",
+                    self.max_triples, count, disk.path)
+        annotate(spilled_graphs=1)
+
+    def add(self, triple: Tuple[Any, Any, Any], context: Any = None, quoted: bool = False) -> None:
+        self._store.add(triple, context, quoted)
+        if not self.spilled and self._store.__len__(context) > self.max_triples:
+            self._spill()
+
+    def addN(self, quads: Iterable[Tuple[Any, Any, Any, Any]]) -> None:
+        for s, p, o, context in quads:
+            self.add((s, p, o), context)
+
+    def remove(self, triple_pattern: Tuple[Any, Any, Any], context: Any = None) -> None:
+        self._store.remove(triple_pattern, context)
+
+    def triples(self, triple_pattern: Tuple[Any, Any, Any], context: Any = None) -> Iterator[Tuple[Tuple[Any, Any, Any], Iterator[Any]]]:
+        return self._store.triples(triple_pattern, context)
+
+    def __len__(self, context: Any = None) -> int:
+        return self._store.__len__(context)
+
+    def contexts(self, triple: Any = None) -> Iterator[Any]:
+        return iter(())
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        self._store.bind(prefix, namespace, override=override)
+
+    def namespace(self, prefix: str) -> Optional[URIRef]:
+        return self._store.namespace(prefix)
+
+    def prefix(self, namespace: URIRef) -> Optional[str]:
+        return self._store.prefix(namespace)
+
+    def namespaces(self) -> Iterator[Tuple[str, URIRef]]:
+        return self._store.namespaces()
+
+    def commit(self) -> None:
+        if self.spilled:
+            self._store.commit()
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        self._store.close()
@@ -0,0 +1,154 @@
+"""Deferred imports for plugins and package exports.
+
+Converters, meta-ontology providers and matchers depend on heavyweight
+libraries (xmlschema, pandas, docker, ...). Importing them when a package is
+first touched made every ``graph-mesh`` invocation, including ``--help`` and
+``plan``, pay for all of them. The helpers here keep a *target* string such
+as ``"graph_mesh_ingest.xsd_to_owl:convert_xsd_to_owl"`` and import it on
+first use:
+
+- :func:`load_object` resolves a ``module[:attribute]`` target
+- :class:`LazyModule` stands in for a module until an attribute is read
+- :class:`LazyCallable` stands in for a function until it is called
+- :func:`lazy_exports` builds the PEP 562 ``__getattr__``/``__dir__`` pair a
+  package ``__init__`` uses to keep its public names without importing them
+- :func:`entry_point_targets` lists plugins installed by other distributions
+
+Example:
+    >>> __getattr__, __dir__ = lazy_exports(__name__, {"Mapping": ".fusion"})
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import sys
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+
+def load_object(target: str, package: str | None = None) -> Any:
+    """Import ``module`` or ``module:attribute`` and return it.
+
+    Args:
+        target: Dotted module path, optionally followed by ``:attribute``
+            (which may itself be dotted, e.g. ``module:Class.method``)
+        package: Anchor for relative module paths such as ``".fusion"``
+
+    Returns:
+        The imported module or attribute
+
+    Raises:
+        ImportError: If the module cannot be imported
+        AttributeError: If the module has no such attribute
+    """
+    module_name, _, attribute = target.partition(":")
+    obj: Any = importlib.import_module(module_name, package)
+    for part in filter(None, attribute.split(".")):
+        obj = getattr(obj, part)
+    return obj
+
+
+class LazyModule:
+    """Module stand-in that imports the real module on first attribute access.
+
+    Assign one to a module-level name (``docker = LazyModule("docker")``) and
+    use it exactly like the module. ``unittest.mock.patch`` on that name keeps
+    working because the name is an ordinary module global.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.__dict__["_name"] = name
+
+    def __getattr__(self, attribute: str) -> Any:
+        # import_module serialises concurrent first imports with the import lock
+        return getattr(importlib.import_module(self._name), attribute)
+
+    def __repr__(self) -> str:
+        loaded = "loaded" if self._name in sys.modules else "not loaded"
+        return f"<lazy module {self._name!r} ({loaded})>"
+
+
+class LazyCallable:
+    """Callable stand-in for a function that is imported on first call.
+
+    ``__module__``, ``__name__`` and ``__qualname__`` describe the target
+    rather than this wrapper, so code that identifies a callable by name
+    (artifact cache keys, log events) sees the same identity either way.
+    Instances pickle as their target string and can be sent to worker
+    processes without importing the target in the parent.
+    """
+
+    def __init__(self, target: str) -> None:
+        module_name, _, qualname = target.partition(":")
+        if not qualname:
+            raise ValueError(f"LazyCallable target must be 'module:function', got {target!r}")
+        self.target = target
+        self.__module__ = module_name
+        self.__qualname__ = qualname
+        self.__name__ = qualname.rsplit(".", 1)[-1]
+
+    def resolve(self) -> Callable[..., Any]:
+        """Import and return the target callable."""
+        return load_object(self.target)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __reduce__(self) -> Tuple[type, Tuple[str]]:
+        return (LazyCallable, (self.target,))
+
+    def __repr__(self) -> str:
+        return f"<lazy callable {self.target}>"
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, str],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build module ``__getattr__`` and ``__dir__`` functions (PEP 562).
+
+    Args:
+        package: ``__name__`` of the package whose exports are deferred
+        exports: Public name mapped to the (relative) module that defines it
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign in the package namespace
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Later lookups hit the module dict directly
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
+
+
+def entry_point_targets(group: str) -> Dict[str, str]:
+    """List entry points of ``group`` without importing them.
+
+    Args:
+        group: Entry point group, e.g. ``"graph_mesh.converters"``
+
+    Returns:
+        Entry point name mapped to its ``module:attribute`` target
+    """
+    from importlib.metadata import entry_points
+
+    try:
+        selected = entry_points(group=group)
+    except TypeError:  # pragma: no cover - Python 3.9
+        selected = entry_points().get(group, [])
+    except Exception as exc:  # pragma: no cover - broken installation metadata
+        LOGGER.warning("Could not read entry points for %s: %s", group, exc)
+        return {}
+    return {entry_point.name: entry_point.value for entry_point in selected}
@@ -3,17 +3,37 @@
 This module provides a central registry for managing and instantiating
 meta-ontology providers. It supports both built-in providers and
 user-defined custom providers.
+
+Providers are known by name and module path until first used, so listing
+or validating provider names does not import rdflib-heavy provider modules.
+Other distributions add providers through the ``graph_mesh.meta_ontologies``
+entry point group::
+
+    [project.entry-points."graph_mesh.meta_ontologies"]
+    mydomain = "mypackage.ontology:MyDomainOntology"
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Type
+from typing import Any, Dict, Optional, Type
 
+from graph_mesh_core.lazy import entry_point_targets, load_object
 from graph_mesh_core.meta_ontology_base import MetaOntologyProvider
 
 LOGGER = logging.getLogger(__name__)
 
+#: Entry point group third-party packages use to add providers
+ENTRY_POINT_GROUP = "graph_mesh.meta_ontologies"
+
+#: Built-in providers, imported on first use
+BUILTIN_PROVIDERS: Dict[str, str] = {
+    "generic": "graph_mesh_core.providers.generic:GenericMetaOntology",
+    "fibo": "graph_mesh_core.providers.fibo:FIBOMetaOntology",
+    "custom": "graph_mesh_core.providers.custom:CustomMetaOntology",
+    "composite": "graph_mesh_core.providers.composite:CompositeMetaOntology",
+}
+
 
 class MetaOntologyRegistry:
     """Central registry for meta-ontology providers.
@@ -37,48 +57,63 @@ class MetaOntologyRegistry:
     """
 
     _providers: Dict[str, Type[MetaOntologyProvider]] = {}
+    # Providers known by name whose module has not been imported yet
+    _targets: Dict[str, str] = {}
     _initialized: bool = False
 
     @classmethod
     def _ensure_initialized(cls):
-        """Lazy initialization of built-in providers."""
+        """Lazy initialization of built-in and entry point providers.
+
+        Only names and module paths are recorded here; a provider's module
+        is imported when the provider is first used (see :meth:`_resolve`).
+        """
         if cls._initialized:
             return
 
-        # Import here to avoid circular dependencies
-        try:
-            from graph_mesh_core.providers.generic import GenericMetaOntology
-
-            cls._providers["generic"] = GenericMetaOntology
-            LOGGER.debug("Registered built-in provider: generic")
-        except ImportError as e:
-            LOGGER.warning("Could not register generic provider: %s", e)
+        plugins = entry_point_targets(ENTRY_POINT_GROUP)
+        for name, target in plugins.items():
+            if name in BUILTIN_PROVIDERS:
+                LOGGER.warning("Ignoring entry point %s: built-in provider of that name", name)
+                continue
+            cls._targets.setdefault(name, target)
+            LOGGER.debug("Discovered provider entry point: %s -> %s", name, target)
+        for name, target in BUILTIN_PROVIDERS.items():
+            cls._targets.setdefault(name, target)
 
-        try:
-            from graph_mesh_core.providers.fibo import FIBOMetaOntology
+        cls._initialized = True
 
-            cls._providers["fibo"] = FIBOMetaOntology
-            LOGGER.debug("Registered built-in provider: fibo")
-        except ImportError as e:
-            LOGGER.debug("FIBO provider not available: %s", e)
+    @classmethod
+    def _resolve(cls, name: str) -> Optional[Type[MetaOntologyProvider]]:
+        """Return the provider class for ``name``, importing it if needed.
 
-        try:
-            from graph_mesh_core.providers.custom import CustomMetaOntology
+        Providers whose module cannot be imported (e.g., a missing optional
+        dependency) are dropped from the registry, as if never registered.
+        """
+        cls._ensure_initialized()
 
-            cls._providers["custom"] = CustomMetaOntology
-            LOGGER.debug("Registered built-in provider: custom")
-        except ImportError as e:
-            LOGGER.warning("Could not register custom provider: %s", e)
+        provider_class = cls._providers.get(name)
+        if provider_class is not None:
+            return provider_class
+        target = cls._targets.get(name)
+        if target is None:
+            return None
 
         try:
-            from graph_mesh_core.providers.composite import CompositeMetaOntology
-
-            cls._providers["composite"] = CompositeMetaOntology
-            LOGGER.debug("Registered built-in provider: composite")
-        except ImportError as e:
-            LOGGER.debug("Composite provider not available: %s", e)
+            provider_class = load_object(target)
+        except (ImportError, AttributeError) as e:
+            LOGGER.warning("Could not load meta-ontology provider %s (%s): %s", name, target, e)
+            cls._targets.pop(name, None)
+            return None
+        if not (isinstance(provider_class, type) and issubclass(provider_class, MetaOntologyProvider)):
+            LOGGER.warning("Ignoring provider %s: %s is not a MetaOntologyProvider", name, target)
+            cls._targets.pop(name, None)
+            return None
 
-        cls._initialized = True
+        cls._providers[name] = provider_class
+        cls._targets.pop(name, None)
+        LOGGER.debug("Loaded meta-ontology provider: %s", name)
+        return provider_class
 
     @classmethod
     def register(cls, name: str, provider_class: Type[MetaOntologyProvider]) -> None:
@@ -107,9 +142,10 @@ class MetaOntologyRegistry:
                 f"got {provider_class}"
             )
 
-        if name in cls._providers:
+        if name in cls._providers or name in cls._targets:
             LOGGER.warning("Overwriting existing provider registration: %s", name)
 
+        cls._targets.pop(name, None)
         cls._providers[name] = provider_class
         LOGGER.info("Registered meta-ontology provider: %s", name)
 
@@ -125,10 +161,11 @@ class MetaOntologyRegistry:
         """
         cls._ensure_initialized()
 
-        if name not in cls._providers:
+        if name not in cls._providers and name not in cls._targets:
             raise KeyError(f"Provider not registered: {name}")
 
-        del cls._providers[name]
+        cls._providers.pop(name, None)
+        cls._targets.pop(name, None)
         LOGGER.info("Unregistered meta-ontology provider: %s", name)
 
     @classmethod
@@ -176,7 +213,7 @@ class MetaOntologyRegistry:
         if not provider_type:
             raise ValueError("Config must specify 'type' field")
 
-        provider_class = cls._providers.get(provider_type)
+        provider_class = cls._resolve(provider_type)
         if not provider_class:
             available = ", ".join(cls.list_providers())
             raise ValueError(
@@ -218,7 +255,7 @@ class MetaOntologyRegistry:
             Available: generic, fibo, custom, composite
         """
         cls._ensure_initialized()
-        return sorted(cls._providers.keys())
+        return sorted(set(cls._providers) | set(cls._targets))
 
     @classmethod
     def get_provider_class(cls, name: str) -> Type[MetaOntologyProvider]:
@@ -233,15 +270,14 @@ class MetaOntologyRegistry:
         Raises:
             KeyError: If provider name is not registered
         """
-        cls._ensure_initialized()
-
-        if name not in cls._providers:
+        provider_class = cls._resolve(name)
+        if provider_class is None:
             available = ", ".join(cls.list_providers())
             raise KeyError(
                 f"Provider '{name}' not found. Available: {available}"
             )
 
-        return cls._providers[name]
+        return provider_class
 
     @classmethod
     def is_registered(cls, name: str) -> bool:
@@ -254,7 +290,7 @@ class MetaOntologyRegistry:
             True if provider is registered, False otherwise.
         """
         cls._ensure_initialized()
-        return name in cls._providers
+        return name in cls._providers or name in cls._targets
 
     @classmethod
     def reset(cls) -> None:
@@ -264,5 +300,6 @@ class MetaOntologyRegistry:
         Built-in providers will be re-registered on next access.
         """
         cls._providers.clear()
+        cls._targets.clear()
         cls._initialized = False
         LOGGER.debug("Registry reset")
@@ -0,0 +1,227 @@
+"""Fast-loading snapshots of built meta-ontologies.
+
+Building a meta-ontology can be expensive: the FIBO provider parses several
+RDF/XML modules on every call to ``build_graph``. A snapshot captures the
+built graph together with the provider's metadata, alignment targets and
+namespace in a pickled binary file that loads much faster than re-parsing
+RDF: each distinct term is stored once in a table of plain strings and the
+triples as integer indexes into it, so loading skips RDF parsing entirely and
+constructs every term only once. Snapshots carry the key of the provider
+configuration they were built from, and a snapshot whose key does not match
+is ignored.
+
+Snapshots are pickles and must only be loaded from locations the pipeline
+itself writes (the workdir and the artifact cache).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional, Union
+
+from rdflib import BNode, Graph, Literal, Namespace, URIRef
+from rdflib.term import Node
+
+from graph_mesh_core.graph_store import new_graph
+from graph_mesh_core.meta_ontology_base import MetaOntologyInfo, MetaOntologyProvider
+
+LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_SUFFIX = ".snapshot"
+
+_URI, _BNODE, _LITERAL = 0, 1, 2
+
+
+@dataclass
+class MetaOntologySnapshot:
+    """A built meta-ontology and the provider data derived from it.
+
+    Attributes:
+        key: Provider configuration key the snapshot was built from
+        info: Provider metadata
+        graph: Built meta-ontology graph
+        namespace: Provider's primary namespace URI
+        alignment_targets: Provider's alignment targets
+    """
+
+    key: str
+    info: MetaOntologyInfo
+    graph: Graph
+    namespace: str
+    alignment_targets: list[URIRef] = field(default_factory=list)
+
+
+class SnapshotMetaOntology(MetaOntologyProvider):
+    """Meta-ontology provider backed by a loaded snapshot.
+
+    Stands in for the original provider once its graph has been built, so
+    ``build_graph`` and ``get_alignment_targets`` return precomputed values.
+    """
+
+    def __init__(self, snapshot: MetaOntologySnapshot):
+        """Initialize provider.
+
+        Args:
+            snapshot: Loaded meta-ontology snapshot
+        """
+        self.snapshot = snapshot
+
+    def get_info(self) -> MetaOntologyInfo:
+        """Return the snapshotted provider metadata."""
+        return self.snapshot.info
+
+    def build_graph(self) -> Graph:
+        """Return the snapshotted graph."""
+        return self.snapshot.graph
+
+    def get_alignment_targets(self) -> list[URIRef]:
+        """Return the snapshotted alignment targets."""
+        return list(self.snapshot.alignment_targets)
+
+    def get_namespace(self) -> Namespace:
+        """Return the snapshotted namespace."""
+        return Namespace(self.snapshot.namespace)
+
+
+def _encode_graph(graph: Graph) -> tuple[list[tuple], list[int]]:
+    """Flatten a graph into a term table and a flat list of term indexes."""
+    index: dict[Node, int] = {}
+    terms: list[tuple] = []
+    triples: list[int] = []
+
+    for triple in graph:
+        for term in triple:
+            position = index.get(term)
+            if position is None:
+                position = index[term] = len(terms)
+                if isinstance(term, Literal):
+                    datatype = str(term.datatype) if term.datatype is not None else None
+                    terms.append((_LITERAL, str(term), term.language, datatype))
+                elif isinstance(term, BNode):
+                    terms.append((_BNODE, str(term)))
+                else:
+                    terms.append((_URI, str(term)))
+            triples.append(position)
+
+    return terms, triples
+
+
+def _decode_graph(terms: list[tuple], triples: list[int]) -> Graph:
+    """Rebuild a graph from the output of ``_encode_graph``."""
+    nodes: list[Node] = []
+    for entry in terms:
+        if entry[0] == _LITERAL:
+            nodes.append(Literal(entry[1], lang=entry[2], datatype=entry[3]))
+        elif entry[0] == _BNODE:
+            nodes.append(BNode(entry[1]))
+        else:
+            nodes.append(URIRef(entry[1]))
+
+    graph = new_graph()
+    graph.addN(
+        (nodes[triples[i]], nodes[triples[i + 1]], nodes[triples[i + 2]], graph)
+        for i in range(0, len(triples), 3)
+    )
+    return graph
+
+
+def save_snapshot(
+    provider: MetaOntologyProvider,
+    graph: Graph,
+    path: Union[str, Path],
+    key: str,
+) -> MetaOntologySnapshot:
+    """Write a snapshot of a built meta-ontology.
+
+    The file is written to a temporary name and renamed into place, so a
+    crashed run never leaves a truncated snapshot behind.
+
+    Args:
+        provider: Provider the graph was built by
+        graph: Built meta-ontology graph
+        path: Snapshot file path
+        key: Provider configuration key
+
+    Returns:
+        The snapshot that was written
+    """
+    snapshot = MetaOntologySnapshot(
+        key=key,
+        info=provider.get_info(),
+        graph=graph,
+        namespace=str(provider.get_namespace()),
+        alignment_targets=list(provider.get_alignment_targets()),
+    )
+    terms, triples = _encode_graph(graph)
+    payload = {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "key": key,
+        "info": asdict(snapshot.info),
+        "namespace": snapshot.namespace,
+        "alignment_targets": [str(target) for target in snapshot.alignment_targets],
+        "prefixes": [(prefix, str(uri)) for prefix, uri in graph.namespaces()],
+        "terms": terms,
+        "triples": triples,
+    }
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}-", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    LOGGER.debug("Wrote meta-ontology snapshot %s (%d triples)", path, len(graph))
+    return snapshot
+
+
+def load_snapshot(path: Union[str, Path], key: Optional[str] = None) -> Optional[MetaOntologySnapshot]:
+    """Load a meta-ontology snapshot.
+
+    Args:
+        path: Snapshot file path
+        key: Expected provider configuration key; a snapshot built from a
+            different configuration is ignored
+
+    Returns:
+        The loaded snapshot, or None if it is missing, unreadable, from an
+        older snapshot format, or stale
+    """
+    path = Path(path)
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        LOGGER.warning("Ignoring unreadable meta-ontology snapshot %s: %s", path, e)
+        return None
+
+    if not isinstance(payload, dict) or payload.get("format") != SNAPSHOT_FORMAT_VERSION:
+        LOGGER.debug("Ignoring meta-ontology snapshot %s with unsupported format", path)
+        return None
+    if key is not None and payload.get("key") != key:
+        LOGGER.debug("Ignoring stale meta-ontology snapshot %s", path)
+        return None
+
+    graph = _decode_graph(payload["terms"], payload["triples"])
+    for prefix, uri in payload["prefixes"]:
+        graph.bind(prefix, uri, override=True, replace=True)
+
+    return MetaOntologySnapshot(
+        key=payload["key"],
+        info=MetaOntologyInfo(**payload["info"]),
+        graph=graph,
+        namespace=payload["namespace"],
+        alignment_targets=[URIRef(target) for target in payload["alignment_targets"]],
+    )
@@ -8,16 +8,19 @@ Available providers:
 - FIBOMetaOntology: Financial Industry Business Ontology
 - CustomMetaOntology: Load ontology from file or URL
 - CompositeMetaOntology: Combine multiple ontologies
+
+Each provider module is imported on first access.
 """
 
-from graph_mesh_core.providers.generic import GenericMetaOntology
-from graph_mesh_core.providers.custom import CustomMetaOntology
-from graph_mesh_core.providers.fibo import FIBOMetaOntology
-from graph_mesh_core.providers.composite import CompositeMetaOntology
+from graph_mesh_core.lazy import lazy_exports
+
+_EXPORTS = {
+    "GenericMetaOntology": ".generic",
+    "CustomMetaOntology": ".custom",
+    "FIBOMetaOntology": ".fibo",
+    "CompositeMetaOntology": ".composite",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
-__all__ = [
-    "GenericMetaOntology",
-    "CustomMetaOntology",
-    "FIBOMetaOntology",
-    "CompositeMetaOntology",
-]
+__all__ = list(_EXPORTS)
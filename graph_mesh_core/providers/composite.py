@@ -11,6 +11,7 @@ from typing import Optional
 
 from rdflib import Graph, Namespace, URIRef
 
+from graph_mesh_core.graph_store import new_graph
 from graph_mesh_core.meta_ontology_base import (
     MetaOntologyInfo,
     MetaOntologyProvider,
@@ -130,7 +131,7 @@ class CompositeMetaOntology(MetaOntologyProvider):
 
         LOGGER.info("Building composite graph from %d providers", len(self.providers))
 
-        combined = Graph()
+        combined = new_graph()
 
         for i, provider in enumerate(self.providers, 1):
             try:
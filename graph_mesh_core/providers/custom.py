@@ -12,6 +12,7 @@ from typing import Optional
 
 from rdflib import Graph, Namespace, URIRef, RDF, OWL, RDFS
 
+from graph_mesh_core.graph_store import new_graph
 from graph_mesh_core.meta_ontology_base import (
     MetaOntologyInfo,
     MetaOntologyProvider,
@@ -103,7 +104,7 @@ class CustomMetaOntology(MetaOntologyProvider):
         if self._graph is not None:
             return self._graph
 
-        graph = Graph()
+        graph = new_graph()
 
         try:
             if self.source.startswith(("http://", "https://")):
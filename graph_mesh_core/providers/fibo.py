@@ -13,6 +13,7 @@ from typing import Optional
 
 from rdflib import Graph, Namespace, URIRef, RDF, OWL, RDFS
 
+from graph_mesh_core.graph_store import new_graph
 from graph_mesh_core.meta_ontology_base import (
     MetaOntologyInfo,
     MetaOntologyProvider,
@@ -203,7 +204,7 @@ class FIBOMetaOntology(MetaOntologyProvider):
         if self._graph is not None:
             return self._graph
 
-        graph = Graph()
+        graph = new_graph()
         graph.bind("fibo", Namespace(FIBO_BASE))
 
         for module in self.modules:
@@ -211,7 +212,7 @@ class FIBOMetaOntology(MetaOntologyProvider):
                 module_file = self._download_module(module)
                 LOGGER.info("Parsing FIBO module: %s", module)
 
-                module_graph = Graph()
+                module_graph = new_graph()
                 module_graph.parse(str(module_file), format="xml")
 
                 # Merge into main graph
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 
 from rdflib import Graph, Literal, Namespace, RDF, RDFS, OWL, URIRef
 
+from graph_mesh_core.graph_store import new_graph
 from graph_mesh_core.meta_ontology_base import (
     MetaOntologyInfo,
     MetaOntologyProvider,
@@ -209,7 +210,7 @@ class GenericMetaOntology(MetaOntologyProvider):
         Returns:
             rdflib.Graph containing classes, properties, and annotations.
         """
-        graph = Graph()
+        graph = new_graph()
         graph.bind("gm", GM)
         graph.bind("owl", OWL)
         graph.bind("rdfs", RDFS)
@@ -0,0 +1,379 @@
+"""Per-stage performance telemetry.
+
+A :class:`MetricsRecorder` collects one :class:`UnitMetrics` record per unit
+of work (a pipeline stage, a source's fetch/ingest/alignment step, a single
+matcher run): wall time, CPU time, peak RSS growth, bytes read and written,
+and a triple count where one is known. Records are written to a JSON file and
+optionally to a Prometheus textfile for the node_exporter textfile collector.
+
+Code measures work with the module-level :func:`measure` context manager and
+reports counts with :func:`annotate`. Both are no-ops unless a recorder is
+active in the current context (inside :meth:`MetricsRecorder.activate` or
+inside one of its units), so library code (converters, matchers, fusion) can
+be instrumented without taking a recorder argument. Units nested inside
+another unit inherit its ``source_id``. When a :class:`~graph_mesh_core.tracing.Tracer`
+is active as well, every unit is also recorded as a span.
+
+Resource figures come from the standard library and ``/proc``:
+
+- ``cpu_seconds`` is CPU time of the measuring thread; ``process_cpu_seconds``
+  covers the whole process (including other workers running concurrently)
+- ``peak_rss_delta_bytes`` is the growth of the process-wide RSS high-water
+  mark during the unit, so concurrent units may share attribution
+- ``read_bytes``/``write_bytes`` are the thread's ``rchar``/``wchar`` counters
+  from ``/proc/thread-self/io`` (None where unavailable)
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from graph_mesh_core.tracing import span
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    resource = None
+
+_active_recorder: contextvars.ContextVar[Optional["MetricsRecorder"]] = contextvars.ContextVar(
+    "graph_mesh_metrics_recorder", default=None
+)
+_active_unit: contextvars.ContextVar[Optional["UnitMetrics"]] = contextvars.ContextVar(
+    "graph_mesh_metrics_unit", default=None
+)
+
+_THREAD_IO_PATH = Path("/proc/thread-self/io")
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _thread_io() -> Tuple[Optional[int], Optional[int]]:
+    try:
+        counters = dict(line.split(":", 1) for line in _THREAD_IO_PATH.read_text().splitlines())
+        return int(counters["rchar"]), int(counters["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None, None
+
+
+def _delta(after: Optional[int], before: Optional[int]) -> Optional[int]:
+    if after is None or before is None:
+        return None
+    return after - before
+
+
+@dataclass
+class UnitMetrics:
+    """Measurements for one unit of work.
+
+    Attributes:
+        stage: Stage name (e.g., 'fetch', 'ingest', 'alignment', 'matcher')
+        source_id: Source the unit belongs to, if any
+        matcher: Matcher name for matcher units
+        started_at: Start time (seconds since the epoch)
+        wall_seconds: Elapsed wall-clock time
+        cpu_seconds: CPU time of the measuring thread
+        process_cpu_seconds: CPU time of the whole process
+        peak_rss_delta_bytes: Growth of the process peak RSS
+        read_bytes: Bytes read by the measuring thread
+        write_bytes: Bytes written by the measuring thread
+        triple_count: Triples produced, if known
+        status: 'ok' or 'error'
+        extra: Additional counters reported via :func:`annotate`
+    """
+
+    stage: str
+    source_id: Optional[str] = None
+    matcher: Optional[str] = None
+    started_at: float = 0.0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    process_cpu_seconds: float = 0.0
+    peak_rss_delta_bytes: Optional[int] = None
+    read_bytes: Optional[int] = None
+    write_bytes: Optional[int] = None
+    triple_count: Optional[int] = None
+    status: str = "ok"
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+class MetricsRecorder:
+    """Collect unit metrics for a pipeline run.
+
+    Example:
+        >>> recorder = MetricsRecorder()
+        >>> with recorder.activate():
+        ...     with measure("fusion") as unit:
+        ...         unit.triple_count = len(graph)
+        >>> recorder.write_json(workdir / "run_metrics.json")
+    """
+
+    def __init__(self) -> None:
+        """Initialize recorder."""
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._units: List[UnitMetrics] = []
+
+    @property
+    def units(self) -> List[UnitMetrics]:
+        """Recorded units, in completion order."""
+        with self._lock:
+            return list(self._units)
+
+    @contextmanager
+    def activate(self) -> Iterator["MetricsRecorder"]:
+        """Make this recorder the target of :func:`measure` in the current context."""
+        token = _active_recorder.set(self)
+        try:
+            yield self
+        finally:
+            _active_recorder.reset(token)
+
+    @contextmanager
+    def measure(
+        self,
+        stage: str,
+        source_id: Optional[str] = None,
+        matcher: Optional[str] = None,
+    ) -> Iterator[UnitMetrics]:
+        """Measure a unit of work and record it when the block exits.
+
+        Args:
+            stage: Stage name
+            source_id: Source identifier (inherited from the enclosing unit if omitted)
+            matcher: Matcher name
+
+        Yields:
+            The UnitMetrics record, whose ``triple_count`` and ``extra`` the
+            block may fill in
+        """
+        parent = _active_unit.get()
+        if source_id is None and parent is not None:
+            source_id = parent.source_id
+        unit = UnitMetrics(stage=stage, source_id=source_id, matcher=matcher, started_at=time.time())
+
+        # Every unit is also a span on the trace timeline when a tracer is active
+        with span(_span_name(unit), _span_category(unit), source_id=source_id, matcher=matcher) as trace_span:
+            # Nested measure()/annotate() calls inside the unit report to this recorder
+            recorder_token = _active_recorder.set(self)
+
+            wall0 = time.perf_counter()
+            cpu0 = time.thread_time()
+            proc0 = time.process_time()
+            rss0 = _peak_rss_bytes()
+            read0, write0 = _thread_io()
+            token = _active_unit.set(unit)
+            try:
+                yield unit
+            except BaseException:
+                unit.status = "error"
+                raise
+            finally:
+                _active_unit.reset(token)
+                _active_recorder.reset(recorder_token)
+                read1, write1 = _thread_io()
+                unit.wall_seconds = time.perf_counter() - wall0
+                unit.cpu_seconds = time.thread_time() - cpu0
+                unit.process_cpu_seconds = time.process_time() - proc0
+                unit.peak_rss_delta_bytes = _delta(_peak_rss_bytes(), rss0)
+                unit.read_bytes = _delta(read1, read0)
+                unit.write_bytes = _delta(write1, write0)
+                with self._lock:
+                    self._units.append(unit)
+                if trace_span is not None:
+                    trace_span.args.update(unit.extra)
+                    if unit.triple_count is not None:
+                        trace_span.args["triple_count"] = unit.triple_count
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate wall time per stage and the slowest units.
+
+        Returns:
+            Dictionary with per-stage totals and the ten slowest units
+        """
+        units = self.units
+        stages: Dict[str, Dict[str, Any]] = {}
+        for unit in units:
+            totals = stages.setdefault(unit.stage, {"count": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0})
+            totals["count"] += 1
+            totals["wall_seconds"] += unit.wall_seconds
+            totals["cpu_seconds"] += unit.cpu_seconds
+
+        slowest = sorted(
+            (u for u in units if u.source_id or u.matcher),
+            key=lambda u: u.wall_seconds,
+            reverse=True,
+        )[:10]
+        return {
+            "stages": stages,
+            "slowest_units": [
+                {"stage": u.stage, "source_id": u.source_id, "matcher": u.matcher,
+                 "wall_seconds": u.wall_seconds}
+                for u in slowest
+            ],
+        }
+
+    def to_dict(self, **run_info: Any) -> Dict[str, Any]:
+        """Return all metrics as a JSON-serializable dictionary.
+
+        Args:
+            **run_info: Extra run-level fields (e.g., manifest, status)
+        """
+        return {
+            "run": {
+                "started_at": self.started_at,
+                "wall_seconds": time.time() - self.started_at,
+                "peak_rss_bytes": _peak_rss_bytes(),
+                **run_info,
+            },
+            "summary": self.summary(),
+            "units": [asdict(unit) for unit in self.units],
+        }
+
+    def write_json(self, path: Union[str, Path], **run_info: Any) -> Path:
+        """Write metrics as JSON.
+
+        Args:
+            path: Output path (typically ``<workdir>/run_metrics.json``)
+            **run_info: Extra run-level fields
+
+        Returns:
+            The output path
+        """
+        path = Path(path)
+        _write_atomic(path, json.dumps(self.to_dict(**run_info), indent=2, default=str))
+        return path
+
+    def write_prometheus(self, path: Union[str, Path], pipeline: str) -> Path:
+        """Write metrics in the Prometheus text exposition format.
+
+        The file is replaced atomically, as the node_exporter textfile
+        collector requires.
+
+        Args:
+            path: Output path (should end in ``.prom``)
+            pipeline: Pipeline name, added as a label to every sample
+
+        Returns:
+            The output path
+        """
+        gauges = [
+            ("graph_mesh_unit_wall_seconds", "Wall-clock time of a pipeline unit", "wall_seconds"),
+            ("graph_mesh_unit_cpu_seconds", "Thread CPU time of a pipeline unit", "cpu_seconds"),
+            ("graph_mesh_unit_peak_rss_delta_bytes", "Peak RSS growth during a pipeline unit",
+             "peak_rss_delta_bytes"),
+            ("graph_mesh_unit_read_bytes", "Bytes read during a pipeline unit", "read_bytes"),
+            ("graph_mesh_unit_write_bytes", "Bytes written during a pipeline unit", "write_bytes"),
+            ("graph_mesh_unit_triples", "Triples produced by a pipeline unit", "triple_count"),
+        ]
+        units = self.units
+        lines: List[str] = []
+        for name, help_text, attribute in gauges:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for unit in units:
+                value = getattr(unit, attribute)
+                if value is None:
+                    continue
+                labels = _format_labels(
+                    pipeline=pipeline,
+                    stage=unit.stage,
+                    source=unit.source_id or "",
+                    matcher=unit.matcher or "",
+                    status=unit.status,
+                )
+                lines.append(f"{name}{labels} {value}")
+
+        lines.append("# HELP graph_mesh_run_wall_seconds Wall-clock time of the pipeline run")
+        lines.append("# TYPE graph_mesh_run_wall_seconds gauge")
+        lines.append(f"graph_mesh_run_wall_seconds{_format_labels(pipeline=pipeline)} "
+                     f"{time.time() - self.started_at}")
+        lines.append("# HELP graph_mesh_run_timestamp_seconds Start time of the pipeline run")
+        lines.append("# TYPE graph_mesh_run_timestamp_seconds gauge")
+        lines.append(f"graph_mesh_run_timestamp_seconds{_format_labels(pipeline=pipeline)} {self.started_at}")
+
+        path = Path(path)
+        _write_atomic(path, "\n".join(lines) + "\n")
+        return path
+
+
+def _span_name(unit: UnitMetrics) -> str:
+    return f"{unit.stage}:{unit.matcher}" if unit.matcher else unit.stage
+
+
+def _span_category(unit: UnitMetrics) -> str:
+    if unit.matcher:
+        return "matcher"
+    return "source" if unit.source_id else "stage"
+
+
+def _format_labels(**labels: str) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    return "{" + ",".join(f'{key}="{escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(data, encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def active_recorder() -> Optional[MetricsRecorder]:
+    """Return the recorder active in the current context, if any."""
+    return _active_recorder.get()
+
+
+@contextmanager
+def measure(
+    stage: str,
+    source_id: Optional[str] = None,
+    matcher: Optional[str] = None,
+) -> Iterator[Optional[UnitMetrics]]:
+    """Measure a unit with the active recorder; a no-op if none is active.
+
+    Args:
+        stage: Stage name
+        source_id: Source identifier
+        matcher: Matcher name
+
+    Yields:
+        The UnitMetrics record, or None when no recorder is active
+    """
+    recorder = _active_recorder.get()
+    if recorder is None:
+        yield None
+        return
+    with recorder.measure(stage, source_id=source_id, matcher=matcher) as unit:
+        yield unit
+
+
+def annotate(triple_count: Optional[int] = None, **extra: Any) -> None:
+    """Attach counts to the innermost unit being measured, if any.
+
+    Args:
+        triple_count: Number of triples produced
+        **extra: Additional counters stored in ``UnitMetrics.extra``
+    """
+    unit = _active_unit.get()
+    if unit is None:
+        return
+    if triple_count is not None:
+        unit.triple_count = triple_count
+    unit.extra.update(extra)
@@ -0,0 +1,370 @@
+"""Span tracing and timeline export.
+
+A :class:`Tracer` records a tree of timed spans (stages, sources, converter
+phases, matcher containers, SSSOM loading, fusion, voting) together with the
+process and thread each ran on. Once sources and matchers run concurrently,
+the resulting timeline shows what overlapped, what waited, and which chain of
+spans bounded the run's wall time. Two exports are provided:
+
+- :meth:`Tracer.write_chrome_trace` writes the Chrome Trace Event format,
+  which Perfetto (https://ui.perfetto.dev) and ``chrome://tracing`` open
+  directly
+- :meth:`Tracer.write_span_table` writes one tab-separated row per span for
+  ad-hoc analysis (``sort``, pandas, a spreadsheet)
+
+Like :mod:`graph_mesh_core.telemetry`, instrumentation goes through the
+module-level :func:`span` context manager (or the :func:`traced` decorator),
+which is a no-op unless a tracer is active in the current context. Telemetry
+units (:func:`telemetry.measure`) open a span automatically, so every
+measured stage, source step and matcher run appears on the timeline without
+extra calls.
+
+Spans opened in another process (e.g., an ingest worker) are recorded by a
+tracer in that process and merged with :meth:`Tracer.add_spans`. Timestamps
+come from :func:`time.perf_counter_ns`, which is a system-wide monotonic
+clock on Linux and macOS, so spans from different processes line up.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import csv
+import functools
+import io
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar, Union
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_active_tracer: contextvars.ContextVar[Optional["Tracer"]] = contextvars.ContextVar(
+    "graph_mesh_tracer", default=None
+)
+_active_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "graph_mesh_span", default=None
+)
+
+SPAN_TABLE_COLUMNS = (
+    "span_id", "parent_id", "name", "category", "source_id", "pid", "thread",
+    "start_ms", "duration_ms", "status", "args",
+)
+
+
+@dataclass
+class Span:
+    """One timed operation.
+
+    Attributes:
+        span_id: Identifier, unique within the tracer
+        parent_id: Enclosing span, if any
+        name: Operation name (e.g., 'ingest', 'container.run', 'sssom.load')
+        category: Kind of operation (e.g., 'stage', 'source', 'converter', 'matcher')
+        start_ns: Start on the ``perf_counter_ns`` clock
+        duration_ns: Duration, 0 until the span ends
+        pid: Process the span ran in
+        tid: Thread the span ran on
+        thread_name: Name of that thread
+        source_id: Source the span belongs to (inherited from the parent span)
+        status: 'ok' or 'error'
+        args: Additional attributes shown in the trace viewer
+    """
+
+    span_id: int
+    parent_id: Optional[int]
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int = 0
+    pid: int = 0
+    tid: int = 0
+    thread_name: str = ""
+    source_id: Optional[str] = None
+    status: str = "ok"
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+    """Collect spans for a pipeline run.
+
+    Example:
+        >>> tracer = Tracer()
+        >>> with tracer.activate():
+        ...     with span("fusion", "stage"):
+        ...         fuse()
+        >>> tracer.write_chrome_trace(workdir / "trace.json")
+    """
+
+    def __init__(self) -> None:
+        """Initialize tracer."""
+        self.started_at = time.time()
+        self.origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._spans: List[Span] = []
+
+    @property
+    def spans(self) -> List[Span]:
+        """Finished spans, ordered by start time."""
+        with self._lock:
+            return sorted(self._spans, key=lambda s: (s.start_ns, s.span_id))
+
+    @contextmanager
+    def activate(self) -> Iterator["Tracer"]:
+        """Make this tracer the target of :func:`span` in the current context."""
+        token = _active_tracer.set(self)
+        try:
+            yield self
+        finally:
+            _active_tracer.reset(token)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        category: str = "default",
+        source_id: Optional[str] = None,
+        **args: Any,
+    ) -> Iterator[Span]:
+        """Time a block of code as a span and record it when the block exits.
+
+        Args:
+            name: Operation name
+            category: Kind of operation
+            source_id: Source identifier (inherited from the enclosing span if omitted)
+            **args: Attributes shown in the trace viewer
+
+        Yields:
+            The Span, whose ``args`` the block may extend
+        """
+        parent = _active_span.get()
+        if source_id is None and parent is not None:
+            source_id = parent.source_id
+        thread = threading.current_thread()
+        with self._lock:
+            span_id = next(self._ids)
+        current = Span(
+            span_id=span_id,
+            parent_id=parent.span_id if parent is not None else None,
+            name=name,
+            category=category,
+            start_ns=time.perf_counter_ns(),
+            pid=os.getpid(),
+            tid=thread.ident or 0,
+            thread_name=thread.name,
+            source_id=source_id,
+            args={key: value for key, value in args.items() if value is not None},
+        )
+        tracer_token = _active_tracer.set(self)
+        span_token = _active_span.set(current)
+        try:
+            yield current
+        except BaseException as exc:
+            current.status = "error"
+            current.args.setdefault("error", f"{type(exc).__name__}: {exc}")
+            raise
+        finally:
+            _active_span.reset(span_token)
+            _active_tracer.reset(tracer_token)
+            current.duration_ns = time.perf_counter_ns() - current.start_ns
+            with self._lock:
+                self._spans.append(current)
+
+    def add_spans(self, spans: Iterable[Union[Span, Dict[str, Any]]], parent: Optional[Span] = None) -> None:
+        """Merge spans recorded by another tracer (e.g., in a worker process).
+
+        Span identifiers are reassigned so they stay unique; root spans of
+        the merged set become children of ``parent`` (default: the span
+        active in the current context).
+
+        Args:
+            spans: Span objects or their ``asdict`` form
+            parent: Span to attach the merged root spans to
+        """
+        parent = parent if parent is not None else _active_span.get()
+        incoming = [Span(**s) if isinstance(s, dict) else s for s in spans]
+        with self._lock:
+            id_map = {s.span_id: next(self._ids) for s in incoming}
+            for s in incoming:
+                if s.parent_id in id_map:
+                    parent_id = id_map[s.parent_id]
+                else:
+                    parent_id = parent.span_id if parent is not None else None
+                if s.source_id is None and parent is not None:
+                    s.source_id = parent.source_id
+                s.span_id, s.parent_id = id_map[s.span_id], parent_id
+                self._spans.append(s)
+
+    def to_chrome_trace(self, **metadata: Any) -> Dict[str, Any]:
+        """Return the spans in the Chrome Trace Event format.
+
+        Every span becomes a complete (``"X"``) event, with microsecond
+        timestamps relative to the tracer's creation. Process and thread
+        name metadata events label the tracks in the viewer.
+
+        Args:
+            **metadata: Run-level fields stored under ``otherData``
+        """
+        spans = self.spans
+        events: List[Dict[str, Any]] = []
+        main_pid = os.getpid()
+        threads: Dict[tuple, str] = {}
+        for s in spans:
+            threads.setdefault((s.pid, s.tid), s.thread_name)
+            args = dict(s.args)
+            if s.source_id:
+                args["source_id"] = s.source_id
+            if s.status != "ok":
+                args["status"] = s.status
+            events.append({
+                "name": f"{s.name} [{s.source_id}]" if s.source_id and s.category != "stage" else s.name,
+                "cat": s.category,
+                "ph": "X",
+                "ts": (s.start_ns - self.origin_ns) / 1000.0,
+                "dur": s.duration_ns / 1000.0,
+                "pid": s.pid,
+                "tid": s.tid,
+                "args": _jsonable(args),
+            })
+
+        for pid in sorted({pid for pid, _ in threads}):
+            name = "graph-mesh" if pid == main_pid else f"worker {pid}"
+            events.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": name}})
+        for (pid, tid), thread_name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                           "args": {"name": thread_name}})
+
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": _jsonable({"started_at": self.started_at, **metadata}),
+        }
+
+    def write_chrome_trace(self, path: Union[str, Path], **metadata: Any) -> Path:
+        """Write a Chrome Trace Event JSON file.
+
+        Args:
+            path: Output path (typically ``<workdir>/trace.json``)
+            **metadata: Run-level fields stored under ``otherData``
+
+        Returns:
+            The output path
+        """
+        path = Path(path)
+        _write_atomic(path, json.dumps(self.to_chrome_trace(**metadata)))
+        return path
+
+    def write_span_table(self, path: Union[str, Path]) -> Path:
+        """Write one tab-separated row per span.
+
+        Columns are :data:`SPAN_TABLE_COLUMNS`; times are milliseconds
+        relative to the tracer's creation and ``args`` is a JSON object.
+
+        Args:
+            path: Output path (typically ``<workdir>/trace_spans.tsv``)
+
+        Returns:
+            The output path
+        """
+        buffer = io.StringIO()
+        # No quoting: ``args`` JSON stays readable, stray tabs are backslash-escaped
+        writer = csv.writer(buffer, delimiter="\t", lineterminator="\n",
+                            quoting=csv.QUOTE_NONE, quotechar=None, escapechar="\\")
+        writer.writerow(SPAN_TABLE_COLUMNS)
+        for s in self.spans:
+            writer.writerow([
+                s.span_id,
+                "" if s.parent_id is None else s.parent_id,
+                s.name,
+                s.category,
+                s.source_id or "",
+                s.pid,
+                s.thread_name,
+                f"{(s.start_ns - self.origin_ns) / 1e6:.3f}",
+                f"{s.duration_ns / 1e6:.3f}",
+                s.status,
+                json.dumps(_jsonable(s.args), sort_keys=True),
+            ])
+        path = Path(path)
+        _write_atomic(path, buffer.getvalue())
+        return path
+
+
+def _jsonable(value: Dict[str, Any]) -> Dict[str, Any]:
+    return json.loads(json.dumps(value, default=str))
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(data, encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def active_tracer() -> Optional[Tracer]:
+    """Return the tracer active in the current context, if any."""
+    return _active_tracer.get()
+
+
+@contextmanager
+def span(
+    name: str,
+    category: str = "default",
+    source_id: Optional[str] = None,
+    **args: Any,
+) -> Iterator[Optional[Span]]:
+    """Record a span with the active tracer; a no-op if none is active.
+
+    Args:
+        name: Operation name
+        category: Kind of operation
+        source_id: Source identifier
+        **args: Attributes shown in the trace viewer
+
+    Yields:
+        The Span, or None when no tracer is active
+    """
+    tracer = _active_tracer.get()
+    if tracer is None:
+        yield None
+        return
+    with tracer.span(name, category, source_id=source_id, **args) as current:
+        yield current
+
+
+def traced(name: Optional[str] = None, category: str = "default") -> Callable[[F], F]:
+    """Decorator recording every call of a function as a span.
+
+    Args:
+        name: Span name (default: the function's qualified name)
+        category: Kind of operation
+
+    Example:
+        >>> @traced("sssom.load", "alignment")
+        ... def load_sssom_mappings(path, matcher_name): ...
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _active_tracer.get()
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(span_name, category):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def span_dicts(tracer: Tracer) -> List[Dict[str, Any]]:
+    """Return a tracer's spans as plain dictionaries (picklable, JSON-safe)."""
+    return [asdict(s) for s in tracer.spans]
@@ -7,50 +7,36 @@ to OWL ontologies. Supported formats include:
 - CSV/TSV - with CSVW patterns and type inference
 
 The conversion system uses a plugin architecture where converters automatically
-register themselves and can be retrieved by schema type.
+register themselves and can be retrieved by schema type. Converter modules
+are imported on first use, and other packages can add converters through the
+``graph_mesh.converters`` entry point group.
 """
 
-from .converter_base import (
-    SchemaConverter,
-    ConverterRegistry,
-    get_converter,
-)
-
-# Import converters to trigger auto-registration
-from .xsd_to_owl import (
-    XSDConverter,
-    convert_xsd_to_owl,
-    convert_xsd_list_to_owl,
-)
-
-from .json_to_owl import (
-    JSONSchemaConverter,
-    convert_jsonschema_to_owl,
-)
-
-from .csv_to_owl import (
-    CSVConverter,
-    convert_csv_to_owl,
-    convert_tsv_to_owl,
-)
-
-__all__ = [
+from graph_mesh_core.lazy import lazy_exports
+
+# Converter modules load on first use: attribute access below, or a
+# ConverterRegistry lookup of their schema type
+_EXPORTS = {
     # Base classes
-    'SchemaConverter',
-    'ConverterRegistry',
-    'get_converter',
+    'SchemaConverter': '.converter_base',
+    'ConverterRegistry': '.converter_base',
+    'get_converter': '.converter_base',
 
     # Converter classes
-    'XSDConverter',
-    'JSONSchemaConverter',
-    'CSVConverter',
+    'XSDConverter': '.xsd_to_owl',
+    'JSONSchemaConverter': '.json_to_owl',
+    'CSVConverter': '.csv_to_owl',
 
     # Backward compatibility functions
-    'convert_xsd_to_owl',
-    'convert_xsd_list_to_owl',
-    'convert_jsonschema_to_owl',
-    'convert_csv_to_owl',
-    'convert_tsv_to_owl',
-]
+    'convert_xsd_to_owl': '.xsd_to_owl',
+    'convert_xsd_list_to_owl': '.xsd_to_owl',
+    'convert_jsonschema_to_owl': '.json_to_owl',
+    'convert_csv_to_owl': '.csv_to_owl',
+    'convert_tsv_to_owl': '.csv_to_owl',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
 
 __version__ = '1.0.0'
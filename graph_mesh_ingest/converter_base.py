@@ -11,46 +11,113 @@ from pathlib import Path
 from typing import Dict, Optional, List, Any, Type
 from rdflib import Graph, Namespace, URIRef, Literal, RDF, RDFS, OWL, XSD
 import logging
+import threading
+
+from graph_mesh_core.graph_handoff import write_graph
+from graph_mesh_core.graph_store import new_graph
+from graph_mesh_core.lazy import entry_point_targets, load_object
+from graph_mesh_core.telemetry import annotate
 
 logger = logging.getLogger(__name__)
 
 
+#: Entry point group third-party packages use to add converters
+ENTRY_POINT_GROUP = "graph_mesh.converters"
+
+#: Ontmalizer image the XSD converter runs unless configured otherwise
+DEFAULT_ONTMALIZER_IMAGE = 'graph-mesh-ontmalizer'
+
+#: Modules defining the built-in converters; imported on first lookup
+BUILTIN_CONVERTERS: Dict[str, str] = {
+    "xsd": "graph_mesh_ingest.xsd_to_owl",
+    "xml": "graph_mesh_ingest.xsd_to_owl",
+    "json": "graph_mesh_ingest.json_to_owl",
+    "jsonschema": "graph_mesh_ingest.json_to_owl",
+    "csv": "graph_mesh_ingest.csv_to_owl",
+    "tsv": "graph_mesh_ingest.csv_to_owl",
+}
+
+
 class ConverterRegistry:
-    """Registry for converter plugins."""
+    """Registry for converter plugins.
+
+    Converter classes register themselves when their module is imported.
+    Built-in converters and ``graph_mesh.converters`` entry points are
+    only imported when their schema type is first looked up, so importing
+    the package does not pull in xmlschema and friends.
+    """
 
     _converters: Dict[str, Type['SchemaConverter']] = {}
+    _targets: Optional[Dict[str, str]] = None
+    _lock = threading.Lock()
 
     @classmethod
     def register(cls, schema_type: str, converter_class: Type['SchemaConverter']) -> None:
         """Register a converter for a specific schema type.
 
+        Registration happens at import time, so ingest worker processes
+        rebuild the same registry when they import the converter modules.
+
         Args:
             schema_type: The schema type identifier (e.g., 'xsd', 'json', 'csv')
             converter_class: The converter class to register
         """
-        cls._converters[schema_type.lower()] = converter_class
+        with cls._lock:
+            cls._converters[schema_type.lower()] = converter_class
         logger.info(f"Registered converter for schema type: {schema_type}")
 
+    @classmethod
+    def _lazy_targets(cls) -> Dict[str, str]:
+        """Schema types mapped to the module (or ``module:Class``) providing them."""
+        with cls._lock:
+            if cls._targets is None:
+                targets = dict(BUILTIN_CONVERTERS)
+                for name, target in entry_point_targets(ENTRY_POINT_GROUP).items():
+                    targets.setdefault(name.lower(), target)
+                cls._targets = targets
+            return cls._targets
+
     @classmethod
     def get_converter(cls, schema_type: str) -> Optional[Type['SchemaConverter']]:
         """Get a converter class for a specific schema type.
 
+        Imports the module providing ``schema_type`` on first lookup.
+
         Args:
             schema_type: The schema type identifier
 
         Returns:
             The converter class or None if not found
         """
-        return cls._converters.get(schema_type.lower())
+        schema_type = schema_type.lower()
+        converter_class = cls._converters.get(schema_type)
+        if converter_class is not None:
+            return converter_class
+
+        target = cls._lazy_targets().get(schema_type)
+        if target is None:
+            return None
+        try:
+            loaded = load_object(target)
+        except (ImportError, AttributeError) as e:
+            logger.warning(f"Could not load converter for {schema_type} ({target}): {e}")
+            return None
+        with cls._lock:
+            # Entry points may name a class that does not set SCHEMA_TYPE
+            if isinstance(loaded, type) and schema_type not in cls._converters:
+                cls._converters[schema_type] = loaded
+            return cls._converters.get(schema_type)
 
     @classmethod
     def list_converters(cls) -> List[str]:
         """List all registered converter types.
 
         Returns:
-            List of registered schema types
+            List of registered schema types, including ones not imported yet
         """
-        return list(cls._converters.keys())
+        targets = cls._lazy_targets()
+        with cls._lock:
+            return list(dict.fromkeys([*cls._converters, *targets]))
 
 
 class SchemaConverter(ABC):
@@ -81,6 +148,17 @@ class SchemaConverter(ABC):
         self.graph: Optional[Graph] = None
         self.namespaces: Dict[str, Namespace] = {}
 
+    def reset(self) -> None:
+        """Discard state left over from a previous conversion.
+
+        Called at the start of every :meth:`convert`, so one instance can be
+        reused for several schemas (e.g., by a long-lived ingest worker)
+        without graphs or resolved references leaking between them.
+        Subclasses holding per-conversion state extend this.
+        """
+        self.graph = None
+        self.namespaces = {}
+
     def __init_subclass__(cls, **kwargs):
         """Automatically register converter subclasses."""
         super().__init_subclass__(**kwargs)
@@ -126,9 +204,10 @@ class SchemaConverter(ABC):
             base_namespace: Optional base namespace URI (defaults to base_uri)
 
         Returns:
-            Initialized RDF Graph with namespace bindings
+            Initialized RDF Graph with namespace bindings (disk-backed past
+            the active memory budget, see :mod:`graph_mesh_core.graph_store`)
         """
-        self.graph = Graph()
+        self.graph = new_graph()
 
         # Bind standard namespaces
         self.graph.bind('rdf', RDF)
@@ -217,6 +296,10 @@ class SchemaConverter(ABC):
     def serialize_graph(self, output_path: str, format: str = 'xml') -> str:
         """Serialize the OWL graph to a file.
 
+        While a :class:`~graph_mesh_core.graph_handoff.GraphHandoff` is
+        active, the graph is handed to it and the file is written in the
+        background; the graph must not be modified afterwards.
+
         Args:
             output_path: Path to output file
             format: RDF serialization format (xml, turtle, n3, etc.)
@@ -229,9 +312,11 @@ class SchemaConverter(ABC):
 
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        self.graph.serialize(destination=str(output_file), format=format)
-        logger.info(f"Serialized OWL graph to {output_file}")
+        if write_graph(self.graph, output_file, format=format):
+            logger.info(f"Handed off OWL graph for {output_file}")
+        else:
+            logger.info(f"Serialized OWL graph to {output_file}")
+        annotate(triple_count=len(self.graph))
 
         return str(output_file)
 
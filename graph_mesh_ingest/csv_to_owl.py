@@ -17,6 +17,8 @@ import logging
 
 from rdflib import Graph, Namespace, RDF, RDFS, OWL, Literal, XSD, URIRef
 
+from graph_mesh_core.tracing import span
+
 from .converter_base import SchemaConverter
 
 logger = logging.getLogger(__name__)
@@ -73,6 +75,7 @@ class CSVConverter(SchemaConverter):
             ValueError: If file cannot be parsed or conversion fails
         """
         logger.info(f"Converting CSV/TSV: {input_path}")
+        self.reset()
 
         input_file = Path(input_path)
 
@@ -94,7 +97,8 @@ class CSVConverter(SchemaConverter):
                 metadata = self._load_csvw_metadata(str(metadata_path))
 
         # Parse CSV
-        columns, rows = self._parse_csv(input_path, delimiter)
+        with span("parse", "converter", converter="csv", path=str(input_path)):
+            columns, rows = self._parse_csv(input_path, delimiter)
 
         if not columns:
             raise ValueError(f"No columns found in CSV file: {input_path}")
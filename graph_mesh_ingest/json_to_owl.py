@@ -19,6 +19,8 @@ import logging
 
 from rdflib import Graph, Namespace, RDF, RDFS, OWL, Literal, XSD, URIRef
 
+from graph_mesh_core.tracing import span
+
 from .converter_base import SchemaConverter
 
 logger = logging.getLogger(__name__)
@@ -48,6 +50,13 @@ class JSONSchemaConverter(SchemaConverter):
         self.processed_refs: Set[str] = set()
         self.definitions: Dict[str, Any] = {}
 
+    def reset(self) -> None:
+        """Discard definitions and resolved references from a previous conversion."""
+        super().reset()
+        self.schema_cache = {}
+        self.processed_refs = set()
+        self.definitions = {}
+
     @classmethod
     def supported_extensions(cls) -> List[str]:
         """Return supported file extensions."""
@@ -67,9 +76,11 @@ class JSONSchemaConverter(SchemaConverter):
             ValueError: If schema is invalid or conversion fails
         """
         logger.info(f"Converting JSON Schema: {input_path}")
+        self.reset()
 
         # Load schema
-        with open(input_path, 'r', encoding='utf-8') as f:
+        with span("parse", "converter", converter="json", path=str(input_path)), \
+                open(input_path, 'r', encoding='utf-8') as f:
             schema = json.load(f)
 
         # Validate basic schema structure
@@ -9,7 +9,6 @@ from __future__ import annotations
 import os
 import re
 import tempfile
-import subprocess
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 import logging
@@ -17,7 +16,12 @@ import logging
 import xmlschema
 from rdflib import Graph, Namespace, RDF, RDFS, OWL, Literal, XSD, URIRef
 
-from .converter_base import SchemaConverter
+from graph_mesh_core.docker_session import default_docker_session
+from graph_mesh_core.graph_handoff import take_graph, write_graph
+from graph_mesh_core.graph_store import new_graph
+from graph_mesh_core.tracing import span
+
+from .converter_base import DEFAULT_ONTMALIZER_IMAGE, SchemaConverter
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +49,7 @@ class XSDConverter(SchemaConverter):
         """
         super().__init__(config)
         self.use_ontmalizer = self.config.get('use_ontmalizer', True)
-        self.ontmalizer_image = self.config.get('ontmalizer_image', 'graph-mesh-ontmalizer')
+        self.ontmalizer_image = self.config.get('ontmalizer_image', DEFAULT_ONTMALIZER_IMAGE)
         self.fallback_to_xmlschema = self.config.get('fallback_to_xmlschema', True)
 
     @classmethod
@@ -66,6 +70,8 @@ class XSDConverter(SchemaConverter):
         Raises:
             ValueError: If conversion fails
         """
+        self.reset()
+
         # Check if input is a list of files
         if isinstance(input_path, list):
             return self._convert_multiple(input_path, output_path)
@@ -96,23 +102,19 @@ class XSDConverter(SchemaConverter):
         Raises:
             RuntimeError: If Docker is not available or conversion fails
         """
-        # Check if Docker is available
+        # Image status comes from the process-wide Docker session's cache
+        session = default_docker_session()
         try:
-            subprocess.run(['docker', '--version'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+            status = session.image_status(self.ontmalizer_image)
+        except ImportError:
             raise RuntimeError("Docker is not available. Cannot use Ontmalizer.")
-
-        # Check if Ontmalizer image exists
-        result = subprocess.run(
-            ['docker', 'images', '-q', self.ontmalizer_image],
-            capture_output=True,
-            text=True
-        )
-        if not result.stdout.strip():
+        if status.not_found:
             raise RuntimeError(
                 f"Ontmalizer Docker image '{self.ontmalizer_image}' not found. "
                 f"Build it with: docker build -t {self.ontmalizer_image} -f docker/ontmalizer.Dockerfile ."
             )
+        if not status.available:
+            raise RuntimeError(f"Docker is not available ({status.error}). Cannot use Ontmalizer.")
 
         # Prepare paths
         input_file = Path(input_path).resolve()
@@ -120,24 +122,23 @@ class XSDConverter(SchemaConverter):
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Run Ontmalizer container
-        cmd = [
-            'docker', 'run', '--rm',
-            '-v', f'{input_file.parent}:/input:ro',
-            '-v', f'{output_file.parent}:/output',
-            self.ontmalizer_image,
-            f'/input/{input_file.name}',
-            f'/output/{output_file.name}'
-        ]
-
-        logger.info(f"Running Ontmalizer: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            raise RuntimeError(
-                f"Ontmalizer conversion failed:\n"
-                f"stdout: {result.stdout}\n"
-                f"stderr: {result.stderr}"
-            )
+        from docker.errors import DockerException
+
+        logger.info(f"Running Ontmalizer: {self.ontmalizer_image} {input_file} -> {output_file}")
+        try:
+            with span("container.run", "container", image=self.ontmalizer_image):
+                session.client.containers.run(
+                    image=self.ontmalizer_image,
+                    command=[f'/input/{input_file.name}', f'/output/{output_file.name}'],
+                    volumes={
+                        str(input_file.parent): {"bind": "/input", "mode": "ro"},
+                        str(output_file.parent): {"bind": "/output", "mode": "rw"},
+                    },
+                    remove=True,
+                    detach=False,
+                )
+        except DockerException as exc:
+            raise RuntimeError(f"Ontmalizer conversion failed:\n{exc}") from exc
 
         if not output_file.exists():
             raise RuntimeError(f"Ontmalizer did not create output file: {output_file}")
@@ -161,7 +162,8 @@ class XSDConverter(SchemaConverter):
         """
         logger.info(f"Converting XSD with xmlschema: {input_path}")
 
-        schema = xmlschema.XMLSchema(input_path, base_url=os.path.dirname(input_path))
+        with span("parse", "converter", converter="xsd", path=str(input_path)):
+            schema = xmlschema.XMLSchema(input_path, base_url=os.path.dirname(input_path))
 
         # Create graph with namespaces
         self.create_graph()
@@ -240,7 +242,7 @@ class XSDConverter(SchemaConverter):
         """
         logger.info(f"Converting {len(input_paths)} XSD files to OWL")
 
-        merged = Graph()
+        merged = new_graph()
         merged.bind('rdf', RDF)
         merged.bind('rdfs', RDFS)
         merged.bind('owl', OWL)
@@ -258,10 +260,13 @@ class XSDConverter(SchemaConverter):
                 # Convert individual file
                 self.convert(xsd_path, tmp_path)
 
-                # Parse and merge
-                temp_graph = Graph()
-                temp_graph.parse(tmp_path)
-                merged += temp_graph
+                # Merge the handed-off graph, or parse the file when there is no handoff
+                handed_off = take_graph(tmp_path)
+                if handed_off is None:
+                    merged.parse(tmp_path)
+                else:
+                    merged += handed_off
+                    handed_off.close()
 
             finally:
                 # Clean up temp file
@@ -272,8 +277,7 @@ class XSDConverter(SchemaConverter):
 
         # Serialize merged graph
         output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        merged.serialize(destination=str(output_file), format='xml')
+        write_graph(merged, output_file, format='xml')
 
         logger.info(f"Merged {len(input_paths)} XSD files to {output_path}")
         return str(output_file)
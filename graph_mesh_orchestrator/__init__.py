@@ -1,5 +1,21 @@
-"""Graph-Mesh pipeline orchestrator."""
+"""Graph-Mesh pipeline orchestrator.
 
-from .pipeline import orchestrate, main
+``orchestrate``, ``orchestrate_batch``, ``coordinate``, ``run_worker`` and
+``main`` are imported on first access, so ``graph-mesh --help`` and the CLI's
+light subcommands do not load the whole pipeline.
+"""
 
-__all__ = ["orchestrate", "main"]
+from graph_mesh_core.lazy import lazy_exports
+
+_EXPORTS = {
+    "orchestrate": ".pipeline",
+    "orchestrate_batch": ".batch",
+    "coordinate": ".distributed",
+    "run_worker": ".distributed",
+    "main": ".pipeline",
+    "HookRegistry": ".hooks",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = ["orchestrate", "orchestrate_batch", "coordinate", "run_worker", "main", "HookRegistry"]
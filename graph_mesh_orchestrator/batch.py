@@ -0,0 +1,326 @@
+"""Batch execution of many manifests that share a meta-ontology.
+
+Running manifests one ``orchestrate`` call at a time rebuilds the same FIBO or
+generic meta-ontology for every manifest, converts a source listed in several
+manifests once per manifest, and gives every call its own matcher budget.
+:func:`orchestrate_batch` instead:
+
+- builds each distinct meta-ontology once and hands the in-memory snapshot to
+  every manifest configured with it
+- runs all manifests against one artifact cache; identical sources are
+  converted and aligned once, and the other manifests wait for and restore
+  that result
+- bounds matcher runs across all manifests with a single :class:`MatcherPool`
+
+Layout::
+
+    <workdir>/
+        meta/                     # one meta-ontology per distinct configuration
+        cache/                    # shared artifact cache (unless one is configured)
+        <manifest name>/          # regular pipeline workdir per manifest
+        batch_summary.json
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from graph_mesh_aligner.pool import MatcherPool, default_matcher_pool
+from graph_mesh_core.artifact_cache import ArtifactCache, cache_key, default_cache_dir
+from graph_mesh_core.meta_ontology_registry import MetaOntologyRegistry
+from graph_mesh_core.meta_ontology_snapshot import MetaOntologySnapshot
+from graph_mesh_orchestrator.errors import PipelineError
+from graph_mesh_orchestrator.journal import write_atomic
+from graph_mesh_orchestrator.models import PipelineManifest
+from graph_mesh_orchestrator.pipeline import (
+    PipelineArtifacts,
+    load_manifest,
+    meta_ontology_cache_key,
+    meta_ontology_provider_config,
+    orchestrate,
+    prepare_meta_ontology,
+)
+
+logger = structlog.get_logger(__name__)
+
+SUMMARY_NAME = "batch_summary.json"
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a batch run.
+
+    Attributes:
+        workdir: Batch working directory
+        artifacts: Pipeline artifacts per manifest label
+        failures: Error message per failed manifest label
+        shared_sources: Source identity to the manifest labels listing it, for
+            sources that appear in more than one manifest
+    """
+
+    workdir: Path
+    artifacts: Dict[str, PipelineArtifacts] = field(default_factory=dict)
+    failures: Dict[str, str] = field(default_factory=dict)
+    shared_sources: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether every manifest completed."""
+        return not self.failures
+
+
+def source_identity(source) -> str:
+    """Identify a source by what it fetches and how it is converted.
+
+    Two sources with different identifiers or descriptions but the same fetch
+    and convert configuration produce the same artifacts.
+
+    Args:
+        source: SourceConfig instance
+
+    Returns:
+        Hex digest
+    """
+    return cache_key(
+        "source-identity",
+        source.fetch.model_dump(mode="json"),
+        source.convert.model_dump(mode="json"),
+    )
+
+
+def _manifest_labels(manifests: Iterable[PipelineManifest]) -> List[str]:
+    """Derive a unique, filesystem-safe label per manifest from its name."""
+    labels: List[str] = []
+    for manifest in manifests:
+        base = re.sub(r"[^A-Za-z0-9._-]+", "-", manifest.name).strip("-") or "manifest"
+        label, n = base, 2
+        while label in labels:
+            label, n = f"{base}-{n}", n + 1
+        labels.append(label)
+    return labels
+
+
+def _find_shared_sources(manifests: Dict[str, PipelineManifest]) -> Dict[str, List[str]]:
+    """Group manifest labels by the identity of the enabled sources they list."""
+    users: Dict[str, List[str]] = {}
+    for label, manifest in manifests.items():
+        for source in manifest.sources:
+            if source.enabled:
+                users.setdefault(source_identity(source), []).append(label)
+    return {identity: labels for identity, labels in users.items() if len(labels) > 1}
+
+
+class MetaOntologyStore:
+    """In-memory meta-ontology snapshots, built at most once per configuration.
+
+    Shared by every manifest of a batch and every job of the orchestrator
+    service. Safe to use from several threads; concurrent requests for the
+    same configuration wait for a single build.
+    """
+
+    def __init__(self, meta_dir: Path, cache: Optional[ArtifactCache] = None) -> None:
+        """Initialize store.
+
+        Args:
+            meta_dir: Directory for the meta-ontology Turtle files and snapshots
+            cache: Optional artifact cache
+        """
+        self.meta_dir = meta_dir
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._entries: Dict[str, Tuple[MetaOntologySnapshot, Path]] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, manifest: PipelineManifest) -> Tuple[MetaOntologySnapshot, Path]:
+        """Return the snapshot and Turtle path for a manifest's meta-ontology.
+
+        Args:
+            manifest: Pipeline manifest
+
+        Returns:
+            Tuple of snapshot and Turtle path, suitable for
+            ``orchestrate(..., shared_meta_ontology=...)``
+        """
+        provider_config = meta_ontology_provider_config(manifest)
+        provider = MetaOntologyRegistry.create(provider_config)
+        key = meta_ontology_cache_key(provider_config, provider)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is None:
+                name = provider.get_info().name.lower().replace(" ", "-")
+                meta_path = self.meta_dir / f"{name}-{key[:12]}-meta-ontology.ttl"
+                snapshot = prepare_meta_ontology(provider, provider_config, meta_path, self.cache)
+                entry = (snapshot, meta_path)
+                with self._lock:
+                    self._entries[key] = entry
+                logger.info("meta_ontology_ready", provider=snapshot.info.name, path=str(meta_path))
+        return entry
+
+
+def _write_summary(result: BatchResult, pool: MatcherPool) -> None:
+    summary = {
+        "manifests": {
+            **{label: {"status": "completed", "merged_graph": str(artifacts.merged_graph)}
+               for label, artifacts in result.artifacts.items()},
+            **{label: {"status": "failed", "error": error} for label, error in result.failures.items()},
+        },
+        "shared_sources": result.shared_sources,
+        "matcher_pool": pool.stats(),
+    }
+    write_atomic(result.workdir / SUMMARY_NAME, json.dumps(summary, indent=2, sort_keys=True))
+
+
+def orchestrate_batch(
+    manifest_paths: Iterable[Path],
+    workdir: Optional[Path] = None,
+    max_parallel: Optional[int] = None,
+    max_concurrent_matchers: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+    resume: bool = False,
+    incremental: bool = False,
+    skip_preflight: bool = False,
+) -> BatchResult:
+    """Run several manifests sharing meta-ontologies, artifacts and matchers.
+
+    A failing manifest does not stop the others; its error is reported in the
+    result.
+
+    Args:
+        manifest_paths: Manifest files
+        workdir: Batch working directory (default: ./artifacts-batch)
+        max_parallel: Manifests run concurrently (default: all)
+        max_concurrent_matchers: Size of the matcher pool shared by all
+            manifests (default: the process-wide pool)
+        cache_dir: Artifact cache (default: ``pipeline.cache_dir`` of the first
+            manifest setting one, ``GRAPH_MESH_CACHE_DIR``, else
+            ``<workdir>/cache``)
+        resume: Resume each manifest from its checkpoint
+        incremental: Recompute only changed sources of each manifest
+        skip_preflight: Skip pre-flight validation checks
+
+    Returns:
+        BatchResult with per-manifest artifacts and failures
+
+    Raises:
+        PipelineError: If no manifests are given
+    """
+    manifest_paths = [Path(p) for p in manifest_paths]
+    if not manifest_paths:
+        raise PipelineError("Batch requires at least one manifest")
+    workdir = (workdir or Path("artifacts-batch")).resolve()
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    loaded = [load_manifest(path) for path in manifest_paths]
+    labels = _manifest_labels(loaded)
+    manifests = dict(zip(labels, loaded))
+    paths = dict(zip(labels, manifest_paths))
+
+    configured_cache = next((m.pipeline.cache_dir for m in loaded if m.pipeline.cache_dir), None)
+    cache_root = Path(cache_dir or configured_cache or default_cache_dir() or workdir / "cache")
+    cache = ArtifactCache(cache_root)
+    pool = MatcherPool(max_concurrent_matchers) if max_concurrent_matchers else default_matcher_pool()
+
+    result = BatchResult(workdir=workdir, shared_sources=_find_shared_sources(manifests))
+    logger.info("batch_starting",
+                manifest_count=len(manifests),
+                shared_source_count=len(result.shared_sources),
+                cache_dir=str(cache.root),
+                matcher_slots=pool.max_concurrent)
+
+    meta_store = MetaOntologyStore(workdir / "meta", cache)
+    shared_meta = {label: meta_store.get(manifest) for label, manifest in manifests.items()}
+    logger.info("batch_meta_ontologies", distinct=len(meta_store), manifests=len(manifests))
+
+    def run(label: str) -> PipelineArtifacts:
+        return orchestrate(
+            paths[label],
+            workdir=workdir / label,
+            resume=resume,
+            skip_preflight=skip_preflight,
+            cache_dir=cache.root,
+            incremental=incremental,
+            matcher_pool=pool,
+            shared_meta_ontology=shared_meta[label],
+        )
+
+    with ThreadPoolExecutor(max_workers=max_parallel or len(labels),
+                            thread_name_prefix="graph-mesh-batch") as executor:
+        futures = {label: executor.submit(run, label) for label in labels}
+        for label, future in futures.items():
+            try:
+                result.artifacts[label] = future.result()
+            except Exception as e:
+                logger.error("batch_manifest_failed", manifest=label, error=str(e))
+                result.failures[label] = str(e)
+
+    _write_summary(result, pool)
+    logger.info("batch_complete",
+                completed=len(result.artifacts),
+                failed=len(result.failures),
+                matcher_pool=pool.stats())
+    return result
+
+
+def main(
+    manifest_paths: List[str],
+    workdir: Optional[str] = None,
+    max_parallel: Optional[int] = None,
+    max_concurrent_matchers: Optional[int] = None,
+) -> None:
+    """Entry point for batch orchestration.
+
+    Args:
+        manifest_paths: Paths to pipeline manifests
+        workdir: Batch working directory
+        max_parallel: Manifests run concurrently
+        max_concurrent_matchers: Matcher pool size
+
+    Raises:
+        PipelineError: If any manifest failed
+    """
+    result = orchestrate_batch(
+        [Path(p) for p in manifest_paths],
+        workdir=Path(workdir) if workdir else None,
+        max_parallel=max_parallel,
+        max_concurrent_matchers=max_concurrent_matchers,
+    )
+    if not result.succeeded:
+        raise PipelineError(f"{len(result.failures)} of {len(manifest_paths)} manifests failed: "
+                            f"{', '.join(sorted(result.failures))}")
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Run several Graph-Mesh manifests sharing a meta-ontology and matcher pool"
+    )
+    parser.add_argument("manifests", nargs="+", help="Paths to pipeline manifest YAML files")
+    parser.add_argument("--workdir", type=str, default=None,
+                        help="Batch working directory (default: ./artifacts-batch)")
+    parser.add_argument("--max-parallel", type=int, default=None,
+                        help="Manifests run concurrently (default: all)")
+    parser.add_argument("--max-matchers", type=int, default=None,
+                        help="Matcher runs in flight across all manifests")
+    args = parser.parse_args()
+    main(args.manifests, workdir=args.workdir, max_parallel=args.max_parallel,
+         max_concurrent_matchers=args.max_matchers)
@@ -0,0 +1,186 @@
+"""Command-line interface for Graph-Mesh.
+
+Subcommands::
+
+    graph-mesh run manifest.yaml [--workdir DIR] [--resume] [--incremental] [--trace]
+                   [--profile-stage STAGE] [--deadline MINUTES]
+    graph-mesh plan manifest.yaml [--workdir DIR] [--incremental] [--memory-limit MB] [--json]
+    graph-mesh batch a.yaml b.yaml [--workdir DIR] [--max-parallel N] [--max-matchers N]
+    graph-mesh serve [--root DIR] [--host HOST] [--port PORT] [--concurrency N]
+    graph-mesh coordinate manifest.yaml [--workdir DIR] [--workers N] [--lease-seconds S]
+                          [--resume] [--timeout S]
+    graph-mesh worker manifest.yaml [--workdir DIR] [--worker-id ID] [--poll-interval S]
+
+``graph-mesh manifest.yaml`` without a subcommand is the same as ``run``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+from typing import List, Optional
+
+from graph_mesh_orchestrator.hooks import STAGES
+
+COMMANDS = ("run", "plan", "batch", "serve", "coordinate", "worker")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all subcommands."""
+    parser = argparse.ArgumentParser(
+        prog="graph-mesh",
+        description="Graph-Mesh ontology alignment and knowledge graph fusion",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="Run one pipeline manifest")
+    run.add_argument("manifest", type=str, help="Path to pipeline manifest YAML")
+    run.add_argument("--workdir", type=str, default=None,
+                     help="Working directory for artifacts (default: ./artifacts)")
+    run.add_argument("--resume", action="store_true", help="Resume from checkpoint if available")
+    run.add_argument("--incremental", action="store_true",
+                     help="Only recompute sources whose inputs changed since the last run")
+    run.add_argument("--trace", action="store_true", default=None,
+                     help="Write a span timeline (trace.json for Perfetto, trace_spans.tsv) to the workdir")
+    run.add_argument("--profile-stage", choices=STAGES, default=None, metavar="STAGE",
+                     help="Profile one stage (meta_ontology, sources, fetch, ingest, alignment or fusion) "
+                          "with cProfile; pstats files go to <workdir>/profiles/")
+    run.add_argument("--deadline", type=float, default=None, metavar="MINUTES",
+                     help="Finish within this many minutes: skip the slowest matchers and reuse earlier "
+                          "mappings if needed (overrides pipeline.deadline_minutes)")
+
+    plan = subparsers.add_parser("plan", help="Estimate runtime and memory of a manifest without running it")
+    plan.add_argument("manifest", type=str, help="Path to pipeline manifest YAML")
+    plan.add_argument("--workdir", type=str, default=None,
+                      help="Working directory the run would use (default: ./artifacts)")
+    plan.add_argument("--incremental", action="store_true",
+                      help="Plan an incremental re-run against the workdir's checkpoint")
+    plan.add_argument("--max-workers", type=int, default=None, help="Override pipeline.max_workers")
+    plan.add_argument("--max-matchers", type=int, default=None, help="Matcher runs in flight")
+    plan.add_argument("--memory-limit", type=int, default=None, metavar="MB",
+                      help="Exit with status 1 if the predicted peak memory exceeds this limit")
+    plan.add_argument("--json", action="store_true", help="Print the plan as JSON")
+
+    batch = subparsers.add_parser("batch", help="Run several manifests sharing a meta-ontology")
+    batch.add_argument("manifests", nargs="+", help="Paths to pipeline manifest YAML files")
+    batch.add_argument("--workdir", type=str, default=None,
+                       help="Batch working directory (default: ./artifacts-batch)")
+    batch.add_argument("--max-parallel", type=int, default=None,
+                       help="Manifests run concurrently (default: all)")
+    batch.add_argument("--max-matchers", type=int, default=None,
+                       help="Matcher runs in flight across all manifests")
+
+    serve = subparsers.add_parser("serve", help="Run the orchestrator service with an HTTP job API")
+    serve.add_argument("--root", type=str, default="graph-mesh-service",
+                       help="Service state directory (default: ./graph-mesh-service)")
+    serve.add_argument("--host", type=str, default=None, help="Interface to bind (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=None, help="Port to bind (default: 8765)")
+    serve.add_argument("--concurrency", type=int, default=2, help="Jobs run at the same time")
+    serve.add_argument("--max-matchers", type=int, default=None,
+                       help="Matcher runs in flight across all jobs")
+    serve.add_argument("--ingest-workers", type=int, default=0,
+                       help="Schema conversion processes shared by all jobs")
+    serve.add_argument("--preload", nargs="*", default=[], metavar="MANIFEST",
+                       help="Manifests whose meta-ontologies are built at start-up")
+
+    coordinate = subparsers.add_parser(
+        "coordinate", help="Run a manifest with its sources spread over distributed workers")
+    coordinate.add_argument("manifest", type=str, help="Path to pipeline manifest YAML")
+    coordinate.add_argument("--workdir", type=str, default=None,
+                            help="Working directory shared with the workers (default: ./artifacts)")
+    coordinate.add_argument("--workers", type=int, default=1,
+                            help="Workers run by the coordinator itself (0 = remote workers only)")
+    coordinate.add_argument("--lease-seconds", type=float, default=300.0,
+                            help="Seconds without a heartbeat before a worker's items are reclaimed")
+    coordinate.add_argument("--resume", action="store_true",
+                            help="Keep items completed by an earlier coordinator; retry failed ones")
+    coordinate.add_argument("--timeout", type=float, default=None,
+                            help="Seconds to wait for all sources (default: no limit)")
+
+    worker = subparsers.add_parser("worker", help="Run (source, stage) work items for a coordinator")
+    worker.add_argument("manifest", type=str, help="Path to the coordinator's pipeline manifest YAML")
+    worker.add_argument("--workdir", type=str, default=None,
+                        help="Working directory shared with the coordinator (default: ./artifacts)")
+    worker.add_argument("--worker-id", type=str, default=None,
+                        help="Worker identifier (default: host, process id and a random suffix)")
+    worker.add_argument("--poll-interval", type=float, default=2.0,
+                        help="Seconds between claims while no item is ready")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point of the ``graph-mesh`` command.
+
+    Args:
+        argv: Command-line arguments (default: ``sys.argv[1:]``)
+    """
+    import sys
+
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # Backward compatible form: graph-mesh manifest.yaml [--workdir ...]
+    if argv and argv[0] not in COMMANDS and not argv[0].startswith("-"):
+        argv.insert(0, "run")
+    args = build_parser().parse_args(argv)
+
+    # Heavy modules are imported per command, so --help stays fast
+    if args.command == "run":
+        from graph_mesh_orchestrator.pipeline import main as run_main
+
+        run_main(args.manifest, workdir=args.workdir, resume=args.resume, incremental=args.incremental,
+                 trace=args.trace, profile_stage=args.profile_stage, deadline_minutes=args.deadline)
+    elif args.command == "plan":
+        import json
+
+        import structlog
+
+        from graph_mesh_orchestrator.planner import plan_pipeline
+
+        # stdout carries the plan itself; send log events to stderr
+        structlog.configure(logger_factory=lambda *args: structlog.PrintLogger(sys.stderr))
+        plan = plan_pipeline(
+            Path(args.manifest),
+            workdir=Path(args.workdir) if args.workdir else None,
+            incremental=args.incremental,
+            max_workers=args.max_workers,
+            max_concurrent_matchers=args.max_matchers,
+            memory_limit_mb=args.memory_limit,
+        )
+        print(json.dumps(plan.to_dict(), indent=2) if args.json else plan.format_text())
+        if plan.exceeds_memory_limit:
+            sys.exit(1)
+    elif args.command == "batch":
+        from graph_mesh_orchestrator.batch import main as batch_main
+
+        logging.basicConfig(level=logging.INFO)
+        batch_main(args.manifests, workdir=args.workdir, max_parallel=args.max_parallel,
+                   max_concurrent_matchers=args.max_matchers)
+    elif args.command == "serve":
+        from graph_mesh_orchestrator.service import DEFAULT_HOST, DEFAULT_PORT, serve
+
+        logging.basicConfig(level=logging.INFO)
+        serve(
+            Path(args.root),
+            host=args.host or DEFAULT_HOST,
+            port=args.port or DEFAULT_PORT,
+            concurrency=args.concurrency,
+            max_concurrent_matchers=args.max_matchers,
+            preload=[Path(p) for p in args.preload],
+            ingest_workers=args.ingest_workers,
+        )
+    elif args.command == "coordinate":
+        from graph_mesh_orchestrator.distributed import coordinator_main
+
+        logging.basicConfig(level=logging.INFO)
+        coordinator_main(args.manifest, workdir=args.workdir, local_workers=args.workers,
+                         lease_seconds=args.lease_seconds, resume=args.resume, timeout=args.timeout)
+    elif args.command == "worker":
+        from graph_mesh_orchestrator.distributed import worker_main
+
+        logging.basicConfig(level=logging.INFO)
+        worker_main(args.manifest, workdir=args.workdir, worker_id=args.worker_id,
+                    poll_interval=args.poll_interval)
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry
+    main()
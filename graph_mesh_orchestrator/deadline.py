@@ -0,0 +1,263 @@
+"""Deadline-aware runs that degrade gracefully to finish on time.
+
+A run given a deadline (``orchestrate(..., deadline=timedelta(minutes=20))``,
+``pipeline.deadline_minutes`` or ``graph-mesh run --deadline``) tracks the
+time it has left and, when it is behind, trades alignment completeness for a
+timely merged graph:
+
+- Preflight checks, which only warn during a run, are skipped.
+- Before each source's alignment, matchers whose mapping is cached are kept
+  (restoring them is cheap); the others run cheapest first, and the slowest
+  ones that would not finish before the deadline are skipped.
+- A source left without any new mapping falls back to the mappings of the
+  previous run in the workdir, when there are any.
+
+Time is always reserved for fusion, so the merged graph is still written.
+Matcher durations are estimated from the matcher runs already finished in
+this run, then from the workdir's previous ``run_metrics.json``, then from
+the planner's cost model. Everything skipped or replaced is recorded as a
+:class:`Degradation`, returned with the run's artifacts and written to
+``<workdir>/deadline.json``.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEADLINE_REPORT = "deadline.json"
+
+# Share of the budget kept for fusion when no earlier fusion was measured
+DEFAULT_FUSION_RESERVE = 0.05
+
+
+@dataclass
+class Degradation:
+    """One thing a deadline run skipped or replaced.
+
+    Attributes:
+        action: 'skipped_preflight', 'skipped_matcher' or 'reused_previous_mappings'
+        stage: Stage affected
+        reason: Why it was done
+        source_id: Source affected, if any
+        matcher: Matcher affected, if any
+        estimated_seconds: Estimated duration of what was skipped
+        remaining_seconds: Time left before the deadline when it was decided
+    """
+
+    action: str
+    stage: str
+    reason: str
+    source_id: Optional[str] = None
+    matcher: Optional[str] = None
+    estimated_seconds: Optional[float] = None
+    remaining_seconds: Optional[float] = None
+
+
+class DeadlineTracker:
+    """Track a run's remaining time budget and decide what to skip.
+
+    Example:
+        >>> tracker = DeadlineTracker(timedelta(minutes=20), history=load_matcher_history(workdir))
+        >>> run, skipped = tracker.plan_matchers(matchers, source_id="users")
+    """
+
+    def __init__(
+        self,
+        deadline: Union[timedelta, float],
+        started: Optional[float] = None,
+        fusion_reserve_seconds: Optional[float] = None,
+        history: Optional[Mapping[str, Any]] = None,
+        default_matcher_seconds: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        """Initialize tracker.
+
+        Args:
+            deadline: Time budget of the run (a timedelta or seconds)
+            started: ``time.monotonic()`` at the start of the run (default: now)
+            fusion_reserve_seconds: Time kept free for fusion (default: the
+                previous run's fusion time, or 5% of the budget)
+            history: Previous run's durations, as returned by
+                :func:`load_matcher_history`
+            default_matcher_seconds: Duration per matcher name used when no
+                run was measured (default: the planner's cost model)
+
+        Raises:
+            ValueError: If the deadline is not positive
+        """
+        seconds = deadline.total_seconds() if isinstance(deadline, timedelta) else float(deadline)
+        if seconds <= 0:
+            raise ValueError("deadline must be positive")
+        self.deadline_seconds = seconds
+        self.started = time.monotonic() if started is None else started
+        history = history or {}
+        if fusion_reserve_seconds is None:
+            fusion_reserve_seconds = history.get("fusion") or seconds * DEFAULT_FUSION_RESERVE
+        self.fusion_reserve_seconds = min(fusion_reserve_seconds, seconds)
+        if default_matcher_seconds is None:
+            # The planner imports the pipeline, which imports this module
+            from graph_mesh_orchestrator.planner import CostModel
+
+            default_matcher_seconds = CostModel().matcher_base_seconds
+        self._defaults = dict(default_matcher_seconds)
+        self._history: Dict[str, float] = dict(history.get("matchers", {}))
+        self._observed: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._degradations: List[Degradation] = []
+
+    def elapsed(self) -> float:
+        """Seconds since the run started."""
+        return time.monotonic() - self.started
+
+    def remaining(self) -> float:
+        """Seconds left for work other than fusion (negative when behind)."""
+        return self.deadline_seconds - self.fusion_reserve_seconds - self.elapsed()
+
+    def expired(self) -> bool:
+        """Whether the time before fusion has run out."""
+        return self.remaining() <= 0
+
+    def observe(self, matcher_name: str, seconds: float) -> None:
+        """Record the duration of a matcher run that executed (not restored from cache)."""
+        with self._lock:
+            self._observed.setdefault(matcher_name, []).append(seconds)
+
+    def estimate(self, matcher_name: str) -> float:
+        """Estimate one run of a matcher, in seconds."""
+        with self._lock:
+            observed = self._observed.get(matcher_name)
+            if observed:
+                return sum(observed) / len(observed)
+        if matcher_name in self._history:
+            return self._history[matcher_name]
+        return self._defaults.get(matcher_name, 30.0)
+
+    def record(self, degradation: Degradation) -> None:
+        """Record something skipped or replaced to meet the deadline."""
+        with self._lock:
+            self._degradations.append(degradation)
+        logger.warning("deadline_degradation", **{k: v for k, v in asdict(degradation).items() if v is not None})
+
+    @property
+    def degradations(self) -> List[Degradation]:
+        """Everything skipped or replaced so far, in decision order."""
+        with self._lock:
+            return list(self._degradations)
+
+    def plan_matchers(
+        self,
+        matchers: Sequence[Any],
+        source_id: Optional[str] = None,
+        cached: Sequence[str] = (),
+    ) -> Tuple[List[Any], List[Any]]:
+        """Choose which matchers a source's alignment can afford.
+
+        Cached matchers are always kept. The others are taken cheapest first
+        while their summed estimate fits in the remaining time; the rest are
+        skipped, and recorded as such.
+
+        Args:
+            matchers: Matchers configured for the alignment
+            source_id: Source being aligned
+            cached: Names of matchers whose mapping is in the artifact cache
+
+        Returns:
+            Matchers to run (cached first, then cheapest first) and matchers skipped
+        """
+        remaining = self.remaining()
+        keep = [m for m in matchers if m.name in cached]
+        budget = remaining
+        skipped = []
+        for matcher in sorted((m for m in matchers if m.name not in cached), key=lambda m: self.estimate(m.name)):
+            estimate = self.estimate(matcher.name)
+            if estimate <= budget:
+                keep.append(matcher)
+                budget -= estimate
+            else:
+                skipped.append(matcher)
+                self.record(Degradation(
+                    action="skipped_matcher", stage="alignment", source_id=source_id,
+                    matcher=matcher.name, estimated_seconds=round(estimate, 3),
+                    remaining_seconds=round(remaining, 3),
+                    reason="estimated run does not fit in the time left before the deadline"))
+        return keep, skipped
+
+    def allows(self, matcher: Any, source_id: Optional[str] = None) -> bool:
+        """Check, just before a matcher starts, that it still fits.
+
+        Earlier matchers and other sources may have used more time than
+        estimated; a matcher that no longer fits is skipped and recorded.
+        """
+        remaining = self.remaining()
+        estimate = self.estimate(matcher.name)
+        if estimate <= remaining:
+            return True
+        self.record(Degradation(
+            action="skipped_matcher", stage="alignment", source_id=source_id, matcher=matcher.name,
+            estimated_seconds=round(estimate, 3), remaining_seconds=round(remaining, 3),
+            reason="deadline budget used up by earlier work"))
+        return False
+
+    def report(self, met: Optional[bool] = None) -> Dict[str, Any]:
+        """Return the deadline summary written to ``deadline.json``."""
+        elapsed = self.elapsed()
+        return {
+            "deadline_seconds": self.deadline_seconds,
+            "elapsed_seconds": round(elapsed, 3),
+            "fusion_reserve_seconds": round(self.fusion_reserve_seconds, 3),
+            "met": elapsed <= self.deadline_seconds if met is None else met,
+            "degraded": bool(self._degradations),
+            "degradations": [asdict(d) for d in self.degradations],
+        }
+
+    def write_report(self, workdir: Path, met: Optional[bool] = None) -> Path:
+        """Write ``deadline.json`` to the workdir.
+
+        Args:
+            workdir: Working directory of the run
+            met: Override for whether the deadline was met
+
+        Returns:
+            Path to the report
+        """
+        path = workdir / DEADLINE_REPORT
+        path.write_text(json.dumps(self.report(met), indent=2))
+        return path
+
+
+def load_matcher_history(workdir: Path) -> Dict[str, Any]:
+    """Read matcher and fusion durations from a previous ``run_metrics.json``.
+
+    Only matcher runs that executed (not restored from the cache) count.
+
+    Args:
+        workdir: Working directory of the previous run
+
+    Returns:
+        ``{"matchers": {name: mean seconds}, "fusion": seconds}``; empty when
+        there was no previous run
+    """
+    try:
+        data = json.loads((workdir / "run_metrics.json").read_text())
+    except (OSError, ValueError):
+        return {}
+    durations: Dict[str, List[float]] = {}
+    history: Dict[str, Any] = {}
+    for unit in data.get("units", []):
+        if unit.get("status") != "ok":
+            continue
+        if unit.get("stage") == "matcher" and unit.get("matcher") and not unit.get("extra", {}).get("cached"):
+            durations.setdefault(unit["matcher"], []).append(unit["wall_seconds"])
+        elif unit.get("stage") == "fusion":
+            history["fusion"] = unit["wall_seconds"]
+    history["matchers"] = {name: sum(values) / len(values) for name, values in durations.items()}
+    return history
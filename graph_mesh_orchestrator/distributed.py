@@ -0,0 +1,497 @@
+"""Distributed execution of one manifest across worker processes and hosts.
+
+``orchestrate`` runs every source of a manifest in one process, and one host
+cannot run three JVM matchers for fifty sources in reasonable time. Here the
+per-source stages are spread over any number of worker processes, on one host
+or on several hosts mounting the same workdir:
+
+- :func:`coordinate` prepares the meta-ontology, enqueues a ``fetch``,
+  ``ingest`` and ``alignment`` item per source in the workdir's
+  :class:`~graph_mesh_orchestrator.workqueue.WorkQueue`, optionally runs some
+  workers itself, waits for the queue to drain, and fuses the results
+- :func:`run_worker` claims items, runs them and records their results until
+  the queue is drained; it renews its leases while it works, so items of a
+  worker that dies are picked up by the others once the lease expires
+
+Usage::
+
+    host-a$ graph-mesh coordinate manifest.yaml --workdir /shared/run --workers 2
+    host-b$ graph-mesh worker manifest.yaml --workdir /shared/run
+    host-c$ graph-mesh worker manifest.yaml --workdir /shared/run
+
+Every host must see the workdir, the local source paths and the artifact
+cache (if any) at the same paths, and must be able to run the matchers.
+Workers refuse to join a queue created from a different manifest.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import structlog
+
+from graph_mesh_aligner.blocking import MinHashBlocker
+from graph_mesh_aligner.matchers import run_alignment
+from graph_mesh_aligner.pool import MatcherPool, default_matcher_pool
+from graph_mesh_core.artifact_cache import cache_key
+from graph_mesh_core.graph_store import MemoryBudget
+from graph_mesh_core.meta_ontology_registry import MetaOntologyRegistry
+from graph_mesh_core.telemetry import MetricsRecorder
+from graph_mesh_orchestrator.errors import PipelineError, RecoverableError, WorkQueueError
+from graph_mesh_orchestrator.ingest import IngestPool, run_ingest
+from graph_mesh_orchestrator.models import PipelineCheckpoint, PipelineManifest, PipelineState, SourceState
+from graph_mesh_orchestrator.pipeline import (
+    MATCHER_REGISTRY,
+    PipelineArtifacts,
+    fetch_source,
+    fuse_sources,
+    load_manifest,
+    meta_ontology_provider_config,
+    prepare_meta_ontology,
+    resolve_cache,
+    save_checkpoint,
+    select_matchers,
+    source_fingerprint,
+    write_run_metrics,
+)
+from graph_mesh_orchestrator.workqueue import (
+    DEFAULT_LEASE_SECONDS,
+    DEFAULT_MAX_ATTEMPTS,
+    QUEUE_NAME,
+    WorkItem,
+    WorkQueue,
+)
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_POLL_INTERVAL = 2.0
+DEFAULT_JOIN_TIMEOUT = 600.0
+
+
+@dataclass
+class WorkerSummary:
+    """What one worker did before the queue drained.
+
+    Attributes:
+        worker_id: Worker identifier
+        completed: Items completed
+        failed: Items that failed
+        lost: Items whose lease was reclaimed before they finished
+    """
+
+    worker_id: str
+    completed: int = 0
+    failed: int = 0
+    lost: int = 0
+
+
+def default_worker_id() -> str:
+    """Return an identifier unique to this host, process and call."""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+def manifest_fingerprint(manifest: PipelineManifest) -> str:
+    """Fingerprint a manifest so workers can check they share the coordinator's."""
+    return cache_key("manifest", manifest.model_dump(mode="json"))
+
+
+def _budget_context(manifest: PipelineManifest, workdir: Path) -> ExitStack:
+    context = ExitStack()
+    if manifest.pipeline.memory_budget_mb:
+        budget = MemoryBudget(manifest.pipeline.memory_budget_mb, spill_dir=str(workdir / "spill"))
+        context.enter_context(budget.activate())
+    return context
+
+
+@contextmanager
+def _heartbeat(queue: WorkQueue, worker_id: str) -> Iterator[None]:
+    """Renew the worker's leases from a background thread while a block runs."""
+    stop = threading.Event()
+    interval = max(queue.lease_seconds / 3, 0.05)
+
+    def beat() -> None:
+        while not stop.wait(interval):
+            try:
+                queue.heartbeat(worker_id)
+            except WorkQueueError as e:
+                logger.warning("worker_heartbeat_failed", worker_id=worker_id, error=str(e))
+
+    thread = threading.Thread(target=beat, name=f"graph-mesh-heartbeat-{worker_id}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _join_queue(path: Path, fingerprint: str, timeout: float, poll_interval: float) -> Optional[WorkQueue]:
+    """Wait until the coordinator has opened the queue.
+
+    Returns:
+        The queue with the coordinator's lease settings, or None if the run
+        it belongs to has already finished
+    """
+    deadline = time.monotonic() + timeout
+    queue = WorkQueue(path)
+    while True:
+        meta = queue.meta()
+        if meta.get("state") in ("open", "closed"):
+            break
+        if time.monotonic() > deadline:
+            raise WorkQueueError(f"No coordinator opened the work queue within {timeout:g}s",
+                                 queue_path=str(path))
+        time.sleep(poll_interval)
+    if meta.get("manifest") != fingerprint:
+        raise WorkQueueError("The work queue was created from a different manifest", queue_path=str(path))
+    if meta["state"] == "closed":
+        return None
+    return WorkQueue(path, lease_seconds=meta["lease_seconds"], max_attempts=meta["max_attempts"])
+
+
+def run_worker(
+    manifest_path: Path,
+    workdir: Optional[Path] = None,
+    worker_id: Optional[str] = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    join_timeout: float = DEFAULT_JOIN_TIMEOUT,
+    cache_dir: Optional[Path] = None,
+    matcher_pool: Optional[MatcherPool] = None,
+    stop: Optional[threading.Event] = None,
+) -> WorkerSummary:
+    """Claim and run (source, stage) items from a workdir's queue until it drains.
+
+    Args:
+        manifest_path: Path to the pipeline manifest the coordinator runs
+        workdir: Shared working directory (default: ./artifacts)
+        worker_id: Worker identifier (default: host, pid and a random suffix)
+        poll_interval: Seconds between claims while nothing is claimable
+        join_timeout: Seconds to wait for a coordinator to open the queue
+        cache_dir: Artifact cache (overrides ``pipeline.cache_dir``)
+        matcher_pool: Pool bounding concurrent matcher runs (default: the
+            process-wide pool)
+        stop: Event that makes the worker exit after its current item
+
+    Returns:
+        WorkerSummary with the worker's item counts
+
+    Raises:
+        WorkQueueError: If no coordinator opens the queue in time, or the
+            queue belongs to a different manifest
+    """
+    workdir = (workdir or Path("artifacts")).resolve()
+    worker_id = worker_id or default_worker_id()
+    log = logger.bind(worker_id=worker_id, workdir=str(workdir))
+    manifest = load_manifest(manifest_path)
+    summary = WorkerSummary(worker_id=worker_id)
+
+    queue = _join_queue(workdir / QUEUE_NAME, manifest_fingerprint(manifest), join_timeout, poll_interval)
+    if queue is None:
+        log.info("worker_queue_closed")
+        return summary
+    meta_path = Path(queue.meta()["meta_ontology_path"])
+
+    cache = resolve_cache(manifest, cache_dir)
+    fetch_cache_dir = cache.root / "fetch" if cache else workdir / "fetch-cache"
+    matcher_pool = matcher_pool or default_matcher_pool()
+    selected_matchers = select_matchers(manifest)
+    blocker = MinHashBlocker() if manifest.pipeline.blocking else None
+    sources = {source.id: source for source in manifest.sources}
+    recorder = MetricsRecorder()
+    ingest_pool = None
+    if manifest.pipeline.ingest_workers > 0:
+        ingest_pool = IngestPool(
+            max_workers=manifest.pipeline.ingest_workers,
+            memory_limit_mb=manifest.pipeline.ingest_memory_limit_mb,
+            timeout_seconds=manifest.pipeline.ingest_timeout,
+            max_tasks_per_worker=manifest.pipeline.ingest_tasks_per_worker,
+        )
+
+    def run_item(item: WorkItem) -> Dict[str, Any]:
+        source = sources.get(item.source_id)
+        if source is None:
+            raise PipelineError(f"Source '{item.source_id}' is not in the worker's manifest")
+        if item.stage == "fetch":
+            fetched = fetch_source(source, workdir, fetch_cache_dir)
+            paths = [str(p) for p in fetched] if isinstance(fetched, (list, tuple)) else str(fetched)
+            return {"fetched": paths, "fingerprint": source_fingerprint(source, fetched)}
+        if item.stage == "ingest":
+            fetched = queue.get(source.id, "fetch").result["fetched"]
+            fetched = [Path(p) for p in fetched] if isinstance(fetched, list) else Path(fetched)
+            converted = run_ingest([source], {source.id: fetched}, workdir, cache=cache, pool=ingest_pool)
+            return {"converted": str(converted[source.id])}
+        if item.stage == "alignment":
+            if not selected_matchers:
+                log.warning("no_matchers_available", source_id=source.id)
+                return {"mappings": []}
+            converted = Path(queue.get(source.id, "ingest").result["converted"])
+            target = meta_path
+            if blocker is not None:
+                target = blocker.block([converted], meta_path, workdir / "blocking" / f"{source.id}.nt").target_path
+            mapping_paths = run_alignment(selected_matchers, converted, target,
+                                          workdir / "mappings" / source.id, cache=cache, pool=matcher_pool)
+            return {"mappings": [str(p) for p in mapping_paths]}
+        raise PipelineError(f"Unknown stage '{item.stage}'")
+
+    queue.register_worker(worker_id)
+    log.info("worker_started", queue=str(queue.path))
+    try:
+        with _budget_context(manifest, workdir):
+            while stop is None or not stop.is_set():
+                item = queue.claim(worker_id)
+                if item is None:
+                    if queue.drained():
+                        break
+                    time.sleep(poll_interval)
+                    continue
+
+                log.info("work_item_claimed", source_id=item.source_id, stage=item.stage, attempt=item.attempts)
+                with _heartbeat(queue, worker_id):
+                    try:
+                        with recorder.measure(item.stage, source_id=item.source_id):
+                            result = run_item(item)
+                    except RecoverableError as e:
+                        recorded = queue.fail(item, str(e), retry=e.can_retry())
+                        summary.failed += recorded
+                    except Exception as e:
+                        log.error("work_item_failed", source_id=item.source_id, stage=item.stage, error=str(e))
+                        recorded = queue.fail(item, str(e))
+                        summary.failed += recorded
+                    else:
+                        recorded = queue.complete(item, result)
+                        summary.completed += recorded
+                summary.lost += not recorded
+    finally:
+        if ingest_pool is not None:
+            ingest_pool.shutdown()
+        safe_id = re.sub(r"[^A-Za-z0-9._-]+", "-", worker_id)
+        recorder.write_json(workdir / "workers" / f"{safe_id}.run_metrics.json",
+                            pipeline=manifest.name, worker_id=worker_id, status="completed")
+
+    log.info("worker_finished", completed=summary.completed, failed=summary.failed, lost=summary.lost)
+    return summary
+
+
+def coordinate(
+    manifest_path: Path,
+    workdir: Optional[Path] = None,
+    local_workers: int = 1,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    resume: bool = False,
+    cache_dir: Optional[Path] = None,
+    timeout: Optional[float] = None,
+) -> PipelineArtifacts:
+    """Run a manifest with per-source stages spread over distributed workers.
+
+    Args:
+        manifest_path: Path to pipeline manifest
+        workdir: Working directory shared with the workers (default: ./artifacts)
+        local_workers: Workers run as threads of this process (0 to rely on
+            remote workers only)
+        lease_seconds: Lease on a claimed item; a worker that misses
+            heartbeats for this long loses its items to other workers
+        max_attempts: Claims per item before an expired lease fails it
+        poll_interval: Seconds between queue polls
+        resume: Keep items completed by an earlier coordinator in this
+            workdir and retry only failed ones
+        cache_dir: Artifact cache (overrides ``pipeline.cache_dir``)
+        timeout: Seconds to wait for the queue to drain (default: no limit)
+
+    Returns:
+        PipelineArtifacts with paths to all outputs
+
+    Raises:
+        PipelineError: If a source's fetch or ingest failed, or the queue did
+            not drain within ``timeout``
+    """
+    workdir = (workdir or Path("artifacts")).resolve()
+    workdir.mkdir(parents=True, exist_ok=True)
+    log = logger.bind(manifest=str(manifest_path), workdir=str(workdir))
+    manifest = load_manifest(manifest_path)
+    cache = resolve_cache(manifest, cache_dir)
+    recorder = MetricsRecorder()
+    checkpoint = PipelineCheckpoint(
+        manifest_path=str(manifest_path),
+        workdir=str(workdir),
+        state=PipelineState.VALIDATING,
+        current_stage="meta_ontology",
+        sources={src.id: SourceState(source_id=src.id) for src in manifest.sources},
+        timestamp=datetime.utcnow().isoformat(),
+    )
+
+    queue = WorkQueue(workdir / QUEUE_NAME, lease_seconds=lease_seconds, max_attempts=max_attempts)
+    if resume:
+        log.info("work_queue_resumed", requeued=queue.retry_failed())
+    else:
+        queue.clear()
+
+    executor: Optional[ThreadPoolExecutor] = None
+    futures: List[Any] = []
+    with _budget_context(manifest, workdir):
+        try:
+            with recorder.measure("meta_ontology"):
+                provider_config = meta_ontology_provider_config(manifest)
+                provider = MetaOntologyRegistry.create(provider_config)
+                provider_name_safe = provider.get_info().name.lower().replace(" ", "-")
+                meta_path = workdir / "meta" / f"{provider_name_safe}-meta-ontology.ttl"
+                snapshot = prepare_meta_ontology(provider, provider_config, meta_path, cache)
+            checkpoint.meta_ontology_path = str(meta_path)
+
+            enabled = [source for source in manifest.sources if source.enabled]
+            queue.enqueue(item for source in enabled for item in (
+                (source.id, "fetch", None), (source.id, "ingest", "fetch"), (source.id, "alignment", "ingest")))
+            queue.set_meta(manifest=manifest_fingerprint(manifest), meta_ontology_path=str(meta_path),
+                           lease_seconds=lease_seconds, max_attempts=max_attempts, state="open")
+            log.info("work_queue_open", queue=str(queue.path), items=queue.counts(), local_workers=local_workers)
+
+            checkpoint.state, checkpoint.current_stage = PipelineState.ALIGNING, "sources"
+            with recorder.measure("sources"):
+                if local_workers > 0:
+                    executor = ThreadPoolExecutor(max_workers=local_workers,
+                                                  thread_name_prefix="graph-mesh-worker")
+                    futures = [executor.submit(run_worker, manifest_path, workdir,
+                                               worker_id=f"{default_worker_id()}-{n}",
+                                               poll_interval=poll_interval, cache_dir=cache_dir)
+                               for n in range(local_workers)]
+                _wait_for_queue(queue, poll_interval, timeout, log)
+
+            # Results per source, in manifest order
+            converted: Dict[str, Path] = {}
+            mappings: Dict[str, List[Path]] = {}
+            failures: List[str] = []
+            for source in enabled:
+                state = checkpoint.sources[source.id]
+                fetch, ingest, align = (queue.get(source.id, stage) for stage in ("fetch", "ingest", "alignment"))
+                if fetch.status == "done":
+                    fetched = fetch.result["fetched"]
+                    state.fetched, state.fingerprint = True, fetch.result["fingerprint"]
+                    if isinstance(fetched, list):
+                        state.fetch_paths = fetched
+                    else:
+                        state.fetch_path = fetched
+                if ingest.status == "done":
+                    converted[source.id] = Path(ingest.result["converted"])
+                    state.ingested, state.converted_path = True, ingest.result["converted"]
+                if align.status == "done":
+                    mappings[source.id] = [Path(p) for p in align.result["mappings"]]
+                    state.aligned, state.mapping_paths = True, align.result["mappings"]
+                    state.alignment_fingerprint = cache_key(
+                        "alignment-inputs", state.fingerprint, snapshot.key,
+                        sorted(name for name in manifest.matchers if name in MATCHER_REGISTRY))
+                for item in (fetch, ingest, align):
+                    if item.status == "failed":
+                        state.error = state.error or item.error
+                        if item.stage != "alignment":
+                            failures.append(f"{item.source_id}/{item.stage}: {item.error}")
+                        elif ingest.status == "done":
+                            # As in orchestrate(), a failed alignment does not fail the run
+                            log.error("alignment_failed", source_id=source.id, error=item.error)
+            if failures:
+                raise PipelineError(f"{len(failures)} work items failed: {'; '.join(failures)}")
+
+            checkpoint.state, checkpoint.current_stage = PipelineState.FUSING, "fusion"
+            with recorder.measure("fusion"):
+                merged_path = fuse_sources(manifest, converted, snapshot, workdir)
+            checkpoint.merged_graph_path = str(merged_path)
+            checkpoint.state, checkpoint.current_stage = PipelineState.COMPLETED, "completed"
+            log.info("distributed_pipeline_complete", merged_graph=str(merged_path), workers=len(queue.workers()))
+            return PipelineArtifacts(
+                workdir=workdir,
+                meta_ontology=meta_path,
+                meta_ontology_provider_name=snapshot.info.name,
+                meta_ontology_provider_version=snapshot.info.version,
+                converted=converted,
+                mappings=mappings,
+                merged_graph=merged_path,
+            )
+        except Exception as e:
+            log.error("distributed_pipeline_failed", error=str(e), stage=checkpoint.current_stage)
+            checkpoint.state, checkpoint.error_message = PipelineState.FAILED, str(e)
+            if isinstance(e, PipelineError):
+                raise
+            raise PipelineError(f"Pipeline execution failed: {str(e)}") from e
+        finally:
+            # Workers exit once the queue is closed or drained
+            queue.set_meta(state="closed")
+            if executor is not None:
+                executor.shutdown(wait=True)
+                for future in futures:
+                    if future.exception() is not None:
+                        log.warning("local_worker_failed", error=str(future.exception()))
+            save_checkpoint(checkpoint, workdir)
+            write_run_metrics(recorder, workdir, manifest, status=checkpoint.state.value)
+
+
+def _wait_for_queue(queue: WorkQueue, poll_interval: float, timeout: Optional[float], log: Any) -> None:
+    """Block until no item is pending or leased, logging progress."""
+    deadline = time.monotonic() + timeout if timeout else None
+    last_counts = None
+    while True:
+        counts = queue.counts()
+        if counts != last_counts:
+            log.info("work_queue_progress", **counts)
+            last_counts = counts
+        if counts["pending"] == 0 and counts["leased"] == 0:
+            return
+        if deadline is not None and time.monotonic() > deadline:
+            raise PipelineError(f"Work queue did not drain within {timeout:g}s "
+                                f"({counts['pending']} pending, {counts['leased']} leased)")
+        time.sleep(poll_interval)
+
+
+def coordinator_main(
+    manifest_path: str,
+    workdir: Optional[str] = None,
+    local_workers: int = 1,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    resume: bool = False,
+    timeout: Optional[float] = None,
+) -> None:
+    """Entry point of ``graph-mesh coordinate``.
+
+    Args:
+        manifest_path: Path to pipeline manifest
+        workdir: Shared working directory
+        local_workers: Workers run by the coordinator itself
+        lease_seconds: Lease on a claimed item
+        resume: Keep completed items of an earlier coordinator
+        timeout: Seconds to wait for the queue to drain
+    """
+    artifacts = coordinate(Path(manifest_path), workdir=Path(workdir) if workdir else None,
+                           local_workers=local_workers, lease_seconds=lease_seconds,
+                           resume=resume, timeout=timeout)
+    logger.info("pipeline_success", merged_graph=str(artifacts.merged_graph),
+                converted_count=len(artifacts.converted))
+
+
+def worker_main(
+    manifest_path: str,
+    workdir: Optional[str] = None,
+    worker_id: Optional[str] = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    join_timeout: float = DEFAULT_JOIN_TIMEOUT,
+) -> None:
+    """Entry point of ``graph-mesh worker``.
+
+    Args:
+        manifest_path: Path to the coordinator's pipeline manifest
+        workdir: Shared working directory
+        worker_id: Worker identifier
+        poll_interval: Seconds between claims while idle
+        join_timeout: Seconds to wait for a coordinator
+    """
+    run_worker(Path(manifest_path), workdir=Path(workdir) if workdir else None, worker_id=worker_id,
+               poll_interval=poll_interval, join_timeout=join_timeout)
@@ -117,6 +117,23 @@ class CheckpointError(PipelineError):
         super().__init__(message, details)
 
 
+class WorkQueueError(PipelineError):
+    """Raised when the distributed work queue is unusable or inconsistent."""
+
+    def __init__(self, message: str, queue_path: Optional[str] = None) -> None:
+        details = {}
+        if queue_path:
+            details["queue_path"] = queue_path
+        super().__init__(message, details)
+
+
+class JobNotFoundError(PipelineError):
+    """Raised when the orchestrator service has no job with a given ID."""
+
+    def __init__(self, job_id: str) -> None:
+        super().__init__(f"Unknown job: {job_id}", {"job_id": job_id})
+
+
 # Stage-Specific Errors
 
 class StageError(PipelineError):
@@ -0,0 +1,586 @@
+"""Remote fetchers for HTTP(S), S3 and git sources.
+
+Downloads go through an on-disk fetch cache, one entry per URL::
+
+    <cache root>/<sha256(url)[:2]>/<sha256(url)>/
+        content           # last complete download
+        content.partial   # interrupted download, resumed on the next attempt
+        meta.json         # url, ETag, Last-Modified, size
+        .lock             # flock held while the entry is updated
+
+A cached HTTP or S3 object is revalidated with a conditional request
+(``If-None-Match``/``If-Modified-Since``); an unchanged object costs one
+round trip and is never downloaded again. An interrupted download is resumed
+with a ``Range`` request guarded by ``If-Range``, so a changed object is
+downloaded from scratch instead of being spliced. Git sources keep a shallow
+clone per URL and branch that is only updated when the remote head moves.
+
+HTTP requests share one thread-safe urllib3 connection pool; the pipeline
+scheduler runs the fetches of different sources concurrently. S3 support uses
+boto3, an optional dependency; ``credentials.endpoint_url`` points it at an
+S3-compatible store such as MinIO or LocalStack.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from email.utils import formatdate
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+from urllib.parse import unquote, urlparse
+
+import structlog
+
+from graph_mesh_core.telemetry import annotate
+from graph_mesh_orchestrator.errors import FetchError, NetworkError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+logger = structlog.get_logger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+DEFAULT_TIMEOUT = 60.0
+
+# Status codes worth retrying; everything else >= 400 is a configuration problem
+_TRANSIENT_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching one remote object.
+
+    Attributes:
+        path: Cached content path
+        status: 'downloaded', 'resumed' or 'not_modified'
+        bytes_downloaded: Bytes transferred by this fetch
+    """
+
+    path: Path
+    status: str
+    bytes_downloaded: int = 0
+
+
+class FetchCache:
+    """On-disk cache of remote objects, keyed by URL."""
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        """Initialize cache.
+
+        Args:
+            root: Cache directory (created if missing)
+        """
+        self.root = Path(root).expanduser().resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def entry_dir(self, url: str) -> Path:
+        """Return the entry directory for a URL."""
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.root / digest[:2] / digest
+
+    @contextmanager
+    def locked(self, url: str) -> Iterator[Path]:
+        """Hold an exclusive lock on a URL's entry while it is read or updated.
+
+        The lock is an ``flock`` on a per-entry file, so it serializes threads
+        and processes sharing the cache.
+
+        Yields:
+            The entry directory
+        """
+        entry = self.entry_dir(url)
+        entry.mkdir(parents=True, exist_ok=True)
+        with open(entry / ".lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield entry
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def read_meta(entry: Path) -> Dict[str, Any]:
+        """Return an entry's metadata, or an empty dict."""
+        try:
+            return json.loads((entry / "meta.json").read_text())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def write_meta(entry: Path, meta: Mapping[str, Any]) -> None:
+        """Replace an entry's metadata atomically."""
+        tmp_path = entry / f".meta.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_path.write_text(json.dumps(dict(meta), indent=2))
+        tmp_path.replace(entry / "meta.json")
+
+
+_http_pool = None
+_http_pool_lock = threading.Lock()
+
+
+def http_pool():
+    """Return the process-wide urllib3 connection pool."""
+    global _http_pool
+    with _http_pool_lock:
+        if _http_pool is None:
+            import urllib3
+            from urllib3.util import Retry
+
+            _http_pool = urllib3.PoolManager(
+                num_pools=32,
+                maxsize=8,
+                retries=Retry(total=3, connect=3, read=0, redirect=5, backoff_factor=0.5,
+                              status_forcelist=[502, 503, 504], raise_on_status=False),
+            )
+        return _http_pool
+
+
+def _auth_headers(credentials: Optional[Mapping[str, str]]) -> Dict[str, str]:
+    """Build request headers from ``fetch.credentials``."""
+    import urllib3
+
+    credentials = credentials or {}
+    headers: Dict[str, str] = {}
+    if credentials.get("token"):
+        headers["Authorization"] = f"Bearer {credentials['token']}"
+    elif credentials.get("username"):
+        headers.update(urllib3.make_headers(
+            basic_auth=f"{credentials['username']}:{credentials.get('password', '')}"))
+    return headers
+
+
+def _validators(meta: Mapping[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    return meta.get("etag"), meta.get("last_modified")
+
+
+class HTTPFetcher:
+    """Fetch HTTP(S) resources with revalidation and resumable downloads."""
+
+    def __init__(self, cache: FetchCache, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """Initialize fetcher.
+
+        Args:
+            cache: Fetch cache
+            timeout: Connect and read timeout in seconds
+        """
+        self.cache = cache
+        self.timeout = timeout
+
+    def fetch(self, url: str, credentials: Optional[Mapping[str, str]] = None) -> FetchResult:
+        """Fetch a URL into the cache.
+
+        Args:
+            url: HTTP or HTTPS URL
+            credentials: Optional ``token`` or ``username``/``password``
+
+        Returns:
+            FetchResult for the cached content
+
+        Raises:
+            NetworkError: On connection failures and transient HTTP statuses
+                (a partial download is kept and resumed on retry)
+            FetchError: On other HTTP errors
+        """
+        import urllib3
+
+        with self.cache.locked(url) as entry:
+            content = entry / "content"
+            partial = entry / "content.partial"
+            meta = self.cache.read_meta(entry)
+            headers = _auth_headers(credentials)
+
+            offset = 0
+            if content.exists():
+                etag, last_modified = _validators(meta)
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+            elif partial.exists() and partial.stat().st_size and any(_validators(meta.get("partial", {}))):
+                offset = partial.stat().st_size
+                etag, last_modified = _validators(meta["partial"])
+                headers["Range"] = f"bytes={offset}-"
+                headers["If-Range"] = etag or last_modified
+
+            try:
+                response = http_pool().request(
+                    "GET", url, headers=headers, preload_content=False,
+                    timeout=urllib3.Timeout(connect=self.timeout, read=self.timeout),
+                )
+            except urllib3.exceptions.HTTPError as e:
+                raise NetworkError(f"Request failed: {e}", url=url) from e
+
+            try:
+                if response.status == 304 and content.exists():
+                    logger.debug("fetch_not_modified", url=url)
+                    return FetchResult(content, "not_modified")
+                if response.status == 416:
+                    # Stale partial longer than the object; start over next attempt
+                    partial.unlink(missing_ok=True)
+                    raise NetworkError("Range not satisfiable; restarting download", url=url)
+                if response.status in _TRANSIENT_STATUS:
+                    raise NetworkError(f"HTTP {response.status}", url=url, status=response.status)
+                if response.status >= 400:
+                    raise FetchError(f"HTTP {response.status} for {url}", source_id="unknown", path=url)
+
+                resumed = response.status == 206 and offset > 0
+                validators = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+                meta["url"] = url
+                meta["partial"] = validators
+                self.cache.write_meta(entry, meta)
+
+                written = self._stream(response, url, partial, append=resumed)
+            finally:
+                response.release_conn()
+
+            expected = response.headers.get("Content-Length")
+            if expected is not None and written != int(expected):
+                raise NetworkError(f"Truncated download ({written} of {expected} bytes)", url=url)
+
+            partial.replace(content)
+            meta.pop("partial", None)
+            meta.update(validators)
+            meta.update(size=content.stat().st_size,
+                        fetched_at=formatdate(time.time(), usegmt=True))
+            self.cache.write_meta(entry, meta)
+            status = "resumed" if resumed else "downloaded"
+            logger.info("fetch_downloaded", url=url, status=status, bytes=written)
+            return FetchResult(content, status, written)
+
+    def _stream(self, response, url: str, partial: Path, append: bool) -> int:
+        import urllib3
+
+        written = 0
+        try:
+            with open(partial, "ab" if append else "wb") as f:
+                # read1 hands over whatever has arrived, so the bytes received
+                # before a dropped connection reach the partial file
+                while True:
+                    chunk = response.read1(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    written += len(chunk)
+        except urllib3.exceptions.HTTPError as e:
+            # Keep what arrived; the retry resumes from here
+            raise NetworkError(f"Download interrupted: {e}", url=url) from e
+        return written
+
+
+class S3Fetcher:
+    """Fetch S3 objects with revalidation and resumable downloads (requires boto3)."""
+
+    def __init__(self, cache: FetchCache) -> None:
+        """Initialize fetcher.
+
+        Args:
+            cache: Fetch cache
+        """
+        self.cache = cache
+        self._clients: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    def _client(self, credentials: Mapping[str, str]):
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError as e:
+            raise FetchError(
+                "S3 sources require boto3 (pip install 'graph-mesh[s3]')",
+                source_id="unknown",
+                fetch_type="s3",
+            ) from e
+
+        key = (credentials.get("endpoint_url"), credentials.get("aws_access_key_id"), credentials.get("region"))
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = boto3.client(
+                    "s3",
+                    endpoint_url=credentials.get("endpoint_url"),
+                    aws_access_key_id=credentials.get("aws_access_key_id"),
+                    aws_secret_access_key=credentials.get("aws_secret_access_key"),
+                    aws_session_token=credentials.get("aws_session_token"),
+                    region_name=credentials.get("region"),
+                    config=Config(max_pool_connections=16, retries={"max_attempts": 3}),
+                )
+            return self._clients[key]
+
+    def fetch(self, url: str, credentials: Optional[Mapping[str, str]] = None) -> FetchResult:
+        """Fetch an ``s3://bucket/key`` object into the cache.
+
+        Args:
+            url: S3 URL
+            credentials: Optional ``aws_access_key_id``, ``aws_secret_access_key``,
+                ``aws_session_token``, ``region`` and ``endpoint_url``
+
+        Returns:
+            FetchResult for the cached content
+
+        Raises:
+            NetworkError: On connection failures (a partial download is resumed on retry)
+            FetchError: On other S3 errors
+        """
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        parsed = urlparse(url)
+        bucket, key = parsed.netloc, parsed.path.lstrip("/")
+        if not bucket or not key:
+            raise FetchError(f"Invalid S3 URL: {url}", source_id="unknown", fetch_type="s3")
+        client = self._client(credentials or {})
+
+        with self.cache.locked(url) as entry:
+            content = entry / "content"
+            partial = entry / "content.partial"
+            meta = self.cache.read_meta(entry)
+            request: Dict[str, Any] = {"Bucket": bucket, "Key": key}
+
+            offset = 0
+            if content.exists() and meta.get("etag"):
+                request["IfNoneMatch"] = meta["etag"]
+            elif partial.exists() and partial.stat().st_size and meta.get("partial", {}).get("etag"):
+                offset = partial.stat().st_size
+                request["Range"] = f"bytes={offset}-"
+                request["IfMatch"] = meta["partial"]["etag"]
+
+            try:
+                response = client.get_object(**request)
+            except ClientError as e:
+                status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+                code = str(e.response.get("Error", {}).get("Code"))
+                if (status == 304 or code == "304") and content.exists():
+                    logger.debug("fetch_not_modified", url=url)
+                    return FetchResult(content, "not_modified")
+                if status in (412, 416) or code in ("PreconditionFailed", "InvalidRange"):
+                    # The object changed (or shrank) since the partial download
+                    partial.unlink(missing_ok=True)
+                    raise NetworkError("Object changed during download; restarting", url=url) from e
+                if status in _TRANSIENT_STATUS:
+                    raise NetworkError(f"S3 error {code}", url=url) from e
+                raise FetchError(f"S3 error {code} for {url}", source_id="unknown", fetch_type="s3") from e
+            except BotoCoreError as e:
+                raise NetworkError(f"S3 request failed: {e}", url=url) from e
+
+            etag = response.get("ETag")
+            meta["url"] = url
+            meta["partial"] = {"etag": etag}
+            self.cache.write_meta(entry, meta)
+
+            resumed = offset > 0
+            written = 0
+            try:
+                with open(partial, "ab" if resumed else "wb") as f:
+                    for chunk in response["Body"].iter_chunks(CHUNK_SIZE):
+                        f.write(chunk)
+                        written += len(chunk)
+            except BotoCoreError as e:
+                raise NetworkError(f"Download interrupted: {e}", url=url) from e
+            if written != response.get("ContentLength", written):
+                raise NetworkError(f"Truncated download ({written} bytes)", url=url)
+
+            partial.replace(content)
+            meta.pop("partial", None)
+            meta.update(etag=etag, size=content.stat().st_size)
+            self.cache.write_meta(entry, meta)
+            status = "resumed" if resumed else "downloaded"
+            logger.info("fetch_downloaded", url=url, status=status, bytes=written)
+            return FetchResult(content, status, written)
+
+
+class GitFetcher:
+    """Keep shallow clones of git repositories, updated only when the remote moves."""
+
+    def __init__(self, cache: FetchCache, timeout: float = 600.0) -> None:
+        """Initialize fetcher.
+
+        Args:
+            cache: Fetch cache
+            timeout: Timeout per git command in seconds
+        """
+        self.cache = cache
+        self.timeout = timeout
+
+    def _git(self, *args: str, cwd: Optional[Path] = None) -> str:
+        try:
+            completed = subprocess.run(
+                ["git", *args], cwd=cwd, capture_output=True, text=True,
+                timeout=self.timeout, check=True,
+                env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+            )
+        except FileNotFoundError as e:
+            raise FetchError("git executable not found", source_id="unknown", fetch_type="git") from e
+        except subprocess.TimeoutExpired as e:
+            raise NetworkError(f"git {args[0]} timed out", timeout_seconds=self.timeout) from e
+        except subprocess.CalledProcessError as e:
+            raise NetworkError(f"git {args[0]} failed: {e.stderr.strip()}") from e
+        return completed.stdout.strip()
+
+    def fetch(self, url: str, branch: Optional[str] = None) -> FetchResult:
+        """Clone or update a repository in the cache.
+
+        Args:
+            url: Repository URL
+            branch: Branch or tag (default: the remote HEAD)
+
+        Returns:
+            FetchResult whose path is the checkout directory
+        """
+        ref = branch or "HEAD"
+        with self.cache.locked(f"{url}#{ref}") as entry:
+            checkout = entry / "repo"
+            remote = self._git("ls-remote", url, ref).split()
+            remote_head = remote[0] if remote else None
+
+            if (checkout / ".git").exists():
+                local_head = self._git("rev-parse", "HEAD", cwd=checkout)
+                if remote_head and local_head == remote_head:
+                    logger.debug("fetch_not_modified", url=url, ref=ref)
+                    return FetchResult(checkout, "not_modified")
+                self._git("fetch", "--depth", "1", "origin", ref, cwd=checkout)
+                self._git("checkout", "--force", "--detach", "FETCH_HEAD", cwd=checkout)
+                self._git("clean", "-fdx", cwd=checkout)
+            else:
+                shutil.rmtree(checkout, ignore_errors=True)
+                clone_args = ["clone", "--depth", "1"]
+                if branch:
+                    clone_args += ["--branch", branch]
+                self._git(*clone_args, url, str(checkout))
+
+            logger.info("fetch_downloaded", url=url, ref=ref)
+            return FetchResult(checkout, "downloaded")
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    """Materialize a cached file in the workdir."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.unlink(missing_ok=True)
+    try:
+        # Cache updates replace files rather than rewriting them, so a hard
+        # link never changes under the pipeline
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def _file_name(url: str) -> str:
+    name = PurePosixPath(unquote(urlparse(url).path)).name
+    return name or "download"
+
+
+def fetch_remote(source: Any, workdir: Path, cache_dir: Optional[Path] = None) -> Union[str, List[str]]:
+    """Fetch a remote source into ``<workdir>/sources/<source id>/``.
+
+    Git sources must select the schema files to convert with
+    ``fetch.path``/``fetch.paths``, relative to the repository root.
+
+    Args:
+        source: SourceConfig with an http, https, s3 or git fetch type
+        workdir: Pipeline working directory
+        cache_dir: Fetch cache directory (default: ``<workdir>/fetch-cache``)
+
+    Returns:
+        Path or list of paths to the fetched data
+
+    Raises:
+        FetchError: If the source cannot be fetched
+        NetworkError: On transient failures worth retrying
+    """
+    fetch_info = source.fetch
+    fetch_type = fetch_info.type.value if hasattr(fetch_info.type, "value") else str(fetch_info.type)
+    cache = FetchCache(cache_dir or workdir / "fetch-cache")
+    destination_dir = workdir / "sources" / source.id
+
+    try:
+        if fetch_type in ("http", "https"):
+            result = HTTPFetcher(cache).fetch(fetch_info.url, fetch_info.credentials)
+            fetched = [(result.path, destination_dir / _file_name(fetch_info.url))]
+        elif fetch_type == "s3":
+            result = _s3_fetcher(cache).fetch(fetch_info.url, fetch_info.credentials)
+            fetched = [(result.path, destination_dir / _file_name(fetch_info.url))]
+        elif fetch_type == "git":
+            selected = fetch_info.paths or ([fetch_info.path] if fetch_info.path else [])
+            if not selected:
+                # Converters take schema files, not a whole checkout
+                raise FetchError(f"Git source '{source.id}' requires fetch.path or fetch.paths",
+                                 source_id=source.id, fetch_type=fetch_type)
+            result = GitFetcher(cache).fetch(fetch_info.url, fetch_info.branch)
+            fetched = []
+            for relative in selected:
+                inside = (result.path / relative).resolve()
+                if result.path.resolve() not in inside.parents or not inside.exists():
+                    raise FetchError(f"Path not found in repository: {relative}",
+                                     source_id=source.id, fetch_type=fetch_type, path=relative)
+                if not inside.is_file():
+                    raise FetchError(f"Git source '{source.id}' path is not a file: {relative}",
+                                     source_id=source.id, fetch_type=fetch_type, path=relative)
+                fetched.append((inside, destination_dir / relative))
+        else:
+            raise FetchError(f"Unsupported fetch type: {fetch_type}",
+                             source_id=source.id, fetch_type=fetch_type)
+    except FetchError as e:
+        if e.details.get("source_id") in (None, "unknown"):
+            e.details["source_id"] = source.id
+        raise
+
+    for cached, destination in fetched:
+        _link_or_copy(cached, destination)
+    annotate(fetch_status=result.status, bytes_downloaded=result.bytes_downloaded)
+    logger.info("fetched_remote_source", source_id=source.id, fetch_type=fetch_type,
+                status=result.status, bytes_downloaded=result.bytes_downloaded)
+
+    paths = [str(destination) for _, destination in fetched]
+    return paths[0] if len(paths) == 1 else paths
+
+
+def cached_paths(source: Any, cache_dir: Path) -> Optional[List[Path]]:
+    """Return the cached copies of a remote source without contacting the remote.
+
+    Args:
+        source: SourceConfig with an http, https, s3 or git fetch type
+        cache_dir: Fetch cache directory
+
+    Returns:
+        Paths inside the fetch cache, or None if the source was never fetched
+    """
+    fetch_info = source.fetch
+    fetch_type = fetch_info.type.value if hasattr(fetch_info.type, "value") else str(fetch_info.type)
+    cache_dir = Path(cache_dir)
+    if not cache_dir.exists():
+        return None
+    cache = FetchCache(cache_dir)
+    if fetch_type == "git":
+        checkout = cache.entry_dir(f"{fetch_info.url}#{fetch_info.branch or 'HEAD'}") / "repo"
+        if not checkout.exists():
+            return None
+        selected = fetch_info.paths or ([fetch_info.path] if fetch_info.path else [])
+        if not selected:
+            return None
+        paths = [checkout / relative for relative in selected]
+    else:
+        paths = [cache.entry_dir(fetch_info.url) / "content"]
+    return paths if all(path.is_file() for path in paths) else None
+
+
+_s3_fetchers: Dict[Path, S3Fetcher] = {}
+_s3_fetchers_lock = threading.Lock()
+
+
+def _s3_fetcher(cache: FetchCache) -> S3Fetcher:
+    """Return an S3 fetcher per cache, so boto3 clients and their pools are reused."""
+    with _s3_fetchers_lock:
+        if cache.root not in _s3_fetchers:
+            _s3_fetchers[cache.root] = S3Fetcher(cache)
+        return _s3_fetchers[cache.root]
@@ -0,0 +1,346 @@
+"""Stage hooks for profilers and custom instrumentation.
+
+A :class:`HookRegistry` passed to :func:`orchestrate` (or listed under
+``pipeline.hooks`` in the manifest) receives callbacks as the run
+progresses, without changes to the orchestrator itself:
+
+- ``before_stage``: a stage is about to run
+- ``after_stage``: a stage finished or failed (``event.error`` is set)
+- ``on_source``: a source finished fetch, ingest and alignment
+- ``on_matcher_result``: one matcher produced (or restored) its mapping
+
+Every callback receives a :class:`HookEvent` carrying the checkpoint, the
+workdir, the artifact paths produced so far and, after a unit of work, its
+:class:`~graph_mesh_core.telemetry.UnitMetrics` timings. Stages are the
+run-level ``meta_ontology``, ``sources`` and ``fusion`` stages and the
+per-source ``fetch``, ``ingest`` and ``alignment`` stages (``event.source_id``
+set). With ``parallel_sources``, per-source callbacks arrive concurrently
+from worker threads, so hooks must be thread-safe; ``before_stage`` and
+``after_stage`` for the same stage always run on the same thread.
+
+Hooks never fail a run: exceptions raised by a callback are logged and
+ignored.
+
+Example:
+    >>> hooks = HookRegistry()
+    >>> @hooks.after_stage
+    ... def ship(event):
+    ...     statsd.timing(f"graph_mesh.{event.stage}", event.wall_seconds)
+    >>> orchestrate(manifest_path, hooks=hooks)
+
+:class:`StageProfiler`, behind ``graph-mesh run --profile-stage``, is built
+on the same callbacks.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import structlog
+
+from graph_mesh_core.lazy import load_object
+from graph_mesh_core.telemetry import UnitMetrics
+from graph_mesh_orchestrator.errors import PipelineConfigurationError
+
+if TYPE_CHECKING:
+    # Models load pydantic; the CLI imports STAGES from here at startup
+    from graph_mesh_orchestrator.models import PipelineCheckpoint
+
+logger = structlog.get_logger(__name__)
+
+HOOK_EVENTS: Tuple[str, ...] = ("before_stage", "after_stage", "on_source", "on_matcher_result")
+
+#: Stages reported to ``before_stage``/``after_stage``
+STAGES: Tuple[str, ...] = ("meta_ontology", "sources", "fetch", "ingest", "alignment", "fusion")
+
+HookCallback = Callable[["HookEvent"], Any]
+
+
+@dataclass
+class HookEvent:
+    """What a hook callback is told about the run.
+
+    Attributes:
+        event: Callback name (one of :data:`HOOK_EVENTS`)
+        stage: Stage the event belongs to
+        checkpoint: Live pipeline checkpoint (read it, do not modify it)
+        workdir: Working directory of the run
+        source_id: Source the event belongs to, for per-source stages
+        matcher: Matcher name, for ``on_matcher_result``
+        artifacts: Paths produced so far (e.g., 'fetched', 'converted',
+            'mappings', 'mapping', 'meta_ontology', 'merged_graph')
+        metrics: Timings of the finished unit (``after_stage``,
+            ``on_matcher_result``)
+        error: Exception that failed the stage (``after_stage`` only)
+        started_at: Start time (seconds since the epoch)
+    """
+
+    event: str
+    stage: str
+    checkpoint: PipelineCheckpoint
+    workdir: Path
+    source_id: Optional[str] = None
+    matcher: Optional[str] = None
+    artifacts: Dict[str, Any] = field(default_factory=dict)
+    metrics: Optional[UnitMetrics] = None
+    error: Optional[BaseException] = None
+    started_at: float = field(default_factory=time.time)
+
+    @property
+    def wall_seconds(self) -> Optional[float]:
+        """Elapsed wall-clock time of the unit, once it has finished."""
+        return self.metrics.wall_seconds if self.metrics is not None else None
+
+
+class HookRegistry:
+    """Callbacks invoked by :func:`orchestrate` as a run progresses.
+
+    Callbacks are registered per event with :meth:`register`, with the
+    decorator methods named after the events, or all at once with
+    :meth:`add` for an object that defines methods named after the events.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._callbacks: Dict[str, List[HookCallback]] = {name: [] for name in HOOK_EVENTS}
+
+    def register(self, event: str, callback: HookCallback) -> HookCallback:
+        """Register ``callback`` for ``event``.
+
+        Args:
+            event: One of :data:`HOOK_EVENTS`
+            callback: Called with a :class:`HookEvent`
+
+        Returns:
+            The callback, so the method can be used as a decorator
+
+        Raises:
+            PipelineConfigurationError: If the event name is unknown
+        """
+        if event not in self._callbacks:
+            raise PipelineConfigurationError(
+                f"Unknown hook event '{event}'. Expected one of: {', '.join(HOOK_EVENTS)}"
+            )
+        with self._lock:
+            self._callbacks[event].append(callback)
+        return callback
+
+    def unregister(self, event: str, callback: HookCallback) -> None:
+        """Remove a previously registered callback (no-op if absent)."""
+        with self._lock:
+            if callback in self._callbacks.get(event, []):
+                self._callbacks[event].remove(callback)
+
+    def before_stage(self, callback: HookCallback) -> HookCallback:
+        """Register a ``before_stage`` callback (usable as a decorator)."""
+        return self.register("before_stage", callback)
+
+    def after_stage(self, callback: HookCallback) -> HookCallback:
+        """Register an ``after_stage`` callback (usable as a decorator)."""
+        return self.register("after_stage", callback)
+
+    def on_source(self, callback: HookCallback) -> HookCallback:
+        """Register an ``on_source`` callback (usable as a decorator)."""
+        return self.register("on_source", callback)
+
+    def on_matcher_result(self, callback: HookCallback) -> HookCallback:
+        """Register an ``on_matcher_result`` callback (usable as a decorator)."""
+        return self.register("on_matcher_result", callback)
+
+    def add(self, hook: Any) -> Any:
+        """Register every method of ``hook`` named after an event.
+
+        Args:
+            hook: Object defining some of ``before_stage``, ``after_stage``,
+                ``on_source`` and ``on_matcher_result``
+
+        Returns:
+            The hook object
+
+        Raises:
+            PipelineConfigurationError: If the object defines none of them
+        """
+        methods = [(name, getattr(hook, name)) for name in HOOK_EVENTS if callable(getattr(hook, name, None))]
+        if not methods:
+            raise PipelineConfigurationError(
+                f"{type(hook).__name__} defines none of the hook methods: {', '.join(HOOK_EVENTS)}"
+            )
+        for name, method in methods:
+            self.register(name, method)
+        return hook
+
+    def extend(self, other: "HookRegistry") -> None:
+        """Register all callbacks of another registry."""
+        for name in HOOK_EVENTS:
+            for callback in other.callbacks(name):
+                self.register(name, callback)
+
+    def callbacks(self, event: str) -> List[HookCallback]:
+        """Callbacks registered for ``event``, in registration order."""
+        with self._lock:
+            return list(self._callbacks.get(event, []))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(callbacks) for callbacks in self._callbacks.values())
+
+    def emit(self, event: HookEvent) -> None:
+        """Invoke the callbacks registered for ``event.event``.
+
+        Exceptions raised by a callback are logged and do not reach the
+        pipeline.
+        """
+        for callback in self.callbacks(event.event):
+            try:
+                callback(event)
+            except Exception as e:
+                logger.warning("hook_failed",
+                               hook=getattr(callback, "__qualname__", repr(callback)),
+                               hook_event=event.event,
+                               stage=event.stage,
+                               source_id=event.source_id,
+                               error=str(e))
+
+    @contextmanager
+    def stage(
+        self,
+        stage: str,
+        checkpoint: PipelineCheckpoint,
+        workdir: Path,
+        source_id: Optional[str] = None,
+    ) -> Iterator[HookEvent]:
+        """Emit ``before_stage`` and ``after_stage`` around a block.
+
+        The block may fill in ``artifacts`` and ``metrics`` of the yielded
+        event; ``after_stage`` receives a copy carrying them.
+
+        Args:
+            stage: Stage name (one of :data:`STAGES`)
+            checkpoint: Live pipeline checkpoint
+            workdir: Working directory
+            source_id: Source identifier, for per-source stages
+
+        Yields:
+            The event passed to ``before_stage``
+        """
+        event = HookEvent("before_stage", stage, checkpoint, workdir, source_id=source_id)
+        self.emit(event)
+        error = None
+        try:
+            yield event
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self.emit(replace(event, event="after_stage", error=error))
+
+
+def load_hooks(targets: Iterable[str]) -> HookRegistry:
+    """Build a registry from ``module:attribute`` import targets.
+
+    Each target names a hook object, or a class or factory that is called
+    without arguments to create one (see :meth:`HookRegistry.add`).
+
+    Args:
+        targets: Import targets, e.g. from ``pipeline.hooks`` in the manifest
+
+    Returns:
+        Registry holding the hooks' callbacks
+
+    Raises:
+        PipelineConfigurationError: If a target cannot be imported or is not a hook
+    """
+    registry = HookRegistry()
+    for target in targets:
+        try:
+            hook = load_object(target)
+        except (ImportError, AttributeError) as e:
+            raise PipelineConfigurationError(f"Cannot load hook '{target}': {e}", config_key="pipeline.hooks") from e
+        if isinstance(hook, type) or (
+                callable(hook) and not any(callable(getattr(hook, name, None)) for name in HOOK_EVENTS)):
+            hook = hook()
+        registry.add(hook)
+    return registry
+
+
+class StageProfiler:
+    """Profile one stage with :mod:`cProfile` and write pstats files.
+
+    Every run of the stage is profiled on the thread that executes it. For
+    per-source stages each source gets ``<stage>-<source_id>.pstats``; all
+    runs are also merged into ``<stage>.pstats``. Inspect them with
+    ``python -m pstats`` or a viewer such as snakeviz.
+
+    Conversions in ingest worker processes (``pipeline.ingest_workers``) are
+    outside the profiled thread; profile ``ingest`` with in-process
+    conversion to see converter code.
+
+    Args:
+        stage: Stage to profile (one of :data:`STAGES`)
+        output_dir: Directory receiving the pstats files
+
+    Raises:
+        PipelineConfigurationError: If the stage name is unknown
+    """
+
+    def __init__(self, stage: str, output_dir: Path) -> None:
+        if stage not in STAGES:
+            raise PipelineConfigurationError(
+                f"Cannot profile unknown stage '{stage}'. Expected one of: {', '.join(STAGES)}",
+                config_key="profile_stage",
+            )
+        self.stage = stage
+        self.output_dir = Path(output_dir)
+        self._lock = threading.Lock()
+        self._profiles: Dict[Tuple[str, Optional[str], int], cProfile.Profile] = {}
+        self._combined: Optional[pstats.Stats] = None
+        self.paths: List[Path] = []
+
+    @staticmethod
+    def _key(event: HookEvent) -> Tuple[str, Optional[str], int]:
+        # A stage's before/after callbacks run on the same thread
+        return event.stage, event.source_id, threading.get_ident()
+
+    def before_stage(self, event: HookEvent) -> None:
+        if event.stage != self.stage:
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            # Python 3.12+ allows one active profiler per process
+            logger.warning("stage_profile_skipped", stage=event.stage, source_id=event.source_id, error=str(e))
+            return
+        with self._lock:
+            self._profiles[self._key(event)] = profile
+
+    def after_stage(self, event: HookEvent) -> None:
+        with self._lock:
+            profile = self._profiles.pop(self._key(event), None)
+        if profile is None:
+            return
+        profile.disable()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            if event.source_id is not None:
+                path = self.output_dir / f"{event.stage}-{event.source_id}.pstats"
+                profile.dump_stats(path)
+                self.paths.append(path)
+            if self._combined is None:
+                self._combined = pstats.Stats(profile)
+            else:
+                self._combined.add(profile)
+            combined_path = self.output_dir / f"{event.stage}.pstats"
+            self._combined.dump_stats(combined_path)
+            if combined_path not in self.paths:
+                self.paths.append(combined_path)
+        logger.info("stage_profile_written", stage=event.stage, source_id=event.source_id,
+                    path=str(combined_path))
@@ -2,26 +2,57 @@
 
 This module uses the graph_mesh_ingest plugin system to convert various
 schema formats (XSD, JSON Schema, CSV/TSV) to OWL ontologies.
+
+Converters are pure-Python and CPU-bound, so conversions in threads serialize
+on the GIL. An :class:`IngestPool` runs them in reusable worker processes
+instead, each conversion optionally bounded in memory and time.
 """
 
 from __future__ import annotations
 
+import contextvars
+import multiprocessing
+import os
+import pickle
+import signal
+import sys
+import threading
+import time
 from collections.abc import Sequence
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Mapping
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 import structlog
 
-from graph_mesh_ingest.json_to_owl import convert_jsonschema_to_owl
-from graph_mesh_ingest.xsd_to_owl import convert_xsd_list_to_owl, convert_xsd_to_owl
+from graph_mesh_core.artifact_cache import ArtifactCache, cache_key, hash_paths
+from graph_mesh_core.graph_handoff import file_pending, wait_for_file
+from graph_mesh_core.graph_store import MemoryBudget, active_budget
+from graph_mesh_core.lazy import LazyCallable
+from graph_mesh_core.telemetry import annotate
+from graph_mesh_core.tracing import Tracer, active_tracer, span, span_dicts
+from graph_mesh_ingest import __version__ as INGEST_VERSION
 from graph_mesh_orchestrator.errors import ConverterNotAvailableError, IngestError
 
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    resource = None
+
 logger = structlog.get_logger(__name__)
 
-from graph_mesh_ingest import get_converter, ConverterRegistry
-from graph_mesh_ingest.xsd_to_owl import convert_xsd_list_to_owl
+# Extra time the parent waits beyond a task's timeout before recycling the pool
+_TIMEOUT_GRACE_SECONDS = 5.0
 
-logger = logging.getLogger(__name__)
+# Converter modules (and xmlschema) are imported on a converter's first call
+CONVERTER_REGISTRY: Dict[str, Callable[[str, str], Any]] = {
+    "xsd": LazyCallable("graph_mesh_ingest.xsd_to_owl:convert_xsd_to_owl"),
+    "json": LazyCallable("graph_mesh_ingest.json_to_owl:convert_jsonschema_to_owl"),
+}
 
 
 def _get_identifier(source: Any) -> str:
@@ -38,8 +69,6 @@ def _get_identifier(source: Any) -> str:
     """
     if hasattr(source, "id"):
         return getattr(source, "id")
-        KeyError: If identifier not found
-    """
     if hasattr(source, "identifier"):
         return getattr(source, "identifier")
     if isinstance(source, Mapping) and "id" in source:
@@ -72,10 +101,411 @@ def _get_convert_config(source: Any) -> Mapping[str, Any]:
     return {}
 
 
+def _ingest_cache_key(converter_name: str, convert_cfg: Mapping[str, Any], converter: Callable, input_path: Any) -> str:
+    """Derive the artifact cache key for converting one source.
+
+    The key covers the input bytes, converter type and options, and the
+    converter implementation and version. Files pulled in indirectly (e.g.,
+    XSD includes) are not hashed; list them in ``fetch.paths`` to track them.
+    """
+    if isinstance(input_path, Sequence) and not isinstance(input_path, (str, Path)):
+        input_digest = hash_paths(input_path)
+    else:
+        input_digest = hash_paths(Path(input_path))
+    converter_id = f"{getattr(converter, '__module__', '')}.{getattr(converter, '__qualname__', repr(converter))}"
+    return cache_key("ingest", converter_name, dict(convert_cfg), converter_id, INGEST_VERSION, input_digest)
+
+
+def _convert_source(
+    converter_name: str,
+    converter: Callable[[str, str], Any],
+    input_path: Any,
+    output_path: Path,
+    identifier: str,
+    log: Any,
+) -> None:
+    """Convert one fetched source to OWL at ``output_path``.
+
+    Args:
+        converter_name: Converter type from the source's convert config
+        converter: Registered converter callable
+        input_path: Fetched schema path or list of paths
+        output_path: OWL output path
+        identifier: Source identifier
+        log: Bound logger
+
+    Raises:
+        IngestError: If conversion fails or produces no output
+    """
+    with span("convert", "converter", converter=converter_name):
+        # Handle different converter types
+        if converter_name == "xsd":
+            if isinstance(input_path, Sequence) and not isinstance(input_path, (str, Path)):
+                # Multiple XSD files
+                from graph_mesh_ingest.xsd_to_owl import convert_xsd_list_to_owl
+
+                path_list = [str(Path(p)) for p in input_path]
+                log.info("ingesting_multiple_xsd", count=len(path_list), output=str(output_path))
+                try:
+                    convert_xsd_list_to_owl(path_list, str(output_path))
+                except Exception as e:
+                    raise IngestError(
+                        f"Failed to convert multiple XSD files: {str(e)}",
+                        source_id=identifier,
+                        converter_type=converter_name,
+                        input_path=str(path_list)
+                    ) from e
+            else:
+                # Single XSD file
+                log.info("ingesting_single_xsd", input=str(input_path), output=str(output_path))
+                try:
+                    converter(str(Path(input_path)), str(output_path))
+                except Exception as e:
+                    raise IngestError(
+                        f"Failed to convert XSD file: {str(e)}",
+                        source_id=identifier,
+                        converter_type=converter_name,
+                        input_path=str(input_path)
+                    ) from e
+        else:
+            # Generic converter
+            log.info("ingesting_schema", converter=converter_name, input=str(input_path), output=str(output_path))
+            try:
+                converter(str(input_path), str(output_path))
+            except Exception as e:
+                raise IngestError(
+                    f"Conversion failed: {str(e)}",
+                    source_id=identifier,
+                    converter_type=converter_name,
+                    input_path=str(input_path)
+                ) from e
+
+        # Verify output was created (or is being written by the graph handoff)
+        if not output_path.exists() and not file_pending(output_path):
+            raise IngestError(
+                "Converter succeeded but output file not found",
+                source_id=identifier,
+                converter_type=converter_name,
+                input_path=str(input_path)
+            )
+
+
+class _ConversionTimeout(BaseException):
+    """Raised in an ingest worker when a conversion exceeds its time limit.
+
+    Derives from BaseException so converters' broad ``except Exception``
+    fallbacks cannot swallow it.
+    """
+
+
+def _raise_timeout(signum: int, frame: Any) -> None:
+    raise _ConversionTimeout()
+
+
+@dataclass
+class _WorkerResult:
+    """Outcome of one conversion in a worker process.
+
+    Errors travel as plain strings: the orchestrator's exception types do not
+    survive pickling with their details.
+    """
+
+    error: Optional[str] = None
+    cpu_seconds: float = 0.0
+    peak_rss_bytes: Optional[int] = None
+    pid: int = 0
+    spans: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _convert_in_worker(
+    converter_name: str,
+    converter: Callable[[str, str], Any],
+    input_path: Any,
+    output_path: Path,
+    identifier: str,
+    memory_limit_mb: Optional[int],
+    timeout_seconds: Optional[float],
+    trace: bool = False,
+    budget: Optional[MemoryBudget] = None,
+) -> _WorkerResult:
+    """Run :func:`_convert_source` inside an ingest worker process.
+
+    With ``trace``, the conversion's spans are recorded by a tracer local to
+    the worker and returned for the parent to merge into its timeline. The
+    parent's memory budget, if any, is activated for the conversion so large
+    graphs spill to disk in the worker too.
+    """
+    log = logger.bind(source_id=identifier, worker_pid=os.getpid())
+    tracer = Tracer() if trace else None
+    cpu0 = time.process_time()
+    previous_limit = None
+    if memory_limit_mb and resource is not None:
+        previous_limit = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_mb * 1024 * 1024, previous_limit[1]))
+    if timeout_seconds:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout_seconds)
+
+    error = None
+    try:
+        with ExitStack() as context:
+            if tracer is not None:
+                context.enter_context(tracer.activate())
+            if budget is not None:
+                context.enter_context(budget.activate())
+            _convert_source(converter_name, converter, input_path, output_path, identifier, log)
+    except _ConversionTimeout:
+        error = f"Conversion exceeded the {timeout_seconds:g}s time limit"
+    except MemoryError:
+        error = f"Conversion exceeded the {memory_limit_mb} MB memory limit"
+    except IngestError as e:
+        if isinstance(e.__cause__, MemoryError) and memory_limit_mb:
+            error = f"Conversion exceeded the {memory_limit_mb} MB memory limit"
+        else:
+            error = e.message
+    finally:
+        if timeout_seconds:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        if previous_limit is not None:
+            resource.setrlimit(resource.RLIMIT_AS, previous_limit)
+
+    peak_rss = None
+    if resource is not None:
+        # ru_maxrss is KiB on Linux and bytes on macOS
+        scale = 1 if sys.platform == "darwin" else 1024
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    return _WorkerResult(error=error, cpu_seconds=time.process_time() - cpu0,
+                         peak_rss_bytes=peak_rss, pid=os.getpid(),
+                         spans=span_dicts(tracer) if tracer is not None else [])
+
+
+def default_ingest_workers() -> int:
+    """Return the default number of ingest worker processes (one per CPU)."""
+    return os.cpu_count() or 1
+
+
+class IngestPool:
+    """Reusable worker processes for schema conversion.
+
+    Workers are started on first use with the ``spawn`` method (the
+    orchestrator is multi-threaded, which makes ``fork`` unsafe) and reused
+    for later conversions. A worker that dies, for example killed by the
+    kernel's OOM killer, fails only its own conversion; the pool is restarted
+    for the next one.
+
+    Example:
+        >>> with IngestPool(max_workers=4, memory_limit_mb=2048, timeout_seconds=600) as pool:
+        ...     run_ingest(sources, fetched, workdir, pool=pool)
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        max_tasks_per_worker: Optional[int] = None,
+    ) -> None:
+        """Initialize pool.
+
+        Args:
+            max_workers: Worker processes (default: one per CPU)
+            memory_limit_mb: Address-space limit per conversion
+            timeout_seconds: Time limit per conversion
+            max_tasks_per_worker: Replace a worker after this many conversions
+                (Python 3.11+; default: workers live as long as the pool)
+        """
+        self.max_workers = max_workers or default_ingest_workers()
+        self.memory_limit_mb = memory_limit_mb
+        self.timeout_seconds = timeout_seconds
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                kwargs: Dict[str, Any] = {}
+                if self.max_tasks_per_worker and sys.version_info >= (3, 11):
+                    kwargs["max_tasks_per_child"] = self.max_tasks_per_worker
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    **kwargs,
+                )
+            return self._executor
+
+    def _discard(self, executor: ProcessPoolExecutor, terminate: bool = False) -> None:
+        """Drop a broken or stuck executor so the next conversion starts a fresh one."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        if terminate:
+            # A worker stuck in native code ignores its alarm; nothing short of
+            # killing it frees the slot
+            for process in list(getattr(executor, "_processes", {}).values()):
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def convert(
+        self,
+        converter_name: str,
+        converter: Callable[[str, str], Any],
+        input_path: Any,
+        output_path: Path,
+        identifier: str,
+    ) -> None:
+        """Convert one source in a worker process, blocking until it finishes.
+
+        Converters that cannot be pickled (e.g., lambdas registered at run
+        time) are run in the calling process instead.
+
+        Raises:
+            IngestError: If conversion fails, exceeds a limit or its worker dies
+        """
+        log = logger.bind(source_id=identifier)
+        try:
+            pickle.dumps(converter)
+        except Exception:
+            log.warning("ingest_converter_not_picklable", converter=converter_name)
+            _convert_source(converter_name, converter, input_path, output_path, identifier, log)
+            return
+
+        tracer = active_tracer()
+        executor = self._get_executor()
+        future = executor.submit(
+            _convert_in_worker, converter_name, converter, input_path, output_path, identifier,
+            self.memory_limit_mb, self.timeout_seconds, tracer is not None, active_budget(),
+        )
+        wait_timeout = self.timeout_seconds + _TIMEOUT_GRACE_SECONDS if self.timeout_seconds else None
+        try:
+            # Queueing and transfer overhead show up as the gap around the worker's spans
+            with span("ingest.worker", "worker", converter=converter_name) as worker_span:
+                result: _WorkerResult = future.result(timeout=wait_timeout)
+                if tracer is not None:
+                    tracer.add_spans(result.spans, parent=worker_span)
+                    worker_span.args["worker_pid"] = result.pid
+        except BrokenProcessPool as e:
+            self._discard(executor)
+            raise IngestError(
+                "Ingest worker process died during conversion",
+                source_id=identifier,
+                converter_type=converter_name,
+                input_path=str(input_path),
+            ) from e
+        except FutureTimeoutError as e:
+            self._discard(executor, terminate=True)
+            raise IngestError(
+                f"Conversion exceeded the {self.timeout_seconds:g}s time limit",
+                source_id=identifier,
+                converter_type=converter_name,
+                input_path=str(input_path),
+            ) from e
+
+        annotate(worker_pid=result.pid, worker_cpu_seconds=result.cpu_seconds,
+                 worker_peak_rss_bytes=result.peak_rss_bytes)
+        if result.error:
+            raise IngestError(
+                result.error,
+                source_id=identifier,
+                converter_type=converter_name,
+                input_path=str(input_path),
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def __enter__(self) -> "IngestPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+
+def _ingest_one(
+    source: Any,
+    fetched_paths: Mapping[str, Any],
+    converted_root: Path,
+    cache: Optional[ArtifactCache],
+    pool: Optional[IngestPool],
+) -> Tuple[str, Path]:
+    """Convert (or restore from the cache) one source; see :func:`run_ingest`."""
+    identifier = None
+    convert_cfg: Mapping[str, Any] = {}
+    try:
+        identifier = _get_identifier(source)
+        log = logger.bind(source_id=identifier)
+
+        convert_cfg = _get_convert_config(source)
+        converter_name = convert_cfg.get("type", "xsd")
+
+        log.debug("ingest_config", converter_type=converter_name, config=convert_cfg)
+
+        converter = CONVERTER_REGISTRY.get(converter_name)
+        if converter is None:
+            raise ConverterNotAvailableError(converter_name)
+
+        input_path = fetched_paths.get(identifier)
+        if input_path is None:
+            raise IngestError(
+                "No fetched artifact found for source",
+                source_id=identifier,
+                converter_type=converter_name
+            )
+
+        output_dir = converted_root / identifier
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = output_dir / f"{identifier}.owl"
+
+        def convert() -> None:
+            if pool is None:
+                _convert_source(converter_name, converter, input_path, output_path, identifier, log)
+            else:
+                pool.convert(converter_name, converter, input_path, output_path, identifier)
+
+        if cache is None:
+            convert()
+        else:
+            entry_key = _ingest_cache_key(converter_name, convert_cfg, converter, input_path)
+            # Identical sources converted concurrently (e.g., by several
+            # manifests in a batch) wait here and then hit the first one's entry
+            with cache.lock(entry_key):
+                if cache.restore(entry_key, {"output.owl": output_path}):
+                    log.info("ingest_cache_hit", output=str(output_path))
+                    annotate(cached=True)
+                    return identifier, output_path
+
+                convert()
+                wait_for_file(output_path)
+                cache.store(
+                    entry_key,
+                    {"output.owl": output_path},
+                    metadata={"source_id": identifier, "converter_type": converter_name},
+                )
+
+        log.info("ingest_complete", output=str(output_path))
+        return identifier, output_path
+
+    except (IngestError, ConverterNotAvailableError):
+        raise
+    except Exception as e:
+        # Catch-all for unexpected errors
+        raise IngestError(
+            f"Unexpected error during ingestion: {str(e)}",
+            source_id=identifier or "unknown",
+            converter_type=convert_cfg.get("type", "unknown")
+        ) from e
+
+
 def run_ingest(
     sources: Iterable[Any],
     fetched_paths: Mapping[str, Any],
     workdir: Path,
+    cache: Optional[ArtifactCache] = None,
+    pool: Optional[IngestPool] = None,
 ) -> Dict[str, Path]:
     """Run the ingest stage for each fetched source.
 
@@ -86,6 +516,10 @@ def run_ingest(
         sources: Iterable of source configurations.
         fetched_paths: Mapping of source identifier to fetched schema path(s).
         workdir: Working directory for pipeline artifacts.
+        cache: Optional artifact cache; sources whose inputs and converter
+            settings are unchanged are restored from it instead of converted.
+        pool: Optional ingest process pool; sources are then converted in its
+            worker processes, up to ``pool.max_workers`` at a time.
 
     Returns:
         Mapping of source identifier to OWL output path.
@@ -96,100 +530,23 @@ def run_ingest(
         KeyError: If converter type not registered or source not found
         ValueError: If conversion fails
     """
-    results: Dict[str, Path] = {}
+    sources = list(sources)
     converted_root = workdir / "converted"
     converted_root.mkdir(parents=True, exist_ok=True)
 
-    logger.info("ingest_starting", source_count=len(list(sources)))
-
-    for source in sources:
-        identifier = None
-        try:
-            identifier = _get_identifier(source)
-            log = logger.bind(source_id=identifier)
-
-            convert_cfg = _get_convert_config(source)
-            converter_name = convert_cfg.get("type", "xsd")
+    logger.info("ingest_starting", source_count=len(sources))
 
-            log.debug("ingest_config", converter_type=converter_name, config=convert_cfg)
+    def ingest(source: Any) -> Tuple[str, Path]:
+        return _ingest_one(source, fetched_paths, converted_root, cache, pool)
 
-            converter = CONVERTER_REGISTRY.get(converter_name)
-            if converter is None:
-                raise ConverterNotAvailableError(converter_name)
-
-            input_path = fetched_paths.get(identifier)
-            if input_path is None:
-                raise IngestError(
-                    f"No fetched artifact found for source",
-                    source_id=identifier,
-                    converter_type=converter_name
-                )
-
-            output_dir = converted_root / identifier
-            output_dir.mkdir(parents=True, exist_ok=True)
-            output_path = output_dir / f"{identifier}.owl"
-
-            # Handle different converter types
-            if converter_name == "xsd":
-                if isinstance(input_path, Sequence) and not isinstance(input_path, (str, Path)):
-                    # Multiple XSD files
-                    path_list = [str(Path(p)) for p in input_path]
-                    log.info("ingesting_multiple_xsd", count=len(path_list), output=str(output_path))
-                    try:
-                        convert_xsd_list_to_owl(path_list, str(output_path))
-                    except Exception as e:
-                        raise IngestError(
-                            f"Failed to convert multiple XSD files: {str(e)}",
-                            source_id=identifier,
-                            converter_type=converter_name,
-                            input_path=str(path_list)
-                        ) from e
-                else:
-                    # Single XSD file
-                    log.info("ingesting_single_xsd", input=str(input_path), output=str(output_path))
-                    try:
-                        converter(str(Path(input_path)), str(output_path))
-                    except Exception as e:
-                        raise IngestError(
-                            f"Failed to convert XSD file: {str(e)}",
-                            source_id=identifier,
-                            converter_type=converter_name,
-                            input_path=str(input_path)
-                        ) from e
-            else:
-                # Generic converter
-                log.info("ingesting_schema", converter=converter_name, input=str(input_path), output=str(output_path))
-                try:
-                    converter(str(input_path), str(output_path))
-                except Exception as e:
-                    raise IngestError(
-                        f"Conversion failed: {str(e)}",
-                        source_id=identifier,
-                        converter_type=converter_name,
-                        input_path=str(input_path)
-                    ) from e
-
-            # Verify output was created
-            if not output_path.exists():
-                raise IngestError(
-                    "Converter succeeded but output file not found",
-                    source_id=identifier,
-                    converter_type=converter_name,
-                    input_path=str(input_path)
-                )
-
-            results[identifier] = output_path
-            log.info("ingest_complete", output=str(output_path))
-
-        except (IngestError, ConverterNotAvailableError):
-            raise
-        except Exception as e:
-            # Catch-all for unexpected errors
-            raise IngestError(
-                f"Unexpected error during ingestion: {str(e)}",
-                source_id=identifier or "unknown",
-                converter_type=convert_cfg.get("type", "unknown") if 'convert_cfg' in locals() else "unknown"
-            ) from e
+    if pool is not None and len(sources) > 1:
+        # One feeder thread per worker process keeps every worker busy; each
+        # runs in a copy of the caller's context so telemetry reaches its unit
+        with ThreadPoolExecutor(max_workers=min(pool.max_workers, len(sources))) as feeders:
+            futures = [feeders.submit(contextvars.copy_context().run, ingest, source) for source in sources]
+            results = dict(future.result() for future in futures)
+    else:
+        results = dict(ingest(source) for source in sources)
 
     logger.info("ingest_complete", converted_count=len(results))
     return results
@@ -0,0 +1,293 @@
+"""Append-only checkpoint journal.
+
+Rewriting ``checkpoint.json`` after every source transition costs O(n) bytes
+per update and O(n²) over a run with many sources, and a crash mid-write
+leaves a corrupt file. The journal instead records each transition as one
+JSON line appended to ``checkpoint.journal`` and fsync'd, and periodically
+compacts the journal into the ``checkpoint.json`` snapshot.
+
+Files in the workdir::
+
+    checkpoint.json      # snapshot (PipelineCheckpoint JSON), replaced atomically
+    checkpoint.journal   # events applied on top of the snapshot, one per line
+
+Events only ever set fields, so replaying an event twice is harmless: a
+crash between writing a new snapshot and truncating the journal loses
+nothing. Appends and compaction take an exclusive ``flock`` on the journal,
+so several processes can share a workdir; within a process a lock
+serializes threads.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import structlog
+
+from graph_mesh_orchestrator.errors import CheckpointError
+from graph_mesh_orchestrator.models import PipelineCheckpoint, SourceState
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+logger = structlog.get_logger(__name__)
+
+SNAPSHOT_NAME = "checkpoint.json"
+JOURNAL_NAME = "checkpoint.journal"
+DEFAULT_COMPACT_EVERY = 256
+
+
+def write_atomic(path: Path, data: str) -> None:
+    """Write a file so readers see either the old or the new content.
+
+    Args:
+        path: Destination path
+        data: Text content
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    # Persist the rename itself
+    dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def _apply_event(data: Dict[str, Any], event: Dict[str, Any]) -> None:
+    """Apply one journal event to a checkpoint dict."""
+    fields = event.get("fields", {})
+    if event.get("type") == "source":
+        source_id = event["source_id"]
+        source = data.setdefault("sources", {}).setdefault(source_id, {"source_id": source_id})
+        source.update(fields)
+    else:
+        data.update(fields)
+
+
+class CheckpointJournal:
+    """Write-ahead journal of pipeline and per-source checkpoint updates.
+
+    Example:
+        >>> journal = CheckpointJournal(workdir)
+        >>> journal.reset(checkpoint)
+        >>> journal.record_source(checkpoint, "users", fetched=True, fetch_path="...")
+        >>> journal.load()  # snapshot + replayed events
+    """
+
+    def __init__(self, workdir: Path, compact_every: int = DEFAULT_COMPACT_EVERY) -> None:
+        """Initialize journal.
+
+        Args:
+            workdir: Pipeline working directory
+            compact_every: Compact after this many appends from this instance
+                (0 disables automatic compaction)
+        """
+        self.workdir = Path(workdir)
+        self.snapshot_path = self.workdir / SNAPSHOT_NAME
+        self.journal_path = self.workdir / JOURNAL_NAME
+        self.compact_every = compact_every
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._repaired = False
+        self._appends = 0
+
+    def _journal_fd(self) -> int:
+        if self._fd is None:
+            self.workdir.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._repaired = False
+        return self._fd
+
+    def _repair_torn_line(self, fd: int) -> None:
+        """Terminate a torn line left by a crash so the next event stays parseable.
+
+        Called with the flock held, so no other writer is mid-append.
+        """
+        with open(self.journal_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    os.write(fd, b"\n")
+        self._repaired = True
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[int]:
+        """Hold the thread lock and an exclusive flock on the journal."""
+        with self._lock:
+            fd = self._journal_fd()
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if not self._repaired:
+                    self._repair_torn_line(fd)
+                yield fd
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Close the journal file descriptor."""
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def reset(self, checkpoint: PipelineCheckpoint) -> None:
+        """Replace the snapshot with a checkpoint and discard journaled events.
+
+        Args:
+            checkpoint: Complete checkpoint state
+
+        Raises:
+            CheckpointError: If the snapshot cannot be written
+        """
+        try:
+            with self._exclusive() as fd:
+                write_atomic(self.snapshot_path, checkpoint.model_dump_json(indent=2))
+                os.ftruncate(fd, 0)
+                os.fsync(fd)
+                self._appends = 0
+        except OSError as e:
+            raise CheckpointError(
+                f"Failed to write checkpoint snapshot: {str(e)}",
+                checkpoint_path=str(self.snapshot_path),
+                operation="save"
+            ) from e
+
+    def record(self, checkpoint: PipelineCheckpoint, **fields: Any) -> None:
+        """Record pipeline-level field updates.
+
+        Args:
+            checkpoint: In-memory checkpoint, updated in place
+            **fields: PipelineCheckpoint fields to set
+        """
+        for name, value in fields.items():
+            setattr(checkpoint, name, value)
+        self._append({"type": "pipeline", "fields": fields})
+
+    def record_source(self, checkpoint: PipelineCheckpoint, source_id: str, **fields: Any) -> None:
+        """Record field updates for one source.
+
+        Args:
+            checkpoint: In-memory checkpoint, updated in place
+            source_id: Source identifier
+            **fields: SourceState fields to set
+        """
+        state = checkpoint.sources.get(source_id)
+        if state is None:
+            state = checkpoint.sources[source_id] = SourceState(source_id=source_id)
+        for name, value in fields.items():
+            setattr(state, name, value)
+        self._append({"type": "source", "source_id": source_id, "fields": fields})
+
+    def _append(self, event: Dict[str, Any]) -> None:
+        line = (json.dumps(event, default=str, separators=(",", ":")) + "\n").encode("utf-8")
+        try:
+            with self._exclusive() as fd:
+                os.write(fd, line)
+                os.fsync(fd)
+                self._appends += 1
+                due = self.compact_every and self._appends >= self.compact_every
+        except OSError as e:
+            raise CheckpointError(
+                f"Failed to append checkpoint event: {str(e)}",
+                checkpoint_path=str(self.journal_path),
+                operation="append"
+            ) from e
+
+        if due:
+            self.compact()
+
+    def _read_events(self) -> List[Dict[str, Any]]:
+        if not self.journal_path.exists():
+            return []
+        events = []
+        with open(self.journal_path, "rb") as f:
+            for raw in f:
+                try:
+                    events.append(json.loads(raw))
+                except ValueError:
+                    # A torn final line from a crash mid-append
+                    logger.warning("checkpoint_journal_line_skipped", path=str(self.journal_path))
+        return events
+
+    def _replay(self) -> Optional[Dict[str, Any]]:
+        if not self.snapshot_path.exists():
+            return None
+        data = json.loads(self.snapshot_path.read_text())
+        for event in self._read_events():
+            _apply_event(data, event)
+        return data
+
+    def load(self) -> Optional[PipelineCheckpoint]:
+        """Load the snapshot and replay journaled events on top of it.
+
+        Returns:
+            Checkpoint or None if no snapshot exists
+
+        Raises:
+            CheckpointError: If the snapshot cannot be read
+        """
+        try:
+            data = self._replay()
+            return PipelineCheckpoint.model_validate(data) if data is not None else None
+        except Exception as e:
+            raise CheckpointError(
+                f"Failed to load checkpoint: {str(e)}",
+                checkpoint_path=str(self.snapshot_path),
+                operation="load"
+            ) from e
+
+    def compact(self) -> None:
+        """Fold journaled events into the snapshot and truncate the journal.
+
+        The state is replayed from disk rather than taken from memory, so
+        events appended by other processes are preserved.
+
+        Raises:
+            CheckpointError: If compaction fails
+        """
+        try:
+            with self._exclusive() as fd:
+                data = self._replay()
+                if data is not None:
+                    checkpoint = PipelineCheckpoint.model_validate(data)
+                    write_atomic(self.snapshot_path, checkpoint.model_dump_json(indent=2))
+                    os.ftruncate(fd, 0)
+                    os.fsync(fd)
+                self._appends = 0
+        except Exception as e:
+            raise CheckpointError(
+                f"Failed to compact checkpoint journal: {str(e)}",
+                checkpoint_path=str(self.snapshot_path),
+                operation="compact"
+            ) from e
+
+        logger.debug("checkpoint_compacted", path=str(self.snapshot_path))
+
+    def __enter__(self) -> "CheckpointJournal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
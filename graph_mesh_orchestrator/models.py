@@ -30,6 +30,7 @@ class MatcherType(str, Enum):
     LOGMAP = "LogMap"
     AML = "AML"
     BERTMAP = "BERTMap"
+    LEXICAL = "Lexical"
 
 
 class FetchConfig(BaseModel):
@@ -149,12 +150,120 @@ class AlignmentConfig(BaseModel):
         return v
 
 
+class MatcherResources(BaseModel):
+    """Resources one matcher container needs while it runs."""
+
+    cpus: Optional[float] = Field(default=None, gt=0, description="CPUs (container CPU limit)")
+    memory_mb: Optional[int] = Field(default=None, ge=1, description="Memory in MB (container memory limit)")
+
+
 class PipelineConfig(BaseModel):
     """Configuration for pipeline execution."""
 
     max_retries: int = Field(default=3, description="Maximum retry attempts for failed stages")
     retry_delay: int = Field(default=5, description="Delay between retries in seconds")
     parallel_sources: bool = Field(default=False, description="Process sources in parallel")
+    max_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Worker pool size when parallel_sources is enabled (default: CPU count + 4, max 32)"
+    )
+    cache_dir: Optional[str] = Field(
+        default=None,
+        description="Content-addressed artifact cache shared across runs (default: $GRAPH_MESH_CACHE_DIR)"
+    )
+    ingest_workers: int = Field(
+        default=0,
+        ge=0,
+        description="Worker processes converting schemas (0 converts in the pipeline process)"
+    )
+    ingest_memory_limit_mb: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Address-space limit per conversion in an ingest worker"
+    )
+    ingest_timeout: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Time limit in seconds per conversion in an ingest worker"
+    )
+    ingest_tasks_per_worker: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Replace an ingest worker after this many conversions (Python 3.11+)"
+    )
+    fusion_format: Literal["turtle", "ntriples", "nquads"] = Field(
+        default="turtle",
+        description="Merged graph format; ntriples/nquads stream with bounded memory"
+    )
+    fusion_dedupe: Literal["memory", "disk"] = Field(
+        default="memory",
+        description="Duplicate-statement tracking for streaming fusion"
+    )
+    memory_budget_mb: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Memory per RDF graph before it spills to disk (converter output, "
+                    "meta-ontology, fusion); unbounded when unset"
+    )
+    graph_handoff: bool = Field(
+        default=True,
+        description="Hand graphs converted in the pipeline process to fusion in memory and write "
+                    "the converted files in the background (ignored with ingest_workers, "
+                    "memory_budget_mb or a streaming fusion_format)"
+    )
+    metrics_textfile: Optional[str] = Field(
+        default=None,
+        description="Prometheus textfile to write run metrics to (run_metrics.json is always written)"
+    )
+    trace: bool = Field(
+        default=False,
+        description="Write a span timeline (trace.json in Chrome Trace Event format, trace_spans.tsv)"
+    )
+    hooks: List[str] = Field(
+        default_factory=list,
+        description="Stage hooks to load, as 'module:attribute' import targets"
+    )
+    deadline_minutes: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Time budget of a run; when behind, the slowest matchers are skipped so the "
+                    "merged graph arrives on time"
+    )
+    matcher_resources: Dict[str, MatcherResources] = Field(
+        default_factory=dict,
+        description="CPU and memory requests per matcher name; the matcher pool packs "
+                    "containers onto the host by them"
+    )
+    prepare_images: bool = Field(
+        default=True,
+        description="Check the matcher and Ontmalizer images concurrently when the run starts"
+    )
+    pull_images: bool = Field(
+        default=False,
+        description="Pull missing matcher images while preparing them"
+    )
+    alignment_batch_size: int = Field(
+        default=1,
+        ge=1,
+        description="Sources aligned to the meta-ontology in one matcher invocation, so each "
+                    "matcher loads and indexes the target once per batch (1 disables batching)"
+    )
+    blocking: bool = Field(
+        default=False,
+        description="Align sources against the part of the meta-ontology whose labels resemble "
+                    "theirs (MinHash/LSH candidate blocking) instead of the whole meta-ontology"
+    )
+    warm_matchers: bool = Field(
+        default=False,
+        description="Keep matcher containers running between alignments and execute each "
+                    "alignment inside one instead of starting a container per alignment"
+    )
+    warm_matcher_idle_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="Seconds a warm matcher container may stay idle before it is stopped"
+    )
     checkpoint_enabled: bool = Field(default=True, description="Enable checkpointing for resume")
     fail_fast: bool = Field(default=False, description="Stop on first error")
     cleanup_on_success: bool = Field(default=False, description="Remove intermediate artifacts on success")
@@ -228,8 +337,11 @@ class SourceState(BaseModel):
     aligned: bool = False
     error: Optional[str] = None
     fetch_path: Optional[str] = None
+    fetch_paths: List[str] = Field(default_factory=list)
     converted_path: Optional[str] = None
     mapping_paths: List[str] = Field(default_factory=list)
+    fingerprint: Optional[str] = None
+    alignment_fingerprint: Optional[str] = None
 
 
 class PipelineCheckpoint(BaseModel):
@@ -246,9 +358,11 @@ class PipelineCheckpoint(BaseModel):
     error_message: Optional[str] = None
 
     def to_file(self, path: Path) -> None:
-        """Save checkpoint to file."""
+        """Save checkpoint to file atomically (write to a temp file, then rename)."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(self.model_dump_json(indent=2))
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(self.model_dump_json(indent=2))
+        tmp_path.replace(path)
 
     @classmethod
     def from_file(cls, path: Path) -> 'PipelineCheckpoint':
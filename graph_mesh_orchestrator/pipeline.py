@@ -4,35 +4,71 @@ from __future__ import annotations
 
 import logging
 import sys
+import threading
 import time
-from dataclasses import dataclass
-from datetime import datetime
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field, fields, is_dataclass, replace
+from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import structlog
 import yaml
 from rdflib import Graph
 
-from graph_mesh_aligner.matchers import DEFAULT_MATCHERS, ContainerMatcher, run_alignment
+from graph_mesh_aligner.blocking import MinHashBlocker
+from graph_mesh_aligner.lexical import LexicalMatcher
+from graph_mesh_aligner.matchers import (
+    DEFAULT_MATCHERS,
+    AlignmentMatcher,
+    alignment_cache_key,
+    run_alignment,
+    run_alignment_batch,
+)
+from graph_mesh_aligner.pool import MatcherPool, default_matcher_pool
+from graph_mesh_core.artifact_cache import ArtifactCache, cache_key, default_cache_dir, hash_paths
+from graph_mesh_core.docker_session import default_docker_session
+from graph_mesh_core.graph_handoff import GraphHandoff, take_graph, wait_for_file
+from graph_mesh_core.graph_store import MemoryBudget, is_spilled, new_graph
 from graph_mesh_core.meta_ontology import build_meta_graph, serialize_meta_graph  # Backward compat
 from graph_mesh_core.meta_ontology_registry import MetaOntologyRegistry
 from graph_mesh_core.meta_ontology_base import MetaOntologyProvider
+from graph_mesh_core.meta_ontology_snapshot import (
+    SNAPSHOT_FORMAT_VERSION,
+    SNAPSHOT_SUFFIX,
+    MetaOntologySnapshot,
+    SnapshotMetaOntology,
+    load_snapshot,
+    save_snapshot,
+)
+from graph_mesh_core.telemetry import MetricsRecorder, annotate
+from graph_mesh_core.tracing import Tracer, span
+from graph_mesh_orchestrator.deadline import Degradation, DeadlineTracker, load_matcher_history
 from graph_mesh_orchestrator.errors import (
-    CheckpointError,
     FetchError,
     FusionError,
     PipelineError,
     PipelineStateError,
     RecoverableError,
 )
-from graph_mesh_orchestrator.ingest import run_ingest
+from graph_mesh_orchestrator.fetchers import fetch_remote
+from graph_mesh_orchestrator.hooks import STAGES, HookEvent, HookRegistry, StageProfiler, load_hooks
+from graph_mesh_ingest.converter_base import DEFAULT_ONTMALIZER_IMAGE
+from graph_mesh_orchestrator.ingest import IngestPool, run_ingest
+from graph_mesh_orchestrator.journal import CheckpointJournal
 from graph_mesh_orchestrator.models import (
     PipelineCheckpoint,
     PipelineManifest,
     PipelineState,
     SourceState,
 )
+from graph_mesh_orchestrator.scheduler import StageScheduler, resolve_worker_count
+from graph_mesh_orchestrator.streaming_fusion import (
+    STREAMING_FORMATS,
+    incremental_fuse_graphs,
+    stream_fuse_graphs,
+)
 from graph_mesh_orchestrator.validation import run_preflight_checks
 
 # Configure structured logging
@@ -53,7 +89,20 @@ structlog.configure(
 
 logger = structlog.get_logger(__name__)
 
-MATCHER_REGISTRY: Dict[str, ContainerMatcher] = {matcher.name: matcher for matcher in DEFAULT_MATCHERS}
+# Container matchers plus the in-process lexical matcher, which needs no Docker
+MATCHER_REGISTRY: Dict[str, AlignmentMatcher] = {
+    matcher.name: matcher for matcher in (*DEFAULT_MATCHERS, LexicalMatcher())
+}
+
+_STATE_ORDER = [
+    PipelineState.PENDING,
+    PipelineState.VALIDATING,
+    PipelineState.FETCHING,
+    PipelineState.INGESTING,
+    PipelineState.ALIGNING,
+    PipelineState.FUSING,
+    PipelineState.COMPLETED,
+]
 
 
 @dataclass
@@ -65,6 +114,7 @@ class PipelineArtifacts:
     converted: dict[str, Path]
     mappings: dict[str, list[Path]]
     merged_graph: Path
+    degradations: List[Degradation] = field(default_factory=list)
 
 
 def load_manifest(path: Path) -> PipelineManifest:
@@ -85,35 +135,42 @@ def load_manifest(path: Path) -> PipelineManifest:
     return PipelineManifest.model_validate(data)
 
 
-def fetch_source(source, workdir):
+def fetch_source(source, workdir, cache_dir: Optional[Path] = None):
     """Fetch source data based on configuration.
 
+    Local sources are used in place. HTTP(S), S3 and git sources are
+    downloaded through the fetch cache (see :mod:`graph_mesh_orchestrator.fetchers`)
+    into ``<workdir>/sources/<source id>/``.
+
     Args:
         source: SourceConfig instance
         workdir: Working directory for artifacts
+        cache_dir: Fetch cache directory for remote sources
+            (default: ``<workdir>/fetch-cache``)
 
     Returns:
         Path or list of paths to fetched data
 
     Raises:
         FetchError: If fetch operation fails
+        NetworkError: If a remote fetch fails transiently
     """
     try:
         fetch_info = source.fetch
         fetch_type = fetch_info.type.value if hasattr(fetch_info.type, 'value') else str(fetch_info.type)
 
-        # Handle multiple paths (list) or single path (string)
-        paths = fetch_info.paths or ([fetch_info.path] if fetch_info.path else [])
-        resolved_paths = [str(Path(p).resolve()) for p in paths if p]
-
-        if not resolved_paths:
-            raise FetchError(
-                f"No paths configured for source",
-                source_id=source.id,
-                fetch_type=fetch_type
-            )
-
         if fetch_type == "local":
+            # Handle multiple paths (list) or single path (string)
+            paths = fetch_info.paths or ([fetch_info.path] if fetch_info.path else [])
+            resolved_paths = [str(Path(p).resolve()) for p in paths if p]
+
+            if not resolved_paths:
+                raise FetchError(
+                    f"No paths configured for source",
+                    source_id=source.id,
+                    fetch_type=fetch_type
+                )
+
             # Validate paths exist
             for path in resolved_paths:
                 if not Path(path).exists():
@@ -133,13 +190,16 @@ def fetch_source(source, workdir):
 
             return resolved
 
+        if fetch_type in ("http", "https", "s3", "git"):
+            return fetch_remote(source, Path(workdir), cache_dir)
+
         raise FetchError(
             f"Unsupported fetch type: {fetch_type}",
             source_id=source.id,
             fetch_type=fetch_type
         )
 
-    except FetchError:
+    except (FetchError, RecoverableError):
         raise
     except Exception as e:
         raise FetchError(
@@ -149,6 +209,24 @@ def fetch_source(source, workdir):
 
 
 
+def source_fingerprint(source, fetched: Path | list[Path]) -> str:
+    """Fingerprint a source's configuration and the bytes it fetched.
+
+    Args:
+        source: SourceConfig instance
+        fetched: Path or list of paths returned by :func:`fetch_source`
+
+    Returns:
+        Hex digest that changes whenever the source's config or inputs change
+    """
+    paths = fetched if isinstance(fetched, (list, tuple)) else [fetched]
+    files = []
+    for path in map(Path, paths):
+        files.extend(sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path])
+    return cache_key("source", source.model_dump(mode="json"), hash_paths(files))
+
+
+
 def fuse_graphs(graphs: Iterable[Path], meta_graph: Graph, output_path: Path) -> Path:
     """Fuse multiple OWL graphs with meta-ontology.
 
@@ -165,17 +243,32 @@ def fuse_graphs(graphs: Iterable[Path], meta_graph: Graph, output_path: Path) ->
     """
     try:
         logger.info("fusing_graphs", graph_count=len(list(graphs)), output=str(output_path))
-        combined = Graph()
+        # Past the memory budget, the merged graph moves to disk
+        combined = new_graph()
         combined += meta_graph
 
         graph_list = list(graphs)
         for i, graph_path in enumerate(graph_list):
-            logger.debug("parsing_graph", index=i + 1, total=len(graph_list), path=str(graph_path))
-            combined.parse(graph_path)
+            with span("fusion.input", "fusion", path=str(graph_path)):
+                # Graphs converted in this process are merged as objects, without a parse
+                handed_off = take_graph(graph_path)
+                if handed_off is None:
+                    logger.debug("parsing_graph", index=i + 1, total=len(graph_list), path=str(graph_path))
+                    combined.parse(graph_path)
+                else:
+                    combined += handed_off
+                    for prefix, namespace in handed_off.namespaces():
+                        combined.bind(prefix, namespace, override=False)
+                    handed_off.close()
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        combined.serialize(destination=output_path, format="turtle")
-        logger.info("fusion_complete", output=str(output_path), triple_count=len(combined))
+        with span("serialize", "fusion", format="turtle"):
+            combined.serialize(destination=output_path, format="turtle")
+        triple_count = len(combined)
+        logger.info("fusion_complete", output=str(output_path), triple_count=triple_count,
+                    spilled_to_disk=is_spilled(combined))
+        annotate(triple_count=triple_count)
+        combined.close()
         return output_path
 
     except Exception as e:
@@ -185,34 +278,88 @@ def fuse_graphs(graphs: Iterable[Path], meta_graph: Graph, output_path: Path) ->
         ) from e
 
 
+def fuse_sources(
+    manifest: PipelineManifest,
+    converted: Dict[str, Path],
+    snapshot: MetaOntologySnapshot,
+    workdir: Path,
+    incremental: bool = False,
+) -> Path:
+    """Fuse converted sources with the meta-ontology in the manifest's format.
+
+    The merged graph is written to ``<workdir>/graph-mesh-merged-<provider>``
+    with the extension of ``pipeline.fusion_format``.
+
+    Args:
+        manifest: Pipeline manifest
+        converted: Converted ontology per source identifier, in manifest order
+        snapshot: Meta-ontology snapshot
+        workdir: Working directory
+        incremental: Rebuild the merged graph from per-source parts, reserializing
+            only changed sources (streaming formats only)
+
+    Returns:
+        Path to the merged graph
+    """
+    provider_name_safe = snapshot.info.name.lower().replace(" ", "-")
+    fusion_format = manifest.pipeline.fusion_format
+    if incremental and fusion_format not in STREAMING_FORMATS:
+        logger.warning("incremental_fusion_unavailable",
+                       fusion_format=fusion_format,
+                       reason="incremental fusion requires fusion_format ntriples or nquads")
+    if fusion_format not in STREAMING_FORMATS:
+        return fuse_graphs(converted.values(), snapshot.graph,
+                           workdir / f"graph-mesh-merged-{provider_name_safe}.ttl")
+
+    merged_path = workdir / f"graph-mesh-merged-{provider_name_safe}{STREAMING_FORMATS[fusion_format]}"
+    if incremental:
+        return incremental_fuse_graphs(
+            converted,
+            snapshot.graph,
+            snapshot.key,
+            workdir / "fusion" / "parts",
+            merged_path,
+            output_format=fusion_format,
+            dedupe=manifest.pipeline.fusion_dedupe,
+            spill_dir=workdir,
+        ).output_path
+    return stream_fuse_graphs(
+        converted.values(),
+        snapshot.graph,
+        merged_path,
+        output_format=fusion_format,
+        dedupe=manifest.pipeline.fusion_dedupe,
+        spill_dir=workdir,
+    ).output_path
+
+
 def save_checkpoint(
     checkpoint: PipelineCheckpoint,
     workdir: Path
 ) -> None:
-    """Save pipeline checkpoint.
+    """Save a complete pipeline checkpoint.
+
+    Atomically replaces the checkpoint snapshot and discards journaled
+    events. Incremental updates during a run go through
+    :class:`~graph_mesh_orchestrator.journal.CheckpointJournal` instead.
 
     Args:
         checkpoint: Checkpoint data
         workdir: Working directory
 
     Raises:
-        CheckpointError: If checkpoint save fails
+        CheckpointError: If the journal cannot write the snapshot
     """
-    try:
-        checkpoint_path = workdir / "checkpoint.json"
-        checkpoint.to_file(checkpoint_path)
-        logger.debug("checkpoint_saved", path=str(checkpoint_path))
-    except Exception as e:
-        raise CheckpointError(
-            f"Failed to save checkpoint: {str(e)}",
-            checkpoint_path=str(checkpoint_path),
-            operation="save"
-        ) from e
+    with CheckpointJournal(workdir) as journal:
+        journal.reset(checkpoint)
+    logger.debug("checkpoint_saved", path=str(journal.snapshot_path))
 
 
 def load_checkpoint(workdir: Path) -> Optional[PipelineCheckpoint]:
     """Load pipeline checkpoint if it exists.
 
+    The snapshot is read and any journaled events are replayed on top of it.
+
     Args:
         workdir: Working directory
 
@@ -220,22 +367,227 @@ def load_checkpoint(workdir: Path) -> Optional[PipelineCheckpoint]:
         Checkpoint data or None if not found
 
     Raises:
-        CheckpointError: If checkpoint load fails
+        CheckpointError: If the journal cannot read or replay the snapshot
+    """
+    checkpoint = CheckpointJournal(workdir).load()
+    if checkpoint is not None:
+        logger.info("checkpoint_loaded", state=checkpoint.state.value)
+    return checkpoint
+
+
+def resolve_cache(manifest: PipelineManifest, cache_dir: Optional[Path] = None) -> Optional[ArtifactCache]:
+    """Resolve the artifact cache for a run.
+
+    Precedence: explicit ``cache_dir`` argument, then the manifest's
+    ``pipeline.cache_dir``, then the ``GRAPH_MESH_CACHE_DIR`` environment
+    variable. Caching is disabled when none is set.
+
+    Args:
+        manifest: Validated pipeline manifest
+        cache_dir: Explicit cache directory
+
+    Returns:
+        ArtifactCache or None if caching is disabled
     """
-    checkpoint_path = workdir / "checkpoint.json"
-    if not checkpoint_path.exists():
+    root = cache_dir or manifest.pipeline.cache_dir or default_cache_dir()
+    if not root:
         return None
+    return ArtifactCache(Path(root))
 
+
+def select_matchers(manifest: PipelineManifest) -> list:
+    """Return the manifest's registered matchers with its resource requests applied.
+
+    Matchers named in ``pipeline.matcher_resources`` get that request's
+    ``cpus`` and ``memory_mb`` (fields left unset keep the matcher's own).
+    With ``pipeline.warm_matchers`` they run in warm containers that stop
+    after ``pipeline.warm_matcher_idle_seconds`` without work, and
+    ``pipeline.alignment_batch_size`` becomes their ``max_batch``. The
+    registry entries themselves are not modified.
+
+    Args:
+        manifest: Validated pipeline manifest
+
+    Returns:
+        Matchers in manifest order; names missing from the registry are skipped
+    """
+    selected = []
+    for name in manifest.matchers:
+        matcher = MATCHER_REGISTRY.get(name)
+        if matcher is None:
+            continue
+        resources = manifest.pipeline.matcher_resources.get(name)
+        if resources is not None and is_dataclass(matcher):
+            requested = resources.model_dump(exclude_none=True)
+            supported = {f.name for f in fields(matcher)}
+            matcher = replace(matcher, **{k: v for k, v in requested.items() if k in supported})
+        if manifest.pipeline.warm_matchers and is_dataclass(matcher) and hasattr(matcher, "warm"):
+            matcher = replace(matcher, warm=True,
+                              warm_idle_seconds=manifest.pipeline.warm_matcher_idle_seconds)
+        if manifest.pipeline.alignment_batch_size > 1 and is_dataclass(matcher) and hasattr(matcher, "max_batch"):
+            matcher = replace(matcher, max_batch=manifest.pipeline.alignment_batch_size)
+        selected.append(matcher)
+    return selected
+
+
+def prepare_images(manifest: PipelineManifest) -> None:
+    """Start checking the Docker images a run needs, concurrently and in the background.
+
+    Matcher images are pulled when missing if ``pipeline.pull_images`` is
+    set; the Ontmalizer image used by XSD sources is built locally, so it is
+    only checked. Matchers and converters then find each image's status in
+    the process-wide Docker session's cache instead of asking the daemon.
+
+    Args:
+        manifest: Validated pipeline manifest
+    """
+    matcher_images = [m.image for m in select_matchers(manifest) if getattr(m, "image", None)]
+    local_images = [DEFAULT_ONTMALIZER_IMAGE for source in manifest.sources
+                    if source.enabled and source.convert.type.value == "xsd"]
+    if not matcher_images and not local_images:
+        return
+    session = default_docker_session()
+    session.prepare_images(matcher_images, pull=manifest.pipeline.pull_images)
+    session.prepare_images(local_images)
+    logger.info("preparing_images", images=sorted(set(matcher_images + local_images)),
+                pull=manifest.pipeline.pull_images)
+
+
+def meta_ontology_provider_config(manifest: PipelineManifest) -> Dict:
+    """Return the MetaOntologyRegistry configuration for a manifest.
+
+    Args:
+        manifest: Pipeline manifest
+
+    Returns:
+        Provider configuration with ``type`` and ``options``
+    """
+    meta_type = manifest.meta_ontology.type
+    return {
+        "type": meta_type.value if hasattr(meta_type, 'value') else str(meta_type),
+        "options": manifest.meta_ontology.options
+    }
+
+
+def meta_ontology_cache_key(provider_config: Dict, provider: MetaOntologyProvider) -> str:
+    """Derive the artifact cache key for a serialized meta-ontology.
+
+    Option values naming existing local files (e.g., a custom ontology path)
+    contribute their content hash, so editing the file invalidates the entry.
+    """
+    file_digests = {}
+    for name, value in (provider_config.get("options") or {}).items():
+        if isinstance(value, str) and Path(value).is_file():
+            file_digests[name] = hash_paths(value)
+
+    info = provider.get_info()
+    provider_id = f"{type(provider).__module__}.{type(provider).__qualname__}"
+    return cache_key(
+        "meta-ontology", provider_config, provider_id, info.version, file_digests, SNAPSHOT_FORMAT_VERSION
+    )
+
+
+def prepare_meta_ontology(
+    provider: MetaOntologyProvider,
+    provider_config: Dict,
+    meta_path: Path,
+    cache: Optional[ArtifactCache] = None,
+) -> MetaOntologySnapshot:
+    """Load or build the meta-ontology, writing it as Turtle plus a snapshot.
+
+    A snapshot next to ``meta_path`` that was built from the same provider
+    configuration is loaded directly; otherwise the artifact cache is tried,
+    and only then is the provider asked to build its graph.
+
+    Args:
+        provider: Meta-ontology provider created from the manifest
+        provider_config: Provider configuration the provider was created from
+        meta_path: Turtle output path; the snapshot is written alongside it
+        cache: Optional artifact cache
+
+    Returns:
+        MetaOntologySnapshot for the provider
+    """
+    key = meta_ontology_cache_key(provider_config, provider)
+    snapshot_path = meta_path.with_suffix(SNAPSHOT_SUFFIX)
+
+    if meta_path.exists():
+        snapshot = load_snapshot(snapshot_path, key)
+        if snapshot is not None:
+            logger.info("meta_ontology_snapshot_loaded",
+                        path=str(snapshot_path),
+                        triple_count=len(snapshot.graph))
+            annotate(triple_count=len(snapshot.graph), origin="snapshot")
+            return snapshot
+
+    files = {"meta-ontology.ttl": meta_path, "meta-ontology.snapshot": snapshot_path}
+    if cache and cache.restore(key, files):
+        snapshot = load_snapshot(snapshot_path, key)
+        if snapshot is not None:
+            logger.info("meta_ontology_cache_hit", triple_count=len(snapshot.graph))
+            annotate(triple_count=len(snapshot.graph), origin="cache")
+            return snapshot
+
+    meta_graph = provider.build_graph()
+    logger.info("meta_ontology_built", triple_count=len(meta_graph))
+    meta_path.parent.mkdir(parents=True, exist_ok=True)
+    meta_graph.serialize(destination=str(meta_path), format="turtle")
+    snapshot = save_snapshot(provider, meta_graph, snapshot_path, key)
+    if cache:
+        cache.store(key, files, metadata={"provider": snapshot.info.name})
+    annotate(triple_count=len(meta_graph), origin="built")
+    return snapshot
+
+
+def write_run_metrics(
+    recorder: MetricsRecorder,
+    workdir: Path,
+    manifest: PipelineManifest,
+    status: str,
+) -> None:
+    """Write ``run_metrics.json`` and, if configured, a Prometheus textfile.
+
+    Failures are logged rather than raised so telemetry never fails a run.
+
+    Args:
+        recorder: Recorder holding the run's unit metrics
+        workdir: Working directory
+        manifest: Pipeline manifest
+        status: Final pipeline state
+    """
     try:
-        checkpoint = PipelineCheckpoint.from_file(checkpoint_path)
-        logger.info("checkpoint_loaded", state=checkpoint.state.value)
-        return checkpoint
+        metrics_path = recorder.write_json(
+            workdir / "run_metrics.json",
+            pipeline=manifest.name,
+            status=status,
+        )
+        logger.info("run_metrics_written", path=str(metrics_path), unit_count=len(recorder.units))
+        if manifest.pipeline.metrics_textfile:
+            textfile = Path(manifest.pipeline.metrics_textfile).expanduser()
+            recorder.write_prometheus(textfile, pipeline=manifest.name)
+            logger.info("prometheus_metrics_written", path=str(textfile))
     except Exception as e:
-        raise CheckpointError(
-            f"Failed to load checkpoint: {str(e)}",
-            checkpoint_path=str(checkpoint_path),
-            operation="load"
-        ) from e
+        logger.warning("run_metrics_write_failed", error=str(e))
+
+
+def write_trace(tracer: Tracer, workdir: Path, manifest: PipelineManifest, status: str) -> None:
+    """Write ``trace.json`` (Chrome Trace Event format) and ``trace_spans.tsv``.
+
+    Failures are logged rather than raised so tracing never fails a run.
+
+    Args:
+        tracer: Tracer holding the run's spans
+        workdir: Working directory
+        manifest: Pipeline manifest
+        status: Final pipeline state
+    """
+    try:
+        trace_path = tracer.write_chrome_trace(workdir / "trace.json", pipeline=manifest.name, status=status)
+        table_path = tracer.write_span_table(workdir / "trace_spans.tsv")
+        logger.info("trace_written", path=str(trace_path), span_table=str(table_path),
+                    span_count=len(tracer.spans))
+    except Exception as e:
+        logger.warning("trace_write_failed", error=str(e))
 
 
 def orchestrate(
@@ -243,16 +595,66 @@ def orchestrate(
     workdir: Path | None = None,
     resume: bool = False,
     skip_preflight: bool = False,
-    max_retries: int = 3
+    max_retries: int = 3,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+    incremental: bool = False,
+    matcher_pool: Optional[MatcherPool] = None,
+    shared_meta_ontology: Optional[Tuple[MetaOntologySnapshot, Path]] = None,
+    ingest_pool: Optional[IngestPool] = None,
+    trace: Optional[bool] = None,
+    hooks: Optional[HookRegistry] = None,
+    profile_stage: Optional[str] = None,
+    deadline: Optional[Union[timedelta, float]] = None,
 ) -> PipelineArtifacts:
     """Orchestrate the complete pipeline with state management and resume capability.
 
+    Fetch, ingest and alignment run as a dependency graph of (source, stage)
+    tasks. When ``pipeline.parallel_sources`` is enabled in the manifest, tasks
+    of different sources overlap on a bounded worker pool.
+
+    With ``incremental``, the previous run's checkpoint in ``workdir`` is
+    reused even if that run completed. Every source is fetched and
+    fingerprinted (configuration plus fetched bytes); only sources whose
+    fingerprint changed are ingested again, and only those, or sources whose
+    meta-ontology or matcher set changed, are aligned again. With a streaming
+    ``pipeline.fusion_format`` the merged graph is rebuilt from per-source
+    parts, reserializing only the changed sources.
+
+    With a ``deadline``, the run skips preflight checks and the slowest
+    matchers it cannot afford, falls back to mappings from earlier runs, and
+    keeps time for fusion, so a merged graph with partial alignments arrives
+    on time (see :mod:`graph_mesh_orchestrator.deadline`). What was skipped
+    is returned in ``PipelineArtifacts.degradations`` and written to
+    ``<workdir>/deadline.json``.
+
     Args:
         manifest_path: Path to pipeline manifest
         workdir: Working directory for artifacts
         resume: Whether to resume from checkpoint
         skip_preflight: Skip pre-flight validation checks
         max_retries: Maximum retry attempts for recoverable errors
+        max_workers: Override for the manifest's ``pipeline.max_workers``
+        cache_dir: Content-addressed artifact cache shared across runs
+            (overrides ``pipeline.cache_dir`` and ``GRAPH_MESH_CACHE_DIR``)
+        incremental: Recompute only sources whose inputs changed since the
+            last run in ``workdir``
+        matcher_pool: Pool bounding concurrent matcher runs (default: the
+            process-wide pool shared by all pipelines)
+        shared_meta_ontology: Prebuilt meta-ontology snapshot and its Turtle
+            file, used instead of building one when it matches the manifest's
+            meta-ontology configuration
+        ingest_pool: Worker processes for schema conversion (default: a pool
+            created from ``pipeline.ingest_workers``, or in-process conversion
+            when that is 0)
+        trace: Record a span timeline to ``trace.json`` and
+            ``trace_spans.tsv`` (default: ``pipeline.trace``)
+        hooks: Callbacks notified before and after each stage, per source
+            and per matcher result (in addition to ``pipeline.hooks``)
+        profile_stage: Stage to profile with cProfile; pstats files are
+            written to ``<workdir>/profiles/``
+        deadline: Time budget of the run, as a timedelta or seconds
+            (default: ``pipeline.deadline_minutes``)
 
     Returns:
         PipelineArtifacts with paths to all outputs
@@ -260,14 +662,35 @@ def orchestrate(
     Raises:
         PipelineError: If pipeline execution fails
     """
+    run_started = time.monotonic()
     workdir = (workdir or Path("artifacts")).resolve()
     workdir.mkdir(parents=True, exist_ok=True)
 
     log = logger.bind(manifest=str(manifest_path), workdir=str(workdir))
 
+    # Load and validate manifest
+    log.info("loading_manifest")
+    manifest = load_manifest(manifest_path)
+    if deadline is None and manifest.pipeline.deadline_minutes:
+        deadline = timedelta(minutes=manifest.pipeline.deadline_minutes)
+    tracker = None
+    if deadline is not None:
+        tracker = DeadlineTracker(deadline, started=run_started, history=load_matcher_history(workdir))
+        log.info("deadline_enabled", deadline_seconds=tracker.deadline_seconds,
+                 fusion_reserve_seconds=round(tracker.fusion_reserve_seconds, 3))
+
     # Initialize or load checkpoint
     checkpoint = None
-    if resume:
+    if incremental:
+        checkpoint = load_checkpoint(workdir)
+        if checkpoint:
+            log.info("incremental_run", previous_state=checkpoint.state.value)
+            checkpoint.state = PipelineState.PENDING
+            checkpoint.current_stage = "initialization"
+            checkpoint.error_message = None
+        else:
+            log.info("incremental_run_without_checkpoint", full_run=True)
+    elif resume:
         checkpoint = load_checkpoint(workdir)
         if checkpoint and checkpoint.can_resume():
             log.info("resuming_pipeline", state=checkpoint.state.value)
@@ -275,17 +698,35 @@ def orchestrate(
             log.warning("no_valid_checkpoint", resuming_from_start=True)
             checkpoint = None
 
-    # Pre-flight checks (unless skipped or resuming)
-    if not skip_preflight and not checkpoint:
+    # Pre-flight checks (unless skipped or resuming); they only warn, so deadline runs skip them
+    if not skip_preflight and not checkpoint and tracker is not None:
+        tracker.record(Degradation(action="skipped_preflight", stage="preflight",
+                                   reason="preflight checks are optional in a deadline run"))
+    elif not skip_preflight and not checkpoint:
         log.info("running_preflight_checks")
         try:
             run_preflight_checks(manifest_path, workdir, check_docker=True, strict=False)
         except Exception as e:
             log.warning("preflight_check_failed", error=str(e))
 
-    # Load and validate manifest
-    log.info("loading_manifest")
-    manifest = load_manifest(manifest_path)
+    # Matcher and converter images are checked (or pulled) while the meta-ontology is built
+    if manifest.pipeline.prepare_images:
+        prepare_images(manifest)
+
+    cache = resolve_cache(manifest, cache_dir)
+    if cache:
+        log.info("artifact_cache_enabled", cache_dir=str(cache.root))
+    # Remote downloads live next to the artifact cache so batches and service jobs share them
+    fetch_cache_dir = cache.root / "fetch" if cache else workdir / "fetch-cache"
+
+    # Callbacks for this run: the caller's hooks, the manifest's, then the profiler
+    run_hooks = HookRegistry()
+    if hooks is not None:
+        run_hooks.extend(hooks)
+    if manifest.pipeline.hooks:
+        run_hooks.extend(load_hooks(manifest.pipeline.hooks))
+    if profile_stage:
+        run_hooks.add(StageProfiler(profile_stage, workdir / "profiles"))
 
     # Initialize checkpoint if not resuming
     if not checkpoint:
@@ -297,9 +738,76 @@ def orchestrate(
             sources={src.id: SourceState(source_id=src.id) for src in manifest.sources},
             timestamp=datetime.utcnow().isoformat()
         )
+    else:
+        # Sources added to the manifest since the checkpoint was written
+        for src in manifest.sources:
+            checkpoint.sources.setdefault(src.id, SourceState(source_id=src.id))
+    save_checkpoint(checkpoint, workdir)
+
+    journal = CheckpointJournal(workdir)
+    recorder = MetricsRecorder()
+    matcher_pool = matcher_pool or default_matcher_pool()
+    owns_ingest_pool = ingest_pool is None and manifest.pipeline.ingest_workers > 0
+    if owns_ingest_pool:
+        ingest_pool = IngestPool(
+            max_workers=manifest.pipeline.ingest_workers,
+            memory_limit_mb=manifest.pipeline.ingest_memory_limit_mb,
+            timeout_seconds=manifest.pipeline.ingest_timeout,
+            max_tasks_per_worker=manifest.pipeline.ingest_tasks_per_worker,
+        )
+
+    @contextmanager
+    def run_stage(stage: str, source_id: Optional[str] = None) -> Iterator[HookEvent]:
+        """Measure a stage and report it to the hooks."""
+        with run_hooks.stage(stage, checkpoint, workdir, source_id=source_id) as event:
+            with recorder.measure(stage, source_id=source_id) as unit:
+                event.metrics = unit
+                yield event
+
+    def load_meta_ontology(
+        provider: MetaOntologyProvider,
+        provider_config: Dict,
+        meta_path: Path,
+    ) -> Tuple[MetaOntologySnapshot, Path]:
+        if shared_meta_ontology is not None:
+            shared_snapshot, shared_path = shared_meta_ontology
+            if shared_snapshot.key == meta_ontology_cache_key(provider_config, provider):
+                log.info("meta_ontology_shared", path=str(shared_path))
+                return shared_snapshot, Path(shared_path)
+            log.warning("shared_meta_ontology_mismatch", provider=shared_snapshot.info.name)
+        with run_stage("meta_ontology") as event:
+            event.artifacts["meta_ontology"] = meta_path
+            return prepare_meta_ontology(provider, provider_config, meta_path, cache), meta_path
+
+    # Run-wide context (memory budget, tracer) reaches scheduler threads and ingest workers
+    run_context = ExitStack()
+    if manifest.pipeline.memory_budget_mb:
+        budget = MemoryBudget(manifest.pipeline.memory_budget_mb, spill_dir=str(workdir / "spill"))
+        run_context.enter_context(budget.activate())
+        log.info("memory_budget_enabled", memory_budget_mb=budget.limit_mb, max_graph_triples=budget.max_triples)
+
+    # Graphs converted in this process reach fusion as objects instead of being re-parsed.
+    # Held graphs add up across sources, so bounded-memory runs (a memory budget or
+    # streaming fusion) keep going through files.
+    handoff = None
+    bounded_memory = bool(manifest.pipeline.memory_budget_mb) or manifest.pipeline.fusion_format in STREAMING_FORMATS
+    if manifest.pipeline.graph_handoff and ingest_pool is None:
+        if bounded_memory:
+            log.info("graph_handoff_disabled", reason="bounded_memory",
+                     memory_budget_mb=manifest.pipeline.memory_budget_mb,
+                     fusion_format=manifest.pipeline.fusion_format)
+        else:
+            handoff = run_context.enter_context(GraphHandoff().activate())
+
+    # Spans from every thread and ingest worker of this run go to one tracer
+    tracer = Tracer() if (manifest.pipeline.trace if trace is None else trace) else None
+    run_span = None
+    if tracer is not None:
+        run_context.enter_context(tracer.activate())
+        run_span = run_context.enter_context(tracer.span("pipeline", "run", manifest=manifest.name))
 
     # Track artifacts
-    fetched: dict[str, Path] = {}
+    fetched: dict[str, Path | list[Path]] = {}
     converted: dict[str, Path] = {}
     mappings: dict[str, list[Path]] = {}
 
@@ -307,15 +815,10 @@ def orchestrate(
         # Stage 1: Meta-ontology preparation with pluggable providers
         if not checkpoint.meta_ontology_path:
             log.info("stage_meta_ontology", stage="preparation")
-            checkpoint.state = PipelineState.VALIDATING
-            checkpoint.current_stage = "meta_ontology"
-            save_checkpoint(checkpoint, workdir)
+            journal.record(checkpoint, state=PipelineState.VALIDATING, current_stage="meta_ontology")
 
             # Create meta-ontology provider from manifest config
-            provider_config = {
-                "type": manifest.meta_ontology.type.value if hasattr(manifest.meta_ontology.type, 'value') else str(manifest.meta_ontology.type),
-                "options": manifest.meta_ontology.options
-            }
+            provider_config = meta_ontology_provider_config(manifest)
 
             log.info("creating_meta_ontology_provider", config=provider_config)
             provider = MetaOntologyRegistry.create(provider_config)
@@ -327,172 +830,335 @@ def orchestrate(
                      provider_namespace=provider_info.namespace,
                      provider_description=provider_info.description)
 
-            # Build ontology graph
-            meta_graph = provider.build_graph()
-            log.info("meta_ontology_built", triple_count=len(meta_graph))
-
             # Serialize with provider-specific naming
             provider_name_safe = provider_info.name.lower().replace(" ", "-")
             meta_filename = f"{provider_name_safe}-meta-ontology.ttl"
             meta_path = workdir / "meta" / meta_filename
             meta_path.parent.mkdir(parents=True, exist_ok=True)
-            meta_graph.serialize(destination=str(meta_path), format="turtle")
 
-            checkpoint.meta_ontology_path = str(meta_path)
-            save_checkpoint(checkpoint, workdir)
+            snapshot, meta_path = load_meta_ontology(provider, provider_config, meta_path)
+            provider = SnapshotMetaOntology(snapshot)
+
+            journal.record(checkpoint, meta_ontology_path=str(meta_path))
 
             log.info("meta_ontology_serialized", path=str(meta_path))
 
         else:
-            # Resuming from checkpoint - recreate provider
+            # Resuming from checkpoint - reload the snapshot instead of rebuilding
             meta_path = Path(checkpoint.meta_ontology_path)
             log.info("meta_ontology_exists", path=str(meta_path))
 
             # Recreate provider from manifest
-            provider_config = {
-                "type": manifest.meta_ontology.type.value if hasattr(manifest.meta_ontology.type, 'value') else str(manifest.meta_ontology.type),
-                "options": manifest.meta_ontology.options
-            }
+            provider_config = meta_ontology_provider_config(manifest)
             provider = MetaOntologyRegistry.create(provider_config)
             provider_info = provider.get_info()
-            meta_graph = provider.build_graph()
+            snapshot, meta_path = load_meta_ontology(provider, provider_config, meta_path)
+            provider = SnapshotMetaOntology(snapshot)
 
-        # Stage 2: Fetch sources
-        log.info("stage_fetch", stage="fetch", source_count=len(manifest.sources))
-        checkpoint.state = PipelineState.FETCHING
-        checkpoint.current_stage = "fetch"
-        save_checkpoint(checkpoint, workdir)
+        # Stages 2-4: fetch → ingest → align, one DAG node per (source, stage)
+        worker_count = resolve_worker_count(
+            manifest.pipeline.parallel_sources,
+            max_workers or manifest.pipeline.max_workers,
+        )
+        log.info("stage_sources",
+                 stage="sources",
+                 source_count=len(manifest.sources),
+                 max_workers=worker_count,
+                 meta_ontology_provider=provider_info.name,
+                 alignment_targets_available=len(provider.get_alignment_targets()))
+        journal.record(checkpoint, state=PipelineState.FETCHING, current_stage="fetch")
 
-        for source in manifest.sources:
-            if not source.enabled:
-                log.info("source_disabled", source_id=source.id)
-                continue
+        state_lock = threading.Lock()
+        changed_sources: set[str] = set()
+        batched: Dict[str, List[Path]] = {}
+        selected_matchers = select_matchers(manifest)
+        blocker = MinHashBlocker() if manifest.pipeline.blocking else None
 
+        def advance_state(state: PipelineState, stage: str) -> None:
+            """Move the checkpoint forward to the furthest stage reached by any source."""
+            with state_lock:
+                if _STATE_ORDER.index(state) > _STATE_ORDER.index(checkpoint.state):
+                    journal.record(checkpoint, state=state, current_stage=stage)
+
+        def fetch_stage(source) -> None:
             source_state = checkpoint.sources.get(source.id)
-            if source_state and source_state.fetched and source_state.fetch_path:
+            # Incremental runs always fetch: the fetched bytes decide what changed
+            if (not incremental and source_state and source_state.fetched
+                    and (source_state.fetch_path or source_state.fetch_paths)):
                 log.info("source_already_fetched", source_id=source.id)
-                fetched[source.id] = Path(source_state.fetch_path)
-                continue
+                if source_state.fetch_paths:
+                    fetched[source.id] = [Path(p) for p in source_state.fetch_paths]
+                else:
+                    fetched[source.id] = Path(source_state.fetch_path)
+                return
 
             log.info("fetching_source", source_id=source.id)
-            try:
-                raw_path = fetch_source(source, workdir)
-                fetched[source.id] = raw_path if isinstance(raw_path, Path) else Path(str(raw_path))
-
-                # Update checkpoint
-                source_state.fetched = True
-                source_state.fetch_path = str(raw_path)
-                save_checkpoint(checkpoint, workdir)
-
-            except RecoverableError as e:
-                if e.can_retry():
-                    log.warning("fetch_failed_retrying", source_id=source.id, error=str(e))
-                    time.sleep(2)
-                    # Retry logic could be more sophisticated
-                    continue
-                raise
-
-        # Stage 3: Ingest (convert to OWL)
-        log.info("stage_ingest", stage="ingest", source_count=len(fetched))
-        checkpoint.state = PipelineState.INGESTING
-        checkpoint.current_stage = "ingest"
-        save_checkpoint(checkpoint, workdir)
-
-        # Check for already converted sources
-        sources_to_convert = []
-        for source in manifest.sources:
-            if not source.enabled or source.id not in fetched:
-                continue
-
+            attempt = 0
+            while True:
+                try:
+                    raw_path = fetch_source(source, workdir, fetch_cache_dir)
+                    break
+                except RecoverableError as e:
+                    attempt += 1
+                    if not e.can_retry() or attempt > max_retries:
+                        raise
+                    log.warning("fetch_failed_retrying", source_id=source.id, attempt=attempt, error=str(e))
+                    time.sleep(manifest.pipeline.retry_delay)
+
+            fingerprint = source_fingerprint(source, raw_path)
+            with state_lock:
+                if isinstance(raw_path, (list, tuple)):
+                    fetched[source.id] = [Path(p) for p in raw_path]
+                    updates = {"fetch_paths": [str(p) for p in raw_path]}
+                else:
+                    fetched[source.id] = Path(raw_path)
+                    updates = {"fetch_path": str(raw_path)}
+                if fingerprint != source_state.fingerprint:
+                    if source_state.fingerprint is not None:
+                        log.info("source_changed", source_id=source.id)
+                    changed_sources.add(source.id)
+                    # Invalidate downstream results recorded for the old inputs
+                    updates.update(ingested=False, converted_path=None, aligned=False,
+                                   mapping_paths=[], alignment_fingerprint=None, error=None)
+                journal.record_source(checkpoint, source.id, fetched=True, fingerprint=fingerprint, **updates)
+
+        def ingest_stage(source) -> None:
+            advance_state(PipelineState.INGESTING, "ingest")
             source_state = checkpoint.sources.get(source.id)
-            if source_state and source_state.ingested and source_state.converted_path:
+            if (source_state and source_state.ingested and source_state.converted_path
+                    and Path(source_state.converted_path).exists()):
                 log.info("source_already_converted", source_id=source.id)
                 converted[source.id] = Path(source_state.converted_path)
-            else:
-                sources_to_convert.append(source)
-
-        # Convert remaining sources
-        if sources_to_convert:
-            fetched_for_ingest = {src.id: fetched[src.id] for src in sources_to_convert if src.id in fetched}
-            newly_converted = run_ingest(sources_to_convert, fetched_for_ingest, workdir)
-            converted.update(newly_converted)
-
-            # Update checkpoint for newly converted sources
-            for source_id, converted_path in newly_converted.items():
-                source_state = checkpoint.sources.get(source_id)
-                if source_state:
-                    source_state.ingested = True
-                    source_state.converted_path = str(converted_path)
-            save_checkpoint(checkpoint, workdir)
-
-        # Stage 4: Alignment
-        log.info("stage_alignment",
-                 stage="alignment",
-                 meta_ontology_provider=provider_info.name,
-                 alignment_targets_available=len(provider.get_alignment_targets()))
-        checkpoint.state = PipelineState.ALIGNING
-        checkpoint.current_stage = "alignment"
-        save_checkpoint(checkpoint, workdir)
-
-        for source in manifest.sources:
-            if not source.enabled or source.id not in converted:
-                continue
+                return
+
+            newly_converted = run_ingest([source], {source.id: fetched[source.id]}, workdir,
+                                         cache=cache, pool=ingest_pool)
+            with state_lock:
+                converted.update(newly_converted)
+                for source_id, converted_path in newly_converted.items():
+                    journal.record_source(checkpoint, source_id,
+                                          ingested=True, converted_path=str(converted_path))
+
+        def alignment_fingerprint_of(source_id: str) -> str:
+            return cache_key(
+                "alignment-inputs",
+                checkpoint.sources[source_id].fingerprint,
+                snapshot.key,
+                sorted(matcher.name for matcher in selected_matchers),
+                *(["blocking"] if blocker is not None else []),
+            )
 
-            source_state = checkpoint.sources.get(source.id)
-            if source_state and source_state.aligned and source_state.mapping_paths:
+        def alignment_target(source_ids: List[str], name: str) -> Path:
+            """Return the ontology the sources are aligned against.
+
+            Without blocking this is the meta-ontology; with it, the part of
+            the meta-ontology holding the sources' candidate entities.
+            """
+            if blocker is None:
+                return meta_path
+            with recorder.measure("blocking"):
+                result = blocker.block([converted[sid] for sid in source_ids], meta_path,
+                                       workdir / "blocking" / f"{name}.nt")
+            log.info("blocking_candidates", sources=source_ids, candidate_pairs=result.pair_count,
+                     target_entities=len(result.target_iris), reduction=result.reduction)
+            return result.target_path
+
+        def already_aligned(source_id: str, alignment_fingerprint: str) -> bool:
+            source_state = checkpoint.sources.get(source_id)
+            return bool(source_state and source_state.aligned and source_state.mapping_paths
+                        and (not incremental or source_state.alignment_fingerprint == alignment_fingerprint))
+
+        def align_batch_stage(group: list) -> None:
+            """Align a group of sources with one invocation per matcher and batch.
+
+            Sources the batch aligned find their mappings in ``batched``; if
+            the batch fails, each source falls back to aligning on its own.
+            """
+            pending = {source.id: converted[source.id] for source in group
+                       if not already_aligned(source.id, alignment_fingerprint_of(source.id))}
+            if len(pending) < 2 or not selected_matchers:
+                return
+            for path in pending.values():
+                wait_for_file(path)
+            log.info("aligning_batch", sources=sorted(pending))
+            try:
+                with recorder.measure("alignment_batch"):
+                    annotate(batch_size=len(pending))
+                    target = alignment_target(sorted(pending), "batch-" + cache_key("blocking-batch", sorted(pending))[:12])
+                    results = run_alignment_batch(
+                        selected_matchers,
+                        pending,
+                        target,
+                        {source_id: workdir / "mappings" / source_id for source_id in pending},
+                        cache=cache,
+                        pool=matcher_pool,
+                        on_result=report_matcher_result,
+                    )
+            except Exception as e:
+                log.warning("batch_alignment_failed", sources=sorted(pending), error=str(e))
+                return
+            with state_lock:
+                batched.update(results)
+
+        def align_stage(source) -> None:
+            advance_state(PipelineState.ALIGNING, "alignment")
+            alignment_fingerprint = alignment_fingerprint_of(source.id)
+            if already_aligned(source.id, alignment_fingerprint):
                 log.info("source_already_aligned", source_id=source.id)
-                mappings[source.id] = [Path(p) for p in source_state.mapping_paths]
-                continue
-
-            log.info("aligning_source", source_id=source.id)
-            converted_path = converted[source.id]
-
-            matcher_names = manifest.matchers
-            selected_matchers = [MATCHER_REGISTRY[name] for name in matcher_names if name in MATCHER_REGISTRY]
+                mappings[source.id] = [Path(p) for p in checkpoint.sources[source.id].mapping_paths]
+                return
 
             if not selected_matchers:
                 log.warning("no_matchers_available", source_id=source.id)
-                continue
+                return
 
+            # Matchers read the converted file, which the graph handoff may still be writing
+            wait_for_file(converted[source.id])
+            log.info("aligning_source", source_id=source.id)
             mapping_dir = workdir / "mappings" / source.id
+            complete = True
+            with state_lock:
+                batch_mappings = batched.pop(source.id, None)
             try:
-                mapping_paths = run_alignment(
-                    selected_matchers,
-                    converted_path,
-                    meta_path,
-                    mapping_dir,
-                )
-                mappings[source.id] = mapping_paths
-
-                # Update checkpoint
-                source_state.aligned = True
-                source_state.mapping_paths = [str(p) for p in mapping_paths]
-                save_checkpoint(checkpoint, workdir)
-
+                if batch_mappings is not None:
+                    mapping_paths = batch_mappings
+                elif tracker is None:
+                    mapping_paths = run_alignment(
+                        selected_matchers,
+                        converted[source.id],
+                        alignment_target([source.id], source.id),
+                        mapping_dir,
+                        cache=cache,
+                        pool=matcher_pool,
+                        on_result=partial(report_matcher_result, source.id),
+                    )
+                else:
+                    target = alignment_target([source.id], source.id)
+                    mapping_paths, complete = align_within_deadline(source.id, mapping_dir, target)
             except Exception as e:
                 log.error("alignment_failed", source_id=source.id, error=str(e))
                 # Continue with other sources even if one fails
-                source_state.error = str(e)
-                save_checkpoint(checkpoint, workdir)
+                with state_lock:
+                    journal.record_source(checkpoint, source.id, error=str(e))
+                return
+
+            with state_lock:
+                mappings[source.id] = mapping_paths
+                # A partial alignment is redone by the next resumed or incremental run
+                journal.record_source(checkpoint, source.id,
+                                      aligned=complete,
+                                      mapping_paths=[str(p) for p in mapping_paths],
+                                      alignment_fingerprint=alignment_fingerprint if complete else None)
+
+        def align_within_deadline(source_id: str, mapping_dir: Path, target: Path) -> Tuple[list[Path], bool]:
+            """Run the matchers the deadline allows, reusing earlier mappings for the rest.
+
+            Returns the mappings in manifest order and whether every matcher ran.
+            """
+            source_path = converted[source_id]
+            cached = [m.name for m in selected_matchers
+                      if cache is not None and cache.contains(alignment_cache_key(m, source_path, target))]
+            planned, skipped = tracker.plan_matchers(selected_matchers, source_id, cached=cached)
+            produced: Dict[str, Path] = {}
+            for matcher in planned:
+                if matcher.name not in cached and not tracker.allows(matcher, source_id):
+                    skipped.append(matcher)
+                    continue
+                produced[matcher.name] = run_alignment(
+                    [matcher], source_path, target, mapping_dir, cache=cache, pool=matcher_pool,
+                    on_result=partial(report_matcher_result, source_id))[0]
+            for matcher in skipped:
+                # A mapping left in the workdir by an earlier run beats none at all
+                previous = mapping_dir / getattr(matcher, "output_filename", f"{matcher.name}.sssom.tsv")
+                if previous.exists():
+                    produced[matcher.name] = previous
+                    tracker.record(Degradation(
+                        action="reused_previous_mappings", stage="alignment", source_id=source_id,
+                        matcher=matcher.name, reason=f"{matcher.name} was skipped; using {previous.name} "
+                                                     "from an earlier run"))
+            return [produced[m.name] for m in selected_matchers if m.name in produced], not skipped
+
+        def source_artifacts(source_id: str) -> Dict[str, Any]:
+            with state_lock:
+                return {name: paths[source_id]
+                        for name, paths in (("fetched", fetched), ("converted", converted), ("mappings", mappings))
+                        if source_id in paths}
+
+        def report_matcher_result(source_id: str, matcher, mapping: Path, unit) -> None:
+            if tracker is not None and unit is not None and not unit.extra.get("cached"):
+                tracker.observe(matcher.name, unit.wall_seconds)
+            run_hooks.emit(HookEvent("on_matcher_result", "alignment", checkpoint, workdir,
+                                     source_id=source_id, matcher=matcher.name,
+                                     artifacts={"mapping": Path(mapping)}, metrics=unit))
+
+        def measured(stage: str, source, func) -> None:
+            with run_stage(stage, source.id) as event:
+                func(source)
+                event.artifacts.update(source_artifacts(source.id))
+            # Alignment is a source's last stage
+            if stage == "alignment":
+                run_hooks.emit(HookEvent("on_source", stage, checkpoint, workdir,
+                                         source_id=source.id, artifacts=source_artifacts(source.id)))
+
+        scheduler = StageScheduler(max_workers=worker_count)
+        ingest_keys = {}
+        for source in manifest.sources:
+            if not source.enabled:
+                log.info("source_disabled", source_id=source.id)
+                continue
+            fetch_key = scheduler.add_task(
+                source.id, "fetch", partial(measured, "fetch", source, fetch_stage))
+            ingest_keys[source.id] = scheduler.add_task(
+                source.id, "ingest", partial(measured, "ingest", source, ingest_stage), depends_on=[fetch_key])
+
+        # With batching, each group of sources is aligned together once all of them are ingested
+        batch_size = manifest.pipeline.alignment_batch_size
+        if batch_size > 1 and tracker is not None:
+            log.info("alignment_batching_disabled", reason="deadline runs plan matchers per source")
+            batch_size = 1
+        enabled_sources = [source for source in manifest.sources if source.enabled]
+        for start in range(0, len(enabled_sources), batch_size):
+            group = enabled_sources[start:start + batch_size]
+            depends_on = [ingest_keys[source.id] for source in group]
+            if len(group) > 1:
+                depends_on = [scheduler.add_task(f"batch-{start // batch_size}", "alignment_batch",
+                                                 partial(align_batch_stage, group), depends_on=depends_on)]
+            for source in group:
+                scheduler.add_task(source.id, "alignment", partial(measured, "alignment", source, align_stage),
+                                   depends_on=depends_on)
+        with run_stage("sources") as event:
+            scheduler.run()
+            event.artifacts.update(converted=dict(converted), mappings=dict(mappings))
+        if incremental:
+            enabled_count = sum(1 for source in manifest.sources if source.enabled)
+            log.info("incremental_sources",
+                     changed=sorted(changed_sources),
+                     unchanged_count=enabled_count - len(changed_sources))
+
+        # Report artifacts in manifest order regardless of completion order
+        source_order = [source.id for source in manifest.sources]
+        converted = {sid: converted[sid] for sid in source_order if sid in converted}
+        mappings = {sid: mappings[sid] for sid in source_order if sid in mappings}
 
         # Stage 5: Fusion
         log.info("stage_fusion",
                  stage="fusion",
                  meta_ontology_provider=provider_info.name)
-        checkpoint.state = PipelineState.FUSING
-        checkpoint.current_stage = "fusion"
-        save_checkpoint(checkpoint, workdir)
-
-        # Include provider name in merged graph filename
-        provider_name_safe = provider_info.name.lower().replace(" ", "-")
-        merged_filename = f"graph-mesh-merged-{provider_name_safe}.ttl"
-        merged_path = fuse_graphs(converted.values(), meta_graph, workdir / merged_filename)
-        checkpoint.merged_graph_path = str(merged_path)
-
-        # Mark as complete
-        checkpoint.state = PipelineState.COMPLETED
-        checkpoint.current_stage = "completed"
-        save_checkpoint(checkpoint, workdir)
+        journal.record(checkpoint, state=PipelineState.FUSING, current_stage="fusion")
+
+        with run_stage("fusion") as fusion_event:
+            merged_path = fuse_sources(manifest, converted, snapshot, workdir, incremental=incremental)
+            fusion_event.artifacts["merged_graph"] = merged_path
+            if handoff is not None:
+                # Converted files are artifacts of the run; surface write errors here
+                handoff.flush()
+                annotate(graphs_handed_off=handoff.stats()["taken"])
+        # Mark as complete and fold the journal into the snapshot
+        journal.record(checkpoint,
+                       merged_graph_path=str(merged_path),
+                       state=PipelineState.COMPLETED,
+                       current_stage="completed")
+        journal.compact()
 
         log.info("pipeline_complete",
                  merged_graph=str(merged_path),
@@ -507,23 +1173,48 @@ def orchestrate(
             converted=converted,
             mappings=mappings,
             merged_graph=merged_path,
+            degradations=tracker.degradations if tracker is not None else [],
         )
 
     except Exception as e:
         log.error("pipeline_failed", error=str(e), stage=checkpoint.current_stage)
-        checkpoint.state = PipelineState.FAILED
-        checkpoint.error_message = str(e)
-        save_checkpoint(checkpoint, workdir)
+        journal.record(checkpoint, state=PipelineState.FAILED, error_message=str(e))
+        journal.compact()
         raise PipelineError(f"Pipeline execution failed: {str(e)}") from e
-
-
-def main(manifest_path: str, workdir: Optional[str] = None, resume: bool = False) -> None:
+    finally:
+        journal.close()
+        if owns_ingest_pool:
+            ingest_pool.shutdown()
+        if run_span is not None:
+            run_span.status = "error" if checkpoint.state == PipelineState.FAILED else "ok"
+        run_context.close()
+        write_run_metrics(recorder, workdir, manifest, status=checkpoint.state.value)
+        if tracker is not None:
+            log.info("deadline_report", path=str(tracker.write_report(workdir)),
+                     degradations=len(tracker.degradations))
+        if tracer is not None:
+            write_trace(tracer, workdir, manifest, status=checkpoint.state.value)
+
+
+def main(
+    manifest_path: str,
+    workdir: Optional[str] = None,
+    resume: bool = False,
+    incremental: bool = False,
+    trace: Optional[bool] = None,
+    profile_stage: Optional[str] = None,
+    deadline_minutes: Optional[float] = None,
+) -> None:
     """Main entry point for pipeline orchestration.
 
     Args:
         manifest_path: Path to pipeline manifest
         workdir: Working directory for artifacts
         resume: Whether to resume from checkpoint
+        incremental: Recompute only sources whose inputs changed
+        trace: Write a span timeline (default: ``pipeline.trace``)
+        profile_stage: Stage to profile with cProfile
+        deadline_minutes: Time budget of the run (default: ``pipeline.deadline_minutes``)
     """
     logging.basicConfig(level=logging.INFO)
 
@@ -533,7 +1224,11 @@ def main(manifest_path: str, workdir: Optional[str] = None, resume: bool = False
             manifest_path=Path(manifest_path),
             workdir=workdir_path,
             resume=resume,
-            skip_preflight=False
+            skip_preflight=False,
+            incremental=incremental,
+            trace=trace,
+            profile_stage=profile_stage,
+            deadline=timedelta(minutes=deadline_minutes) if deadline_minutes else None,
         )
         logger.info("pipeline_success", artifacts={
             "workdir": str(artifacts.workdir),
@@ -542,6 +1237,7 @@ def main(manifest_path: str, workdir: Optional[str] = None, resume: bool = False
             "meta_ontology_version": artifacts.meta_ontology_provider_version,
             "merged_graph": str(artifacts.merged_graph),
             "converted_count": len(artifacts.converted),
+            "degradations": len(artifacts.degradations),
         })
     except Exception as e:
         logger.error("pipeline_failed", error=str(e), error_type=type(e).__name__)
@@ -566,5 +1262,31 @@ if __name__ == "__main__":  # pragma: no cover - CLI entry
         action="store_true",
         help="Resume from checkpoint if available"
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only recompute sources whose inputs changed since the last run"
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        default=None,
+        help="Write a span timeline (trace.json, trace_spans.tsv) to the workdir"
+    )
+    parser.add_argument(
+        "--profile-stage",
+        choices=STAGES,
+        default=None,
+        help="Profile one stage with cProfile (pstats files in <workdir>/profiles/)"
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        metavar="MINUTES",
+        help="Finish within this many minutes, skipping the slowest matchers if needed"
+    )
     args = parser.parse_args()
-    main(args.manifest, workdir=args.workdir, resume=args.resume)
+
+    main(args.manifest, workdir=args.workdir, resume=args.resume, incremental=args.incremental,
+         trace=args.trace, profile_stage=args.profile_stage, deadline_minutes=args.deadline)
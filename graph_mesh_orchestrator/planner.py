@@ -0,0 +1,678 @@
+"""Pre-run execution plans and cost estimates (``graph-mesh plan``).
+
+:func:`plan_pipeline` profiles every source without converting it (file sizes,
+XSD component counts, JSON Schema definition counts, CSV columns) and counts
+the meta-ontology's classes when a built snapshot is available. A
+:class:`CostModel` turns those profiles into per-stage runtime and memory
+estimates; stages whose results are already in the artifact cache (or, for
+incremental plans, in the workdir's checkpoint) are reported as cached or
+skipped. The remaining work is replayed through the scheduler's dispatch
+policy to predict wall-clock time under the configured worker count and
+matcher pool.
+
+When the workdir holds a ``run_metrics.json`` from an earlier run, measured
+times and memory of the same source and stage replace the model's guesses.
+
+Example:
+    >>> plan = plan_pipeline(Path("manifest.yaml"), memory_limit_mb=16384)
+    >>> print(plan.format_text())
+    >>> plan.exceeds_memory_limit
+    False
+"""
+
+from __future__ import annotations
+
+import csv
+import heapq
+import json
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import structlog
+from rdflib import OWL, RDF
+
+from graph_mesh_aligner.matchers import alignment_cache_key
+from graph_mesh_aligner.pool import default_pool_size
+from graph_mesh_core.artifact_cache import cache_key
+from graph_mesh_core.meta_ontology_registry import MetaOntologyRegistry
+from graph_mesh_core.meta_ontology_snapshot import SNAPSHOT_SUFFIX, load_snapshot
+from graph_mesh_orchestrator.fetchers import cached_paths
+from graph_mesh_orchestrator.ingest import CONVERTER_REGISTRY, _ingest_cache_key
+from graph_mesh_orchestrator.journal import CheckpointJournal
+from graph_mesh_orchestrator.models import PipelineManifest, SourceConfig
+from graph_mesh_orchestrator.pipeline import (
+    MATCHER_REGISTRY,
+    load_manifest,
+    meta_ontology_cache_key,
+    meta_ontology_provider_config,
+    resolve_cache,
+    select_matchers,
+    source_fingerprint,
+)
+from graph_mesh_orchestrator.scheduler import resolve_worker_count
+from graph_mesh_orchestrator.streaming_fusion import STREAMING_FORMATS
+
+logger = structlog.get_logger(__name__)
+
+MB = 1024 * 1024
+
+# XSD components that become OWL classes or properties
+_XSD_COMPONENTS = ("complexType", "simpleType", "element", "attribute", "group", "attributeGroup")
+
+
+@dataclass
+class CostModel:
+    """Coefficients turning source profiles into runtime and memory estimates.
+
+    The defaults are rough figures for a developer workstation; pass a tuned
+    instance to :func:`plan_pipeline` for other hardware.
+
+    Attributes:
+        remote_fetch_seconds: Fetch time for a remote source of unknown size
+        ingest_base_seconds: Fixed converter start-up time per source
+        ingest_seconds_per_class: Conversion time per schema component
+        ingest_seconds_per_mb: Parse time per MB of schema input
+        ingest_base_bytes: Fixed converter memory per source
+        ingest_bytes_per_input_byte: Parsed-schema memory per byte of input
+        ingest_bytes_per_class: Output-graph memory per schema component
+        triples_per_class: OWL triples produced per schema component
+        matcher_base_seconds: Container start-up and ontology loading per matcher run
+        matcher_seconds_per_pair: Time per (source class, meta class) pair, per matcher
+        matcher_memory_bytes: Memory per matcher without a memory_mb request; container
+            memory, or orchestrator memory for in-process matchers (those without an image)
+        meta_base_seconds: Meta-ontology build time per provider type
+        meta_seconds_per_fibo_module: Download and parse time per FIBO module
+        meta_bytes_per_triple: Resident memory per meta-ontology triple
+        meta_default_triples: Triple count assumed when no snapshot exists
+        fusion_seconds_per_triple: Parse and serialize time per merged triple
+        fusion_bytes_per_triple: Resident memory per in-memory merged triple
+    """
+
+    remote_fetch_seconds: float = 2.0
+    ingest_base_seconds: Dict[str, float] = field(
+        default_factory=lambda: {"xsd": 0.5, "json": 0.2, "csv": 0.2})
+    ingest_seconds_per_class: Dict[str, float] = field(
+        default_factory=lambda: {"xsd": 0.004, "json": 0.002, "csv": 0.001})
+    ingest_seconds_per_mb: float = 1.5
+    ingest_base_bytes: int = 120 * MB
+    ingest_bytes_per_input_byte: int = 30
+    ingest_bytes_per_class: int = 20 * 1024
+    triples_per_class: int = 8
+    matcher_base_seconds: Dict[str, float] = field(
+        default_factory=lambda: {"LogMap": 20.0, "AML": 15.0, "BERTMap": 120.0, "Lexical": 0.5})
+    matcher_seconds_per_pair: Dict[str, float] = field(
+        default_factory=lambda: {"LogMap": 2e-5, "AML": 1e-5, "BERTMap": 4e-4, "Lexical": 1e-7})
+    matcher_memory_bytes: Dict[str, int] = field(
+        default_factory=lambda: {"LogMap": 2048 * MB, "AML": 2048 * MB, "BERTMap": 6144 * MB,
+                                 "Lexical": 256 * MB})
+    meta_base_seconds: Dict[str, float] = field(
+        default_factory=lambda: {"generic": 0.5, "custom": 2.0, "composite": 5.0, "fibo": 10.0})
+    meta_seconds_per_fibo_module: float = 45.0
+    meta_bytes_per_triple: int = 1024
+    meta_default_triples: Dict[str, int] = field(
+        default_factory=lambda: {"generic": 200, "custom": 10_000, "composite": 50_000, "fibo": 150_000})
+    fusion_seconds_per_triple: float = 2e-5
+    fusion_bytes_per_triple: int = 1024
+
+
+@dataclass
+class SourceProfile:
+    """Cheap structural profile of one source's schema files.
+
+    Attributes:
+        source_id: Source identifier
+        convert_type: Converter type
+        fetch_type: Fetch type
+        files: Profiled files (empty if a remote source was never fetched)
+        total_bytes: Combined size of the files, None if unknown
+        counts: Component counts by kind (e.g., ``complexType``, ``definitions``, ``columns``)
+        class_estimate: Estimated number of OWL classes and properties produced
+    """
+
+    source_id: str
+    convert_type: str
+    fetch_type: str
+    files: List[str] = field(default_factory=list)
+    total_bytes: Optional[int] = None
+    counts: Dict[str, int] = field(default_factory=dict)
+    class_estimate: int = 0
+
+
+@dataclass
+class StageEstimate:
+    """Estimated cost of one unit of work.
+
+    Attributes:
+        stage: 'meta_ontology', 'fetch', 'ingest', 'alignment' or 'fusion'
+        source_id: Source the unit belongs to, if any
+        seconds: Estimated wall-clock time of the unit
+        memory_bytes: Estimated peak memory of the orchestrator process
+        container_memory_bytes: Estimated memory of matcher containers
+        status: 'execute', 'cached' (restored from the artifact cache) or
+            'skip' (unchanged since the last run)
+        basis: 'model' or 'history' (measured in a previous run)
+        matchers: Matchers executed by an alignment unit
+    """
+
+    stage: str
+    source_id: Optional[str] = None
+    seconds: float = 0.0
+    memory_bytes: int = 0
+    container_memory_bytes: int = 0
+    status: str = "execute"
+    basis: str = "model"
+    matchers: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ExecutionPlan:
+    """Predicted execution of a manifest.
+
+    Attributes:
+        manifest: Pipeline name
+        workers: Worker pool size the run will use
+        matcher_slots: Concurrent matcher runs allowed by the matcher pool
+        meta_class_count: Classes in the meta-ontology, None if not built yet
+        profiles: Per-source profiles
+        stages: Per-unit estimates, in execution order
+        wall_seconds: Predicted wall-clock time under the configured concurrency
+        serial_seconds: Sum of all unit times
+        peak_memory_bytes: Predicted peak memory of the orchestrator process
+        peak_container_memory_bytes: Predicted peak memory of concurrent matcher containers
+        memory_limit_bytes: Limit the plan was checked against, if any
+        warnings: Notes about unknowns and limits
+    """
+
+    manifest: str
+    workers: int
+    matcher_slots: int
+    meta_class_count: Optional[int]
+    profiles: List[SourceProfile]
+    stages: List[StageEstimate]
+    wall_seconds: float
+    serial_seconds: float
+    peak_memory_bytes: int
+    peak_container_memory_bytes: int
+    memory_limit_bytes: Optional[int] = None
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def exceeds_memory_limit(self) -> bool:
+        """Whether the predicted peak memory exceeds the configured limit."""
+        if self.memory_limit_bytes is None:
+            return False
+        return self.peak_memory_bytes + self.peak_container_memory_bytes > self.memory_limit_bytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the plan as a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["exceeds_memory_limit"] = self.exceeds_memory_limit
+        return data
+
+    def format_text(self) -> str:
+        """Render the plan as a human-readable table."""
+        lines = [
+            f"Plan for '{self.manifest}': {self.workers} worker(s), {self.matcher_slots} matcher slot(s)",
+            f"Meta-ontology classes: {self.meta_class_count if self.meta_class_count is not None else 'unknown'}",
+            "",
+            f"{'stage':<14} {'source':<24} {'status':<8} {'time':>10} {'memory':>10}  basis",
+        ]
+        for stage in self.stages:
+            memory = stage.memory_bytes + stage.container_memory_bytes
+            lines.append(
+                f"{stage.stage:<14} {(stage.source_id or '-'):<24} {stage.status:<8} "
+                f"{_format_seconds(stage.seconds):>10} {_format_bytes(memory):>10}  {stage.basis}"
+            )
+        lines += [
+            "",
+            f"Predicted wall-clock: {_format_seconds(self.wall_seconds)} "
+            f"(serial {_format_seconds(self.serial_seconds)})",
+            f"Predicted peak memory: {_format_bytes(self.peak_memory_bytes)} orchestrator"
+            f" + {_format_bytes(self.peak_container_memory_bytes)} matcher containers",
+        ]
+        if self.memory_limit_bytes is not None:
+            verdict = "EXCEEDS" if self.exceeds_memory_limit else "within"
+            lines.append(f"Memory limit: {_format_bytes(self.memory_limit_bytes)} ({verdict})")
+        lines += [f"Warning: {warning}" for warning in self.warnings]
+        return "\n".join(lines)
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f}m"
+    return f"{seconds / 3600:.1f}h"
+
+
+def _format_bytes(count: int) -> str:
+    if count < 1024 * MB:
+        return f"{count / MB:.0f}MB"
+    return f"{count / (1024 * MB):.1f}GB"
+
+
+def _profile_xsd(path: Path, counts: Dict[str, int]) -> None:
+    for _, element in ET.iterparse(path, events=("start",)):
+        local = element.tag.rsplit("}", 1)[-1]
+        if local in _XSD_COMPONENTS:
+            counts[local] = counts.get(local, 0) + 1
+
+
+def _profile_json(path: Path, counts: Dict[str, int]) -> None:
+    with open(path, encoding="utf-8") as f:
+        schema = json.load(f)
+
+    def walk(node: Any) -> None:
+        if isinstance(node, dict):
+            for keyword in ("definitions", "$defs"):
+                if isinstance(node.get(keyword), dict):
+                    counts["definitions"] = counts.get("definitions", 0) + len(node[keyword])
+            if isinstance(node.get("properties"), dict):
+                counts["properties"] = counts.get("properties", 0) + len(node["properties"])
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    counts["definitions"] = counts.get("definitions", 0) + 1  # the root schema
+    walk(schema)
+
+
+def _profile_csv(path: Path, counts: Dict[str, int]) -> None:
+    with open(path, newline="", encoding="utf-8", errors="replace") as f:
+        sample = f.read(64 * 1024)
+    delimiter = "\t" if path.suffix.lower() == ".tsv" else ","
+    try:
+        delimiter = csv.Sniffer().sniff(sample, delimiters=",;\t|").delimiter
+    except csv.Error:
+        pass
+    header = next(csv.reader(sample.splitlines(), delimiter=delimiter), [])
+    counts["columns"] = counts.get("columns", 0) + len(header)
+
+
+_PROFILERS = {"xsd": _profile_xsd, "json": _profile_json, "csv": _profile_csv}
+
+
+def _source_files(source: SourceConfig, fetch_cache_dir: Path) -> Optional[List[Path]]:
+    """Return the files a source would be converted from, without fetching it."""
+    fetch_type = source.fetch.type.value
+    if fetch_type == "local":
+        paths = source.fetch.paths or ([source.fetch.path] if source.fetch.path else [])
+        return [Path(p) for p in paths]
+    return cached_paths(source, fetch_cache_dir)
+
+
+def profile_source(source: SourceConfig, files: Optional[Sequence[Path]]) -> SourceProfile:
+    """Profile one source's schema files.
+
+    Args:
+        source: Source configuration
+        files: Files to profile (None if a remote source has no cached copy)
+
+    Returns:
+        SourceProfile; unreadable files leave counts empty rather than failing
+    """
+    convert_type = source.convert.type.value
+    profile = SourceProfile(source_id=source.id, convert_type=convert_type, fetch_type=source.fetch.type.value)
+    if files is None:
+        return profile
+
+    profiler = _PROFILERS.get(convert_type)
+    expanded: List[Path] = []
+    for path in files:
+        expanded.extend(sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path])
+    profile.files = [str(p) for p in expanded]
+    profile.total_bytes = sum(p.stat().st_size for p in expanded if p.exists())
+    for path in expanded:
+        try:
+            if profiler:
+                profiler(path, profile.counts)
+        except Exception as e:
+            logger.warning("profile_failed", source_id=source.id, path=str(path), error=str(e))
+
+    counts = profile.counts
+    if convert_type == "xsd":
+        profile.class_estimate = sum(counts.values())
+    elif convert_type == "json":
+        profile.class_estimate = counts.get("definitions", 0) + counts.get("properties", 0)
+    elif convert_type == "csv":
+        # One row class plus a property per column
+        profile.class_estimate = len(expanded) + counts.get("columns", 0)
+    return profile
+
+
+def _load_history(workdir: Path) -> Dict[Tuple[str, Optional[str]], Dict[str, Any]]:
+    """Index a previous run's ``run_metrics.json`` by (stage, source_id)."""
+    try:
+        data = json.loads((workdir / "run_metrics.json").read_text())
+    except (OSError, ValueError):
+        return {}
+    history: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+    for unit in data.get("units", []):
+        if unit.get("status") == "ok" and not unit.get("extra", {}).get("cached"):
+            history[(unit["stage"], unit.get("source_id"))] = unit
+    return history
+
+
+def _apply_history(estimate: StageEstimate, history: Mapping[Tuple[str, Optional[str]], Dict[str, Any]]) -> None:
+    unit = history.get((estimate.stage, estimate.source_id))
+    if unit is None or estimate.status != "execute":
+        return
+    estimate.seconds = unit["wall_seconds"]
+    if unit.get("peak_rss_delta_bytes"):
+        # The RSS delta excludes memory already held; keep the model's baseline
+        estimate.memory_bytes = max(estimate.memory_bytes, unit["peak_rss_delta_bytes"])
+    estimate.basis = "history"
+
+
+def simulate_schedule(
+    stages: Sequence[StageEstimate],
+    workers: int,
+    matcher_slots: int,
+) -> float:
+    """Replay per-source units through the scheduler's dispatch policy.
+
+    Each source's fetch, ingest and alignment run in order. Ready units are
+    started highest rank first, as :class:`StageScheduler` does, on
+    ``workers`` workers; alignment units additionally wait for a matcher slot.
+
+    Args:
+        stages: Per-source fetch, ingest and alignment estimates
+        workers: Worker pool size
+        matcher_slots: Matcher pool size
+
+    Returns:
+        Predicted makespan in seconds
+    """
+    chains: Dict[str, List[StageEstimate]] = {}
+    for stage in stages:
+        chains.setdefault(stage.source_id, []).append(stage)
+    order = {source_id: index for index, source_id in enumerate(chains)}
+
+    # (-rank, manifest index, source, position in chain)
+    ready = [(-len(chain), order[source_id], source_id, 0) for source_id, chain in chains.items()]
+    heapq.heapify(ready)
+    running: List[Tuple[float, str, int, bool]] = []
+    deferred: List[Tuple[int, int, str, int]] = []
+    now = 0.0
+    free_workers, free_slots = workers, matcher_slots
+
+    while ready or running or deferred:
+        while ready and free_workers:
+            item = heapq.heappop(ready)
+            _, _, source_id, position = item
+            stage = chains[source_id][position]
+            needs_slot = stage.stage == "alignment" and stage.status == "execute" and bool(stage.matchers)
+            if needs_slot and not free_slots:
+                # The worker thread blocks on the matcher pool
+                deferred.append(item)
+                free_workers -= 1
+                continue
+            free_workers -= 1
+            free_slots -= needs_slot
+            heapq.heappush(running, (now + stage.seconds, source_id, position, needs_slot))
+        if not running:
+            break
+        now, source_id, position, held_slot = heapq.heappop(running)
+        free_workers += 1
+        free_slots += held_slot
+        if held_slot and deferred:
+            _, _, waiting_source, waiting_position = deferred.pop(0)
+            waiting = chains[waiting_source][waiting_position]
+            free_slots -= 1
+            heapq.heappush(running, (now + waiting.seconds, waiting_source, waiting_position, True))
+        if position + 1 < len(chains[source_id]):
+            chain = chains[source_id]
+            heapq.heappush(ready, (-(len(chain) - position - 1), order[source_id], source_id, position + 1))
+    return now
+
+
+def _peak_concurrent(values: Sequence[int], concurrency: int) -> int:
+    """Upper bound on the combined size of ``concurrency`` simultaneous units."""
+    return sum(sorted(values, reverse=True)[:max(concurrency, 0)])
+
+
+def plan_pipeline(
+    manifest_path: Path,
+    workdir: Optional[Path] = None,
+    cache_dir: Optional[Path] = None,
+    incremental: bool = False,
+    max_workers: Optional[int] = None,
+    max_concurrent_matchers: Optional[int] = None,
+    memory_limit_mb: Optional[int] = None,
+    cost_model: Optional[CostModel] = None,
+) -> ExecutionPlan:
+    """Estimate the cost of running a manifest without running it.
+
+    Nothing is fetched, converted or aligned; the meta-ontology is only read
+    from an existing snapshot or cache entry.
+
+    Args:
+        manifest_path: Path to pipeline manifest
+        workdir: Working directory the run would use (default: ./artifacts)
+        cache_dir: Artifact cache override, as for :func:`orchestrate`
+        incremental: Plan an incremental re-run against the workdir's checkpoint
+        max_workers: Override for the manifest's ``pipeline.max_workers``
+        max_concurrent_matchers: Matcher pool size (default: the pool's default)
+        memory_limit_mb: Memory available to the run, to check the prediction against
+        cost_model: Estimation coefficients (default: :class:`CostModel`)
+
+    Returns:
+        ExecutionPlan with per-stage estimates and the predicted totals
+
+    Raises:
+        ManifestValidationError: If the manifest is invalid
+    """
+    model = cost_model or CostModel()
+    workdir = (workdir or Path("artifacts")).resolve()
+    manifest: PipelineManifest = load_manifest(manifest_path)
+    cache = resolve_cache(manifest, cache_dir)
+    fetch_cache_dir = cache.root / "fetch" if cache else workdir / "fetch-cache"
+    history = _load_history(workdir)
+    warnings: List[str] = []
+    budget_mb = manifest.pipeline.memory_budget_mb
+    budget_bytes = budget_mb * MB if budget_mb else None
+
+    checkpoint = CheckpointJournal(workdir).load() if incremental and workdir.exists() else None
+    if incremental and checkpoint is None:
+        warnings.append("No checkpoint in workdir; an incremental run recomputes every source")
+
+    # Meta-ontology: read the class count from a built snapshot when one exists
+    provider_config = meta_ontology_provider_config(manifest)
+    provider = MetaOntologyRegistry.create(provider_config)
+    meta_key = meta_ontology_cache_key(provider_config, provider)
+    provider_name = provider.get_info().name.lower().replace(" ", "-")
+    meta_path = workdir / "meta" / f"{provider_name}-meta-ontology.ttl"
+    meta_estimate = StageEstimate(stage="meta_ontology")
+    snapshot = None
+    if meta_path.exists():
+        snapshot = load_snapshot(meta_path.with_suffix(SNAPSHOT_SUFFIX), meta_key)
+        meta_estimate.status = "skip" if snapshot else "execute"
+    if snapshot is None and cache and cache.contains(meta_key):
+        cached_snapshot = cache.entry_path(meta_key, "meta-ontology.snapshot")
+        snapshot = load_snapshot(cached_snapshot, meta_key) if cached_snapshot else None
+        meta_path = cache.entry_path(meta_key, "meta-ontology.ttl") or meta_path
+        meta_estimate.status = "cached" if snapshot else "execute"
+
+    meta_type = provider_config["type"]
+    if snapshot is not None:
+        meta_classes: Optional[int] = len(set(snapshot.graph.subjects(RDF.type, OWL.Class)))
+        meta_triples = len(snapshot.graph)
+        meta_estimate.seconds = 0.2 + meta_triples * 2e-6
+    else:
+        meta_classes = None
+        meta_triples = model.meta_default_triples.get(meta_type, 10_000)
+        modules = len(provider_config["options"].get("modules") or ["FND", "LOAN"]) if meta_type == "fibo" else 0
+        meta_estimate.seconds = (model.meta_base_seconds.get(meta_type, 5.0)
+                                 + modules * model.meta_seconds_per_fibo_module)
+        warnings.append("Meta-ontology not built yet; its class count is estimated")
+    meta_estimate.memory_bytes = meta_triples * model.meta_bytes_per_triple
+    _apply_history(meta_estimate, history)
+    meta_class_estimate = meta_classes if meta_classes is not None else max(meta_triples // 10, 1)
+
+    matchers = select_matchers(manifest)
+    unknown_matchers = [name for name in manifest.matchers if name not in MATCHER_REGISTRY]
+    if unknown_matchers:
+        warnings.append(f"Unknown matchers are skipped: {', '.join(unknown_matchers)}")
+
+    profiles: List[SourceProfile] = []
+    source_stages: List[StageEstimate] = []
+    for source in manifest.sources:
+        if not source.enabled:
+            continue
+        fetch_type = source.fetch.type.value
+        convert_type = source.convert.type.value
+        files = _source_files(source, fetch_cache_dir)
+        profile = profile_source(source, files)
+        profiles.append(profile)
+        if files is None:
+            warnings.append(f"Source '{source.id}' has not been fetched yet; its size is unknown")
+
+        # Fetch
+        fetch = StageEstimate(stage="fetch", source_id=source.id)
+        if fetch_type != "local":
+            fetch.seconds = model.remote_fetch_seconds
+            if profile.total_bytes is None:
+                fetch.status = "execute"
+            else:
+                # A cached copy only needs revalidating
+                fetch.status = "cached"
+                fetch.seconds = model.remote_fetch_seconds / 4
+
+        # Ingest
+        ingest = StageEstimate(stage="ingest", source_id=source.id)
+        size = profile.total_bytes or 0
+        ingest.seconds = (model.ingest_base_seconds.get(convert_type, 0.5)
+                          + profile.class_estimate * model.ingest_seconds_per_class.get(convert_type, 0.002)
+                          + size / MB * model.ingest_seconds_per_mb)
+        graph_bytes = profile.class_estimate * model.ingest_bytes_per_class
+        if budget_bytes is not None:
+            # Past the budget, the output graph spills to disk
+            graph_bytes = min(graph_bytes, budget_bytes)
+        ingest.memory_bytes = model.ingest_base_bytes + size * model.ingest_bytes_per_input_byte + graph_bytes
+
+        # Alignment
+        alignment = StageEstimate(stage="alignment", source_id=source.id,
+                                  matchers=[matcher.name for matcher in matchers])
+        pairs = max(profile.class_estimate, 1) * meta_class_estimate
+        alignment.seconds = sum(model.matcher_base_seconds.get(m.name, 30.0)
+                                + pairs * model.matcher_seconds_per_pair.get(m.name, 1e-4)
+                                for m in matchers)
+        matcher_memory = {m.name: (getattr(m, "memory_mb", None) or 0) * MB
+                          or model.matcher_memory_bytes.get(m.name, 2048 * MB) for m in matchers}
+        alignment.container_memory_bytes = max(
+            (matcher_memory[m.name] for m in matchers if getattr(m, "image", None)), default=0)
+        # Matchers without an image run inside the orchestrator process
+        alignment.memory_bytes = max(
+            (matcher_memory[m.name] for m in matchers if not getattr(m, "image", None)), default=0)
+
+        # Cache and checkpoint state
+        converted: Optional[Path] = None
+        converter = CONVERTER_REGISTRY.get(convert_type)
+        if converter is None:
+            warnings.append(f"No converter is registered for '{convert_type}' (source '{source.id}')")
+        if files is None or converter is None or not all(path.is_file() for path in files):
+            pass
+        elif checkpoint is not None and _unchanged(source, files, checkpoint):
+            source_state = checkpoint.sources[source.id]
+            ingest.status = "skip"
+            converted = Path(source_state.converted_path) if source_state.converted_path else None
+            alignment_fingerprint = cache_key("alignment-inputs", source_state.fingerprint, meta_key,
+                                              sorted(matcher.name for matcher in matchers))
+            if source_state.aligned and source_state.alignment_fingerprint == alignment_fingerprint:
+                alignment.status = "skip"
+        elif cache is not None:
+            input_path: Any = files if len(files) > 1 else files[0]
+            ingest_key = _ingest_cache_key(convert_type, source.convert.model_dump(), converter, input_path)
+            converted = cache.entry_path(ingest_key, "output.owl")
+            if converted is not None:
+                ingest.status = "cached"
+
+        if alignment.status == "execute" and cache is not None and converted is not None \
+                and converted.exists() and meta_path.exists() and matchers:
+            pending = [m.name for m in matchers
+                       if not cache.contains(alignment_cache_key(m, converted, meta_path))]
+            if not pending:
+                alignment.status = "cached"
+            else:
+                alignment.seconds *= len(pending) / len(matchers)
+                alignment.matchers = pending
+
+        for estimate in (fetch, ingest, alignment):
+            if estimate.status in ("cached", "skip") and estimate.stage != "fetch":
+                estimate.seconds = 0.05
+                estimate.memory_bytes = 0
+                estimate.container_memory_bytes = 0
+            _apply_history(estimate, history)
+        if not matchers:
+            alignment.seconds = 0.0
+            alignment.memory_bytes = 0
+            alignment.container_memory_bytes = 0
+        source_stages += [fetch, ingest, alignment]
+
+    # Fusion
+    fusion = StageEstimate(stage="fusion")
+    triple_counts = [p.class_estimate * model.triples_per_class for p in profiles]
+    total_triples = sum(triple_counts) + meta_triples
+    fusion.seconds = total_triples * model.fusion_seconds_per_triple
+    streaming = manifest.pipeline.fusion_format in STREAMING_FORMATS
+    held_triples = max(triple_counts, default=0) if streaming else total_triples
+    fusion.memory_bytes = held_triples * model.fusion_bytes_per_triple
+    if budget_bytes is not None:
+        fusion.memory_bytes = min(fusion.memory_bytes, budget_bytes)
+    _apply_history(fusion, history)
+
+    workers = resolve_worker_count(manifest.pipeline.parallel_sources, max_workers or manifest.pipeline.max_workers)
+    matcher_slots = max_concurrent_matchers or default_pool_size()
+    sources_seconds = simulate_schedule(source_stages, workers, matcher_slots)
+    stages = [meta_estimate] + source_stages + [fusion]
+
+    # The meta-ontology graph stays resident for the whole run; a worker
+    # holds one source's ingest or in-process alignment memory at a time
+    source_memory: Dict[Optional[str], int] = {}
+    for s in source_stages:
+        if s.stage in ("ingest", "alignment"):
+            source_memory[s.source_id] = max(source_memory.get(s.source_id, 0), s.memory_bytes)
+    peak_memory = meta_estimate.memory_bytes + max(_peak_concurrent(list(source_memory.values()), workers),
+                                                   fusion.memory_bytes)
+    container_memory = [s.container_memory_bytes for s in source_stages if s.stage == "alignment"]
+    peak_containers = _peak_concurrent(container_memory, min(workers, matcher_slots))
+
+    plan = ExecutionPlan(
+        manifest=manifest.name,
+        workers=workers,
+        matcher_slots=matcher_slots,
+        meta_class_count=meta_classes,
+        profiles=profiles,
+        stages=stages,
+        wall_seconds=meta_estimate.seconds + sources_seconds + fusion.seconds,
+        serial_seconds=sum(s.seconds for s in stages),
+        peak_memory_bytes=peak_memory,
+        peak_container_memory_bytes=peak_containers,
+        memory_limit_bytes=memory_limit_mb * MB if memory_limit_mb else None,
+        warnings=warnings,
+    )
+    if plan.exceeds_memory_limit:
+        plan.warnings.append(
+            f"Predicted peak memory exceeds the {memory_limit_mb} MB limit; lower pipeline.max_workers, "
+            "the matcher pool size, set pipeline.memory_budget_mb, or use a streaming fusion_format"
+        )
+    logger.info("plan_complete", manifest=manifest.name, wall_seconds=plan.wall_seconds,
+                peak_memory_bytes=plan.peak_memory_bytes)
+    return plan
+
+
+def _unchanged(source: SourceConfig, files: Sequence[Path], checkpoint: Any) -> bool:
+    """Whether a source's fingerprint matches the checkpoint and its outputs still exist."""
+    source_state = checkpoint.sources.get(source.id)
+    if source_state is None or not source_state.fingerprint or not source_state.ingested:
+        return False
+    if source.fetch.type.value != "local":
+        # Remote sources are fingerprinted from the copy materialized in the workdir
+        return False
+    fetched: Any = list(files) if len(files) > 1 else files[0]
+    return (source_fingerprint(source, fetched) == source_state.fingerprint
+            and bool(source_state.converted_path) and Path(source_state.converted_path).exists())
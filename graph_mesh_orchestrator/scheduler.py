@@ -0,0 +1,190 @@
+"""Dependency-graph scheduler for per-source pipeline stages.
+
+Each unit of work is a node keyed by ``(source_id, stage)``. A node becomes
+runnable once every node it depends on has finished, so one source can be
+aligning while another is still being ingested. Runnable nodes are dispatched
+to a bounded thread pool, highest rank first, where the rank of a node is the
+length of the longest dependency chain hanging off it. With a single worker
+this degenerates to the classic stage-by-stage ordering.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import heapq
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+TaskKey = Tuple[str, str]
+
+
+@dataclass
+class StageTask:
+    """A single schedulable (source, stage) unit of work."""
+
+    key: TaskKey
+    func: Callable[[], Any]
+    depends_on: Tuple[TaskKey, ...] = ()
+    dependents: List[TaskKey] = field(default_factory=list)
+
+    @property
+    def source_id(self) -> str:
+        return self.key[0]
+
+    @property
+    def stage(self) -> str:
+        return self.key[1]
+
+
+def resolve_worker_count(parallel: bool, max_workers: Optional[int] = None) -> int:
+    """Determine the worker pool size for a pipeline run.
+
+    Args:
+        parallel: Whether per-source parallelism is enabled
+        max_workers: Explicit pool size, if configured
+
+    Returns:
+        Number of worker threads to use (always at least 1)
+    """
+    if not parallel:
+        return 1
+    if max_workers:
+        return max(1, max_workers)
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class StageScheduler:
+    """Execute a DAG of stage tasks on a bounded worker pool.
+
+    Example:
+        >>> scheduler = StageScheduler(max_workers=4)
+        >>> scheduler.add_task("src", "fetch", fetch)
+        >>> scheduler.add_task("src", "ingest", ingest, depends_on=[("src", "fetch")])
+        >>> results = scheduler.run()
+    """
+
+    def __init__(self, max_workers: int = 1) -> None:
+        """Initialize scheduler.
+
+        Args:
+            max_workers: Maximum number of tasks running concurrently
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.max_workers = max_workers
+        self._tasks: Dict[TaskKey, StageTask] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    @property
+    def tasks(self) -> List[StageTask]:
+        """Registered tasks in insertion order."""
+        return list(self._tasks.values())
+
+    def add_task(
+        self,
+        source_id: str,
+        stage: str,
+        func: Callable[[], Any],
+        depends_on: Iterable[TaskKey] = (),
+    ) -> TaskKey:
+        """Register a task.
+
+        Dependencies must already be registered, which also guarantees the
+        resulting graph is acyclic.
+
+        Args:
+            source_id: Source identifier (or a pseudo-id for global stages)
+            stage: Stage name
+            func: Zero-argument callable performing the work
+            depends_on: Keys of tasks that must finish first
+
+        Returns:
+            Key of the registered task
+
+        Raises:
+            ValueError: If the key is a duplicate or a dependency is unknown
+        """
+        key = (source_id, stage)
+        if key in self._tasks:
+            raise ValueError(f"Duplicate task: {source_id}/{stage}")
+
+        deps = tuple(depends_on)
+        for dep in deps:
+            if dep not in self._tasks:
+                raise ValueError(f"Task {source_id}/{stage} depends on unknown task {dep[0]}/{dep[1]}")
+
+        self._tasks[key] = StageTask(key=key, func=func, depends_on=deps)
+        for dep in deps:
+            self._tasks[dep].dependents.append(key)
+        return key
+
+    def _ranks(self) -> Dict[TaskKey, int]:
+        """Length of the longest downstream chain for each task."""
+        ranks: Dict[TaskKey, int] = {}
+        # Insertion order is a topological order, so walk it backwards.
+        for key in reversed(list(self._tasks)):
+            task = self._tasks[key]
+            ranks[key] = 1 + max((ranks[d] for d in task.dependents), default=0)
+        return ranks
+
+    def run(self) -> Dict[TaskKey, Any]:
+        """Run all tasks, respecting dependencies.
+
+        On the first failure no further tasks are started; tasks already in
+        flight are allowed to finish and the original exception is re-raised.
+
+        Returns:
+            Mapping of task key to the value returned by its callable
+        """
+        ranks = self._ranks()
+        order = {key: i for i, key in enumerate(self._tasks)}
+        pending = {key: len(task.depends_on) for key, task in self._tasks.items()}
+        ready: List[Tuple[int, int, TaskKey]] = []
+        for key, count in pending.items():
+            if count == 0:
+                heapq.heappush(ready, (-ranks[key], order[key], key))
+
+        results: Dict[TaskKey, Any] = {}
+        running: Dict[Future, TaskKey] = {}
+        failure: Optional[BaseException] = None
+
+        logger.debug("scheduler_starting", task_count=len(self._tasks), max_workers=self.max_workers)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="graph-mesh") as pool:
+            while ready or running:
+                while ready and failure is None and len(running) < self.max_workers:
+                    _, _, key = heapq.heappop(ready)
+                    # Propagate structlog/contextvars bindings into the worker.
+                    ctx = contextvars.copy_context()
+                    running[pool.submit(ctx.run, self._tasks[key].func)] = key
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    exc = future.exception()
+                    if exc is not None:
+                        logger.error("task_failed", source_id=key[0], stage=key[1], error=str(exc))
+                        if failure is None:
+                            failure = exc
+                        continue
+
+                    results[key] = future.result()
+                    for dependent in self._tasks[key].dependents:
+                        pending[dependent] -= 1
+                        if pending[dependent] == 0:
+                            heapq.heappush(ready, (-ranks[dependent], order[dependent], dependent))
+
+        if failure is not None:
+            raise failure
+        return results
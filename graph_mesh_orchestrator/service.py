@@ -0,0 +1,494 @@
+"""Long-running orchestrator service with a prioritized job queue.
+
+A one-shot ``graph-mesh`` invocation pays interpreter start-up, heavy imports
+(rdflib, pandas, docker, owlready2) and the meta-ontology build before doing
+any work. The service pays them once: it keeps those modules loaded, holds
+every meta-ontology it has built in memory (see :class:`MetaOntologyStore`),
+shares one artifact cache and one matcher pool across jobs, and runs submitted
+manifests from a priority queue on a fixed number of worker threads.
+
+Jobs are submitted and polled over a small local HTTP API::
+
+    POST   /jobs          {"manifest": "path.yaml" | "manifest_yaml": "...",
+                           "priority": 0, "resume": false, "incremental": false}
+    GET    /jobs          list jobs
+    GET    /jobs/<id>     job status and artifacts
+    DELETE /jobs/<id>     cancel a queued job
+    GET    /health        queue depth, workers, warm meta-ontologies
+
+Higher priorities run first; jobs of equal priority run in submission order.
+
+Layout::
+
+    <root>/
+        cache/                  # artifact cache shared by all jobs
+        meta/                   # meta-ontologies kept warm
+        jobs/<id>/manifest.yaml # inline manifests
+        jobs/<id>/work/         # pipeline workdir per job
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import queue
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import structlog
+
+from graph_mesh_aligner.pool import MatcherPool, default_matcher_pool
+from graph_mesh_core.artifact_cache import ArtifactCache
+from graph_mesh_orchestrator.batch import MetaOntologyStore
+from graph_mesh_orchestrator.errors import (
+    GraphMeshError,
+    JobNotFoundError,
+    ManifestValidationError,
+    PipelineStateError,
+)
+from graph_mesh_orchestrator.ingest import IngestPool
+from graph_mesh_orchestrator.models import PipelineManifest
+from graph_mesh_orchestrator.pipeline import PipelineArtifacts, load_manifest, orchestrate
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a service job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class Job:
+    """A manifest submitted to the service."""
+
+    id: str
+    manifest_path: Path
+    workdir: Path
+    priority: int = 0
+    resume: bool = False
+    incremental: bool = False
+    status: JobStatus = JobStatus.QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    artifacts: Optional[PipelineArtifacts] = None
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable view of the job."""
+        data: Dict[str, Any] = {
+            "id": self.id,
+            "manifest": str(self.manifest_path),
+            "workdir": str(self.workdir),
+            "priority": self.priority,
+            "status": self.status.value,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+        if self.started_at is not None:
+            data["wall_seconds"] = (self.finished_at or time.time()) - self.started_at
+        if self.artifacts is not None:
+            data["artifacts"] = {
+                "meta_ontology": str(self.artifacts.meta_ontology),
+                "merged_graph": str(self.artifacts.merged_graph),
+                "converted": {k: str(v) for k, v in self.artifacts.converted.items()},
+                "mappings": {k: [str(p) for p in v] for k, v in self.artifacts.mappings.items()},
+            }
+        return data
+
+
+class OrchestratorService:
+    """Run submitted manifests on warm workers.
+
+    Example:
+        >>> service = OrchestratorService(Path("/var/lib/graph-mesh"), concurrency=2)
+        >>> service.start()
+        >>> job = service.submit(manifest_path=Path("manifest.yaml"), priority=10)
+        >>> service.wait(job.id).status
+        <JobStatus.COMPLETED: 'completed'>
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        root: Path,
+        concurrency: int = 2,
+        cache_dir: Optional[Path] = None,
+        max_concurrent_matchers: Optional[int] = None,
+        skip_preflight: bool = True,
+        ingest_workers: int = 0,
+    ) -> None:
+        """Initialize service.
+
+        Args:
+            root: Service state directory
+            concurrency: Jobs run at the same time
+            cache_dir: Artifact cache (default: ``<root>/cache``)
+            max_concurrent_matchers: Matcher pool size shared by all jobs
+                (default: the process-wide pool)
+            skip_preflight: Skip per-job pre-flight checks (manifests are
+                validated at submission)
+            ingest_workers: Schema conversion processes shared by all jobs
+                (0 leaves it to each manifest's ``pipeline.ingest_workers``)
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.root = Path(root).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.concurrency = concurrency
+        self.skip_preflight = skip_preflight
+        self.cache = ArtifactCache(cache_dir or self.root / "cache")
+        self.pool = MatcherPool(max_concurrent_matchers) if max_concurrent_matchers else default_matcher_pool()
+        self.meta_ontologies = MetaOntologyStore(self.root / "meta", self.cache)
+        self.ingest_pool = IngestPool(ingest_workers) if ingest_workers else None
+
+        self._queue: "queue.PriorityQueue[tuple]" = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._workers: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        if self._workers:
+            return
+        for index in range(self.concurrency):
+            worker = threading.Thread(target=self._work, name=f"graph-mesh-job-{index}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+        logger.info("service_started", root=str(self.root), concurrency=self.concurrency,
+                    matcher_slots=self.pool.max_concurrent)
+
+    def stop(self, wait: bool = True) -> None:
+        """Stop the workers once the queued jobs have run.
+
+        Args:
+            wait: Block until the workers have exited
+        """
+        for _ in self._workers:
+            # Sorts after every job, so queued work drains first
+            self._queue.put((float("inf"), next(self._sequence), self._STOP))
+        if wait:
+            for worker in self._workers:
+                worker.join()
+            if self.ingest_pool is not None:
+                self.ingest_pool.shutdown()
+        self._workers = []
+        logger.info("service_stopped")
+
+    def preload(self, manifest_paths: Iterable[Path]) -> None:
+        """Build the meta-ontologies of the given manifests ahead of any job.
+
+        Args:
+            manifest_paths: Manifests whose meta-ontology configuration to warm
+        """
+        for path in manifest_paths:
+            snapshot, meta_path = self.meta_ontologies.get(self._load(Path(path)))
+            logger.info("meta_ontology_preloaded", provider=snapshot.info.name, path=str(meta_path))
+
+    def _load(self, manifest_path: Path) -> PipelineManifest:
+        try:
+            return load_manifest(manifest_path)
+        except Exception as e:
+            raise ManifestValidationError(f"Invalid manifest: {e}", manifest_path=str(manifest_path)) from e
+
+    def submit(
+        self,
+        manifest_path: Optional[Path] = None,
+        manifest_yaml: Optional[str] = None,
+        priority: int = 0,
+        workdir: Optional[Path] = None,
+        resume: bool = False,
+        incremental: bool = False,
+    ) -> Job:
+        """Validate a manifest and queue it.
+
+        Args:
+            manifest_path: Manifest file on the service host
+            manifest_yaml: Manifest content, used instead of ``manifest_path``
+            priority: Higher values run first
+            workdir: Pipeline workdir (default: ``<root>/jobs/<id>/work``)
+            resume: Resume from the workdir's checkpoint
+            incremental: Recompute only changed sources
+
+        Returns:
+            The queued job
+
+        Raises:
+            ManifestValidationError: If the manifest is missing or invalid
+        """
+        job_id = uuid.uuid4().hex[:12]
+        job_dir = self.root / "jobs" / job_id
+        if manifest_yaml is not None:
+            job_dir.mkdir(parents=True, exist_ok=True)
+            manifest_path = job_dir / "manifest.yaml"
+            manifest_path.write_text(manifest_yaml, encoding="utf-8")
+        elif manifest_path is None:
+            raise ManifestValidationError("Either a manifest path or manifest content is required")
+        manifest_path = Path(manifest_path).resolve()
+        self._load(manifest_path)
+
+        job = Job(
+            id=job_id,
+            manifest_path=manifest_path,
+            workdir=Path(workdir).resolve() if workdir else job_dir / "work",
+            priority=priority,
+            resume=resume,
+            incremental=incremental,
+        )
+        with self._lock:
+            self._jobs[job_id] = job
+        self._queue.put((-priority, next(self._sequence), job_id))
+        logger.info("job_queued", job_id=job_id, manifest=str(manifest_path), priority=priority)
+        return job
+
+    def get(self, job_id: str) -> Job:
+        """Return a job.
+
+        Raises:
+            JobNotFoundError: If no job has that ID
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFoundError(job_id)
+        return job
+
+    def jobs(self) -> List[Job]:
+        """Return all jobs in submission order."""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.submitted_at)
+
+    def cancel(self, job_id: str) -> Job:
+        """Cancel a queued job.
+
+        Raises:
+            JobNotFoundError: If no job has that ID
+            PipelineStateError: If the job has already started
+        """
+        job = self.get(job_id)
+        with self._lock:
+            if job.status != JobStatus.QUEUED:
+                raise PipelineStateError("Only queued jobs can be cancelled",
+                                         current_state=job.status.value,
+                                         expected_state=JobStatus.QUEUED.value)
+            job.status = JobStatus.CANCELLED
+            job.finished_at = time.time()
+        job.done.set()
+        logger.info("job_cancelled", job_id=job_id)
+        return job
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Job:
+        """Block until a job finishes or the timeout expires.
+
+        Returns:
+            The job, in whatever state it is when the wait ends
+        """
+        job = self.get(job_id)
+        job.done.wait(timeout)
+        return job
+
+    def health(self) -> Dict[str, Any]:
+        """Return service status counters."""
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for job in self._jobs.values():
+                counts[job.status.value] = counts.get(job.status.value, 0) + 1
+        return {
+            "status": "ok",
+            "workers": len(self._workers),
+            "jobs": counts,
+            "warm_meta_ontologies": len(self.meta_ontologies),
+            "matcher_pool": self.pool.stats(),
+        }
+
+    def _work(self) -> None:
+        while True:
+            _, _, job_id = self._queue.get()
+            if job_id is self._STOP:
+                return
+            job = self.get(job_id)
+            with self._lock:
+                if job.status != JobStatus.QUEUED:
+                    continue
+                job.status = JobStatus.RUNNING
+                job.started_at = time.time()
+            self._run(job)
+
+    def _run(self, job: Job) -> None:
+        log = logger.bind(job_id=job.id)
+        log.info("job_started", manifest=str(job.manifest_path))
+        try:
+            manifest = load_manifest(job.manifest_path)
+            artifacts = orchestrate(
+                job.manifest_path,
+                workdir=job.workdir,
+                resume=job.resume,
+                skip_preflight=self.skip_preflight,
+                cache_dir=self.cache.root,
+                incremental=job.incremental,
+                matcher_pool=self.pool,
+                shared_meta_ontology=self.meta_ontologies.get(manifest),
+                ingest_pool=self.ingest_pool,
+            )
+        except Exception as e:
+            with self._lock:
+                job.status = JobStatus.FAILED
+                job.error = str(e)
+                job.finished_at = time.time()
+            log.error("job_failed", error=str(e))
+        else:
+            with self._lock:
+                job.status = JobStatus.COMPLETED
+                job.artifacts = artifacts
+                job.finished_at = time.time()
+            log.info("job_completed", wall_seconds=job.finished_at - job.started_at)
+        finally:
+            job.done.set()
+
+
+class _ServiceRequestHandler(BaseHTTPRequestHandler):
+    """JSON HTTP front end for an :class:`OrchestratorService`."""
+
+    server: "ServiceHTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("http_request", client=self.client_address[0], message=format % args)
+
+    def _send(self, status: HTTPStatus, body: Any) -> None:
+        payload = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_error(self, status: HTTPStatus, error: Exception) -> None:
+        body = error.to_dict() if isinstance(error, GraphMeshError) else {"message": str(error)}
+        self._send(status, {"error": body})
+
+    def _job_id(self) -> Optional[str]:
+        parts = self.path.strip("/").split("/")
+        return parts[1] if len(parts) == 2 and parts[0] == "jobs" else None
+
+    def do_GET(self) -> None:
+        service = self.server.service
+        try:
+            if self.path == "/health":
+                self._send(HTTPStatus.OK, service.health())
+            elif self.path.rstrip("/") == "/jobs":
+                self._send(HTTPStatus.OK, {"jobs": [job.to_dict() for job in service.jobs()]})
+            elif self._job_id():
+                self._send(HTTPStatus.OK, service.get(self._job_id()).to_dict())
+            else:
+                self._send(HTTPStatus.NOT_FOUND, {"error": {"message": f"No route for {self.path}"}})
+        except JobNotFoundError as e:
+            self._send_error(HTTPStatus.NOT_FOUND, e)
+
+    def do_POST(self) -> None:
+        if self.path.rstrip("/") != "/jobs":
+            self._send(HTTPStatus.NOT_FOUND, {"error": {"message": f"No route for {self.path}"}})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("Request body must be a JSON object")
+            job = self.server.service.submit(
+                manifest_path=Path(request["manifest"]) if request.get("manifest") else None,
+                manifest_yaml=request.get("manifest_yaml"),
+                priority=int(request.get("priority", 0)),
+                workdir=Path(request["workdir"]) if request.get("workdir") else None,
+                resume=bool(request.get("resume", False)),
+                incremental=bool(request.get("incremental", False)),
+            )
+        except (ValueError, ManifestValidationError) as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, e)
+            return
+        self._send(HTTPStatus.ACCEPTED, job.to_dict())
+
+    def do_DELETE(self) -> None:
+        job_id = self._job_id()
+        if not job_id:
+            self._send(HTTPStatus.NOT_FOUND, {"error": {"message": f"No route for {self.path}"}})
+            return
+        try:
+            self._send(HTTPStatus.OK, self.server.service.cancel(job_id).to_dict())
+        except JobNotFoundError as e:
+            self._send_error(HTTPStatus.NOT_FOUND, e)
+        except PipelineStateError as e:
+            self._send_error(HTTPStatus.CONFLICT, e)
+
+
+class ServiceHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server bound to an orchestrator service."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple, service: OrchestratorService) -> None:
+        """Initialize server.
+
+        Args:
+            address: (host, port) to bind; port 0 picks a free port
+            service: Service handling the requests
+        """
+        super().__init__(address, _ServiceRequestHandler)
+        self.service = service
+
+
+def serve(
+    root: Path,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    concurrency: int = 2,
+    max_concurrent_matchers: Optional[int] = None,
+    preload: Iterable[Path] = (),
+    ingest_workers: int = 0,
+) -> None:
+    """Run the orchestrator service until interrupted.
+
+    Args:
+        root: Service state directory
+        host: Interface to bind (local-only by default)
+        port: Port to bind
+        concurrency: Jobs run at the same time
+        max_concurrent_matchers: Matcher pool size shared by all jobs
+        preload: Manifests whose meta-ontologies are built at start-up
+        ingest_workers: Schema conversion processes shared by all jobs
+    """
+    service = OrchestratorService(root, concurrency=concurrency,
+                                  max_concurrent_matchers=max_concurrent_matchers,
+                                  ingest_workers=ingest_workers)
+    service.preload(preload)
+    service.start()
+    server = ServiceHTTPServer((host, port), service)
+    logger.info("service_listening", host=host, port=server.server_address[1])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("service_interrupted")
+    finally:
+        server.server_close()
+        service.stop()
@@ -0,0 +1,478 @@
+"""Streaming, bounded-memory graph fusion.
+
+``fuse_graphs`` loads every converted ontology into one in-memory rdflib
+graph before serializing it as Turtle, so peak memory grows with the total
+size of all inputs. The functions here instead parse one input at a time,
+append its statements to the output as N-Triples or N-Quads, and drop the
+parsed graph before moving on. Duplicate statements are suppressed with a set
+of fixed-size statement digests, held in memory or in an on-disk SQLite
+table, so memory stays bounded by the largest single input rather than the
+sum of all of them. Under a memory budget (``pipeline.memory_budget_mb``),
+large inputs are parsed into disk-backed graphs and an in-memory digest set
+that outgrows the budget moves to disk as well.
+
+Blank node labels are unique per parse, so blank nodes from different inputs
+never collide in the output.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, Optional, TextIO, Tuple, Union
+
+import structlog
+from rdflib import Graph, Literal, URIRef
+
+from graph_mesh_core.artifact_cache import hash_file
+from graph_mesh_core.graph_handoff import load_graph, wait_for_file
+from graph_mesh_core.graph_store import active_budget
+from graph_mesh_core.telemetry import annotate
+from graph_mesh_core.tracing import span, traced
+from graph_mesh_orchestrator.errors import FusionError
+
+logger = structlog.get_logger(__name__)
+
+STREAMING_FORMATS = {"ntriples": ".nt", "nquads": ".nq"}
+META_GRAPH_NAME = "urn:graph-mesh:meta-ontology"
+
+# Approximate memory per digest in the in-memory set (bytes object plus set slot)
+_DIGEST_ENTRY_BYTES = 80
+
+
+class StatementDeduplicator:
+    """Remember which statements have already been written.
+
+    Statements are reduced to 16-byte BLAKE2b digests. In ``memory`` mode the
+    digests live in a Python set; in ``disk`` mode they live in a SQLite table
+    under ``spill_dir`` so memory use is independent of the output size. A
+    ``memory`` deduplicator whose set outgrows ``memory_limit_bytes`` switches
+    to ``disk`` mode.
+    """
+
+    def __init__(
+        self,
+        mode: str = "memory",
+        spill_dir: Optional[Path] = None,
+        memory_limit_bytes: Optional[int] = None,
+    ) -> None:
+        """Initialize deduplicator.
+
+        Args:
+            mode: ``memory`` or ``disk``
+            spill_dir: Directory for the on-disk digest table
+            memory_limit_bytes: Size of the in-memory set at which to move it
+                to disk (default: the active memory budget, if any)
+        """
+        if mode not in ("memory", "disk"):
+            raise ValueError(f"Unsupported dedupe mode: {mode}")
+        if memory_limit_bytes is None:
+            budget = active_budget()
+            memory_limit_bytes = budget.limit_bytes if budget is not None else None
+        self.mode = mode
+        self.spill_dir = spill_dir
+        self._max_digests = memory_limit_bytes // _DIGEST_ENTRY_BYTES if memory_limit_bytes else None
+        self._seen: set[bytes] = set()
+        self._db: Optional[sqlite3.Connection] = None
+        self._tmpdir: Optional[Path] = None
+        self._pending = 0
+
+        if mode == "disk":
+            self._open_disk()
+
+    def _open_disk(self) -> None:
+        if self.spill_dir is not None:
+            Path(self.spill_dir).mkdir(parents=True, exist_ok=True)
+        self._tmpdir = Path(tempfile.mkdtemp(prefix="graph-mesh-dedupe-", dir=self.spill_dir))
+        self._db = sqlite3.connect(str(self._tmpdir / "digests.sqlite"))
+        self._db.execute("PRAGMA journal_mode=OFF")
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.execute("CREATE TABLE seen (digest BLOB PRIMARY KEY) WITHOUT ROWID")
+
+    def _spill(self) -> None:
+        """Move the in-memory digests to the on-disk table."""
+        self._open_disk()
+        self._db.executemany("INSERT INTO seen (digest) VALUES (?)", ((d,) for d in self._seen))
+        self._db.commit()
+        logger.info("dedupe_spilled_to_disk", digest_count=len(self._seen), path=str(self._tmpdir))
+        self._seen = set()
+        self.mode = "disk"
+
+    def add(self, statement: str) -> bool:
+        """Record a statement.
+
+        Args:
+            statement: Serialized statement line
+
+        Returns:
+            True if the statement had not been seen before
+        """
+        digest = hashlib.blake2b(statement.encode("utf-8"), digest_size=16).digest()
+        if self._db is None:
+            if digest in self._seen:
+                return False
+            self._seen.add(digest)
+            if self._max_digests is not None and len(self._seen) > self._max_digests:
+                self._spill()
+            return True
+
+        cursor = self._db.execute("INSERT OR IGNORE INTO seen (digest) VALUES (?)", (digest,))
+        self._pending += 1
+        if self._pending >= 50_000:
+            self._db.commit()
+            self._pending = 0
+        return cursor.rowcount == 1
+
+    def close(self) -> None:
+        """Release the digest store."""
+        self._seen.clear()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        if self._tmpdir is not None:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+
+    def __enter__(self) -> "StatementDeduplicator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+@dataclass
+class FusionResult:
+    """Outcome of a streaming fusion run."""
+
+    output_path: Path
+    statement_count: int
+    duplicate_count: int
+    graph_count: int
+
+
+_LITERAL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+def _nt_term(term: Any) -> str:
+    """Format one term as N-Triples.
+
+    IRIs and blank nodes use ``term.n3()``. Literals are written in their
+    long form and escaped here, since ``Literal.n3()`` may emit Turtle-only
+    shorthand such as triple-quoted strings.
+    """
+    if isinstance(term, Literal):
+        text = f'"{str(term).translate(_LITERAL_ESCAPES)}"'
+        if term.language:
+            return f"{text}@{term.language}"
+        if term.datatype:
+            return f"{text}^^<{term.datatype}>"
+        return text
+    return term.n3()
+
+
+def _ntriples_lines(graph: Graph) -> Iterator[str]:
+    """Serialize a graph to N-Triples one statement at a time."""
+    # Same statements as graph.serialize(format="nt"), without building the whole document
+    for subject, predicate, obj in graph:
+        yield f"{_nt_term(subject)} {_nt_term(predicate)} {_nt_term(obj)} ."
+
+
+def _statement_lines(graph: Graph, graph_name: Optional[str]) -> Iterator[str]:
+    """Yield a graph's statements as N-Triples, or N-Quads when named."""
+    for line in _ntriples_lines(graph):
+        if graph_name is not None:
+            # "<s> <p> <o> ." -> "<s> <p> <o> <g> ."
+            line = f"{line.rstrip()[:-1].rstrip()} <{graph_name}> ."
+        yield line
+
+
+def _graph_name(item: Union[Path, Graph]) -> str:
+    """Named-graph IRI recording where a statement came from."""
+    if isinstance(item, Graph):
+        if isinstance(item.identifier, URIRef):
+            return str(item.identifier)
+        return f"urn:graph-mesh:graph:{item.identifier}"
+    return Path(item).resolve().as_uri()
+
+
+def _write_graph(
+    graph: Graph,
+    out: TextIO,
+    dedupe: StatementDeduplicator,
+    graph_name: Optional[str],
+) -> Tuple[int, int]:
+    """Append one graph's statements to the output, skipping duplicates."""
+    written = duplicates = 0
+    for line in _statement_lines(graph, graph_name):
+        if dedupe.add(line):
+            out.write(line)
+            out.write("\n")
+            written += 1
+        else:
+            duplicates += 1
+    return written, duplicates
+
+
+def stream_fuse_graphs(
+    graphs: Iterable[Union[Path, Graph]],
+    meta_graph: Graph,
+    output_path: Path,
+    output_format: str = "ntriples",
+    dedupe: str = "memory",
+    spill_dir: Optional[Path] = None,
+) -> FusionResult:
+    """Fuse graphs into an N-Triples or N-Quads file with bounded memory.
+
+    Args:
+        graphs: Graph file paths (or already-parsed graphs) to fuse
+        meta_graph: Meta-ontology graph, written first
+        output_path: Output file path
+        output_format: ``ntriples`` or ``nquads``; N-Quads places each input in
+            a named graph (its file URI) for provenance
+        dedupe: ``memory`` (hashed set) or ``disk`` (SQLite-backed set)
+        spill_dir: Directory for disk-backed dedupe state (default: system temp)
+
+    Returns:
+        FusionResult with the output path and statement counts
+
+    Raises:
+        FusionError: If fusion fails
+    """
+    if output_format not in STREAMING_FORMATS:
+        raise FusionError(f"Unsupported streaming fusion format: {output_format}")
+
+    quads = output_format == "nquads"
+    graph_list = list(graphs)
+    total_written = total_duplicates = 0
+
+    logger.info("streaming_fusion_starting",
+                graph_count=len(graph_list),
+                output=str(output_path),
+                format=output_format,
+                dedupe=dedupe)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = output_path.with_name(output_path.name + ".partial")
+
+    try:
+        with StatementDeduplicator(dedupe, spill_dir) as seen, \
+                open(partial_path, "w", encoding="utf-8") as out:
+            written, duplicates = _write_graph(meta_graph, out, seen, META_GRAPH_NAME if quads else None)
+            total_written += written
+            total_duplicates += duplicates
+
+            for i, item in enumerate(graph_list):
+                with span("fusion.input", "fusion", path=None if isinstance(item, Graph) else str(item)):
+                    if isinstance(item, Graph):
+                        graph = item
+                    else:
+                        logger.debug("loading_graph", index=i + 1, total=len(graph_list), path=str(item))
+                        graph = load_graph(item)
+                    name = _graph_name(item) if quads else None
+
+                    written, duplicates = _write_graph(graph, out, seen, name)
+                    total_written += written
+                    total_duplicates += duplicates
+                    if graph is not item:
+                        graph.close()
+                    del graph
+
+        partial_path.replace(output_path)
+    except FusionError:
+        raise
+    except Exception as e:
+        partial_path.unlink(missing_ok=True)
+        raise FusionError(
+            f"Streaming graph fusion failed: {str(e)}",
+            graph_count=len(graph_list)
+        ) from e
+
+    logger.info("fusion_complete",
+                output=str(output_path),
+                triple_count=total_written,
+                duplicates_skipped=total_duplicates)
+    annotate(triple_count=total_written, duplicates_skipped=total_duplicates)
+
+    return FusionResult(
+        output_path=output_path,
+        statement_count=total_written,
+        duplicate_count=total_duplicates,
+        graph_count=len(graph_list),
+    )
+
+
+@traced("fusion.part", "fusion")
+def write_part(
+    item: Union[Path, Graph],
+    part_path: Path,
+    output_format: str = "ntriples",
+    graph_name: Optional[str] = None,
+) -> int:
+    """Serialize one graph to a fusion part file.
+
+    Args:
+        item: Graph file path or parsed graph
+        part_path: Part file to (re)write
+        output_format: ``ntriples`` or ``nquads``
+        graph_name: Named graph for N-Quads (default: derived from ``item``)
+
+    Returns:
+        Number of statements written
+    """
+    graph = item if isinstance(item, Graph) else load_graph(item)
+    if output_format == "nquads" and graph_name is None:
+        graph_name = _graph_name(item)
+    elif output_format != "nquads":
+        graph_name = None
+
+    part_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = part_path.with_name(part_path.name + ".partial")
+    count = 0
+    with open(tmp_path, "w", encoding="utf-8") as out:
+        for line in _statement_lines(graph, graph_name):
+            out.write(line)
+            out.write("\n")
+            count += 1
+    os.replace(tmp_path, part_path)
+    if graph is not item:
+        graph.close()
+    return count
+
+
+def merge_parts(
+    part_paths: Iterable[Path],
+    output_path: Path,
+    dedupe: str = "memory",
+    spill_dir: Optional[Path] = None,
+) -> FusionResult:
+    """Concatenate part files into one output, dropping duplicate statements.
+
+    Parts are read line by line; nothing is parsed as RDF.
+
+    Args:
+        part_paths: Part files, in output order
+        output_path: Merged output path
+        dedupe: ``memory`` or ``disk``
+        spill_dir: Directory for disk-backed dedupe state
+
+    Returns:
+        FusionResult for the merged output
+    """
+    part_list = list(part_paths)
+    written = duplicates = 0
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = output_path.with_name(output_path.name + ".partial")
+
+    with StatementDeduplicator(dedupe, spill_dir) as seen, \
+            open(partial_path, "w", encoding="utf-8") as out:
+        for part_path in part_list:
+            with open(part_path, encoding="utf-8") as part:
+                for line in part:
+                    line = line.rstrip("\n")
+                    if not line:
+                        continue
+                    if seen.add(line):
+                        out.write(line)
+                        out.write("\n")
+                        written += 1
+                    else:
+                        duplicates += 1
+    partial_path.replace(output_path)
+
+    return FusionResult(
+        output_path=output_path,
+        statement_count=written,
+        duplicate_count=duplicates,
+        graph_count=len(part_list),
+    )
+
+
+def _part_name(label: str, digest: str, output_format: str) -> str:
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", label)
+    return f"{safe}.{digest[:16]}{STREAMING_FORMATS[output_format]}"
+
+
+def incremental_fuse_graphs(
+    graphs: Mapping[str, Path],
+    meta_graph: Graph,
+    meta_key: str,
+    parts_dir: Path,
+    output_path: Path,
+    output_format: str = "ntriples",
+    dedupe: str = "memory",
+    spill_dir: Optional[Path] = None,
+) -> FusionResult:
+    """Fuse graphs, reserializing only inputs that changed since the last run.
+
+    Each input is kept as a part file in ``parts_dir`` named after its source
+    and the content hash of its graph file, and the meta-ontology as a part
+    named after ``meta_key``. A part is regenerated only when no part with the
+    current hash exists; parts of removed or changed inputs are deleted. The
+    output is then rebuilt by concatenating the parts, so unchanged inputs are
+    never parsed again.
+
+    Args:
+        graphs: Mapping of source identifier to graph file path, in output order
+        meta_graph: Meta-ontology graph
+        meta_key: Key identifying the meta-ontology's content
+        parts_dir: Directory holding part files between runs
+        output_path: Merged output path
+        output_format: ``ntriples`` or ``nquads``
+        dedupe: ``memory`` or ``disk``
+        spill_dir: Directory for disk-backed dedupe state
+
+    Returns:
+        FusionResult for the merged output
+
+    Raises:
+        FusionError: If fusion fails
+    """
+    if output_format not in STREAMING_FORMATS:
+        raise FusionError(f"Unsupported streaming fusion format: {output_format}")
+
+    try:
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        meta_part = parts_dir / _part_name("_meta", meta_key, output_format)
+        source_parts = {}
+        for source_id, path in graphs.items():
+            # The part is named after the file's hash, so the file must be written
+            wait_for_file(path)
+            source_parts[source_id] = parts_dir / _part_name(source_id, hash_file(path), output_format)
+
+        rebuilt = []
+        if not meta_part.exists():
+            write_part(meta_graph, meta_part, output_format, graph_name=META_GRAPH_NAME)
+            rebuilt.append("_meta")
+        for source_id, part_path in source_parts.items():
+            if not part_path.exists():
+                logger.debug("fusion_part_rebuilding", source_id=source_id, part=str(part_path))
+                write_part(Path(graphs[source_id]), part_path, output_format)
+                rebuilt.append(source_id)
+
+        expected = {meta_part, *source_parts.values()}
+        for stale in parts_dir.iterdir():
+            if stale not in expected:
+                stale.unlink()
+
+        result = merge_parts([meta_part, *source_parts.values()], output_path, dedupe, spill_dir)
+    except FusionError:
+        raise
+    except Exception as e:
+        raise FusionError(
+            f"Incremental graph fusion failed: {str(e)}",
+            graph_count=len(graphs)
+        ) from e
+
+    logger.info("incremental_fusion_complete",
+                output=str(output_path),
+                triple_count=result.statement_count,
+                parts_rebuilt=len(rebuilt),
+                parts_reused=len(source_parts) + 1 - len(rebuilt))
+    annotate(triple_count=result.statement_count, parts_rebuilt=len(rebuilt))
+    return result
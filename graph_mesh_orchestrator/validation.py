@@ -198,12 +198,10 @@ class PreflightValidator:
     def check_docker(self) -> None:
         """Check if Docker is available and running."""
         try:
-            import docker
-            client = docker.from_env()
-            # Try to ping Docker daemon
-            client.ping()
-            # Close the client
-            client.close()
+            # Ping through the shared session so the pipeline reuses its connection
+            from graph_mesh_core.docker_session import default_docker_session
+
+            default_docker_session().ping()
         except ImportError:
             self.warnings.append(
                 "Docker Python library not installed. Matchers requiring Docker may fail."
@@ -275,7 +273,7 @@ class PreflightValidator:
         # In practice, you'd check Docker images, executables, etc.
 
         # For now, just check if it's a known matcher
-        known_matchers = {'LogMap', 'AML', 'BERTMap'}
+        known_matchers = {'LogMap', 'AML', 'BERTMap', 'Lexical'}
         return matcher_name in known_matchers
 
     @staticmethod
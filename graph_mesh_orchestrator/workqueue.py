@@ -0,0 +1,408 @@
+"""Durable (source, stage) work queue shared by distributed workers.
+
+The queue is a SQLite database in the run's workdir (``workqueue.sqlite``),
+so orchestrator workers on one host, or on several hosts mounting the same
+workdir, coordinate without a separate broker. Every item is one
+``(source_id, stage)`` unit of work and may depend on another stage of the
+same source; an item is claimable once its dependency is done.
+
+Claiming an item grants a lease. A worker renews the leases it holds with
+:meth:`WorkQueue.heartbeat` while it works; if it dies, its leases expire
+and the next :meth:`WorkQueue.claim` by any worker returns the items to
+the queue (up to ``max_attempts`` claims per item). A worker whose lease
+was reclaimed cannot complete the item afterwards, so each item has
+exactly one recorded result.
+
+Item states::
+
+    pending ──claim──▶ leased ──complete──▶ done
+       ▲                 │
+       └──lease expired──┤──fail──▶ failed (dependents fail too)
+
+Every change runs in a ``BEGIN IMMEDIATE`` transaction on a fresh
+connection with the rollback journal (not WAL, which needs shared memory
+and does not work on network filesystems). Lease expiry uses wall-clock
+time, so hosts sharing a queue need synchronized clocks.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import structlog
+
+from graph_mesh_orchestrator.errors import WorkQueueError
+
+logger = structlog.get_logger(__name__)
+
+QUEUE_NAME = "workqueue.sqlite"
+DEFAULT_LEASE_SECONDS = 300.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+ITEM_STATES = ("pending", "leased", "done", "failed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    source_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    depends_on TEXT,
+    position INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker_id TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (source_id, stage)
+);
+CREATE INDEX IF NOT EXISTS items_status ON items (status, position);
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    heartbeat REAL NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class WorkItem:
+    """One claimed or recorded unit of work.
+
+    Attributes:
+        source_id: Source the work belongs to
+        stage: Stage to run ('fetch', 'ingest' or 'alignment')
+        depends_on: Stage of the same source that must be done first
+        status: One of :data:`ITEM_STATES`
+        worker_id: Worker holding or last holding the lease
+        attempts: Times the item has been claimed
+        result: JSON-compatible result recorded by :meth:`WorkQueue.complete`
+        error: Failure message recorded by :meth:`WorkQueue.fail`
+    """
+
+    source_id: str
+    stage: str
+    depends_on: Optional[str] = None
+    status: str = "pending"
+    worker_id: Optional[str] = None
+    attempts: int = 0
+    result: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.source_id, self.stage
+
+
+def _row_to_item(row: sqlite3.Row) -> WorkItem:
+    return WorkItem(
+        source_id=row["source_id"],
+        stage=row["stage"],
+        depends_on=row["depends_on"],
+        status=row["status"],
+        worker_id=row["worker_id"],
+        attempts=row["attempts"],
+        result=json.loads(row["result"]) if row["result"] else {},
+        error=row["error"],
+    )
+
+
+class WorkQueue:
+    """SQLite work queue with leases and heartbeat-based reclamation.
+
+    Safe to use from several threads and processes; every method opens its
+    own connection.
+
+    Args:
+        path: Database file (typically ``<workdir>/workqueue.sqlite``)
+        lease_seconds: Lease granted by :meth:`claim` and :meth:`heartbeat`
+        max_attempts: Claims per item before an expired lease fails it
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._transaction() as conn:
+            for statement in filter(str.strip, _SCHEMA.split(";")):
+                conn.execute(statement)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block in an immediate (write-locked) transaction."""
+        try:
+            conn = sqlite3.connect(str(self.path), timeout=60.0, isolation_level=None)
+        except sqlite3.Error as e:
+            raise WorkQueueError(f"Cannot open work queue: {e}", queue_path=str(self.path)) from e
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA journal_mode=DELETE")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            raise WorkQueueError(f"Work queue operation failed: {e}", queue_path=str(self.path)) from e
+        finally:
+            conn.close()
+
+    # -- Setup -------------------------------------------------------------
+
+    def enqueue(self, items: Iterable[Tuple[str, str, Optional[str]]]) -> int:
+        """Add ``(source_id, stage, depends_on)`` items; existing items are kept.
+
+        Items are claimed in the order they were first enqueued.
+
+        Returns:
+            Number of items added
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            position = conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM items").fetchone()[0]
+            added = 0
+            for offset, (source_id, stage, depends_on) in enumerate(items):
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO items (source_id, stage, depends_on, position, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (source_id, stage, depends_on, position + offset, now),
+                )
+                added += cursor.rowcount
+        return added
+
+    def clear(self) -> None:
+        """Remove every item, worker record and metadata entry."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM items")
+            conn.execute("DELETE FROM workers")
+            conn.execute("DELETE FROM meta")
+
+    def retry_failed(self) -> int:
+        """Return failed items to the queue with a fresh attempt budget.
+
+        Returns:
+            Number of items requeued
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE items SET status = 'pending', worker_id = NULL, lease_expires = NULL,"
+                " attempts = 0, error = NULL, updated_at = ? WHERE status = 'failed'",
+                (time.time(),),
+            )
+            return cursor.rowcount
+
+    def set_meta(self, **values: Any) -> None:
+        """Store run-level values (JSON-encoded) for workers to read."""
+        with self._transaction() as conn:
+            conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                             [(key, json.dumps(value)) for key, value in values.items()])
+
+    def meta(self) -> Dict[str, Any]:
+        """Run-level values stored with :meth:`set_meta`."""
+        with self._transaction() as conn:
+            return {row["key"]: json.loads(row["value"]) for row in conn.execute("SELECT key, value FROM meta")}
+
+    # -- Workers -----------------------------------------------------------
+
+    def register_worker(self, worker_id: str) -> None:
+        """Record a worker joining the queue."""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO workers (worker_id, host, started_at, heartbeat) VALUES (?, ?, ?, ?)",
+                (worker_id, socket.gethostname(), now, now),
+            )
+
+    def claim(self, worker_id: str) -> Optional[WorkItem]:
+        """Lease the next claimable item to ``worker_id``.
+
+        Expired leases are reclaimed first: their items return to the queue,
+        or fail once they have been claimed ``max_attempts`` times.
+
+        Returns:
+            The leased item, or None if nothing is claimable right now
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            self._reclaim_expired(conn, now)
+            row = conn.execute(
+                "SELECT i.* FROM items i LEFT JOIN items d"
+                " ON d.source_id = i.source_id AND d.stage = i.depends_on"
+                " WHERE i.status = 'pending' AND (i.depends_on IS NULL OR d.status = 'done')"
+                " ORDER BY i.position LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE items SET status = 'leased', worker_id = ?, lease_expires = ?,"
+                " attempts = attempts + 1, updated_at = ? WHERE source_id = ? AND stage = ?",
+                (worker_id, now + self.lease_seconds, now, row["source_id"], row["stage"]),
+            )
+            conn.execute("UPDATE workers SET heartbeat = ? WHERE worker_id = ?", (now, worker_id))
+        item = _row_to_item(row)
+        item.status, item.worker_id, item.attempts = "leased", worker_id, item.attempts + 1
+        return item
+
+    def _reclaim_expired(self, conn: sqlite3.Connection, now: float) -> None:
+        expired = conn.execute(
+            "SELECT source_id, stage, worker_id, attempts FROM items"
+            " WHERE status = 'leased' AND lease_expires < ?", (now,)
+        ).fetchall()
+        for row in expired:
+            if row["attempts"] >= self.max_attempts:
+                error = f"Lease expired {row['attempts']} times (last worker: {row['worker_id']})"
+                self._fail(conn, row["source_id"], row["stage"], error, now)
+                logger.warning("work_item_abandoned", source_id=row["source_id"], stage=row["stage"],
+                               worker_id=row["worker_id"], attempts=row["attempts"])
+            else:
+                conn.execute(
+                    "UPDATE items SET status = 'pending', worker_id = NULL, lease_expires = NULL,"
+                    " updated_at = ? WHERE source_id = ? AND stage = ?",
+                    (now, row["source_id"], row["stage"]),
+                )
+                logger.warning("work_item_reclaimed", source_id=row["source_id"], stage=row["stage"],
+                               worker_id=row["worker_id"], attempts=row["attempts"])
+
+    def heartbeat(self, worker_id: str) -> int:
+        """Extend every lease held by ``worker_id``.
+
+        Returns:
+            Number of leases renewed
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute("UPDATE workers SET heartbeat = ? WHERE worker_id = ?", (now, worker_id))
+            cursor = conn.execute(
+                "UPDATE items SET lease_expires = ? WHERE worker_id = ? AND status = 'leased'",
+                (now + self.lease_seconds, worker_id),
+            )
+            return cursor.rowcount
+
+    def complete(self, item: WorkItem, result: Dict[str, Any]) -> bool:
+        """Record a finished item.
+
+        Args:
+            item: Item returned by :meth:`claim`
+            result: JSON-compatible result for dependents and the coordinator
+
+        Returns:
+            False if the worker's lease was reclaimed meanwhile (the result
+            is discarded)
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE items SET status = 'done', result = ?, error = NULL, lease_expires = NULL,"
+                " updated_at = ? WHERE source_id = ? AND stage = ? AND worker_id = ? AND status = 'leased'",
+                (json.dumps(result), now, item.source_id, item.stage, item.worker_id),
+            )
+            if cursor.rowcount:
+                conn.execute("UPDATE workers SET completed = completed + 1, heartbeat = ? WHERE worker_id = ?",
+                             (now, item.worker_id))
+        if not cursor.rowcount:
+            logger.warning("work_item_lease_lost", source_id=item.source_id, stage=item.stage,
+                           worker_id=item.worker_id)
+        return bool(cursor.rowcount)
+
+    def fail(self, item: WorkItem, error: str, retry: bool = False) -> bool:
+        """Record a failed item.
+
+        Args:
+            item: Item returned by :meth:`claim`
+            error: Failure message
+            retry: Return the item to the queue if it has attempts left
+
+        Returns:
+            False if the worker's lease was reclaimed meanwhile
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts FROM items WHERE source_id = ? AND stage = ? AND worker_id = ?"
+                " AND status = 'leased'", (item.source_id, item.stage, item.worker_id)
+            ).fetchone()
+            if row is None:
+                return False
+            conn.execute("UPDATE workers SET failed = failed + 1, heartbeat = ? WHERE worker_id = ?",
+                         (now, item.worker_id))
+            if retry and row["attempts"] < self.max_attempts:
+                conn.execute(
+                    "UPDATE items SET status = 'pending', worker_id = NULL, lease_expires = NULL,"
+                    " error = ?, updated_at = ? WHERE source_id = ? AND stage = ?",
+                    (error, now, item.source_id, item.stage),
+                )
+            else:
+                self._fail(conn, item.source_id, item.stage, error, now)
+        return True
+
+    @staticmethod
+    def _fail(conn: sqlite3.Connection, source_id: str, stage: str, error: str, now: float) -> None:
+        """Mark an item failed, along with every item depending on it."""
+        conn.execute(
+            "UPDATE items SET status = 'failed', error = ?, lease_expires = NULL, updated_at = ?"
+            " WHERE source_id = ? AND stage = ?", (error, now, source_id, stage),
+        )
+        dependents = conn.execute(
+            "SELECT stage FROM items WHERE source_id = ? AND depends_on = ? AND status = 'pending'",
+            (source_id, stage),
+        ).fetchall()
+        for row in dependents:
+            WorkQueue._fail(conn, source_id, row["stage"], f"{stage} failed: {error}", now)
+
+    # -- Inspection --------------------------------------------------------
+
+    def items(self, status: Optional[str] = None) -> List[WorkItem]:
+        """Items in claim order, optionally only those in ``status``."""
+        query = "SELECT * FROM items"
+        params: Tuple[Any, ...] = ()
+        if status is not None:
+            query, params = query + " WHERE status = ?", (status,)
+        with self._transaction() as conn:
+            return [_row_to_item(row) for row in conn.execute(query + " ORDER BY position", params)]
+
+    def get(self, source_id: str, stage: str) -> Optional[WorkItem]:
+        """Return one item, or None if it was never enqueued."""
+        with self._transaction() as conn:
+            row = conn.execute("SELECT * FROM items WHERE source_id = ? AND stage = ?",
+                               (source_id, stage)).fetchone()
+        return _row_to_item(row) if row is not None else None
+
+    def counts(self) -> Dict[str, int]:
+        """Number of items per state (every state present, possibly 0)."""
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM items GROUP BY status").fetchall()
+        counts = dict.fromkeys(ITEM_STATES, 0)
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def drained(self) -> bool:
+        """Whether no item is pending or leased."""
+        counts = self.counts()
+        return counts["pending"] == 0 and counts["leased"] == 0
+
+    def workers(self) -> List[Dict[str, Any]]:
+        """Registered workers with their last heartbeat and item counts."""
+        with self._transaction() as conn:
+            return [dict(row) for row in conn.execute("SELECT * FROM workers ORDER BY started_at")]
@@ -47,10 +47,13 @@ setup(
             "sphinx-autodoc-typehints>=1.24.0",
             "myst-parser>=2.0.0",
         ],
+        "s3": [
+            "boto3>=1.28.0",
+        ],
     },
     entry_points={
         "console_scripts": [
-            "graph-mesh=graph_mesh_orchestrator.pipeline:main",
+            "graph-mesh=graph_mesh_orchestrator.cli:main",
         ],
     },
     classifiers=[
@@ -0,0 +1,210 @@
+"""
+Unit tests for the content-addressed artifact cache.
+
+Tests cover:
+- Key derivation and file hashing
+- Store/restore round trips and misses
+- Ingest reuse across workdirs
+- Alignment reuse across workdirs
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from graph_mesh_aligner.matchers import run_alignment
+from graph_mesh_core.artifact_cache import ArtifactCache, cache_key, hash_file, hash_paths
+from graph_mesh_orchestrator import ingest
+
+
+@dataclass
+class CountingMatcher:
+    """Matcher stub that writes a mapping file and counts invocations."""
+
+    name: str = "Counting"
+    output_filename: str = "counting.sssom.tsv"
+    calls: int = 0
+
+    def align(self, source_ontology: Path, target_ontology: Path, output_dir: Path) -> Path:
+        self.calls += 1
+        output_dir.mkdir(parents=True, exist_ok=True)
+        mapping = output_dir / self.output_filename
+        mapping.write_text("subject_id\tobject_id\nex:A\tex:B\n")
+        return mapping
+
+
+class TestHashing:
+    """Test key derivation helpers."""
+
+    @pytest.mark.unit
+    def test_cache_key_is_deterministic(self):
+        """Test that dict ordering does not change the key."""
+        assert cache_key("ingest", {"a": 1, "b": 2}) == cache_key("ingest", {"b": 2, "a": 1})
+
+    @pytest.mark.unit
+    def test_cache_key_depends_on_namespace(self):
+        """Test that identical parts in different namespaces do not collide."""
+        assert cache_key("ingest", "x") != cache_key("alignment", "x")
+
+    @pytest.mark.unit
+    def test_hash_file_tracks_content_changes(self, temp_dir):
+        """Test that rewriting a file changes its digest."""
+        path = temp_dir / "schema.xsd"
+        path.write_text("one")
+        first = hash_file(path)
+        path.write_text("two, longer")
+
+        assert hash_file(path) != first
+
+    @pytest.mark.unit
+    def test_hash_paths_is_order_sensitive(self, temp_dir):
+        """Test that multi-file digests respect input order."""
+        a = temp_dir / "a.xsd"
+        b = temp_dir / "b.xsd"
+        a.write_text("a")
+        b.write_text("b")
+
+        assert hash_paths([a, b]) != hash_paths([b, a])
+        assert hash_paths(a) == hash_paths([a])
+
+
+class TestArtifactCache:
+    """Test ArtifactCache storage semantics."""
+
+    @pytest.mark.unit
+    def test_store_and_restore_round_trip(self, temp_dir):
+        """Test that stored files are restored with identical content."""
+        cache = ArtifactCache(temp_dir / "cache")
+        artifact = temp_dir / "out.owl"
+        artifact.write_text("<rdf/>")
+
+        cache.store("k" * 64, {"output.owl": artifact}, metadata={"source_id": "s"})
+        destination = temp_dir / "elsewhere" / "restored.owl"
+
+        assert cache.restore("k" * 64, {"output.owl": destination})
+        assert destination.read_text() == "<rdf/>"
+        assert cache.metadata("k" * 64)["metadata"] == {"source_id": "s"}
+
+    @pytest.mark.unit
+    def test_restore_miss(self, temp_dir):
+        """Test that unknown keys report a miss and write nothing."""
+        cache = ArtifactCache(temp_dir / "cache")
+        destination = temp_dir / "restored.owl"
+
+        assert not cache.restore("0" * 64, {"output.owl": destination})
+        assert not destination.exists()
+
+    @pytest.mark.unit
+    def test_restored_file_is_independent_copy(self, temp_dir):
+        """Test that overwriting a restored file leaves the cache intact."""
+        cache = ArtifactCache(temp_dir / "cache")
+        artifact = temp_dir / "out.owl"
+        artifact.write_text("original")
+        cache.store("a" * 64, {"output.owl": artifact})
+
+        destination = temp_dir / "restored.owl"
+        cache.restore("a" * 64, {"output.owl": destination})
+        destination.write_text("overwritten")
+
+        second = temp_dir / "second.owl"
+        cache.restore("a" * 64, {"output.owl": second})
+        assert second.read_text() == "original"
+
+    @pytest.mark.unit
+    def test_store_keeps_first_entry(self, temp_dir):
+        """Test that storing an existing key is a no-op."""
+        cache = ArtifactCache(temp_dir / "cache")
+        first = temp_dir / "first.owl"
+        second = temp_dir / "second.owl"
+        first.write_text("first")
+        second.write_text("second")
+
+        cache.store("b" * 64, {"output.owl": first})
+        cache.store("b" * 64, {"output.owl": second})
+
+        destination = temp_dir / "restored.owl"
+        cache.restore("b" * 64, {"output.owl": destination})
+        assert destination.read_text() == "first"
+
+
+class TestIngestCache:
+    """Test artifact cache integration in run_ingest."""
+
+    @pytest.mark.unit
+    def test_unchanged_source_reused_in_fresh_workdir(self, sample_json_schema_path, temp_dir):
+        """Test that a second workdir restores the converted source from cache."""
+        cache = ArtifactCache(temp_dir / "cache")
+        source = {"id": "users", "convert": {"type": "json"}}
+        fetched = {"users": sample_json_schema_path}
+        calls = []
+
+        def convert(input_path, output_path):
+            calls.append(input_path)
+            Path(output_path).write_text("<rdf/>")
+
+        with patch.dict(ingest.CONVERTER_REGISTRY, {"json": convert}):
+            first = ingest.run_ingest([source], fetched, temp_dir / "run1", cache=cache)
+            second = ingest.run_ingest([source], fetched, temp_dir / "run2", cache=cache)
+
+        assert len(calls) == 1
+        assert second["users"].read_bytes() == first["users"].read_bytes()
+        assert second["users"] == temp_dir / "run2" / "converted" / "users" / "users.owl"
+
+    @pytest.mark.unit
+    def test_changed_options_miss(self, sample_json_schema_path, temp_dir):
+        """Test that different converter options produce a separate entry."""
+        cache = ArtifactCache(temp_dir / "cache")
+        fetched = {"users": sample_json_schema_path}
+        calls = []
+
+        def convert(input_path, output_path):
+            calls.append(input_path)
+            Path(output_path).write_text("<rdf/>")
+
+        with patch.dict(ingest.CONVERTER_REGISTRY, {"json": convert}):
+            ingest.run_ingest([{"id": "users", "convert": {"type": "json"}}], fetched, temp_dir / "a", cache=cache)
+            ingest.run_ingest(
+                [{"id": "users", "convert": {"type": "json", "namespace": "http://x/"}}],
+                fetched, temp_dir / "b", cache=cache,
+            )
+
+        assert len(calls) == 2
+
+
+class TestAlignmentCache:
+    """Test artifact cache integration in run_alignment."""
+
+    @pytest.mark.unit
+    def test_unchanged_inputs_skip_matcher(self, temp_dir):
+        """Test that a repeated alignment is restored rather than re-run."""
+        cache = ArtifactCache(temp_dir / "cache")
+        source = temp_dir / "source.owl"
+        target = temp_dir / "target.ttl"
+        source.write_text("source")
+        target.write_text("target")
+        matcher = CountingMatcher()
+
+        run_alignment([matcher], source, target, temp_dir / "run1", cache=cache)
+        results = run_alignment([matcher], source, target, temp_dir / "run2", cache=cache)
+
+        assert matcher.calls == 1
+        assert results == [temp_dir / "run2" / "counting.sssom.tsv"]
+        assert results[0].exists()
+
+    @pytest.mark.unit
+    def test_changed_source_reruns_matcher(self, temp_dir):
+        """Test that editing the source ontology invalidates the mapping."""
+        cache = ArtifactCache(temp_dir / "cache")
+        source = temp_dir / "source.owl"
+        target = temp_dir / "target.ttl"
+        source.write_text("source")
+        target.write_text("target")
+        matcher = CountingMatcher()
+
+        run_alignment([matcher], source, target, temp_dir / "run1", cache=cache)
+        source.write_text("source, edited")
+        run_alignment([matcher], source, target, temp_dir / "run2", cache=cache)
+
+        assert matcher.calls == 2
@@ -0,0 +1,119 @@
+"""
+Unit tests for batch orchestration.
+
+Tests cover:
+- Source identity and manifest labels
+- One meta-ontology build per distinct configuration
+- Sources shared between manifests converted once
+- Failure isolation between manifests
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from graph_mesh_orchestrator import batch, ingest, pipeline
+from graph_mesh_orchestrator.batch import SUMMARY_NAME, orchestrate_batch, source_identity
+from graph_mesh_orchestrator.models import PipelineManifest, SourceConfig
+
+
+def _write_schema(path: Path) -> Path:
+    path.write_text(json.dumps({
+        "title": path.stem.capitalize(),
+        "type": "object",
+        "properties": {"id": {"type": "string"}, "name": {"type": "string"}},
+    }))
+    return path
+
+
+def _write_manifest(path: Path, name: str, sources: dict) -> Path:
+    path.write_text(yaml.safe_dump({
+        "name": name,
+        "matchers": ["LogMap"],
+        "sources": [
+            {"id": source_id, "fetch": {"type": "local", "path": str(schema)}, "convert": {"type": "json"}}
+            for source_id, schema in sources.items()
+        ],
+    }))
+    return path
+
+
+class TestHelpers:
+    """Test batch helpers."""
+
+    @pytest.mark.unit
+    def test_source_identity_ignores_identifier(self):
+        """Test that sources differing only in id share an identity."""
+        a = SourceConfig(id="a", fetch={"type": "local", "path": "x.json"}, convert={"type": "json"})
+        b = SourceConfig(id="b", fetch={"type": "local", "path": "x.json"}, convert={"type": "json"})
+        c = SourceConfig(id="c", fetch={"type": "local", "path": "y.json"}, convert={"type": "json"})
+
+        assert source_identity(a) == source_identity(b)
+        assert source_identity(a) != source_identity(c)
+
+    @pytest.mark.unit
+    def test_manifest_labels_unique(self):
+        """Test that duplicate manifest names get distinct labels."""
+        manifests = [
+            PipelineManifest(name=name, sources=[{"id": "s", "fetch": {"path": "x"}}])
+            for name in ("team a", "team a", "other")
+        ]
+
+        assert batch._manifest_labels(manifests) == ["team-a", "team-a-2", "other"]
+
+
+class TestOrchestrateBatch:
+    """Test orchestrate_batch."""
+
+    @pytest.fixture
+    def manifests(self, temp_dir):
+        shared = _write_schema(temp_dir / "customers.json")
+        orders = _write_schema(temp_dir / "orders.json")
+        invoices = _write_schema(temp_dir / "invoices.json")
+        return [
+            _write_manifest(temp_dir / "sales.yaml", "sales", {"customers": shared, "orders": orders}),
+            _write_manifest(temp_dir / "billing.yaml", "billing", {"clients": shared, "invoices": invoices}),
+        ]
+
+    @pytest.mark.unit
+    def test_shares_meta_ontology_and_sources(self, temp_dir, manifests):
+        """Test that the meta-ontology is built once and shared sources converted once."""
+        converted_inputs = []
+        original = ingest.CONVERTER_REGISTRY["json"]
+
+        def counting_converter(input_path, output_path):
+            converted_inputs.append(Path(input_path).name)
+            return original(input_path, output_path)
+
+        with patch.object(pipeline, "run_alignment", return_value=[]), \
+                patch.dict(ingest.CONVERTER_REGISTRY, {"json": counting_converter}), \
+                patch.object(batch, "prepare_meta_ontology", wraps=batch.prepare_meta_ontology) as batch_meta, \
+                patch.object(pipeline, "prepare_meta_ontology", wraps=pipeline.prepare_meta_ontology) as run_meta:
+            result = orchestrate_batch(manifests, workdir=temp_dir / "work", skip_preflight=True)
+
+        assert result.succeeded
+        assert set(result.artifacts) == {"sales", "billing"}
+        assert batch_meta.call_count == 1
+        assert run_meta.call_count == 0
+        assert sorted(converted_inputs) == ["customers.json", "invoices.json", "orders.json"]
+        assert len(result.shared_sources) == 1
+        assert result.artifacts["billing"].converted["clients"].exists()
+        summary = json.loads((temp_dir / "work" / SUMMARY_NAME).read_text())
+        assert summary["manifests"]["sales"]["status"] == "completed"
+
+    @pytest.mark.unit
+    def test_failure_isolated(self, temp_dir, manifests):
+        """Test that one failing manifest does not stop the others."""
+        broken = _write_manifest(temp_dir / "broken.yaml", "broken",
+                                 {"missing": temp_dir / "does-not-exist.json"})
+
+        with patch.object(pipeline, "run_alignment", return_value=[]):
+            result = orchestrate_batch([manifests[0], broken], workdir=temp_dir / "work",
+                                       skip_preflight=True, max_parallel=1)
+
+        assert not result.succeeded
+        assert set(result.artifacts) == {"sales"}
+        assert set(result.failures) == {"broken"}
@@ -0,0 +1,232 @@
+"""
+Unit tests for batch alignment.
+
+Tests cover:
+- run_alignment_batch splitting sources into batches per matcher
+- Cached mappings skipped and batch results stored per source
+- Sources left without a mapping by a batch aligned again on their own
+- Cache locks held per batch
+- ContainerMatcher.align_batch container invocation (mocked)
+- Orchestration aligning groups of sources together
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import yaml
+
+from graph_mesh_aligner.matchers import ContainerMatcher, run_alignment_batch
+from graph_mesh_core.artifact_cache import ArtifactCache
+from graph_mesh_core.docker_session import configure_docker_session
+from graph_mesh_orchestrator import pipeline
+from graph_mesh_orchestrator.pipeline import orchestrate
+
+
+@dataclass
+class BatchMatcher:
+    """Matcher stub recording single and batch invocations."""
+
+    name: str = "Batch"
+    output_filename: str = "batch.sssom.tsv"
+    max_batch: int = 2
+    batch_writes_all: bool = True
+    calls: list = field(default_factory=list)
+
+    def align(self, source, target, output_dir):
+        self.calls.append([Path(source).stem])
+        return self._write(Path(output_dir))
+
+    def align_batch(self, sources, target, output_dirs):
+        self.calls.append([Path(p).stem for p in sources.values()])
+        written = list(sources) if self.batch_writes_all else list(sources)[-1:]
+        for sid in written:
+            self._write(Path(output_dirs[sid]))
+        return {sid: Path(output_dirs[sid]) / self.output_filename for sid in sources}
+
+    def _write(self, output_dir):
+        output_dir.mkdir(parents=True, exist_ok=True)
+        mapping = output_dir / self.output_filename
+        mapping.write_text("subject_id\tobject_id\na\tb\n")
+        return mapping
+
+
+@pytest.fixture
+def sources(temp_dir):
+    paths = {}
+    for name in ("a", "b", "c"):
+        paths[name] = temp_dir / f"{name}.owl"
+        paths[name].write_text(name)
+    (temp_dir / "meta.ttl").write_text("meta")
+    return paths
+
+
+class TestRunAlignmentBatch:
+    """Test batching sources per matcher."""
+
+    @pytest.mark.unit
+    @pytest.mark.matcher
+    def test_sources_split_into_batches(self, temp_dir, sources):
+        """Test that sources are aligned max_batch at a time, in order."""
+        matcher = BatchMatcher()
+        reported = []
+        output_dirs = {sid: temp_dir / "out" / sid for sid in sources}
+
+        results = run_alignment_batch([matcher], sources, temp_dir / "meta.ttl", output_dirs,
+                                      on_result=lambda sid, m, mapping, unit: reported.append(sid))
+
+        assert matcher.calls == [["a", "b"], ["c"]]
+        assert results == {sid: [output_dirs[sid] / "batch.sssom.tsv"] for sid in sources}
+        assert reported == ["a", "b", "c"]
+
+    @pytest.mark.unit
+    @pytest.mark.matcher
+    def test_matcher_without_batch_support(self, temp_dir, sources):
+        """Test that a matcher without align_batch runs per source."""
+        matcher = MagicMock(spec=["name", "align"])
+        matcher.name = "Single"
+        matcher.align.side_effect = lambda source, target, output_dir: output_dir / "single.sssom.tsv"
+
+        results = run_alignment_batch([matcher], sources, temp_dir / "meta.ttl",
+                                      {sid: temp_dir / sid for sid in sources})
+
+        assert matcher.align.call_count == 3
+        assert results["c"] == [temp_dir / "c" / "single.sssom.tsv"]
+
+    @pytest.mark.unit
+    @pytest.mark.matcher
+    def test_cached_sources_not_realigned(self, temp_dir, sources):
+        """Test that batch results are cached per source and restored on the next run."""
+        cache = ArtifactCache(temp_dir / "cache")
+        output_dirs = {sid: temp_dir / "out" / sid for sid in sources}
+        run_alignment_batch([BatchMatcher()], {"a": sources["a"], "b": sources["b"]},
+                            temp_dir / "meta.ttl", output_dirs, cache=cache)
+
+        matcher = BatchMatcher()
+        fresh_dirs = {sid: temp_dir / "fresh" / sid for sid in sources}
+        results = run_alignment_batch([matcher], sources, temp_dir / "meta.ttl", fresh_dirs, cache=cache)
+
+        assert matcher.calls == [["c"]]
+        assert results["a"][0].read_text() == "subject_id\tobject_id\na\tb\n"
+        assert results["a"][0].parent == fresh_dirs["a"]
+
+    @pytest.mark.unit
+    @pytest.mark.matcher
+    def test_missing_batch_outputs_realigned(self, temp_dir, sources):
+        """Test that sources a batch wrote no mapping for are aligned on their own."""
+        matcher = BatchMatcher(max_batch=3, batch_writes_all=False)
+        cache = ArtifactCache(temp_dir / "cache")
+        output_dirs = {sid: temp_dir / "out" / sid for sid in sources}
+
+        results = run_alignment_batch([matcher], sources, temp_dir / "meta.ttl", output_dirs, cache=cache)
+
+        assert matcher.calls == [["a", "b", "c"], ["a"], ["b"]]
+        assert all(paths[0].exists() for paths in results.values())
+        # Every source's mapping was cached, wherever it was produced
+        rerun = BatchMatcher(max_batch=3)
+        run_alignment_batch([rerun], sources, temp_dir / "meta.ttl", output_dirs, cache=cache)
+        assert rerun.calls == []
+
+    @pytest.mark.unit
+    @pytest.mark.matcher
+    def test_batch_holds_cache_locks(self, temp_dir, sources):
+        """Test that a batch locks its keys in sorted order and restores entries stored meanwhile."""
+        cache = ArtifactCache(temp_dir / "cache")
+        run_alignment_batch([BatchMatcher()], {"a": sources["a"]}, temp_dir / "meta.ttl",
+                            {"a": temp_dir / "first"}, cache=cache)
+        locked = []
+        lock, contains = cache.lock, cache.contains
+        checked = set()
+
+        def recording_lock(key):
+            locked.append(key)
+            return lock(key)
+
+        def contains_after_first_check(key):
+            # The entry for "a" is missed before locking, as if another run stored it meanwhile
+            if key not in checked:
+                checked.add(key)
+                return False
+            return contains(key)
+
+        matcher = BatchMatcher()
+        with patch.object(cache, "contains", side_effect=contains_after_first_check), \
+                patch.object(cache, "lock", side_effect=recording_lock):
+            results = run_alignment_batch([matcher], {"a": sources["a"], "b": sources["b"]},
+                                          temp_dir / "meta.ttl", {"a": temp_dir / "a", "b": temp_dir / "b"},
+                                          cache=cache)
+
+        assert matcher.calls == [["b"]]
+        assert results["a"] == [temp_dir / "a" / "batch.sssom.tsv"]
+        assert len(locked) == 2 and locked == sorted(locked)
+
+
+class TestContainerAlignBatch:
+    """Test the batch container invocation."""
+
+    @pytest.mark.unit
+    @pytest.mark.matcher
+    @pytest.mark.docker
+    @patch('graph_mesh_core.docker_session.docker')
+    def test_one_container_for_all_sources(self, mock_docker, temp_dir, sources):
+        """Test that the target is mounted once and each source gets a source/output pair."""
+        mock_client = MagicMock()
+        mock_client.containers.run.return_value = b"Success"
+        mock_docker.from_env.return_value = mock_client
+        session = configure_docker_session()
+        matcher = ContainerMatcher(name="LogMap", image="test/logmap:latest",
+                                   output_filename="logmap.sssom.tsv", max_batch=3)
+        output_dirs = {sid: temp_dir / "out" / sid for sid in sources}
+
+        try:
+            mappings = matcher.align_batch(sources, temp_dir / "meta.ttl", output_dirs)
+        finally:
+            session.close()
+
+        mock_client.containers.run.assert_called_once()
+        kwargs = mock_client.containers.run.call_args[1]
+        command, volumes = kwargs["command"], kwargs["volumes"]
+        assert command[:2] == ["--target", "/data/target.owl"]
+        assert command.count("--source") == 3 and command.count("--output") == 3
+        assert volumes[str(sources["b"].resolve())]["bind"] == "/data/sources/1.owl"
+        assert volumes[str(output_dirs["b"].resolve())] == {"bind": "/data/output/1", "mode": "rw"}
+        assert "/data/output/1/logmap.sssom.tsv" in command
+        assert mappings["c"] == output_dirs["c"].resolve() / "logmap.sssom.tsv"
+
+
+class TestBatchOrchestration:
+    """Test orchestrate() with pipeline.alignment_batch_size."""
+
+    @pytest.mark.unit
+    def test_sources_aligned_in_groups(self, temp_dir):
+        """Test that groups of sources go to run_alignment_batch and sources record their own mappings."""
+        manifest_sources = []
+        for source_id in ("users", "orders", "items"):
+            path = temp_dir / f"{source_id}.json"
+            path.write_text(json.dumps({"type": "object", "properties": {"id": {"type": "string"}}}))
+            manifest_sources.append({"id": source_id, "fetch": {"type": "local", "path": str(path)},
+                                     "convert": {"type": "json"}})
+        manifest = temp_dir / "manifest.yaml"
+        manifest.write_text(yaml.safe_dump({
+            "name": "batched",
+            "matchers": ["LogMap"],
+            "sources": manifest_sources,
+            "pipeline": {"alignment_batch_size": 2, "prepare_images": False},
+        }))
+
+        def fake_batch(matchers, source_ontologies, target, output_dirs, **kwargs):
+            assert [m.max_batch for m in matchers] == [2]
+            return {sid: [Path(output_dirs[sid]) / "logmap.sssom.tsv"] for sid in source_ontologies}
+
+        with patch.object(pipeline, "run_alignment_batch", side_effect=fake_batch) as batch, \
+                patch.object(pipeline, "run_alignment", return_value=[temp_dir / "single.sssom.tsv"]) as single:
+            artifacts = orchestrate(manifest, workdir=temp_dir / "work", skip_preflight=True)
+
+        batch.assert_called_once()
+        assert sorted(batch.call_args[0][1]) == ["orders", "users"]
+        # The last group has one source, which is aligned on its own
+        single.assert_called_once()
+        assert artifacts.mappings["users"] == [temp_dir / "work" / "mappings" / "users" / "logmap.sssom.tsv"]
+        assert artifacts.mappings["items"] == [temp_dir / "single.sssom.tsv"]
@@ -0,0 +1,204 @@
+"""
+Unit tests for MinHash/LSH candidate blocking.
+
+Tests cover:
+- Character n-gram shingles and reproducible MinHash signatures
+- Candidate pairs for similar labels, kept apart by entity kind
+- Pruned target sub-ontologies and candidate lists
+- The lexical matcher and orchestrate() aligning against blocking candidates
+"""
+
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import yaml
+
+from graph_mesh_aligner import blocking
+from graph_mesh_aligner.blocking import MinHashBlocker, shingles
+from graph_mesh_aligner.lexical import LexicalEntity, LexicalMatcher, normalize
+from graph_mesh_orchestrator import pipeline
+from graph_mesh_orchestrator.pipeline import orchestrate
+
+SOURCE_TTL = """
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix src: <http://example.org/source#> .
+
+src:CustomerAddress a owl:Class .
+src:PaymentTransaction a owl:Class .
+src:orderID a owl:DatatypeProperty .
+"""
+
+TARGET_TTL = """
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix meta: <http://example.org/meta#> .
+
+meta:Ontology a owl:Ontology .
+meta:Thing a owl:Class .
+meta:Location a owl:Class ; rdfs:subClassOf meta:Thing .
+meta:CustomerAddress a owl:Class ; rdfs:subClassOf meta:Location ;
+    rdfs:subClassOf [ a owl:Restriction ; owl:onProperty meta:street ; owl:someValuesFrom meta:Thing ] .
+meta:PaymentTransactions a owl:Class .
+meta:Vehicle a owl:Class .
+meta:Spacecraft a owl:Class .
+meta:orderIdentifier a owl:DatatypeProperty .
+meta:OrderIdentifier a owl:Class .
+"""
+
+
+def entity(label, kind="class", prefix="http://example.org/x#"):
+    words = normalize(label)
+    return LexicalEntity(prefix + label, kind, label, frozenset({" ".join(sorted(words))}), frozenset(words))
+
+
+@pytest.fixture
+def ontologies(temp_dir):
+    source = temp_dir / "source.ttl"
+    target = temp_dir / "meta.ttl"
+    source.write_text(SOURCE_TTL)
+    target.write_text(TARGET_TTL)
+    return source, target
+
+
+class TestMinHash:
+    """Test shingles and signatures."""
+
+    @pytest.mark.unit
+    def test_shingles(self):
+        """Test that shingles are padded character trigrams of the normalized label."""
+        assert shingles(entity("Order")) == {" or", "ord", "rde", "der", "er "}
+        assert shingles(entity("ab"), n=5) == {" ab "}
+
+    @pytest.mark.unit
+    def test_signatures_are_reproducible(self):
+        """Test that equal labels get equal signatures, across blocker instances."""
+        entities = [entity("CustomerAddress"), entity("customer_address"), entity("Vehicle")]
+
+        first = MinHashBlocker().signatures(entities)
+        second = MinHashBlocker().signatures(entities)
+
+        assert first.shape == (3, 64)
+        assert np.array_equal(first, second)
+        assert np.array_equal(first[0], first[1])
+        assert not np.array_equal(first[0], first[2])
+
+    @pytest.mark.unit
+    def test_signature_chunks_match(self):
+        """Test that signatures computed in several chunks equal those computed in one."""
+        entities = [entity(f"Entity{i}Name") for i in range(50)]
+        expected = MinHashBlocker().signatures(entities)
+
+        with patch.object(blocking, "_CHUNK", 7):
+            assert np.array_equal(MinHashBlocker().signatures(entities), expected)
+
+    @pytest.mark.unit
+    def test_bands_must_divide_permutations(self):
+        """Test that an uneven band split is rejected."""
+        with pytest.raises(ValueError):
+            MinHashBlocker(num_perm=64, bands=10)
+
+
+class TestCandidates:
+    """Test candidate pair generation."""
+
+    @pytest.mark.unit
+    def test_similar_labels_become_candidates(self):
+        """Test that near-identical labels collide and unrelated ones do not."""
+        sources = [entity("PaymentTransaction", prefix="s:"), entity("Spacecraft", prefix="s:")]
+        targets = [entity("PaymentTransactions"), entity("Vehicle"), entity("Spacecraft")]
+
+        candidates = MinHashBlocker().candidate_pairs(sources, targets)
+
+        assert "http://example.org/x#PaymentTransactions" in candidates["s:PaymentTransaction"]
+        assert "http://example.org/x#Vehicle" not in candidates["s:PaymentTransaction"]
+        assert candidates["s:Spacecraft"] == {"http://example.org/x#Spacecraft"}
+
+    @pytest.mark.unit
+    def test_kinds_are_kept_apart(self):
+        """Test that a property is never a candidate for a class."""
+        sources = [entity("orderID", kind="property", prefix="s:")]
+        targets = [entity("orderIdentifier", kind="property"), entity("OrderIdentifier")]
+
+        candidates = MinHashBlocker().candidate_pairs(sources, targets)
+
+        assert candidates == {"s:orderID": {"http://example.org/x#orderIdentifier"}}
+
+
+class TestBlockOntologies:
+    """Test blocking ontology files."""
+
+    @pytest.mark.unit
+    def test_block_writes_pruned_target(self, temp_dir, ontologies):
+        """Test that the pruned target keeps candidates, their ancestors and restrictions."""
+        result = MinHashBlocker().block([ontologies[0]], ontologies[1], temp_dir / "blocking" / "src.nt")
+
+        assert result.target_path == temp_dir / "blocking" / "src.nt"
+        assert result.source_entities == 3 and result.target_entities == 8
+        assert 0 < result.reduction < 1
+        pruned = result.target_path.read_text()
+        assert "<http://example.org/meta#CustomerAddress>" in pruned
+        # Ancestors and the restriction's blank node come along
+        assert "<http://example.org/meta#Location> <http://www.w3.org/2000/01/rdf-schema#subClassOf>" in pruned
+        assert "<http://www.w3.org/2002/07/owl#someValuesFrom>" in pruned
+        assert "<http://example.org/meta#Vehicle> " not in pruned
+        candidates = (temp_dir / "blocking" / "src.candidates.tsv").read_text().splitlines()
+        assert candidates[0] == "subject_id\tobject_id"
+        assert "http://example.org/source#orderID\thttp://example.org/meta#orderIdentifier" in candidates
+
+    @pytest.mark.unit
+    def test_pruned_target_is_byte_stable(self, temp_dir, ontologies):
+        """Test that blocking the same inputs twice writes identical bytes."""
+        first = MinHashBlocker().block([ontologies[0]], ontologies[1], temp_dir / "a.nt").target_path
+        second = MinHashBlocker().block([ontologies[0]], ontologies[1], temp_dir / "b.nt").target_path
+
+        assert first.read_bytes() == second.read_bytes()
+
+    @pytest.mark.unit
+    def test_target_indexed_once(self, temp_dir, ontologies):
+        """Test that blocking several sources against one target parses it once."""
+        blocker = MinHashBlocker()
+        with patch.object(blocking, "_parse", wraps=blocking._parse) as parse:
+            blocker.block([ontologies[0]], ontologies[1])
+            blocker.block([ontologies[0]], ontologies[1])
+
+        parsed = [call.args[0] for call in parse.call_args_list]
+        assert parsed.count(ontologies[1]) == 1
+        assert parsed.count(ontologies[0]) == 2
+
+
+class TestBlockingConsumers:
+    """Test matchers and the pipeline using blocking."""
+
+    @pytest.mark.unit
+    @pytest.mark.matcher
+    def test_lexical_matcher_with_blocking(self, temp_dir, ontologies):
+        """Test that the lexical matcher finds the same matches when scoring only candidates."""
+        plain = LexicalMatcher().align(*ontologies, temp_dir / "plain").read_text()
+        blocked = LexicalMatcher(blocking=True).align(*ontologies, temp_dir / "blocked").read_text()
+
+        assert blocked == plain
+        assert "src:CustomerAddress" in blocked
+
+    @pytest.mark.unit
+    def test_orchestrate_aligns_against_pruned_target(self, temp_dir):
+        """Test that with pipeline.blocking each source is aligned against its blocked target."""
+        schema = temp_dir / "users.json"
+        schema.write_text(json.dumps({"title": "User", "type": "object",
+                                      "properties": {"name": {"type": "string"}}}))
+        manifest = temp_dir / "manifest.yaml"
+        manifest.write_text(yaml.safe_dump({
+            "name": "blocked",
+            "matchers": ["Lexical"],
+            "sources": [{"id": "users", "fetch": {"type": "local", "path": str(schema)},
+                         "convert": {"type": "json"}}],
+            "pipeline": {"blocking": True, "prepare_images": False},
+        }))
+
+        with patch.object(pipeline, "run_alignment", return_value=[]) as run:
+            orchestrate(manifest, workdir=temp_dir / "work", skip_preflight=True)
+
+        target = run.call_args[0][2]
+        assert target == temp_dir / "work" / "blocking" / "users.nt"
+        assert target.exists()
@@ -0,0 +1,170 @@
+"""
+Unit tests for deadline-aware runs.
+
+Tests cover:
+- Remaining time, the fusion reserve and invalid deadlines
+- Skipping the slowest matchers, keeping cached ones, late skips
+- Estimates from this run, the previous run and the cost model
+- orchestrate(deadline=...) recording what it skipped and reusing earlier mappings
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from graph_mesh_orchestrator import pipeline
+from graph_mesh_orchestrator.deadline import DEADLINE_REPORT, DeadlineTracker, load_matcher_history
+from graph_mesh_orchestrator.pipeline import load_checkpoint, orchestrate
+
+
+@dataclass
+class StubMatcher:
+    """Matcher stub that writes a one-row SSSOM file."""
+
+    name: str
+    output_filename: str
+
+    def align(self, source_ontology: Path, target_ontology: Path, output_dir: Path) -> Path:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        mapping = output_dir / self.output_filename
+        mapping.write_text(f"subject_id\tobject_id\nex:{self.name}\tex:B\n")
+        return mapping
+
+
+STUBS = {name: StubMatcher(name, f"{name.lower()}.sssom.tsv") for name in ("LogMap", "AML", "BERTMap")}
+COSTS = {"LogMap": 20.0, "AML": 15.0, "BERTMap": 120.0}
+
+
+@pytest.fixture
+def manifest(temp_dir):
+    schema = temp_dir / "users.json"
+    schema.write_text(json.dumps({"title": "Users", "type": "object", "properties": {"id": {"type": "string"}}}))
+    manifest_path = temp_dir / "manifest.yaml"
+    manifest_path.write_text(yaml.safe_dump({
+        "name": "deadline", "matchers": ["LogMap", "AML", "BERTMap"],
+        "sources": [{"id": "users", "fetch": {"type": "local", "path": str(schema)}, "convert": {"type": "json"}}],
+    }))
+    return manifest_path
+
+
+class TestDeadlineTracker:
+    """Test budget tracking and matcher selection."""
+
+    @pytest.mark.unit
+    def test_remaining_keeps_fusion_reserve(self):
+        """Test that the time before fusion excludes the reserve."""
+        tracker = DeadlineTracker(timedelta(minutes=10), started=time.monotonic() - 60,
+                                  default_matcher_seconds=COSTS)
+
+        assert tracker.fusion_reserve_seconds == 30.0
+        assert tracker.remaining() == pytest.approx(510.0, abs=1.0)
+        assert not tracker.expired()
+        with pytest.raises(ValueError):
+            DeadlineTracker(0)
+
+    @pytest.mark.unit
+    def test_skips_slowest_matchers(self):
+        """Test that matchers are taken cheapest first and the slowest ones skipped."""
+        tracker = DeadlineTracker(60, fusion_reserve_seconds=0, default_matcher_seconds=COSTS)
+
+        planned, skipped = tracker.plan_matchers(list(STUBS.values()), source_id="users")
+
+        assert [m.name for m in planned] == ["AML", "LogMap"]
+        assert [m.name for m in skipped] == ["BERTMap"]
+        (degradation,) = tracker.degradations
+        assert (degradation.action, degradation.source_id, degradation.matcher) == \
+            ("skipped_matcher", "users", "BERTMap")
+
+    @pytest.mark.unit
+    def test_cached_matchers_always_run(self):
+        """Test that a cached mapping is kept even when its matcher would not fit."""
+        tracker = DeadlineTracker(10, fusion_reserve_seconds=0, default_matcher_seconds=COSTS)
+
+        planned, skipped = tracker.plan_matchers(list(STUBS.values()), cached=["BERTMap"])
+
+        assert [m.name for m in planned] == ["BERTMap"]
+        assert {m.name for m in skipped} == {"LogMap", "AML"}
+
+    @pytest.mark.unit
+    def test_late_skip(self):
+        """Test that a matcher which no longer fits when it is due is skipped."""
+        tracker = DeadlineTracker(30, started=time.monotonic() - 25, fusion_reserve_seconds=0,
+                                  default_matcher_seconds=COSTS)
+
+        assert not tracker.allows(STUBS["AML"], source_id="users")
+        assert tracker.degradations[0].reason == "deadline budget used up by earlier work"
+
+    @pytest.mark.unit
+    def test_estimates(self, temp_dir):
+        """Test estimates from observed runs, then history, then the cost model."""
+        (temp_dir / "run_metrics.json").write_text(json.dumps({"units": [
+            {"stage": "matcher", "matcher": "AML", "status": "ok", "wall_seconds": 4.0, "extra": {}},
+            {"stage": "matcher", "matcher": "AML", "status": "ok", "wall_seconds": 6.0, "extra": {}},
+            {"stage": "matcher", "matcher": "LogMap", "status": "ok", "wall_seconds": 0.1,
+             "extra": {"cached": True}},
+            {"stage": "fusion", "status": "ok", "wall_seconds": 12.0},
+        ]}))
+        history = load_matcher_history(temp_dir)
+        tracker = DeadlineTracker(600, history=history, default_matcher_seconds=COSTS)
+
+        assert history["matchers"] == {"AML": 5.0}
+        assert tracker.fusion_reserve_seconds == 12.0
+        assert tracker.estimate("AML") == 5.0
+        assert tracker.estimate("LogMap") == 20.0
+        tracker.observe("LogMap", 2.0)
+        assert tracker.estimate("LogMap") == 2.0
+        assert load_matcher_history(temp_dir / "missing") == {}
+
+
+class TestDeadlineRun:
+    """Test orchestrate() with a deadline."""
+
+    @pytest.mark.unit
+    def test_partial_alignment_on_time(self, temp_dir, manifest):
+        """Test that a run behind its deadline skips a matcher and records it."""
+        workdir = temp_dir / "work"
+
+        with patch.dict(pipeline.MATCHER_REGISTRY, STUBS):
+            artifacts = orchestrate(manifest, workdir=workdir, deadline=timedelta(seconds=60))
+
+        assert [p.name for p in artifacts.mappings["users"]] == ["logmap.sssom.tsv", "aml.sssom.tsv"]
+        assert artifacts.merged_graph.exists()
+        actions = [(d.action, d.matcher) for d in artifacts.degradations]
+        assert actions == [("skipped_preflight", None), ("skipped_matcher", "BERTMap")]
+
+        report = json.loads((workdir / DEADLINE_REPORT).read_text())
+        assert report["met"] and report["degraded"]
+        assert report["degradations"][1]["matcher"] == "BERTMap"
+        # The partial alignment is redone by the next resumed run
+        assert not load_checkpoint(workdir).sources["users"].aligned
+
+    @pytest.mark.unit
+    def test_reuses_previous_mappings(self, temp_dir, manifest):
+        """Test that a skipped matcher's mapping from an earlier run is used instead."""
+        workdir = temp_dir / "work"
+        previous = workdir / "mappings" / "users" / "bertmap.sssom.tsv"
+        previous.parent.mkdir(parents=True)
+        previous.write_text("subject_id\tobject_id\nex:Old\tex:B\n")
+
+        with patch.dict(pipeline.MATCHER_REGISTRY, STUBS):
+            artifacts = orchestrate(manifest, workdir=workdir, skip_preflight=True,
+                                    deadline=timedelta(seconds=60))
+
+        assert artifacts.mappings["users"][-1] == previous
+        assert [d.action for d in artifacts.degradations] == ["skipped_matcher", "reused_previous_mappings"]
+
+    @pytest.mark.unit
+    def test_no_deadline_runs_everything(self, temp_dir, manifest):
+        """Test that without a deadline nothing is skipped or reported."""
+        with patch.dict(pipeline.MATCHER_REGISTRY, STUBS):
+            artifacts = orchestrate(manifest, workdir=temp_dir / "work", skip_preflight=True)
+
+        assert len(artifacts.mappings["users"]) == 3
+        assert artifacts.degradations == []
+        assert not (temp_dir / "work" / DEADLINE_REPORT).exists()
@@ -0,0 +1,162 @@
+"""
+Unit tests for distributed execution.
+
+Tests cover:
+- A coordinator with local workers producing the same artifacts as orchestrate()
+- Remote workers joining a coordinator that runs none itself
+- Items of a dead worker reclaimed by another worker
+- Failed fetches failing the run, workers refusing a different manifest
+- The `graph-mesh coordinate` and `graph-mesh worker` commands
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+from rdflib import Graph
+
+from graph_mesh_orchestrator import distributed, pipeline
+from graph_mesh_orchestrator.cli import main as cli_main
+from graph_mesh_orchestrator.distributed import coordinate, run_worker
+from graph_mesh_orchestrator.errors import PipelineError, WorkQueueError
+from graph_mesh_orchestrator.models import PipelineState
+from graph_mesh_orchestrator.pipeline import load_checkpoint
+from graph_mesh_orchestrator.workqueue import QUEUE_NAME, WorkQueue
+
+
+@dataclass
+class StubMatcher:
+    """Matcher stub that writes a one-row SSSOM file."""
+
+    name: str = "LogMap"
+    output_filename: str = "stub.sssom.tsv"
+
+    def align(self, source_ontology: Path, target_ontology: Path, output_dir: Path) -> Path:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        mapping = output_dir / self.output_filename
+        mapping.write_text("# curie_map: {}\nsubject_id\tobject_id\nex:A\tex:B\n")
+        return mapping
+
+
+@pytest.fixture
+def manifest(temp_dir):
+    sources = []
+    for source_id in ("users", "orders", "invoices"):
+        schema = temp_dir / f"{source_id}.json"
+        schema.write_text(json.dumps({"title": source_id, "type": "object",
+                                      "properties": {"id": {"type": "string"}}}))
+        sources.append({"id": source_id, "fetch": {"type": "local", "path": str(schema)},
+                        "convert": {"type": "json"}})
+    manifest_path = temp_dir / "manifest.yaml"
+    manifest_path.write_text(yaml.safe_dump({"name": "distributed", "matchers": ["LogMap"], "sources": sources}))
+    return manifest_path
+
+
+@pytest.fixture
+def stub_matcher():
+    with patch.dict(pipeline.MATCHER_REGISTRY, {"LogMap": StubMatcher()}):
+        yield
+
+
+def _wait_for_open(workdir):
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if (workdir / QUEUE_NAME).exists() and WorkQueue(workdir / QUEUE_NAME).meta().get("state") == "open":
+            return
+        time.sleep(0.02)
+    raise AssertionError("coordinator never opened the queue")
+
+
+class TestCoordinate:
+    """Test distributed runs."""
+
+    @pytest.mark.unit
+    def test_local_workers(self, temp_dir, manifest, stub_matcher):
+        """Test a run whose items are all handled by the coordinator's workers."""
+        workdir = temp_dir / "work"
+
+        artifacts = coordinate(manifest, workdir=workdir, local_workers=2, poll_interval=0.02)
+
+        assert list(artifacts.converted) == ["users", "orders", "invoices"]
+        assert all(len(paths) == 1 and paths[0].exists() for paths in artifacts.mappings.values())
+        assert len(Graph().parse(artifacts.merged_graph)) > 0
+
+        queue = WorkQueue(workdir / QUEUE_NAME)
+        assert queue.counts()["done"] == 9
+        assert queue.meta()["state"] == "closed"
+        assert sum(worker["completed"] for worker in queue.workers()) == 9
+        assert len(list((workdir / "workers").glob("*.run_metrics.json"))) == 2
+
+        checkpoint = load_checkpoint(workdir)
+        assert checkpoint.state == PipelineState.COMPLETED
+        assert all(state.aligned and state.fingerprint for state in checkpoint.sources.values())
+
+    @pytest.mark.unit
+    def test_remote_workers_and_reclaimed_lease(self, temp_dir, manifest, stub_matcher):
+        """Test that a worker joining later finishes the run, including a dead worker's item."""
+        workdir = temp_dir / "work"
+        result = {}
+        coordinator = threading.Thread(target=lambda: result.update(artifacts=coordinate(
+            manifest, workdir=workdir, local_workers=0, lease_seconds=0.3, poll_interval=0.02)))
+        coordinator.start()
+        _wait_for_open(workdir)
+
+        # A worker that claims an item and dies without heartbeats
+        abandoned = WorkQueue(workdir / QUEUE_NAME, lease_seconds=0.3).claim("dead-worker")
+        summary = run_worker(manifest, workdir=workdir, worker_id="survivor", poll_interval=0.02)
+        coordinator.join(timeout=60)
+
+        assert summary.completed == 9
+        reclaimed = WorkQueue(workdir / QUEUE_NAME).get(*abandoned.key)
+        assert (reclaimed.status, reclaimed.worker_id, reclaimed.attempts) == ("done", "survivor", 2)
+        assert result["artifacts"].merged_graph.exists()
+
+    @pytest.mark.unit
+    def test_failed_fetch_fails_run(self, temp_dir, manifest, stub_matcher):
+        """Test that a source that cannot be fetched fails the run after the others finish."""
+        (temp_dir / "orders.json").unlink()
+        workdir = temp_dir / "work"
+
+        with pytest.raises(PipelineError, match="orders/fetch"):
+            coordinate(manifest, workdir=workdir, local_workers=1, poll_interval=0.02)
+
+        queue = WorkQueue(workdir / QUEUE_NAME)
+        assert queue.get("orders", "alignment").status == "failed"
+        assert queue.get("users", "alignment").status == "done"
+        assert load_checkpoint(workdir).state == PipelineState.FAILED
+
+    @pytest.mark.unit
+    def test_worker_rejects_other_manifest(self, temp_dir, manifest):
+        """Test that a worker refuses a queue opened for a different manifest."""
+        workdir = temp_dir / "work"
+        queue = WorkQueue(workdir / QUEUE_NAME)
+        queue.set_meta(manifest="0" * 64, meta_ontology_path="meta.ttl", lease_seconds=60,
+                       max_attempts=3, state="open")
+
+        with pytest.raises(WorkQueueError, match="different manifest"):
+            run_worker(manifest, workdir=workdir, poll_interval=0.01)
+        with pytest.raises(WorkQueueError, match="No coordinator"):
+            run_worker(manifest, workdir=temp_dir / "empty", poll_interval=0.01, join_timeout=0.05)
+
+
+class TestCommands:
+    """Test the coordinate and worker subcommands."""
+
+    @pytest.mark.unit
+    def test_dispatch(self):
+        """Test that the subcommands pass their options through."""
+        with patch.object(distributed, "coordinate") as coordinate_mock, \
+                patch.object(distributed, "run_worker") as worker_mock:
+            cli_main(["coordinate", "m.yaml", "--workdir", "/shared/run", "--workers", "0",
+                      "--lease-seconds", "30"])
+            cli_main(["worker", "m.yaml", "--workdir", "/shared/run", "--worker-id", "host-b"])
+
+        assert coordinate_mock.call_args.kwargs["local_workers"] == 0
+        assert coordinate_mock.call_args.kwargs["lease_seconds"] == 30.0
+        assert worker_mock.call_args.kwargs["worker_id"] == "host-b"
+        assert worker_mock.call_args.kwargs["workdir"] == Path("/shared/run")
@@ -0,0 +1,143 @@
+"""
+Unit tests for the shared Docker session.
+
+Tests cover:
+- One client per session
+- Image status caching with a TTL
+- Concurrent image preparation and pulls
+- Lookups waiting for images being prepared
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from docker.errors import DockerException, ImageNotFound
+
+from graph_mesh_core.docker_session import DockerSession
+
+
+def make_session(**kwargs):
+    client = MagicMock()
+    factory = MagicMock(return_value=client)
+    return DockerSession(client_factory=factory, **kwargs), client, factory
+
+
+class TestDockerSession:
+    """Test the shared client and image status cache."""
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_client_is_created_once(self):
+        """Test that the client is connected once and reused."""
+        session, client, factory = make_session()
+
+        assert session.client is client
+        assert session.client is client
+        factory.assert_called_once()
+        assert session.stats()["connects"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_image_status_is_cached(self):
+        """Test that image statuses are cached until the TTL expires."""
+        session, client, _ = make_session(ttl_seconds=60)
+        client.images.get.return_value.id = "sha256:abc"
+
+        status = session.image_status("img")
+        assert status.available and status.image_id == "sha256:abc"
+        assert session.image_available("img")
+        client.images.get.assert_called_once_with("img")
+        assert session.stats()["cache_hits"] == 1
+
+        with patch("graph_mesh_core.docker_session.time.monotonic", return_value=10**9):
+            session.image_status("img")
+        assert client.images.get.call_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_missing_and_unreachable(self):
+        """Test that a missing image is told apart from an unreachable daemon."""
+        session, client, _ = make_session()
+        client.images.get.side_effect = [ImageNotFound("missing"), DockerException("no daemon")]
+
+        missing = session.image_status("missing")
+        unreachable = session.image_status("other")
+
+        assert not missing.available and missing.not_found
+        assert not unreachable.available and not unreachable.not_found
+        assert "no daemon" in unreachable.error
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_invalidate(self):
+        """Test that an invalidated image is checked again."""
+        session, client, _ = make_session()
+        session.image_status("img")
+        session.invalidate("img")
+        session.image_status("img")
+
+        assert client.images.get.call_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_ensure_images_pulls_missing(self):
+        """Test that missing images are pulled concurrently when requested."""
+        session, client, _ = make_session(max_workers=3)
+        client.images.get.side_effect = ImageNotFound("missing")
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+        release = threading.Barrier(3, timeout=5)
+
+        def pull(image):
+            with lock:
+                in_flight.append(image)
+                peak.append(len(in_flight))
+            release.wait()
+            return MagicMock(id=f"id-{image}")
+
+        client.images.pull.side_effect = pull
+
+        statuses = session.ensure_images(["a", "b", "c", "a"], pull=True)
+
+        assert sorted(statuses) == ["a", "b", "c"]
+        assert all(s.available and s.pulled for s in statuses.values())
+        assert max(peak) == 3
+        assert session.stats()["pending_images"] == 0
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_lookup_waits_for_preparation(self):
+        """Test that a lookup during preparation waits for it instead of failing."""
+        session, client, _ = make_session()
+        client.images.get.side_effect = ImageNotFound("missing")
+        pulling = threading.Event()
+        finish = threading.Event()
+
+        def pull(image):
+            pulling.set()
+            finish.wait(5)
+            return MagicMock(id="sha256:pulled")
+
+        client.images.pull.side_effect = pull
+        session.prepare_images(["img"], pull=True)
+        assert pulling.wait(5)
+
+        threading.Timer(0.05, finish.set).start()
+        status = session.image_status("img")
+
+        assert status.available and status.image_id == "sha256:pulled"
+        client.images.get.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_close_reconnects_on_next_use(self):
+        """Test that a closed session connects again when used."""
+        session, client, factory = make_session()
+        session.client
+        session.close()
+        session.client
+
+        client.close.assert_called_once()
+        assert factory.call_count == 2
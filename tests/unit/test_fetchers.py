@@ -0,0 +1,286 @@
+"""
+Unit tests for remote fetchers.
+
+Tests cover:
+- HTTP downloads revalidated with ETag/Last-Modified
+- Resuming interrupted HTTP downloads with Range requests
+- Transient and permanent HTTP errors
+- Git checkouts updated only when the remote moves
+- S3 downloads against a local S3-compatible stand-in (requires boto3)
+- fetch_source dispatch for remote fetch types
+"""
+
+import hashlib
+import shutil
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from graph_mesh_orchestrator.errors import FetchError, NetworkError
+from graph_mesh_orchestrator.fetchers import FetchCache, GitFetcher, HTTPFetcher, S3Fetcher
+from graph_mesh_orchestrator.models import SourceConfig
+from graph_mesh_orchestrator.pipeline import fetch_source
+
+LAST_MODIFIED = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+class _ObjectHandler(BaseHTTPRequestHandler):
+    """Serve ``server.objects`` with ETag, Last-Modified, 304 and Range support."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        name = self.path.lstrip("/")
+        if name in server.fail_statuses:
+            self.send_response(server.fail_statuses[name])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if name not in server.objects:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = server.objects[name]
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range") in (None, etag):
+            start = int(range_header.split("=")[1].rstrip("-"))
+        truncate = server.truncate.pop(name, None)
+
+        self.send_response(206 if start else 200)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.send_header("Content-Length", str(len(body) - start))
+        if start:
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        self.end_headers()
+        # Simulate a dropped connection after `truncate` bytes
+        self.wfile.write(body[start:truncate] if truncate is not None else body[start:])
+        if truncate is not None:
+            self.close_connection = True
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ObjectHandler)
+    server.objects = {}
+    server.fail_statuses = {}
+    server.truncate = {}
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestHTTPFetcher:
+    """Test HTTP downloads through the fetch cache."""
+
+    @pytest.mark.unit
+    def test_unchanged_object_not_downloaded_again(self, temp_dir, http_server):
+        """Test that a cached object is revalidated instead of re-downloaded."""
+        http_server.objects["schema.json"] = b'{"title": "Thing"}'
+        fetcher = HTTPFetcher(FetchCache(temp_dir / "cache"))
+        url = f"{http_server.base_url}/schema.json"
+
+        first = fetcher.fetch(url)
+        second = fetcher.fetch(url)
+
+        assert first.status == "downloaded"
+        assert second.status == "not_modified"
+        assert second.bytes_downloaded == 0
+        assert second.path.read_bytes() == b'{"title": "Thing"}'
+        assert http_server.requests[1]["If-None-Match"]
+        assert http_server.requests[1]["If-Modified-Since"] == LAST_MODIFIED
+
+    @pytest.mark.unit
+    def test_changed_object_downloaded(self, temp_dir, http_server):
+        """Test that a changed object replaces the cached copy."""
+        http_server.objects["schema.json"] = b"v1"
+        fetcher = HTTPFetcher(FetchCache(temp_dir / "cache"))
+        url = f"{http_server.base_url}/schema.json"
+        fetcher.fetch(url)
+
+        http_server.objects["schema.json"] = b"v2"
+        result = fetcher.fetch(url)
+
+        assert result.status == "downloaded"
+        assert result.path.read_bytes() == b"v2"
+
+    @pytest.mark.unit
+    def test_interrupted_download_resumes(self, temp_dir, http_server):
+        """Test that a retry only requests the missing bytes."""
+        body = bytes(range(256)) * 64
+        http_server.objects["big.xsd"] = body
+        http_server.truncate["big.xsd"] = 5000
+        fetcher = HTTPFetcher(FetchCache(temp_dir / "cache"))
+        url = f"{http_server.base_url}/big.xsd"
+
+        with pytest.raises(NetworkError):
+            fetcher.fetch(url)
+        result = fetcher.fetch(url)
+
+        assert result.status == "resumed"
+        assert result.bytes_downloaded == len(body) - 5000
+        assert result.path.read_bytes() == body
+        assert http_server.requests[-1]["Range"] == "bytes=5000-"
+
+    @pytest.mark.unit
+    def test_http_errors(self, temp_dir, http_server):
+        """Test that 5xx responses are retryable and 404 is not."""
+        http_server.fail_statuses["flaky"] = 503
+        fetcher = HTTPFetcher(FetchCache(temp_dir / "cache"))
+
+        with pytest.raises(NetworkError) as excinfo:
+            fetcher.fetch(f"{http_server.base_url}/flaky")
+        assert excinfo.value.can_retry()
+        with pytest.raises(FetchError):
+            fetcher.fetch(f"{http_server.base_url}/missing")
+
+    @pytest.mark.unit
+    def test_bearer_token(self, temp_dir, http_server):
+        """Test that a token credential is sent as a bearer token."""
+        http_server.objects["private"] = b"data"
+        HTTPFetcher(FetchCache(temp_dir / "cache")).fetch(
+            f"{http_server.base_url}/private", {"token": "secret"})
+
+        assert http_server.requests[0]["Authorization"] == "Bearer secret"
+
+
+class TestFetchSource:
+    """Test fetch_source with remote fetch types."""
+
+    @pytest.mark.unit
+    def test_http_source_materialized_in_workdir(self, temp_dir, http_server):
+        """Test that remote sources land in <workdir>/sources/<id>/."""
+        http_server.objects["schemas/orders.json"] = b"{}"
+        source = SourceConfig.model_validate({
+            "id": "orders",
+            "fetch": {"type": "https", "url": f"{http_server.base_url}/schemas/orders.json"},
+            "convert": {"type": "json"},
+        })
+
+        path = fetch_source(source, temp_dir, cache_dir=temp_dir / "cache")
+        again = fetch_source(source, temp_dir, cache_dir=temp_dir / "cache")
+
+        assert Path(path) == temp_dir / "sources" / "orders" / "orders.json"
+        assert again == path
+        assert Path(path).read_bytes() == b"{}"
+        assert len(http_server.requests) == 2
+
+    @pytest.mark.unit
+    def test_remote_errors_keep_source_id(self, temp_dir, http_server):
+        """Test that fetch errors name the failing source."""
+        source = SourceConfig.model_validate({
+            "id": "gone",
+            "fetch": {"type": "http", "url": f"{http_server.base_url}/missing"},
+        })
+
+        with pytest.raises(FetchError) as excinfo:
+            fetch_source(source, temp_dir, cache_dir=temp_dir / "cache")
+        assert excinfo.value.details["source_id"] == "gone"
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestGitFetcher:
+    """Test git checkouts through the fetch cache."""
+
+    def _git(self, cwd, *args):
+        subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+                       cwd=cwd, check=True, capture_output=True)
+
+    @pytest.fixture
+    def repo(self, temp_dir):
+        repo = temp_dir / "origin"
+        (repo / "schemas").mkdir(parents=True)
+        (repo / "schemas" / "a.json").write_text("{}")
+        self._git(repo, "init", "-q")
+        self._git(repo, "add", ".")
+        self._git(repo, "commit", "-q", "-m", "initial")
+        return repo
+
+    @pytest.mark.unit
+    def test_checkout_reused_until_remote_moves(self, temp_dir, repo):
+        """Test that an unchanged remote is not fetched again."""
+        fetcher = GitFetcher(FetchCache(temp_dir / "cache"))
+        url = repo.as_uri()
+
+        assert fetcher.fetch(url).status == "downloaded"
+        assert fetcher.fetch(url).status == "not_modified"
+
+        (repo / "schemas" / "b.json").write_text("{}")
+        self._git(repo, "add", ".")
+        self._git(repo, "commit", "-q", "-m", "second")
+        result = fetcher.fetch(url)
+
+        assert result.status == "downloaded"
+        assert (result.path / "schemas" / "b.json").exists()
+
+    @pytest.mark.unit
+    def test_paths_select_files(self, temp_dir, repo):
+        """Test that fetch.path selects files inside the repository."""
+        source = SourceConfig.model_validate({
+            "id": "repo",
+            "fetch": {"type": "git", "url": repo.as_uri(), "path": "schemas/a.json"},
+            "convert": {"type": "json"},
+        })
+
+        path = fetch_source(source, temp_dir / "work", cache_dir=temp_dir / "cache")
+
+        assert Path(path) == temp_dir / "work" / "sources" / "repo" / "schemas" / "a.json"
+        assert Path(path).read_text() == "{}"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("fetch", [{}, {"path": "schemas"}])
+    def test_git_source_requires_file_paths(self, temp_dir, repo, fetch):
+        """Test that a git source without fetch.path, or selecting a directory, is rejected."""
+        source = SourceConfig.model_validate({
+            "id": "repo",
+            "fetch": {"type": "git", "url": repo.as_uri(), **fetch},
+            "convert": {"type": "json"},
+        })
+
+        with pytest.raises(FetchError, match="Git source 'repo'") as excinfo:
+            fetch_source(source, temp_dir / "work", cache_dir=temp_dir / "cache")
+        assert excinfo.value.details["source_id"] == "repo"
+
+
+class TestS3Fetcher:
+    """Test S3 downloads against a local S3-compatible stand-in."""
+
+    @pytest.mark.unit
+    def test_unchanged_object_not_downloaded_again(self, temp_dir, http_server):
+        """Test conditional GetObject requests."""
+        pytest.importorskip("boto3")
+        http_server.objects["bucket/schemas/a.json"] = b"{}"
+        fetcher = S3Fetcher(FetchCache(temp_dir / "cache"))
+        credentials = {
+            "endpoint_url": http_server.base_url,
+            "aws_access_key_id": "test",
+            "aws_secret_access_key": "test",
+            "region": "us-east-1",
+        }
+
+        first = fetcher.fetch("s3://bucket/schemas/a.json", credentials)
+        second = fetcher.fetch("s3://bucket/schemas/a.json", credentials)
+
+        assert first.status == "downloaded"
+        assert first.path.read_bytes() == b"{}"
+        assert second.status == "not_modified"
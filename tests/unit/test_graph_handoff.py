@@ -0,0 +1,176 @@
+"""
+Unit tests for the in-process graph handoff.
+
+Tests cover:
+- Synchronous writes without a handoff, background writes with one
+- Graphs taken once, then parsed from their file
+- Write errors surfacing on wait and flush
+- Fusion merging handed-off graphs with unchanged output
+- Ingest with a cache and pipeline runs with and without pipeline.graph_handoff
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+import yaml
+from rdflib import OWL, RDF, Graph, Namespace
+from rdflib.compare import isomorphic
+
+from graph_mesh_core.artifact_cache import ArtifactCache
+from graph_mesh_core.graph_handoff import GraphHandoff, active_handoff, load_graph, wait_for_file, write_graph
+from graph_mesh_ingest.json_to_owl import convert_jsonschema_to_owl
+from graph_mesh_orchestrator import pipeline
+from graph_mesh_orchestrator.ingest import run_ingest
+from graph_mesh_orchestrator.pipeline import fuse_graphs, orchestrate
+
+EX = Namespace("http://example.org/")
+
+
+def _write_schema(path, title):
+    path.write_text(json.dumps({"title": title, "type": "object",
+                                "properties": {"id": {"type": "string"}, "name": {"type": "string"}}}))
+    return path
+
+
+def _graph(*names):
+    graph = Graph()
+    graph.bind("ex", EX)
+    for name in names:
+        graph.add((EX[name], RDF.type, OWL.Class))
+    return graph
+
+
+class TestWriteGraph:
+    """Test writing graphs with and without a handoff."""
+
+    @pytest.mark.unit
+    def test_without_handoff_writes_now(self, temp_dir):
+        """Test that without a handoff the file is written before returning."""
+        assert active_handoff() is None
+        assert write_graph(_graph("A"), temp_dir / "a.owl") is False
+        assert isomorphic(Graph().parse(temp_dir / "a.owl"), _graph("A"))
+        assert not (temp_dir / "a.owl.partial").exists()
+
+    @pytest.mark.unit
+    def test_handoff_returns_graph_once(self, temp_dir):
+        """Test that a handed-off graph is returned as is, then read from its file."""
+        graph = _graph("A", "B")
+
+        with GraphHandoff().activate() as handoff:
+            assert write_graph(graph, temp_dir / "a.owl") is True
+            with patch.object(Graph, "parse", side_effect=AssertionError("parsed")):
+                assert load_graph(temp_dir / "a.owl") is graph
+            reparsed = load_graph(temp_dir / "a.owl")
+
+        assert reparsed is not graph and isomorphic(reparsed, graph)
+        assert handoff.stats() == {"published": 1, "taken": 1, "held": 0}
+
+    @pytest.mark.unit
+    def test_files_written_on_exit(self, temp_dir):
+        """Test that leaving the block waits for writes and releases untaken graphs."""
+        with GraphHandoff().activate() as handoff:
+            for name in ("a", "b", "c"):
+                write_graph(_graph(name), temp_dir / f"{name}.owl")
+
+        assert all((temp_dir / f"{name}.owl").exists() for name in ("a", "b", "c"))
+        assert handoff.stats()["held"] == 0
+
+    @pytest.mark.unit
+    def test_write_error_surfaces(self, temp_dir):
+        """Test that a failed background write raises on wait and flush."""
+        (temp_dir / "blocked").write_text("a file, not a directory")
+        target = temp_dir / "blocked" / "a.owl"
+
+        with GraphHandoff().activate() as handoff:
+            write_graph(_graph("A"), target)
+            with pytest.raises(OSError):
+                wait_for_file(target)
+            with pytest.raises(OSError):
+                handoff.flush()
+
+
+class TestHandoffConsumers:
+    """Test converters, fusion and ingest with an active handoff."""
+
+    @pytest.mark.unit
+    def test_fusion_output_unchanged(self, temp_dir):
+        """Test that fusing handed-off graphs gives the same graph as parsing files."""
+        schemas = [_write_schema(temp_dir / f"{name}.json", name.title()) for name in ("users", "orders")]
+        meta = _graph("Meta")
+        plain = [temp_dir / "plain" / f"{schema.stem}.owl" for schema in schemas]
+        handed = [temp_dir / "handed" / f"{schema.stem}.owl" for schema in schemas]
+        for schema, path in zip(schemas, plain):
+            convert_jsonschema_to_owl(str(schema), str(path))
+        fuse_graphs(plain, meta, temp_dir / "plain.ttl")
+
+        with GraphHandoff().activate() as handoff:
+            for schema, path in zip(schemas, handed):
+                convert_jsonschema_to_owl(str(schema), str(path))
+            fuse_graphs(handed, meta, temp_dir / "handed.ttl")
+
+        assert handoff.stats()["taken"] == 2
+        assert isomorphic(Graph().parse(temp_dir / "plain.ttl"), Graph().parse(temp_dir / "handed.ttl"))
+        for plain_path, handed_path in zip(plain, handed):
+            assert isomorphic(Graph().parse(plain_path), Graph().parse(handed_path))
+
+    @pytest.mark.unit
+    def test_ingest_cache_stores_written_file(self, temp_dir):
+        """Test that ingest waits for the file before storing it in the cache."""
+        schema = _write_schema(temp_dir / "users.json", "Users")
+        source = {"id": "users", "convert": {"type": "json"}}
+        cache = ArtifactCache(temp_dir / "cache")
+
+        with GraphHandoff().activate():
+            converted = run_ingest([source], {"users": schema}, temp_dir / "first", cache=cache)
+        restored = run_ingest([source], {"users": schema}, temp_dir / "second", cache=cache)
+
+        assert isomorphic(Graph().parse(converted["users"]), Graph().parse(restored["users"]))
+
+
+class TestHandoffPipeline:
+    """Test runs with pipeline.graph_handoff."""
+
+    @pytest.mark.unit
+    def test_memory_budget_skips_handoff(self, temp_dir):
+        """Test that a run with a memory budget goes through files."""
+        schema = _write_schema(temp_dir / "users.json", "users")
+        manifest = temp_dir / "manifest.yaml"
+        manifest.write_text(yaml.safe_dump({
+            "name": "budget", "matchers": ["LogMap"],
+            "sources": [{"id": "users", "fetch": {"type": "local", "path": str(schema)},
+                         "convert": {"type": "json"}}],
+            "pipeline": {"graph_handoff": True, "memory_budget_mb": 512},
+        }))
+
+        with patch.object(pipeline, "GraphHandoff") as handoff, \
+                patch.object(pipeline, "run_alignment", return_value=[]):
+            orchestrate(manifest, workdir=temp_dir / "work", skip_preflight=True)
+
+        handoff.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("fusion_format", ["turtle", "ntriples"])
+    def test_same_artifacts_with_and_without_handoff(self, temp_dir, fusion_format):
+        """Test that a run hands its graphs to fusion and produces the same artifacts."""
+        sources = [{"id": name, "fetch": {"type": "local", "path": str(_write_schema(temp_dir / f"{name}.json", name))},
+                    "convert": {"type": "json"}} for name in ("users", "orders")]
+        results = {}
+        for handoff in (True, False):
+            manifest = temp_dir / f"manifest-{handoff}.yaml"
+            manifest.write_text(yaml.safe_dump({
+                "name": "handoff", "matchers": ["LogMap"], "sources": sources,
+                "pipeline": {"graph_handoff": handoff, "fusion_format": fusion_format},
+            }))
+            workdir = temp_dir / f"work-{handoff}"
+            with patch.object(pipeline, "run_alignment", return_value=[]):
+                results[handoff] = orchestrate(manifest, workdir=workdir, skip_preflight=True)
+
+        fusion = [u for u in json.loads((temp_dir / "work-True" / "run_metrics.json").read_text())["units"]
+                  if u["stage"] == "fusion"][0]
+        # Streaming fusion bounds memory, so graphs are not held for it
+        assert fusion["extra"].get("graphs_handed_off", 0) == (0 if fusion_format == "ntriples" else 2)
+        assert all(path.exists() for path in results[True].converted.values())
+        fmt = "turtle" if fusion_format == "turtle" else "nt"
+        assert isomorphic(Graph().parse(results[True].merged_graph, format=fmt),
+                          Graph().parse(results[False].merged_graph, format=fmt))
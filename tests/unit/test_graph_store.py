@@ -0,0 +1,211 @@
+"""
+Unit tests for memory-budgeted graphs.
+
+Tests cover:
+- Plain graphs without a budget, spilling graphs with one
+- Term round trips, removal, length and namespaces after a spill
+- Temporary database cleanup on close
+- Streaming deduplication moving its digests to disk
+- Converters and fusion producing identical output under a tiny budget
+- A pipeline run with pipeline.memory_budget_mb
+"""
+
+import gc
+import json
+from unittest.mock import patch
+
+import pytest
+import yaml
+from rdflib import OWL, RDF, RDFS, XSD, BNode, Graph, Literal, Namespace, URIRef
+from rdflib.compare import isomorphic
+
+from graph_mesh_core.graph_store import (
+    MemoryBudget,
+    SQLiteStore,
+    SpillingStore,
+    active_budget,
+    is_spilled,
+    new_graph,
+)
+from graph_mesh_ingest.json_to_owl import convert_jsonschema_to_owl
+from graph_mesh_orchestrator import pipeline
+from graph_mesh_orchestrator.pipeline import fuse_graphs, orchestrate
+from graph_mesh_orchestrator.streaming_fusion import StatementDeduplicator
+
+EX = Namespace("http://example.org/")
+
+
+def _tiny_budget(temp_dir, max_triples=5):
+    # limit_mb is whole megabytes, so size the triple estimate to get a small threshold
+    return MemoryBudget(limit_mb=1, spill_dir=str(temp_dir / "spill"), bytes_per_triple=1024 * 1024 // max_triples)
+
+
+def _populate(graph):
+    graph.bind("ex", EX)
+    node = BNode()
+    graph.add((EX.Order, RDF.type, OWL.Class))
+    graph.add((EX.Order, RDFS.label, Literal("Order", lang="en")))
+    graph.add((EX.Order, RDFS.comment, Literal('A "quoted"\ttab\nnewline')))
+    graph.add((EX.total, RDFS.range, XSD.decimal))
+    graph.add((EX.total, EX.default, Literal("1.50", datatype=XSD.decimal)))
+    graph.add((EX.Order, RDFS.subClassOf, node))
+    graph.add((node, OWL.onProperty, EX.total))
+    return graph
+
+
+def _write_schema(path, title):
+    path.write_text(json.dumps({"title": title, "type": "object",
+                                "properties": {"id": {"type": "string"}, "name": {"type": "string"}}}))
+    return path
+
+
+class TestNewGraph:
+    """Test graph creation under a memory budget."""
+
+    @pytest.mark.unit
+    def test_plain_graph_without_budget(self):
+        """Test that no budget means rdflib's default in-memory store."""
+        graph = new_graph()
+
+        assert active_budget() is None
+        assert not isinstance(graph.store, SpillingStore)
+        assert not is_spilled(graph)
+
+    @pytest.mark.unit
+    def test_budget_activation(self, temp_dir):
+        """Test that an active budget applies to new graphs only inside its block."""
+        budget = _tiny_budget(temp_dir)
+
+        with budget.activate():
+            assert active_budget() is budget
+            graph = new_graph(identifier=EX.graph)
+
+        assert isinstance(graph.store, SpillingStore)
+        assert graph.store.max_triples == 5
+        assert graph.identifier == EX.graph
+        assert active_budget() is None
+
+    @pytest.mark.unit
+    def test_max_triples(self):
+        """Test the triple threshold derived from the budget."""
+        assert MemoryBudget(limit_mb=2048).max_triples == 2048 * 1024
+        assert MemoryBudget(limit_mb=1, bytes_per_triple=10**9).max_triples == 1
+
+
+class TestSpilling:
+    """Test graphs moving to disk."""
+
+    @pytest.mark.unit
+    def test_spills_past_threshold(self, temp_dir):
+        """Test that a graph stays in memory up to the threshold, then spills."""
+        graph = new_graph(budget=_tiny_budget(temp_dir))
+        for i in range(5):
+            graph.add((EX[f"c{i}"], RDF.type, OWL.Class))
+        assert not is_spilled(graph)
+
+        graph.add((EX.c5, RDF.type, OWL.Class))
+
+        assert is_spilled(graph)
+        assert len(graph) == 6
+        assert list((temp_dir / "spill").iterdir())
+        graph.close()
+
+    @pytest.mark.unit
+    def test_spilled_graph_matches_memory_graph(self, temp_dir):
+        """Test that terms, patterns and serialization survive the spill."""
+        spilled = _populate(new_graph(budget=_tiny_budget(temp_dir, max_triples=2)))
+        reference = _populate(Graph())
+
+        assert is_spilled(spilled)
+        assert isomorphic(spilled, reference)
+        assert spilled.value(EX.Order, RDFS.label) == Literal("Order", lang="en")
+        assert spilled.value(EX.total, EX.default) == Literal("1.50", datatype=XSD.decimal)
+        assert set(spilled.subjects(RDF.type, OWL.Class)) == {EX.Order}
+        assert dict(spilled.namespaces())["ex"] == URIRef(EX)
+        assert isomorphic(Graph().parse(data=spilled.serialize(format="turtle"), format="turtle"), reference)
+
+    @pytest.mark.unit
+    def test_remove_and_len(self, temp_dir):
+        """Test removal by pattern on a spilled graph."""
+        graph = _populate(new_graph(budget=_tiny_budget(temp_dir, max_triples=2)))
+
+        graph.remove((EX.Order, None, None))
+        graph.add((EX.total, RDF.type, OWL.DatatypeProperty))
+        graph.add((EX.total, RDF.type, OWL.DatatypeProperty))
+
+        assert len(graph) == 4
+        assert (EX.Order, RDF.type, OWL.Class) not in graph
+        assert (EX.total, RDF.type, OWL.DatatypeProperty) in graph
+
+    @pytest.mark.unit
+    def test_close_removes_database(self, temp_dir):
+        """Test that closing a disk store deletes its temporary directory."""
+        store = SQLiteStore(temp_dir)
+        store.add((EX.a, EX.b, EX.c))
+
+        assert len(store) == 1
+        store.close()
+        assert not store.path.exists()
+
+
+class TestDeduplicatorSpill:
+    """Test streaming deduplication under a memory limit."""
+
+    @pytest.mark.unit
+    def test_moves_digests_to_disk(self, temp_dir):
+        """Test that the digest set moves to disk and still rejects duplicates."""
+        dedupe = StatementDeduplicator(spill_dir=temp_dir, memory_limit_bytes=800)
+        statements = [f"<urn:s{i}> <urn:p> <urn:o> ." for i in range(20)]
+
+        assert all(dedupe.add(statement) for statement in statements)
+        assert dedupe.mode == "disk"
+        assert not any(dedupe.add(statement) for statement in statements)
+        dedupe.close()
+
+    @pytest.mark.unit
+    def test_limit_from_active_budget(self, temp_dir):
+        """Test that the active budget sets the default limit."""
+        with MemoryBudget(limit_mb=1).activate():
+            dedupe = StatementDeduplicator(spill_dir=temp_dir)
+
+        assert dedupe._max_digests == 1024 * 1024 // 80
+        dedupe.close()
+
+
+class TestBudgetedPipeline:
+    """Test conversion, fusion and runs under a memory budget."""
+
+    @pytest.mark.unit
+    def test_converter_and_fusion_output_unchanged(self, temp_dir):
+        """Test that spilled graphs produce the same converted and fused output."""
+        schema = _write_schema(temp_dir / "users.json", "Users")
+        meta = _populate(Graph())
+
+        convert_jsonschema_to_owl(str(schema), str(temp_dir / "plain.owl"))
+        fuse_graphs([temp_dir / "plain.owl"], meta, temp_dir / "plain.ttl")
+        with _tiny_budget(temp_dir).activate():
+            convert_jsonschema_to_owl(str(schema), str(temp_dir / "spilled.owl"))
+            fuse_graphs([temp_dir / "spilled.owl"], meta, temp_dir / "spilled.ttl")
+
+        for plain, spilled in (("plain.owl", "spilled.owl"), ("plain.ttl", "spilled.ttl")):
+            assert isomorphic(Graph().parse(temp_dir / plain), Graph().parse(temp_dir / spilled))
+        # rdflib graphs and their namespace managers form reference cycles
+        gc.collect()
+        assert not list((temp_dir / "spill").iterdir())
+
+    @pytest.mark.unit
+    def test_orchestrate_with_budget(self, temp_dir):
+        """Test that a run with pipeline.memory_budget_mb completes."""
+        schema = _write_schema(temp_dir / "users.json", "Users")
+        manifest = temp_dir / "manifest.yaml"
+        manifest.write_text(yaml.safe_dump({
+            "name": "budgeted", "matchers": ["LogMap"],
+            "pipeline": {"memory_budget_mb": 1},
+            "sources": [{"id": "users", "fetch": {"type": "local", "path": str(schema)},
+                         "convert": {"type": "json"}}],
+        }))
+
+        with patch.object(pipeline, "run_alignment", return_value=[]):
+            artifacts = orchestrate(manifest, workdir=temp_dir / "work", skip_preflight=True)
+
+        assert len(Graph().parse(artifacts.merged_graph)) > 0
@@ -0,0 +1,213 @@
+"""
+Unit tests for stage hooks.
+
+Tests cover:
+- Registering callbacks per event, by decorator and from hook objects
+- Loading hooks from import targets
+- Failing callbacks never failing the run
+- before_stage/after_stage, on_source and on_matcher_result during orchestrate()
+- StageProfiler pstats output
+"""
+
+import json
+import pstats
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from graph_mesh_orchestrator import pipeline
+from graph_mesh_orchestrator.errors import PipelineConfigurationError
+from graph_mesh_orchestrator.hooks import HookEvent, HookRegistry, StageProfiler, load_hooks
+from graph_mesh_orchestrator.models import PipelineCheckpoint, PipelineState
+from graph_mesh_orchestrator.pipeline import orchestrate
+
+
+@dataclass
+class StubMatcher:
+    """Matcher stub that writes a one-row SSSOM file."""
+
+    name: str = "LogMap"
+    output_filename: str = "stub.sssom.tsv"
+
+    def align(self, source_ontology: Path, target_ontology: Path, output_dir: Path) -> Path:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        mapping = output_dir / self.output_filename
+        mapping.write_text("# curie_map: {}\nsubject_id\tobject_id\nex:A\tex:B\n")
+        return mapping
+
+
+class RecordingHook:
+    """Hook object recording every event it receives."""
+
+    instances = []
+
+    def __init__(self):
+        self.events = []
+        RecordingHook.instances.append(self)
+
+    def before_stage(self, event):
+        self.events.append(("before_stage", event.stage, event.source_id))
+
+    def after_stage(self, event):
+        self.events.append(("after_stage", event.stage, event.source_id))
+
+
+def _checkpoint(workdir):
+    return PipelineCheckpoint(manifest_path="m.yaml", workdir=str(workdir), state=PipelineState.PENDING,
+                              current_stage="initialization", sources={}, timestamp="")
+
+
+@pytest.fixture
+def manifest(temp_dir):
+    sources = []
+    for source_id in ("users", "orders"):
+        schema = temp_dir / f"{source_id}.json"
+        schema.write_text(json.dumps({"title": source_id, "type": "object",
+                                      "properties": {"id": {"type": "string"}}}))
+        sources.append({"id": source_id, "fetch": {"type": "local", "path": str(schema)},
+                        "convert": {"type": "json"}})
+    manifest_path = temp_dir / "manifest.yaml"
+    manifest_path.write_text(yaml.safe_dump({"name": "hooked", "matchers": ["LogMap"], "sources": sources}))
+    return manifest_path
+
+
+class TestHookRegistry:
+    """Test callback registration and dispatch."""
+
+    @pytest.mark.unit
+    def test_decorators_and_emit(self, temp_dir):
+        """Test that callbacks registered by decorator receive their events."""
+        hooks = HookRegistry()
+        seen = []
+
+        @hooks.on_source
+        def record(event):
+            seen.append(event.source_id)
+
+        hooks.emit(HookEvent("on_source", "alignment", _checkpoint(temp_dir), temp_dir, source_id="users"))
+        hooks.emit(HookEvent("after_stage", "fusion", _checkpoint(temp_dir), temp_dir))
+
+        assert seen == ["users"]
+        assert len(hooks) == 1
+
+    @pytest.mark.unit
+    def test_unknown_event(self):
+        """Test that registering for an unknown event fails."""
+        with pytest.raises(PipelineConfigurationError, match="Unknown hook event"):
+            HookRegistry().register("on_everything", print)
+
+    @pytest.mark.unit
+    def test_stage_context_reports_error(self, temp_dir):
+        """Test that after_stage runs with the error when the stage fails."""
+        hook = RecordingHook()
+        hooks = HookRegistry()
+        hooks.add(hook)
+        errors = []
+        hooks.after_stage(lambda event: errors.append(event.error))
+
+        with pytest.raises(RuntimeError):
+            with hooks.stage("fusion", _checkpoint(temp_dir), temp_dir):
+                raise RuntimeError("disk full")
+
+        assert hook.events == [("before_stage", "fusion", None), ("after_stage", "fusion", None)]
+        assert isinstance(errors[0], RuntimeError)
+
+    @pytest.mark.unit
+    def test_failing_callback_ignored(self, temp_dir):
+        """Test that an exception in a callback does not propagate."""
+        hooks = HookRegistry()
+        finished = []
+        hooks.before_stage(lambda event: 1 / 0)
+        hooks.after_stage(finished.append)
+
+        with hooks.stage("ingest", _checkpoint(temp_dir), temp_dir, source_id="users"):
+            pass
+
+        assert [(e.event, e.source_id) for e in finished] == [("after_stage", "users")]
+
+    @pytest.mark.unit
+    def test_load_hooks(self):
+        """Test that import targets naming a hook class are instantiated."""
+        registry = load_hooks(["tests.unit.test_hooks:RecordingHook"])
+
+        assert len(registry.callbacks("before_stage")) == 1
+        with pytest.raises(PipelineConfigurationError, match="Cannot load hook"):
+            load_hooks(["no_such_module:Hook"])
+        with pytest.raises(PipelineConfigurationError, match="defines none"):
+            load_hooks(["json:JSONDecoder"])
+
+
+class TestOrchestrateHooks:
+    """Test hooks invoked by orchestrate()."""
+
+    @pytest.mark.unit
+    def test_stage_source_and_matcher_events(self, temp_dir, manifest):
+        """Test the callbacks a run emits and what they carry."""
+        hooks = HookRegistry()
+        events = []
+        for name in ("before_stage", "after_stage", "on_source", "on_matcher_result"):
+            hooks.register(name, events.append)
+
+        with patch.dict(pipeline.MATCHER_REGISTRY, {"LogMap": StubMatcher()}):
+            artifacts = orchestrate(manifest, workdir=temp_dir / "work", skip_preflight=True, hooks=hooks)
+
+        stages = [(e.event, e.stage) for e in events if e.source_id is None]
+        assert stages == [
+            ("before_stage", "meta_ontology"), ("after_stage", "meta_ontology"),
+            ("before_stage", "sources"), ("after_stage", "sources"),
+            ("before_stage", "fusion"), ("after_stage", "fusion"),
+        ]
+        after = [e for e in events if e.event == "after_stage"]
+        assert all(e.wall_seconds is not None and e.error is None for e in after)
+        assert after[-1].artifacts["merged_graph"] == artifacts.merged_graph
+
+        sources = {e.source_id: e for e in events if e.event == "on_source"}
+        assert set(sources) == {"users", "orders"}
+        assert sources["users"].artifacts["converted"] == artifacts.converted["users"]
+        assert sources["users"].artifacts["mappings"] == artifacts.mappings["users"]
+
+        results = [e for e in events if e.event == "on_matcher_result"]
+        assert sorted(e.source_id for e in results) == ["orders", "users"]
+        assert all(e.matcher == "LogMap" and e.artifacts["mapping"].exists() for e in results)
+        assert all(e.metrics.stage == "matcher" for e in results)
+
+    @pytest.mark.unit
+    def test_manifest_hooks(self, temp_dir, manifest):
+        """Test that pipeline.hooks entries are loaded for the run."""
+        config = yaml.safe_load(manifest.read_text())
+        config["pipeline"] = {"hooks": ["tests.unit.test_hooks:RecordingHook"]}
+        manifest.write_text(yaml.safe_dump(config))
+
+        with patch.object(pipeline, "run_alignment", return_value=[]):
+            orchestrate(manifest, workdir=temp_dir / "work", skip_preflight=True)
+
+        hook = RecordingHook.instances[-1]
+        assert ("after_stage", "ingest", "users") in hook.events
+
+
+class TestStageProfiler:
+    """Test the cProfile stage profiler."""
+
+    @pytest.mark.unit
+    def test_unknown_stage(self, temp_dir):
+        """Test that only known stages can be profiled."""
+        with pytest.raises(PipelineConfigurationError, match="unknown stage"):
+            StageProfiler("ingestion", temp_dir)
+
+    @pytest.mark.unit
+    def test_profile_stage(self, temp_dir, manifest):
+        """Test that only the chosen stage is profiled, per source and merged."""
+        workdir = temp_dir / "work"
+
+        with patch.object(pipeline, "run_alignment", return_value=[]):
+            orchestrate(manifest, workdir=workdir, skip_preflight=True, profile_stage="ingest")
+
+        profiles = workdir / "profiles"
+        assert sorted(p.name for p in profiles.iterdir()) == [
+            "ingest-orders.pstats", "ingest-users.pstats", "ingest.pstats"]
+        functions = {func for _, _, func in pstats.Stats(str(profiles / "ingest.pstats")).stats}
+        assert "run_ingest" in functions
+        assert "fuse_graphs" not in functions
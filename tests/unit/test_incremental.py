@@ -0,0 +1,173 @@
+"""
+Unit tests for incremental pipeline re-runs.
+
+Tests cover:
+- Source fingerprints over configuration and fetched files
+- Part reuse and stale-part removal in incremental fusion
+- Incremental orchestration re-ingesting only changed sources
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+from rdflib import Graph, Namespace
+from rdflib.namespace import OWL, RDF
+
+from graph_mesh_orchestrator import pipeline, streaming_fusion
+from graph_mesh_orchestrator.models import SourceConfig
+from graph_mesh_orchestrator.pipeline import load_checkpoint, orchestrate, source_fingerprint
+from graph_mesh_orchestrator.streaming_fusion import incremental_fuse_graphs
+
+EX = Namespace("http://example.org/")
+
+
+def _write_graph(path: Path, *classes: str) -> Path:
+    graph = Graph()
+    for name in classes:
+        graph.add((EX[name], RDF.type, OWL.Class))
+    graph.serialize(destination=str(path), format="turtle")
+    return path
+
+
+def _write_schema(path: Path, *properties: str) -> Path:
+    path.write_text(json.dumps({
+        "title": path.stem.capitalize(),
+        "type": "object",
+        "properties": {name: {"type": "string"} for name in properties},
+    }))
+    return path
+
+
+def _source(path: Path, source_id: str = "users", **convert) -> SourceConfig:
+    return SourceConfig(
+        id=source_id,
+        fetch={"type": "local", "path": str(path)},
+        convert={"type": "json", **convert},
+    )
+
+
+class TestSourceFingerprint:
+    """Test source fingerprints."""
+
+    @pytest.mark.unit
+    def test_stable_for_unchanged_inputs(self, temp_dir):
+        """Test that the same config and bytes give the same fingerprint."""
+        path = _write_schema(temp_dir / "users.json", "id")
+
+        assert source_fingerprint(_source(path), path) == source_fingerprint(_source(path), path)
+
+    @pytest.mark.unit
+    def test_changes_with_file_content(self, temp_dir):
+        """Test that editing a fetched file changes the fingerprint."""
+        path = _write_schema(temp_dir / "users.json", "id")
+        before = source_fingerprint(_source(path), path)
+        _write_schema(path, "id", "email")
+
+        assert source_fingerprint(_source(path), path) != before
+
+    @pytest.mark.unit
+    def test_changes_with_config(self, temp_dir):
+        """Test that changing conversion options changes the fingerprint."""
+        path = _write_schema(temp_dir / "users.json", "id")
+
+        assert (source_fingerprint(_source(path), path)
+                != source_fingerprint(_source(path, prefix="usr"), path))
+
+    @pytest.mark.unit
+    def test_directory_contents(self, temp_dir):
+        """Test that files inside a fetched directory are fingerprinted."""
+        repo = temp_dir / "repo"
+        repo.mkdir()
+        _write_schema(repo / "a.json", "id")
+        source = _source(repo)
+        before = source_fingerprint(source, [repo])
+        _write_schema(repo / "b.json", "id")
+
+        assert source_fingerprint(source, [repo]) != before
+
+
+class TestIncrementalFusion:
+    """Test part-based incremental fusion."""
+
+    @pytest.mark.unit
+    def test_only_changed_inputs_reserialized(self, temp_dir):
+        """Test that unchanged inputs reuse their parts."""
+        a = _write_graph(temp_dir / "a.ttl", "A")
+        b = _write_graph(temp_dir / "b.ttl", "B")
+        meta = Graph()
+        meta.add((EX.Meta, RDF.type, OWL.Class))
+        parts_dir = temp_dir / "parts"
+        output = temp_dir / "merged.nt"
+
+        incremental_fuse_graphs({"a": a, "b": b}, meta, "meta-key", parts_dir, output)
+        _write_graph(b, "B", "C")
+        with patch.object(streaming_fusion, "write_part", wraps=streaming_fusion.write_part) as write_part:
+            result = incremental_fuse_graphs({"a": a, "b": b}, meta, "meta-key", parts_dir, output)
+
+        assert [Path(c.args[0]) for c in write_part.call_args_list] == [b]
+        assert len(list(parts_dir.iterdir())) == 3
+        assert result.statement_count == 4
+        merged = Graph().parse(output, format="nt")
+        assert {s for s, _, _ in merged} == {EX.Meta, EX.A, EX.B, EX.C}
+
+    @pytest.mark.unit
+    def test_removed_input_dropped(self, temp_dir):
+        """Test that a source no longer present leaves the output."""
+        a = _write_graph(temp_dir / "a.ttl", "A")
+        b = _write_graph(temp_dir / "b.ttl", "B")
+        parts_dir = temp_dir / "parts"
+        output = temp_dir / "merged.nt"
+
+        incremental_fuse_graphs({"a": a, "b": b}, Graph(), "meta-key", parts_dir, output)
+        incremental_fuse_graphs({"a": a}, Graph(), "meta-key", parts_dir, output)
+
+        merged = Graph().parse(output, format="nt")
+        assert {s for s, _, _ in merged} == {EX.A}
+        assert len(list(parts_dir.iterdir())) == 2
+
+
+class TestIncrementalOrchestration:
+    """Test orchestrate(..., incremental=True)."""
+
+    @pytest.fixture
+    def manifest(self, temp_dir):
+        sources = []
+        for source_id in ("users", "orders"):
+            path = _write_schema(temp_dir / f"{source_id}.json", "id", "name")
+            sources.append({"id": source_id, "fetch": {"type": "local", "path": str(path)},
+                            "convert": {"type": "json"}})
+        manifest_path = temp_dir / "manifest.yaml"
+        manifest_path.write_text(yaml.safe_dump({
+            "name": "incremental",
+            "matchers": ["LogMap"],
+            "sources": sources,
+            "pipeline": {"fusion_format": "ntriples"},
+        }))
+        return manifest_path
+
+    def _run(self, manifest, workdir):
+        with patch.object(pipeline, "run_alignment", return_value=[]), \
+                patch.object(pipeline, "run_ingest", wraps=pipeline.run_ingest) as run_ingest:
+            artifacts = orchestrate(manifest, workdir=workdir, skip_preflight=True, incremental=True)
+        ingested = [call.args[0][0].id for call in run_ingest.call_args_list]
+        return artifacts, ingested
+
+    @pytest.mark.unit
+    def test_only_changed_source_reingested(self, temp_dir, manifest):
+        """Test that a re-run ingests only the source whose file changed."""
+        workdir = temp_dir / "work"
+
+        _, first = self._run(manifest, workdir)
+        _, unchanged = self._run(manifest, workdir)
+        _write_schema(temp_dir / "orders.json", "id", "name", "total")
+        artifacts, changed = self._run(manifest, workdir)
+
+        assert sorted(first) == ["orders", "users"]
+        assert unchanged == []
+        assert changed == ["orders"]
+        merged = artifacts.merged_graph.read_text()
+        assert "total" in merged
+        assert load_checkpoint(workdir).is_complete()
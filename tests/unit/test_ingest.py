@@ -10,16 +10,25 @@ Tests cover:
 - Error handling for missing converters
 - Error handling for missing fetched paths
 - Output directory creation
+- Conversion in worker processes with time and memory limits
+- Converter state isolation between conversions
 """
 
+import json
+import os
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 import pytest
 from rdflib import Graph
 
+from graph_mesh_core.telemetry import MetricsRecorder
+from graph_mesh_ingest.json_to_owl import JSONSchemaConverter, convert_jsonschema_to_owl
+from graph_mesh_orchestrator.errors import IngestError
 from graph_mesh_orchestrator.ingest import (
     CONVERTER_REGISTRY,
+    IngestPool,
     _get_identifier,
     _get_convert_config,
     run_ingest,
@@ -384,3 +393,105 @@ class TestIngestOutputVerification:
         from rdflib import OWL
         owl_classes = list(g.triples((None, None, OWL.Class)))
         assert len(owl_classes) > 0
+
+
+def _slow_converter(input_path, output_path):
+    time.sleep(60)
+
+
+def _greedy_converter(input_path, output_path):
+    return bytearray(8 * 1024 ** 3)
+
+
+def _crashing_converter(input_path, output_path):
+    os._exit(1)
+
+
+def _write_schema(directory: Path, name: str) -> Path:
+    path = directory / f"{name}.json"
+    path.write_text(json.dumps({"title": name.title(), "type": "object",
+                                "properties": {"id": {"type": "string"}}}))
+    return path
+
+
+@pytest.fixture
+def ingest_pool():
+    pool = IngestPool(max_workers=2, memory_limit_mb=1024, timeout_seconds=5)
+    yield pool
+    pool.shutdown()
+
+
+class TestIngestPool:
+    """Test conversion in worker processes."""
+
+    @pytest.mark.unit
+    def test_sources_converted_in_workers(self, temp_dir, ingest_pool):
+        """Test that sources are converted by worker processes."""
+        sources = [{"id": name, "convert": {"type": "json"}} for name in ("a", "b", "c")]
+        fetched = {name: str(_write_schema(temp_dir, name)) for name in ("a", "b", "c")}
+
+        recorder = MetricsRecorder()
+        with recorder.measure("ingest"):
+            results = run_ingest(sources, fetched, temp_dir / "artifacts", pool=ingest_pool)
+
+        assert sorted(results) == ["a", "b", "c"]
+        assert all(path.exists() for path in results.values())
+        worker_pid = recorder.units[0].extra["worker_pid"]
+        assert worker_pid != os.getpid()
+
+    @pytest.mark.unit
+    def test_time_limit(self, temp_dir, ingest_pool):
+        """Test that a conversion over its time limit fails and the pool stays usable."""
+        schema = _write_schema(temp_dir, "slow")
+        with pytest.raises(IngestError, match="time limit"):
+            ingest_pool.convert("slow", _slow_converter, str(schema), temp_dir / "slow.owl", "slow")
+
+        ingest_pool.convert("json", convert_jsonschema_to_owl, str(schema), temp_dir / "ok.owl", "ok")
+        assert (temp_dir / "ok.owl").exists()
+
+    @pytest.mark.unit
+    def test_memory_limit(self, temp_dir, ingest_pool):
+        """Test that a conversion over its memory limit fails."""
+        schema = _write_schema(temp_dir, "greedy")
+        with pytest.raises(IngestError, match="memory limit"):
+            ingest_pool.convert("greedy", _greedy_converter, str(schema), temp_dir / "greedy.owl", "greedy")
+
+    @pytest.mark.unit
+    def test_dead_worker_replaced(self, temp_dir, ingest_pool):
+        """Test that a crashed worker fails only its own conversion."""
+        schema = _write_schema(temp_dir, "crash")
+        with pytest.raises(IngestError, match="died"):
+            ingest_pool.convert("crash", _crashing_converter, str(schema), temp_dir / "crash.owl", "crash")
+
+        ingest_pool.convert("json", convert_jsonschema_to_owl, str(schema), temp_dir / "ok.owl", "ok")
+        assert (temp_dir / "ok.owl").exists()
+
+    @pytest.mark.unit
+    def test_unpicklable_converter_runs_in_process(self, temp_dir, ingest_pool):
+        """Test that converters that cannot be sent to a worker still run."""
+        schema = _write_schema(temp_dir, "local")
+        output = temp_dir / "local.owl"
+
+        ingest_pool.convert("custom", lambda src, out: Path(out).write_text("x"), str(schema), output, "local")
+
+        assert output.read_text() == "x"
+
+
+class TestConverterStateIsolation:
+    """Test that converter instances can be reused."""
+
+    @pytest.mark.unit
+    def test_definitions_do_not_leak(self, temp_dir):
+        """Test that a second conversion does not see the first one's definitions."""
+        first = temp_dir / "first.json"
+        first.write_text(json.dumps({"title": "First", "type": "object",
+                                     "definitions": {"Only": {"type": "object"}}}))
+        second = _write_schema(temp_dir, "second")
+        converter = JSONSchemaConverter()
+
+        converter.convert(str(first), str(temp_dir / "first.owl"))
+        converter.convert(str(second), str(temp_dir / "second.owl"))
+
+        assert converter.definitions == {}
+        assert converter.processed_refs == set()
+        assert "Only" not in (temp_dir / "second.owl").read_text()
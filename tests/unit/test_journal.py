@@ -0,0 +1,216 @@
+"""
+Unit tests for the checkpoint journal.
+
+Tests cover:
+- Event replay on load
+- Snapshot reset and compaction
+- Torn journal lines, repaired under the journal lock
+- Concurrent appends from threads and separate journal instances
+- save_checkpoint / load_checkpoint integration
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from graph_mesh_orchestrator.journal import JOURNAL_NAME, CheckpointJournal
+from graph_mesh_orchestrator.models import PipelineCheckpoint, PipelineState, SourceState
+from graph_mesh_orchestrator.pipeline import load_checkpoint, save_checkpoint
+
+
+def _checkpoint(workdir, source_ids=("a", "b")):
+    return PipelineCheckpoint(
+        manifest_path="manifest.yaml",
+        workdir=str(workdir),
+        state=PipelineState.PENDING,
+        current_stage="initialization",
+        sources={sid: SourceState(source_id=sid) for sid in source_ids},
+        timestamp="2024-01-01T00:00:00",
+    )
+
+
+class TestReplay:
+    """Test that journaled events survive a reload."""
+
+    @pytest.mark.unit
+    def test_events_replayed_on_load(self, temp_dir):
+        """Test that pipeline and source updates are visible after reload."""
+        checkpoint = _checkpoint(temp_dir)
+        with CheckpointJournal(temp_dir) as journal:
+            journal.reset(checkpoint)
+            journal.record(checkpoint, state=PipelineState.FETCHING, current_stage="fetch")
+            journal.record_source(checkpoint, "a", fetched=True, fetch_path="/data/a.xsd")
+            journal.record_source(checkpoint, "b", fetched=True, fetch_paths=["/x", "/y"])
+
+        loaded = CheckpointJournal(temp_dir).load()
+
+        assert loaded == checkpoint
+        assert loaded.state == PipelineState.FETCHING
+        assert loaded.sources["a"].fetch_path == "/data/a.xsd"
+        assert loaded.sources["b"].fetch_paths == ["/x", "/y"]
+
+    @pytest.mark.unit
+    def test_snapshot_not_rewritten_per_event(self, temp_dir):
+        """Test that source transitions only append to the journal."""
+        checkpoint = _checkpoint(temp_dir)
+        with CheckpointJournal(temp_dir) as journal:
+            journal.reset(checkpoint)
+            before = journal.snapshot_path.read_text()
+            journal.record_source(checkpoint, "a", fetched=True)
+
+            assert journal.snapshot_path.read_text() == before
+            assert len(journal.journal_path.read_text().splitlines()) == 1
+
+    @pytest.mark.unit
+    def test_missing_snapshot(self, temp_dir):
+        """Test that a workdir without a checkpoint loads as None."""
+        assert CheckpointJournal(temp_dir).load() is None
+
+    @pytest.mark.unit
+    def test_torn_line_skipped(self, temp_dir):
+        """Test that a partially written final event does not break replay."""
+        checkpoint = _checkpoint(temp_dir)
+        with CheckpointJournal(temp_dir) as journal:
+            journal.reset(checkpoint)
+            journal.record_source(checkpoint, "a", fetched=True)
+        with open(temp_dir / JOURNAL_NAME, "a") as f:
+            f.write('{"type":"source","source_id":"b","fie')
+
+        with CheckpointJournal(temp_dir) as journal:
+            journal.record_source(checkpoint, "b", ingested=True)
+        loaded = CheckpointJournal(temp_dir).load()
+
+        assert loaded.sources["a"].fetched
+        assert loaded.sources["b"].ingested
+
+    @pytest.mark.unit
+    def test_torn_line_repaired_under_lock(self, temp_dir):
+        """Test that the torn-line repair is written while holding the journal flock."""
+        fcntl = pytest.importorskip("fcntl")
+        (temp_dir / JOURNAL_NAME).write_text('{"type":"source"')
+        calls = []
+        flock = fcntl.flock
+
+        def recording_flock(fd, operation):
+            calls.append("lock" if operation == fcntl.LOCK_EX else "unlock")
+            flock(fd, operation)
+
+        journal = CheckpointJournal(temp_dir)
+        repair = journal._repair_torn_line
+        with patch("graph_mesh_orchestrator.journal.fcntl.flock", side_effect=recording_flock), \
+                patch.object(journal, "_repair_torn_line", side_effect=lambda fd: (calls.append("repair"),
+                                                                                    repair(fd))):
+            with journal:
+                journal.record_source(_checkpoint(temp_dir), "a", fetched=True)
+                journal.record_source(_checkpoint(temp_dir), "b", fetched=True)
+
+        assert calls == ["lock", "repair", "unlock", "lock", "unlock"]
+        assert (temp_dir / JOURNAL_NAME).read_text().splitlines()[0] == '{"type":"source"'
+
+
+class TestCompaction:
+    """Test folding the journal into the snapshot."""
+
+    @pytest.mark.unit
+    def test_compaction_truncates_journal(self, temp_dir):
+        """Test that compaction preserves state and empties the journal."""
+        checkpoint = _checkpoint(temp_dir)
+        with CheckpointJournal(temp_dir, compact_every=0) as journal:
+            journal.reset(checkpoint)
+            journal.record_source(checkpoint, "a", aligned=True, mapping_paths=["m.tsv"])
+            journal.compact()
+
+            assert journal.journal_path.read_text() == ""
+        assert PipelineCheckpoint.from_file(temp_dir / "checkpoint.json") == checkpoint
+
+    @pytest.mark.unit
+    def test_periodic_compaction(self, temp_dir):
+        """Test that the journal is compacted after compact_every appends."""
+        checkpoint = _checkpoint(temp_dir)
+        with CheckpointJournal(temp_dir, compact_every=3) as journal:
+            journal.reset(checkpoint)
+            for stage in ("fetch", "ingest", "alignment", "fusion"):
+                journal.record(checkpoint, current_stage=stage)
+
+            assert len(journal.journal_path.read_text().splitlines()) == 1
+        assert CheckpointJournal(temp_dir).load().current_stage == "fusion"
+
+    @pytest.mark.unit
+    def test_compaction_keeps_other_writers_events(self, temp_dir):
+        """Test that compaction replays from disk, not from one writer's memory."""
+        checkpoint = _checkpoint(temp_dir)
+        first = CheckpointJournal(temp_dir, compact_every=0)
+        second = CheckpointJournal(temp_dir, compact_every=0)
+        first.reset(checkpoint)
+
+        second.record_source(_checkpoint(temp_dir), "b", fetched=True)
+        first.record_source(checkpoint, "a", fetched=True)
+        first.compact()
+        first.close()
+        second.close()
+
+        loaded = CheckpointJournal(temp_dir).load()
+        assert loaded.sources["a"].fetched
+        assert loaded.sources["b"].fetched
+
+
+class TestConcurrency:
+    """Test concurrent appends."""
+
+    @pytest.mark.unit
+    def test_concurrent_appends(self, temp_dir):
+        """Test that events from many threads and journal instances all land."""
+        source_ids = [f"s{i}" for i in range(16)]
+        checkpoint = _checkpoint(temp_dir, source_ids)
+        shared = CheckpointJournal(temp_dir, compact_every=7)
+        shared.reset(checkpoint)
+        lock = threading.Lock()
+
+        def worker(source_id, journal):
+            for stage in ("fetched", "ingested", "aligned"):
+                with lock:
+                    state = checkpoint.model_copy(deep=True)
+                journal.record_source(state, source_id, **{stage: True})
+
+        # Half the workers share one instance; the rest have their own
+        journals = [shared if i % 2 else CheckpointJournal(temp_dir, compact_every=5)
+                    for i in range(len(source_ids))]
+        threads = [threading.Thread(target=worker, args=(sid, j)) for sid, j in zip(source_ids, journals)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for journal in set(journals):
+            journal.close()
+
+        loaded = CheckpointJournal(temp_dir).load()
+        for source_id in source_ids:
+            state = loaded.sources[source_id]
+            assert state.fetched and state.ingested and state.aligned
+
+
+class TestPipelineIntegration:
+    """Test the pipeline checkpoint helpers."""
+
+    @pytest.mark.unit
+    def test_save_and_load_checkpoint(self, temp_dir):
+        """Test that save_checkpoint discards the journal and load replays it."""
+        checkpoint = _checkpoint(temp_dir)
+        with CheckpointJournal(temp_dir) as journal:
+            journal.reset(checkpoint)
+            journal.record_source(checkpoint, "a", fetched=True)
+
+        save_checkpoint(_checkpoint(temp_dir), temp_dir)
+
+        assert (temp_dir / JOURNAL_NAME).read_text() == ""
+        assert not load_checkpoint(temp_dir).sources["a"].fetched
+
+    @pytest.mark.unit
+    def test_to_file_is_atomic(self, temp_dir):
+        """Test that to_file leaves no temporary file behind."""
+        path = temp_dir / "checkpoint.json"
+        _checkpoint(temp_dir).to_file(path)
+
+        assert [p.name for p in temp_dir.iterdir()] == ["checkpoint.json"]
+        assert PipelineCheckpoint.from_file(path).state == PipelineState.PENDING
@@ -0,0 +1,180 @@
+"""
+Unit tests for deferred imports.
+
+Tests cover:
+- load_object, LazyModule and LazyCallable
+- Package exports resolved on first attribute access
+- Converter and meta-ontology provider discovery by name and entry point
+- Heavy libraries kept out of the CLI, plan and preflight import paths
+"""
+
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from graph_mesh_core.lazy import LazyCallable, LazyModule, lazy_exports, load_object
+from graph_mesh_core.meta_ontology_registry import MetaOntologyRegistry
+from graph_mesh_ingest.converter_base import ConverterRegistry
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+HEAVY = ("docker", "pandas", "xmlschema")
+
+
+def _modules_loaded_by(statement: str) -> set:
+    """Run ``statement`` in a fresh interpreter and return the top-level modules loaded."""
+    code = f"{statement}\nimport sys\nprint(' '.join(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=REPO_ROOT, check=True)
+    return set(result.stdout.split())
+
+
+class TestLazyHelpers:
+    """Test the deferred import helpers."""
+
+    @pytest.mark.unit
+    def test_load_object(self):
+        """Test module and module:attribute targets."""
+        assert load_object("os.path:join") is __import__("os").path.join
+        assert load_object("json").__name__ == "json"
+        with pytest.raises(AttributeError):
+            load_object("json:missing")
+
+    @pytest.mark.unit
+    def test_lazy_module(self):
+        """Test that attribute access reaches the real module."""
+        json_module = LazyModule("json")
+
+        assert json_module.dumps([1]) == "[1]"
+
+    @pytest.mark.unit
+    def test_lazy_callable_identity_and_pickle(self):
+        """Test that a lazy callable reports and pickles as its target."""
+        dumps = LazyCallable("json:dumps")
+
+        assert (dumps.__module__, dumps.__qualname__, dumps.__name__) == ("json", "dumps", "dumps")
+        assert dumps({"a": 1}) == '{"a": 1}'
+        assert pickle.loads(pickle.dumps(dumps)).target == "json:dumps"
+        with pytest.raises(ValueError):
+            LazyCallable("json")
+
+    @pytest.mark.unit
+    def test_lazy_exports(self):
+        """Test PEP 562 exports for a package."""
+        getattr_, dir_ = lazy_exports("graph_mesh_core", {"cache_key": ".artifact_cache"})
+
+        assert getattr_("cache_key") is load_object("graph_mesh_core.artifact_cache:cache_key")
+        assert "cache_key" in dir_()
+        with pytest.raises(AttributeError):
+            getattr_("missing")
+
+    @pytest.mark.unit
+    def test_package_exports_still_importable(self):
+        """Test that public names of the packages resolve on access."""
+        from graph_mesh_aligner import MatcherPool, fuse_mappings
+        from graph_mesh_core import MetaOntologyRegistry as Registry
+        from graph_mesh_ingest import JSONSchemaConverter, get_converter
+        from graph_mesh_orchestrator import orchestrate
+
+        assert MatcherPool and fuse_mappings and orchestrate
+        assert Registry is MetaOntologyRegistry
+        assert isinstance(get_converter("json"), JSONSchemaConverter)
+
+
+class TestConverterDiscovery:
+    """Test converter lookup by schema type."""
+
+    @pytest.mark.unit
+    def test_builtin_types_listed(self):
+        """Test that built-in schema types are listed before any import."""
+        assert {"xsd", "xml", "json", "jsonschema", "csv", "tsv"} <= set(ConverterRegistry.list_converters())
+
+    @pytest.mark.unit
+    def test_entry_point_converter(self):
+        """Test that an entry point class is registered under its entry point name."""
+        with patch.dict(ConverterRegistry._converters), \
+                patch.object(ConverterRegistry, "_targets",
+                             {"yaml-schema": "graph_mesh_ingest.json_to_owl:JSONSchemaConverter"}):
+            converter_class = ConverterRegistry.get_converter("yaml-schema")
+
+            assert converter_class.__name__ == "JSONSchemaConverter"
+            assert "yaml-schema" in ConverterRegistry.list_converters()
+
+    @pytest.mark.unit
+    def test_broken_entry_point(self):
+        """Test that an unimportable converter is reported as missing."""
+        with patch.object(ConverterRegistry, "_targets", {"broken": "no_such_module:Converter"}):
+            assert ConverterRegistry.get_converter("broken") is None
+
+
+class TestProviderDiscovery:
+    """Test meta-ontology provider lookup by name."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_registry(self):
+        MetaOntologyRegistry.reset()
+        yield
+        MetaOntologyRegistry.reset()
+
+    @pytest.mark.unit
+    def test_listed_without_import(self):
+        """Test that listing providers records names only."""
+        assert MetaOntologyRegistry.list_providers() == ["composite", "custom", "fibo", "generic"]
+        assert MetaOntologyRegistry._providers == {}
+
+    @pytest.mark.unit
+    def test_entry_point_provider(self):
+        """Test that providers installed through entry points can be created."""
+        target = "graph_mesh_core.providers.generic:GenericMetaOntology"
+        with patch("graph_mesh_core.meta_ontology_registry.entry_point_targets",
+                   return_value={"plugin": target, "generic": "elsewhere:Other"}):
+            provider = MetaOntologyRegistry.create({"type": "plugin"})
+
+        assert type(provider).__name__ == "GenericMetaOntology"
+        assert MetaOntologyRegistry.get_provider_class("generic") is type(provider)
+
+    @pytest.mark.unit
+    def test_unloadable_provider_dropped(self):
+        """Test that a provider whose module fails to import is unregistered."""
+        with patch("graph_mesh_core.meta_ontology_registry.entry_point_targets",
+                   return_value={"broken": "no_such_module:Provider"}):
+            assert MetaOntologyRegistry.is_registered("broken")
+            with pytest.raises(ValueError, match="Unknown meta-ontology provider"):
+                MetaOntologyRegistry.create({"type": "broken"})
+
+        assert not MetaOntologyRegistry.is_registered("broken")
+
+
+class TestImportFootprint:
+    """Test that light entry points stay light."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("statement", [
+        "import graph_mesh_core, graph_mesh_ingest, graph_mesh_aligner, graph_mesh_orchestrator",
+        "import graph_mesh_orchestrator.cli",
+        "import graph_mesh_orchestrator.validation",
+        "import graph_mesh_orchestrator.planner",
+    ])
+    def test_no_heavy_libraries(self, statement):
+        """Test that docker, pandas and xmlschema are not imported."""
+        assert not _modules_loaded_by(statement).intersection(HEAVY)
+
+    @pytest.mark.unit
+    def test_package_roots_skip_rdflib(self):
+        """Test that package roots do not import rdflib."""
+        loaded = _modules_loaded_by("import graph_mesh_core, graph_mesh_ingest, graph_mesh_aligner")
+
+        assert "rdflib" not in loaded
+
+    @pytest.mark.unit
+    def test_converter_loaded_on_lookup(self):
+        """Test that looking up a converter imports only its module."""
+        loaded = _modules_loaded_by(
+            "from graph_mesh_ingest import ConverterRegistry; ConverterRegistry.get_converter('json')")
+
+        assert "rdflib" in loaded
+        assert "xmlschema" not in loaded
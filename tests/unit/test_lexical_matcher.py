@@ -0,0 +1,170 @@
+"""
+Unit tests for the native lexical matcher.
+
+Tests cover:
+- Label normalization (word splitting, synonyms, stemming)
+- Exact and close matches between classes and between properties
+- SSSOM output with CURIEs, readable by fusion
+- Registration in the pipeline's matcher registry and cache key options
+"""
+
+import asyncio
+
+import pytest
+
+from graph_mesh_aligner.fusion import load_sssom_mappings
+from graph_mesh_aligner.lexical import LexicalMatcher, normalize, split_words, stem
+from graph_mesh_aligner.matchers import alignment_cache_key
+from graph_mesh_orchestrator.models import PipelineManifest
+from graph_mesh_orchestrator.pipeline import MATCHER_REGISTRY, select_matchers
+
+SOURCE_TTL = """
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix src: <http://example.org/source#> .
+
+src:CustomerAddress a owl:Class .
+src:PaymentTxn a owl:Class ; rdfs:label "Payment transactions" .
+src:Widget a owl:Class .
+src:orderID a owl:DatatypeProperty .
+src:customer_address a owl:ObjectProperty .
+"""
+
+TARGET_TTL = """
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix meta: <http://example.org/meta#> .
+
+meta:Address a owl:Class ; rdfs:label "Address of a customer" .
+meta:Transaction a owl:Class ; skos:prefLabel "Payment transaction record" .
+meta:Party a owl:Class .
+meta:orderIdentifier a owl:DatatypeProperty .
+meta:hasAddress a owl:ObjectProperty .
+"""
+
+
+@pytest.fixture
+def ontologies(temp_dir):
+    source = temp_dir / "source.ttl"
+    target = temp_dir / "meta.ttl"
+    source.write_text(SOURCE_TTL)
+    target.write_text(TARGET_TTL)
+    return source, target
+
+
+def aligned(mapping_path):
+    return {(m.subject_id.split(":")[1], m.object_id.split(":")[1]): m
+            for m in load_sssom_mappings(mapping_path, "Lexical")}
+
+
+class TestNormalization:
+    """Test label normalization."""
+
+    @pytest.mark.unit
+    def test_split_words(self):
+        """Test splitting identifiers at case changes, digits and punctuation."""
+        assert split_words("XMLSchemaID_value2") == ["XML", "Schema", "ID", "value", "2"]
+        assert split_words("order-line item") == ["order", "line", "item"]
+
+    @pytest.mark.unit
+    def test_stem_conflates_variants(self):
+        """Test that inflected forms share a stem."""
+        assert stem("addresses") == stem("address")
+        assert stem("created") == stem("creation") == stem("create")
+        assert stem("status") == "status"
+
+    @pytest.mark.unit
+    def test_synonyms_and_stop_words(self):
+        """Test that abbreviations are expanded and stop words dropped."""
+        assert normalize("custID") == normalize("Customer identifier")
+        assert normalize("hasDateOfBirth") == ("date", "birth")
+        assert normalize("dob", {"dob": "date of birth"}) == ("date", "birth")
+
+
+class TestLexicalMatcher:
+    """Test aligning ontologies in-process."""
+
+    @pytest.mark.unit
+    @pytest.mark.matcher
+    def test_align_writes_sssom(self, temp_dir, ontologies):
+        """Test that exact and close matches are written as SSSOM."""
+        mapping_path = LexicalMatcher(threshold=0.5).align(*ontologies, temp_dir / "out")
+
+        assert mapping_path == temp_dir / "out" / "lexical.sssom.tsv"
+        mappings = aligned(mapping_path)
+        exact = mappings[("orderID", "orderIdentifier")]
+        assert exact.predicate_id == "skos:exactMatch"
+        assert exact.confidence == 1.0
+        close = mappings[("PaymentTxn", "Transaction")]
+        assert close.predicate_id == "skos:closeMatch"
+        assert 0.5 <= close.confidence < 1.0
+        # Word order does not matter for exact matches
+        assert mappings[("CustomerAddress", "Address")].predicate_id == "skos:exactMatch"
+
+    @pytest.mark.unit
+    @pytest.mark.matcher
+    def test_sssom_uses_ontology_prefixes(self, temp_dir, ontologies):
+        """Test that identifiers are CURIEs declared in the curie_map header."""
+        text = LexicalMatcher().align(*ontologies, temp_dir).read_text()
+
+        assert "#   src: http://example.org/source#" in text
+        assert "#   meta: http://example.org/meta#" in text
+        assert "src:orderID\torderID\tskos:exactMatch\tmeta:orderIdentifier" in text
+
+    @pytest.mark.unit
+    @pytest.mark.matcher
+    def test_classes_and_properties_kept_apart(self, temp_dir, ontologies):
+        """Test that a property never matches a class."""
+        mappings = aligned(LexicalMatcher(threshold=0.3).align(*ontologies, temp_dir))
+
+        assert ("customer_address", "Address") not in mappings
+        assert ("customer_address", "hasAddress") in mappings
+        assert not any(subject == "Widget" for subject, _ in mappings)
+
+    @pytest.mark.unit
+    @pytest.mark.matcher
+    def test_threshold_filters_close_matches(self, temp_dir, ontologies):
+        """Test that close matches below the threshold are dropped, exact ones kept."""
+        mappings = aligned(LexicalMatcher(threshold=0.99).align(*ontologies, temp_dir))
+
+        assert set(mappings) == {("orderID", "orderIdentifier"), ("CustomerAddress", "Address")}
+        assert all(m.predicate_id == "skos:exactMatch" for m in mappings.values())
+
+    @pytest.mark.unit
+    @pytest.mark.matcher
+    def test_align_async(self, temp_dir, ontologies):
+        """Test the asynchronous interface used by run_alignment_parallel."""
+        result = asyncio.run(LexicalMatcher().align_async(*ontologies, temp_dir))
+
+        assert result.success
+        assert result.mapping_path.exists()
+
+    @pytest.mark.unit
+    @pytest.mark.matcher
+    def test_options_change_cache_key(self, ontologies):
+        """Test that matcher settings are part of the alignment cache key."""
+        default = alignment_cache_key(LexicalMatcher(), *ontologies)
+
+        assert alignment_cache_key(LexicalMatcher(), *ontologies) == default
+        assert alignment_cache_key(LexicalMatcher(threshold=0.9), *ontologies) != default
+        assert alignment_cache_key(LexicalMatcher(synonyms={"po": "purchase order"}), *ontologies) != default
+
+
+class TestLexicalRegistration:
+    """Test using the lexical matcher from a manifest."""
+
+    @pytest.mark.unit
+    def test_manifest_selects_lexical(self):
+        """Test that "Lexical" is a valid manifest matcher backed by the native matcher."""
+        manifest = PipelineManifest(
+            name="lexical",
+            sources=[{"id": "s", "fetch": {"type": "local", "path": "s.json"}, "convert": {"type": "json"}}],
+            matchers=["Lexical"],
+            pipeline={"warm_matchers": True, "alignment_batch_size": 4},
+        )
+
+        matchers = select_matchers(manifest)
+
+        assert matchers == [MATCHER_REGISTRY["Lexical"]]
+        assert isinstance(matchers[0], LexicalMatcher)
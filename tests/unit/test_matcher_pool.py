@@ -0,0 +1,251 @@
+"""
+Unit tests for the shared matcher pool.
+
+Tests cover:
+- Bounded concurrency and statistics
+- Packing runs by CPU and memory requests, queueing, oversized requests
+- Matcher resource requests from the manifest
+- Process-wide default pool
+- run_alignment holding pool slots
+- Identical concurrent matcher runs executing once with a cache
+- Cache key locks
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+from graph_mesh_aligner.matchers import ContainerMatcher, run_alignment
+from graph_mesh_aligner.pool import MatcherPool, configure_matcher_pool, default_matcher_pool
+from graph_mesh_core.artifact_cache import ArtifactCache
+from graph_mesh_orchestrator import pipeline
+from graph_mesh_orchestrator.models import PipelineManifest
+from graph_mesh_orchestrator.pipeline import select_matchers
+
+
+@dataclass
+class SlowMatcher:
+    """Matcher stub that tracks how many runs overlap."""
+
+    name: str = "Slow"
+    output_filename: str = "slow.sssom.tsv"
+    delay: float = 0.05
+    calls: int = 0
+    active: int = 0
+    peak: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def align(self, source_ontology: Path, target_ontology: Path, output_dir: Path) -> Path:
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        mapping = output_dir / self.output_filename
+        mapping.write_text("subject_id\tobject_id\nex:A\tex:B\n")
+        with self.lock:
+            self.active -= 1
+        return mapping
+
+
+def _run_threads(target, count):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+class TestMatcherPool:
+    """Test pool slots."""
+
+    @pytest.mark.unit
+    def test_bounds_concurrency(self):
+        """Test that no more than max_concurrent slots are held at once."""
+        pool = MatcherPool(max_concurrent=2)
+        matcher = SlowMatcher()
+
+        def work(i):
+            with pool.slot(matcher.name):
+                matcher.align(Path("s"), Path("t"), Path("/tmp/graph-mesh-pool-test"))
+
+        _run_threads(work, 6)
+
+        assert matcher.peak <= 2
+        stats = pool.stats()
+        assert stats["runs"] == {"Slow": 6}
+        assert stats["peak_concurrent"] <= 2
+        assert stats["active"] == 0
+
+    @pytest.mark.unit
+    def test_invalid_size(self):
+        """Test that a pool needs at least one slot."""
+        with pytest.raises(ValueError):
+            MatcherPool(max_concurrent=-1)
+
+    @pytest.mark.unit
+    def test_default_pool_is_shared(self):
+        """Test that the default pool is one instance until reconfigured."""
+        previous = default_matcher_pool()
+        try:
+            assert default_matcher_pool() is previous
+            configured = configure_matcher_pool(3)
+            assert default_matcher_pool() is configured
+            assert configured.max_concurrent == 3
+        finally:
+            configure_matcher_pool(previous.max_concurrent)
+
+
+class TestResourcePacking:
+    """Test packing matcher runs by their CPU and memory requests."""
+
+    @pytest.mark.unit
+    def test_packs_by_memory(self):
+        """Test that runs start only while their memory fits, the rest queue."""
+        pool = MatcherPool(max_concurrent=4, cpus=8, memory_mb=8192)
+        matcher = SlowMatcher()
+
+        def work(i):
+            with pool.slot(matcher.name, cpus=1, memory_mb=4096):
+                matcher.align(Path("s"), Path("t"), Path("/tmp/graph-mesh-pool-test"))
+
+        _run_threads(work, 5)
+
+        stats = pool.stats()
+        assert matcher.peak == 2
+        assert stats["peak_memory_mb"] == 8192
+        assert stats["peak_cpus"] == 2
+        assert stats["active"] == stats["queued"] == 0
+
+    @pytest.mark.unit
+    def test_small_runs_fill_gaps_without_starving_large(self):
+        """Test that small runs overtake a queued large run only max_bypass times."""
+        pool = MatcherPool(max_concurrent=4, cpus=4, memory_mb=8192, max_bypass=1)
+        started = []
+        release = threading.Event()
+
+        def run(name, memory_mb):
+            with pool.slot(name, memory_mb=memory_mb):
+                started.append(name)
+                release.wait(5)
+
+        holder = threading.Thread(target=run, args=("holder", 4096))
+        holder.start()
+        while not started:
+            time.sleep(0.005)
+        threads = [threading.Thread(target=run, args=("large", 8192))]
+        threads[0].start()
+        while pool.stats()["queued"] < 1:
+            time.sleep(0.005)
+        for name in ("small-1", "small-2"):
+            threads.append(threading.Thread(target=run, args=(name, 2048)))
+            threads[-1].start()
+            time.sleep(0.05)
+
+        assert started == ["holder", "small-1"]
+        release.set()
+        for thread in [holder, *threads]:
+            thread.join()
+        assert started.index("large") < started.index("small-2")
+
+    @pytest.mark.unit
+    def test_oversized_request_runs_alone(self):
+        """Test that a request larger than the pool is clamped instead of waiting forever."""
+        pool = MatcherPool(max_concurrent=2, cpus=2, memory_mb=4096)
+
+        with pool.slot("BERTMap", cpus=8, memory_mb=16384):
+            stats = pool.stats()
+
+        assert (stats["peak_cpus"], stats["peak_memory_mb"]) == (2, 4096)
+
+    @pytest.mark.unit
+    def test_manifest_requests_applied(self):
+        """Test that pipeline.matcher_resources configures copies of the registered matchers."""
+        manifest = PipelineManifest.model_validate({
+            "name": "resources", "matchers": ["LogMap", "BERTMap", "Unknown"],
+            "pipeline": {"matcher_resources": {"LogMap": {"cpus": 2, "memory_mb": 4096},
+                                               "BERTMap": {"memory_mb": 8192}}},
+            "sources": [{"id": "users", "fetch": {"type": "local", "path": "u.json"},
+                         "convert": {"type": "json"}}],
+        })
+
+        logmap, bertmap = select_matchers(manifest)
+
+        assert (logmap.cpus, logmap.memory_mb) == (2, 4096)
+        assert (bertmap.cpus, bertmap.memory_mb) == (None, 8192)
+        assert isinstance(logmap, ContainerMatcher)
+        assert pipeline.MATCHER_REGISTRY["LogMap"].memory_mb is None
+
+
+class TestPooledAlignment:
+    """Test run_alignment with a pool and a cache."""
+
+    @pytest.mark.unit
+    def test_run_alignment_uses_pool(self, temp_dir):
+        """Test that concurrent alignments share the pool's bound."""
+        pool = MatcherPool(max_concurrent=1)
+        matcher = SlowMatcher(delay=0.02)
+        for name in ("a", "b", "c"):
+            (temp_dir / f"{name}.owl").write_text(name)
+        (temp_dir / "meta.ttl").write_text("meta")
+
+        def work(i):
+            name = "abc"[i]
+            run_alignment([matcher], temp_dir / f"{name}.owl", temp_dir / "meta.ttl",
+                          temp_dir / "out" / name, pool=pool)
+
+        _run_threads(work, 3)
+
+        assert matcher.calls == 3
+        assert matcher.peak == 1
+
+    @pytest.mark.unit
+    def test_identical_runs_execute_once(self, temp_dir):
+        """Test that concurrent runs of the same inputs wait for one execution."""
+        cache = ArtifactCache(temp_dir / "cache")
+        matcher = SlowMatcher()
+        source = temp_dir / "source.owl"
+        target = temp_dir / "meta.ttl"
+        source.write_text("source")
+        target.write_text("meta")
+
+        results = {}
+
+        def work(i):
+            # Separate cache instances over one root share the key lock
+            results[i] = run_alignment([matcher], source, target, temp_dir / f"out{i}",
+                                       cache=ArtifactCache(cache.root))
+
+        _run_threads(work, 4)
+
+        assert matcher.calls == 1
+        assert all(paths[0].exists() for paths in results.values())
+
+
+class TestCacheKeyLock:
+    """Test ArtifactCache.lock."""
+
+    @pytest.mark.unit
+    def test_lock_serializes_and_cleans_up(self, temp_dir):
+        """Test that holders of one key run one at a time and the lock is released."""
+        from graph_mesh_core import artifact_cache
+
+        cache = ArtifactCache(temp_dir / "cache")
+        active = []
+        peak = []
+
+        def work(i):
+            with cache.lock("key"):
+                active.append(i)
+                peak.append(len(active))
+                time.sleep(0.01)
+                active.remove(i)
+
+        _run_threads(work, 4)
+
+        assert max(peak) == 1
+        assert not artifact_cache._key_locks
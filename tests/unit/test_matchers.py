@@ -9,8 +9,11 @@ Tests cover:
 - Error handling for Docker failures
 - DEFAULT_MATCHERS configuration
 - run_alignment orchestration
+- Container resource limits and sampled usage
+- Shared Docker session and cached image health
 """
 
+import time
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
 
@@ -23,6 +26,16 @@ from graph_mesh_aligner.matchers import (
     DEFAULT_MATCHERS,
     run_alignment,
 )
+from graph_mesh_core.docker_session import configure_docker_session
+from graph_mesh_core.telemetry import MetricsRecorder, measure
+
+
+@pytest.fixture(autouse=True)
+def docker_session():
+    """Give every test a fresh process-wide Docker session."""
+    session = configure_docker_session()
+    yield session
+    session.close()
 
 
 class TestAlignmentMatcherProtocol:
@@ -81,7 +94,7 @@ class TestContainerMatcher:
 
     @pytest.mark.unit
     @pytest.mark.matcher
-    @patch('graph_mesh_aligner.matchers.docker')
+    @patch('graph_mesh_core.docker_session.docker')
     def test_align_creates_output_directory(self, mock_docker, sample_ontology_file, temp_dir):
         """Test that align creates output directory if it doesn't exist."""
         # Setup mock
@@ -106,7 +119,7 @@ class TestContainerMatcher:
 
     @pytest.mark.unit
     @pytest.mark.matcher
-    @patch('graph_mesh_aligner.matchers.docker')
+    @patch('graph_mesh_core.docker_session.docker')
     def test_align_returns_mapping_path(self, mock_docker, sample_ontology_file, temp_dir):
         """Test that align returns the expected mapping file path."""
         # Setup mock
@@ -131,7 +144,7 @@ class TestContainerMatcher:
     @pytest.mark.unit
     @pytest.mark.matcher
     @pytest.mark.docker
-    @patch('graph_mesh_aligner.matchers.docker')
+    @patch('graph_mesh_core.docker_session.docker')
     def test_align_calls_docker_with_correct_params(self, mock_docker, sample_ontology_file, temp_dir):
         """Test that Docker is called with correct parameters."""
         # Setup mock
@@ -164,7 +177,7 @@ class TestContainerMatcher:
     @pytest.mark.unit
     @pytest.mark.matcher
     @pytest.mark.docker
-    @patch('graph_mesh_aligner.matchers.docker')
+    @patch('graph_mesh_core.docker_session.docker')
     def test_align_mounts_correct_volumes(self, mock_docker, sample_ontology_file, temp_dir):
         """Test that volumes are mounted correctly."""
         # Setup mock
@@ -205,7 +218,7 @@ class TestContainerMatcher:
     @pytest.mark.unit
     @pytest.mark.matcher
     @pytest.mark.docker
-    @patch('graph_mesh_aligner.matchers.docker')
+    @patch('graph_mesh_core.docker_session.docker')
     def test_align_passes_correct_command(self, mock_docker, sample_ontology_file, temp_dir):
         """Test that correct command is passed to container."""
         # Setup mock
@@ -239,7 +252,7 @@ class TestContainerMatcher:
     @pytest.mark.unit
     @pytest.mark.matcher
     @pytest.mark.docker
-    @patch('graph_mesh_aligner.matchers.docker')
+    @patch('graph_mesh_core.docker_session.docker')
     def test_align_handles_docker_exception(self, mock_docker, sample_ontology_file, temp_dir):
         """Test that Docker exceptions are handled and re-raised as RuntimeError."""
         # Setup mock to raise DockerException
@@ -263,9 +276,9 @@ class TestContainerMatcher:
     @pytest.mark.unit
     @pytest.mark.matcher
     @pytest.mark.docker
-    @patch('graph_mesh_aligner.matchers.docker')
-    def test_align_closes_docker_client(self, mock_docker, sample_ontology_file, temp_dir):
-        """Test that Docker client is closed after execution."""
+    @patch('graph_mesh_core.docker_session.docker')
+    def test_align_reuses_docker_client(self, mock_docker, sample_ontology_file, temp_dir):
+        """Test that alignments share one client and one image health check."""
         # Setup mock
         mock_client = MagicMock()
         mock_client.containers.run.return_value = b"Success"
@@ -277,20 +290,21 @@ class TestContainerMatcher:
             output_filename="test.sssom.tsv"
         )
 
-        source = sample_ontology_file
-        target = sample_ontology_file
-        output_dir = temp_dir / "output"
+        for name in ("a", "b"):
+            matcher.align(sample_ontology_file, sample_ontology_file, temp_dir / name)
 
-        matcher.align(source, target, output_dir)
-
-        # Verify client was closed
-        mock_client.close.assert_called_once()
+        # One connection and one image lookup; the client stays open for later runs
+        mock_docker.from_env.assert_called_once()
+        mock_client.images.get.assert_called_once_with("test/matcher:latest")
+        assert mock_client.containers.run.call_count == 2
+        mock_client.close.assert_not_called()
 
     @pytest.mark.unit
     @pytest.mark.matcher
     @pytest.mark.docker
-    @patch('graph_mesh_aligner.matchers.docker')
-    def test_align_handles_client_close_exception(self, mock_docker, sample_ontology_file, temp_dir):
+    @patch('graph_mesh_core.docker_session.docker')
+    def test_session_close_ignores_client_close_exception(self, mock_docker, docker_session,
+                                                          sample_ontology_file, temp_dir):
         """Test that exceptions during client.close() are silently ignored."""
         # Setup mock
         mock_client = MagicMock()
@@ -304,13 +318,34 @@ class TestContainerMatcher:
             output_filename="test.sssom.tsv"
         )
 
-        source = sample_ontology_file
-        target = sample_ontology_file
-        output_dir = temp_dir / "output"
+        result = matcher.align(sample_ontology_file, sample_ontology_file, temp_dir / "output")
+        assert result is not None
 
         # Should not raise even though close() fails
-        result = matcher.align(source, target, output_dir)
-        assert result is not None
+        docker_session.close()
+        mock_client.close.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.matcher
+    @pytest.mark.docker
+    @patch('graph_mesh_core.docker_session.docker')
+    def test_missing_image_fails_health_check(self, mock_docker, sample_ontology_file, temp_dir):
+        """Test that a missing image fails the health check without running a container."""
+        from docker.errors import ImageNotFound
+
+        mock_client = MagicMock()
+        mock_client.images.get.side_effect = ImageNotFound("missing")
+        mock_docker.from_env.return_value = mock_client
+
+        matcher = ContainerMatcher(
+            name="TestMatcher",
+            image="test/matcher:latest",
+            output_filename="test.sssom.tsv"
+        )
+
+        with pytest.raises(RuntimeError, match="Health check failed"):
+            matcher.align(sample_ontology_file, sample_ontology_file, temp_dir / "output")
+        mock_client.containers.run.assert_not_called()
 
 
 class TestDefaultMatchers:
@@ -494,7 +529,7 @@ class TestRunAlignment:
     @pytest.mark.unit
     @pytest.mark.matcher
     @pytest.mark.slow
-    @patch('graph_mesh_aligner.matchers.docker')
+    @patch('graph_mesh_core.docker_session.docker')
     def test_run_alignment_with_default_matchers(self, mock_docker, sample_ontology_file, temp_dir):
         """Test running alignment with DEFAULT_MATCHERS."""
         # Setup mock
@@ -515,3 +550,41 @@ class TestRunAlignment:
         expected_files = {"logmap.sssom.tsv", "aml.sssom.tsv", "bertmap.sssom.tsv"}
         actual_files = {r.name for r in results}
         assert actual_files == expected_files
+
+
+class TestContainerResources:
+    """Test resource limits and usage of matcher containers."""
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    @patch('graph_mesh_aligner.matchers.USAGE_SAMPLE_INTERVAL', 0.01)
+    @patch('graph_mesh_core.docker_session.docker')
+    def test_limits_and_usage(self, mock_docker, temp_dir):
+        """Test that the request becomes container limits and sampled usage is reported."""
+        stats = {"memory_stats": {"usage": 900 * 2**20, "max_usage": 1536 * 2**20},
+                 "cpu_stats": {"cpu_usage": {"total_usage": 4_500_000_000}}}
+        mock_client = MagicMock()
+        mock_client.containers.run.side_effect = lambda **kwargs: time.sleep(0.2) or b"Success"
+        mock_client.containers.get.return_value.stats.return_value = stats
+        mock_docker.from_env.return_value = mock_client
+        (temp_dir / "source.owl").write_text("source")
+        matcher = ContainerMatcher(name="LogMap", image="test/logmap:latest",
+                                   output_filename="logmap.sssom.tsv", cpus=2, memory_mb=4096)
+
+        with MetricsRecorder().activate(), measure("matcher", matcher="LogMap") as unit:
+            matcher.align(temp_dir / "source.owl", temp_dir / "source.owl", temp_dir / "output")
+
+        call_kwargs = mock_client.containers.run.call_args[1]
+        assert call_kwargs["nano_cpus"] == 2_000_000_000
+        assert call_kwargs["mem_limit"] == "4096m"
+        assert call_kwargs["name"].startswith("graph-mesh-logmap-")
+        mock_client.containers.get.assert_called_with(call_kwargs["name"])
+        assert unit.extra["container_peak_memory_bytes"] == 1536 * 2**20
+        assert unit.extra["container_cpu_seconds"] == 4.5
+
+    @pytest.mark.unit
+    def test_no_limits_by_default(self):
+        """Test that a matcher without a request runs its container unconstrained."""
+        assert DEFAULT_MATCHERS[0].resource_limits() == {}
+        assert ContainerMatcher(name="BERTMap", image="i", output_filename="o",
+                                memory_mb=8192).resource_limits() == {"mem_limit": "8192m"}
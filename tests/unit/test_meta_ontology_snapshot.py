@@ -0,0 +1,135 @@
+"""
+Unit tests for meta-ontology snapshots.
+
+Tests cover:
+- Snapshot round trips (triples, prefixes, provider data)
+- Stale and unreadable snapshots
+- SnapshotMetaOntology provider
+- Snapshot reuse in prepare_meta_ontology
+"""
+
+import pytest
+from rdflib import BNode, Literal, Namespace
+from rdflib.namespace import RDFS, XSD
+
+from graph_mesh_core.artifact_cache import ArtifactCache
+from graph_mesh_core.meta_ontology_snapshot import (
+    SnapshotMetaOntology,
+    load_snapshot,
+    save_snapshot,
+)
+from graph_mesh_core.providers.generic import GenericMetaOntology
+from graph_mesh_orchestrator.pipeline import prepare_meta_ontology
+
+EX = Namespace("http://example.org/")
+
+
+class CountingProvider(GenericMetaOntology):
+    """Generic provider that counts graph builds."""
+
+    def __init__(self):
+        super().__init__()
+        self.builds = 0
+
+    def build_graph(self):
+        self.builds += 1
+        return super().build_graph()
+
+
+class TestSnapshotRoundTrip:
+    """Test save_snapshot / load_snapshot."""
+
+    @pytest.mark.unit
+    def test_graph_and_provider_data_preserved(self, temp_dir):
+        """Test that a loaded snapshot matches what was saved."""
+        provider = GenericMetaOntology()
+        graph = provider.build_graph()
+        graph.bind("ex", EX)
+        node = BNode()
+        graph.add((node, RDFS.label, Literal("étiquette", lang="fr")))
+        graph.add((EX.thing, EX.size, Literal(3, datatype=XSD.integer)))
+
+        save_snapshot(provider, graph, temp_dir / "meta.snapshot", key="k1")
+        loaded = load_snapshot(temp_dir / "meta.snapshot", key="k1")
+
+        assert loaded is not None
+        assert set(loaded.graph) == set(graph)
+        assert str(dict(loaded.graph.namespaces())["ex"]) == str(EX)
+        assert loaded.info == provider.get_info()
+        assert loaded.alignment_targets == provider.get_alignment_targets()
+        assert loaded.namespace == str(provider.get_namespace())
+
+    @pytest.mark.unit
+    def test_key_mismatch_ignored(self, temp_dir):
+        """Test that a snapshot built from another configuration is not used."""
+        provider = GenericMetaOntology()
+        save_snapshot(provider, provider.build_graph(), temp_dir / "meta.snapshot", key="old")
+
+        assert load_snapshot(temp_dir / "meta.snapshot", key="new") is None
+
+    @pytest.mark.unit
+    def test_missing_and_corrupt_snapshots(self, temp_dir):
+        """Test that unusable snapshots load as None."""
+        corrupt = temp_dir / "corrupt.snapshot"
+        corrupt.write_bytes(b"not a pickle")
+
+        assert load_snapshot(temp_dir / "missing.snapshot") is None
+        assert load_snapshot(corrupt) is None
+
+    @pytest.mark.unit
+    def test_snapshot_provider(self, temp_dir):
+        """Test that SnapshotMetaOntology serves the snapshotted values."""
+        provider = GenericMetaOntology()
+        snapshot = save_snapshot(provider, provider.build_graph(), temp_dir / "meta.snapshot", key="k")
+
+        wrapped = SnapshotMetaOntology(snapshot)
+
+        assert wrapped.get_info() == provider.get_info()
+        assert wrapped.build_graph() is snapshot.graph
+        assert wrapped.get_alignment_targets() == provider.get_alignment_targets()
+        assert wrapped.get_namespace() == provider.get_namespace()
+
+
+class TestPrepareMetaOntology:
+    """Test snapshot reuse by the orchestrator."""
+
+    @pytest.mark.unit
+    def test_second_call_loads_snapshot(self, temp_dir):
+        """Test that a resumed run does not rebuild the graph."""
+        config = {"type": "generic", "options": {}}
+        meta_path = temp_dir / "meta" / "generic-meta-ontology.ttl"
+
+        first = CountingProvider()
+        prepare_meta_ontology(first, config, meta_path)
+        second = CountingProvider()
+        snapshot = prepare_meta_ontology(second, config, meta_path)
+
+        assert first.builds == 1
+        assert second.builds == 0
+        assert meta_path.exists()
+        assert meta_path.with_suffix(".snapshot").exists()
+        assert set(snapshot.graph) == set(GenericMetaOntology().build_graph())
+
+    @pytest.mark.unit
+    def test_changed_config_rebuilds(self, temp_dir):
+        """Test that a snapshot from a different configuration is rebuilt."""
+        meta_path = temp_dir / "meta" / "generic-meta-ontology.ttl"
+
+        prepare_meta_ontology(CountingProvider(), {"type": "generic", "options": {}}, meta_path)
+        provider = CountingProvider()
+        prepare_meta_ontology(provider, {"type": "generic", "options": {"v": 2}}, meta_path)
+
+        assert provider.builds == 1
+
+    @pytest.mark.unit
+    def test_snapshot_restored_from_cache(self, temp_dir):
+        """Test that a fresh workdir restores the snapshot from the artifact cache."""
+        cache = ArtifactCache(temp_dir / "cache")
+        config = {"type": "generic", "options": {}}
+
+        prepare_meta_ontology(CountingProvider(), config, temp_dir / "run1" / "meta.ttl", cache)
+        provider = CountingProvider()
+        prepare_meta_ontology(provider, config, temp_dir / "run2" / "meta.ttl", cache)
+
+        assert provider.builds == 0
+        assert (temp_dir / "run2" / "meta.snapshot").exists()
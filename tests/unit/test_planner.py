@@ -0,0 +1,249 @@
+"""
+Unit tests for execution planning.
+
+Tests cover:
+- Profiling XSD, JSON Schema and CSV sources
+- Wall-clock prediction under worker and matcher pool limits
+- Cached stages and the meta-ontology class count after a run
+- Memory limit checks and the `graph-mesh plan` command
+- In-process matchers counted as orchestrator memory
+- Graph memory capped by pipeline.memory_budget_mb
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from graph_mesh_orchestrator.cli import main as cli_main
+from graph_mesh_orchestrator.models import SourceConfig
+from graph_mesh_orchestrator.pipeline import orchestrate
+from graph_mesh_orchestrator.planner import CostModel, StageEstimate, plan_pipeline, profile_source, simulate_schedule
+
+XSD = """<?xml version="1.0"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:complexType name="Order">
+    <xs:sequence>
+      <xs:element name="id" type="xs:string"/>
+      <xs:element name="total" type="xs:decimal"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:simpleType name="Code"><xs:restriction base="xs:string"/></xs:simpleType>
+  <xs:element name="order" type="Order"/>
+</xs:schema>
+"""
+
+
+def _source(source_id, path, convert_type):
+    return SourceConfig.model_validate({
+        "id": source_id,
+        "fetch": {"type": "local", "path": str(path)},
+        "convert": {"type": convert_type},
+    })
+
+
+def _write_manifest(directory: Path, cache_dir: Path = None) -> Path:
+    schema = directory / "thing.json"
+    schema.write_text(json.dumps({
+        "title": "Thing",
+        "type": "object",
+        "properties": {"id": {"type": "string"}, "name": {"type": "string"}},
+        "definitions": {"Part": {"type": "object", "properties": {"sku": {"type": "string"}}}},
+    }))
+    pipeline = {"cache_dir": str(cache_dir)} if cache_dir else {}
+    manifest = directory / "plan.yaml"
+    manifest.write_text(yaml.safe_dump({
+        "name": "plan",
+        "matchers": ["LogMap", "AML"],
+        "pipeline": pipeline,
+        "sources": [{"id": "thing", "fetch": {"type": "local", "path": str(schema)}, "convert": {"type": "json"}}],
+    }))
+    return manifest
+
+
+class TestProfileSource:
+    """Test source profiling."""
+
+    @pytest.mark.unit
+    def test_xsd_components(self, temp_dir):
+        """Test that XSD components are counted by kind."""
+        path = temp_dir / "order.xsd"
+        path.write_text(XSD)
+
+        profile = profile_source(_source("orders", path, "xsd"), [path])
+
+        assert profile.counts == {"complexType": 1, "simpleType": 1, "element": 3}
+        assert profile.class_estimate == 5
+        assert profile.total_bytes == path.stat().st_size
+
+    @pytest.mark.unit
+    def test_json_definitions(self, temp_dir):
+        """Test that JSON Schema definitions and properties are counted."""
+        path = temp_dir / "thing.json"
+        path.write_text(json.dumps({
+            "type": "object",
+            "properties": {"a": {"type": "string"}},
+            "$defs": {"B": {"properties": {"c": {}, "d": {}}}},
+        }))
+
+        profile = profile_source(_source("thing", path, "json"), [path])
+
+        assert profile.counts == {"definitions": 2, "properties": 3}
+
+    @pytest.mark.unit
+    def test_csv_columns(self, temp_dir):
+        """Test that CSV header columns are counted."""
+        path = temp_dir / "rows.csv"
+        path.write_text("id;name;price\n1;a;2.5\n")
+
+        profile = profile_source(_source("rows", path, "csv"), [path])
+
+        assert profile.counts == {"columns": 3}
+        assert profile.class_estimate == 4
+
+    @pytest.mark.unit
+    def test_unfetched_remote_source(self):
+        """Test that a remote source without a cached copy has an unknown size."""
+        source = SourceConfig.model_validate({"id": "r", "fetch": {"type": "https", "url": "https://x/y.xsd"}})
+
+        profile = profile_source(source, None)
+
+        assert profile.total_bytes is None
+        assert profile.class_estimate == 0
+
+
+class TestSimulateSchedule:
+    """Test wall-clock prediction."""
+
+    def _chains(self, sources):
+        stages = []
+        for source_id in sources:
+            stages += [
+                StageEstimate(stage="fetch", source_id=source_id, seconds=1),
+                StageEstimate(stage="ingest", source_id=source_id, seconds=2),
+                StageEstimate(stage="alignment", source_id=source_id, seconds=4, matchers=["LogMap"]),
+            ]
+        return stages
+
+    @pytest.mark.unit
+    def test_single_worker_is_serial(self):
+        """Test that one worker runs every unit back to back."""
+        assert simulate_schedule(self._chains(["a", "b"]), workers=1, matcher_slots=4) == 14
+
+    @pytest.mark.unit
+    def test_parallel_sources_overlap(self):
+        """Test that independent sources overlap on several workers."""
+        assert simulate_schedule(self._chains(["a", "b"]), workers=2, matcher_slots=2) == 7
+
+    @pytest.mark.unit
+    def test_matcher_slots_serialize_alignment(self):
+        """Test that alignment waits for a free matcher slot."""
+        assert simulate_schedule(self._chains(["a", "b"]), workers=2, matcher_slots=1) == 11
+
+
+class TestPlanPipeline:
+    """Test plans for manifests."""
+
+    @pytest.mark.unit
+    def test_fresh_plan(self, temp_dir):
+        """Test a plan for a workdir and cache that have never been used."""
+        manifest = _write_manifest(temp_dir)
+
+        plan = plan_pipeline(manifest, workdir=temp_dir / "work")
+
+        assert [(s.stage, s.status) for s in plan.stages] == [
+            ("meta_ontology", "execute"),
+            ("fetch", "execute"),
+            ("ingest", "execute"),
+            ("alignment", "execute"),
+            ("fusion", "execute"),
+        ]
+        assert plan.meta_class_count is None
+        assert plan.profiles[0].class_estimate == 5
+        assert plan.stages[3].container_memory_bytes > 0
+        assert plan.wall_seconds == pytest.approx(plan.serial_seconds)
+        assert not (temp_dir / "work").exists()
+
+    @pytest.mark.unit
+    def test_plan_after_run_uses_cache(self, temp_dir):
+        """Test that a previous run's cache and snapshot are reflected in the plan."""
+        manifest = _write_manifest(temp_dir, cache_dir=temp_dir / "cache")
+        with patch("graph_mesh_orchestrator.pipeline.run_alignment", return_value=[]):
+            orchestrate(manifest, workdir=temp_dir / "work", skip_preflight=True)
+
+        plan = plan_pipeline(manifest, workdir=temp_dir / "work-2")
+        statuses = {s.stage: s.status for s in plan.stages}
+
+        assert statuses["meta_ontology"] == "cached"
+        assert statuses["ingest"] == "cached"
+        assert statuses["alignment"] == "execute"
+        assert plan.meta_class_count > 0
+
+    @pytest.mark.unit
+    def test_in_process_matcher_memory(self, temp_dir):
+        """Test that matchers without an image count as orchestrator memory, not container memory."""
+        manifest = _write_manifest(temp_dir)
+        config = yaml.safe_load(manifest.read_text())
+        config["matchers"] = ["Lexical"]
+        manifest.write_text(yaml.safe_dump(config))
+        model = CostModel(matcher_memory_bytes={"Lexical": 10**12})
+
+        plan = plan_pipeline(manifest, workdir=temp_dir / "work", cost_model=model)
+
+        alignment = plan.stages[3]
+        assert alignment.memory_bytes == 10**12
+        assert alignment.container_memory_bytes == 0
+        assert plan.peak_container_memory_bytes == 0
+        assert plan.peak_memory_bytes >= 10**12
+
+    @pytest.mark.unit
+    def test_memory_limit(self, temp_dir):
+        """Test that plans over the memory limit are flagged."""
+        manifest = _write_manifest(temp_dir)
+
+        assert plan_pipeline(manifest, workdir=temp_dir / "work", memory_limit_mb=1).exceeds_memory_limit
+        assert not plan_pipeline(manifest, workdir=temp_dir / "work", memory_limit_mb=10**6).exceeds_memory_limit
+
+    @pytest.mark.unit
+    def test_memory_budget_caps_graph_memory(self, temp_dir):
+        """Test that graphs beyond the memory budget are expected to spill."""
+        manifest = _write_manifest(temp_dir)
+        model = CostModel(fusion_bytes_per_triple=10**9)
+        unbounded = plan_pipeline(manifest, workdir=temp_dir / "work", cost_model=model)
+
+        config = yaml.safe_load(manifest.read_text())
+        config["pipeline"]["memory_budget_mb"] = 1
+        manifest.write_text(yaml.safe_dump(config))
+        budgeted = plan_pipeline(manifest, workdir=temp_dir / "work", cost_model=model)
+
+        assert unbounded.stages[-1].memory_bytes > 1024 * 1024
+        assert budgeted.stages[-1].memory_bytes == 1024 * 1024
+        assert budgeted.peak_memory_bytes < unbounded.peak_memory_bytes
+
+
+class TestPlanCommand:
+    """Test `graph-mesh plan`."""
+
+    @pytest.mark.unit
+    def test_json_output(self, temp_dir, capsys):
+        """Test that --json prints the plan as JSON."""
+        manifest = _write_manifest(temp_dir)
+
+        cli_main(["plan", str(manifest), "--workdir", str(temp_dir / "work"), "--json"])
+        plan = json.loads(capsys.readouterr().out)
+
+        assert plan["manifest"] == "plan"
+        assert plan["exceeds_memory_limit"] is False
+
+    @pytest.mark.unit
+    def test_memory_limit_exit_status(self, temp_dir, capsys):
+        """Test that exceeding --memory-limit exits with status 1."""
+        manifest = _write_manifest(temp_dir)
+
+        with pytest.raises(SystemExit) as excinfo:
+            cli_main(["plan", str(manifest), "--workdir", str(temp_dir / "work"), "--memory-limit", "1"])
+
+        assert excinfo.value.code == 1
+        assert "EXCEEDS" in capsys.readouterr().out
@@ -0,0 +1,168 @@
+"""
+Unit tests for the DAG stage scheduler.
+
+Tests cover:
+- Dependency ordering
+- Stage-by-stage ordering with a single worker
+- Cross-source overlap with multiple workers
+- Failure propagation
+- Task registration validation
+- Worker pool sizing
+"""
+
+import threading
+
+import pytest
+
+from graph_mesh_orchestrator.scheduler import StageScheduler, resolve_worker_count
+
+
+def _add_source(scheduler, source_id, func_for_stage):
+    """Register a fetch → ingest → alignment chain for one source."""
+    fetch = scheduler.add_task(source_id, "fetch", func_for_stage(source_id, "fetch"))
+    ingest = scheduler.add_task(source_id, "ingest", func_for_stage(source_id, "ingest"), depends_on=[fetch])
+    scheduler.add_task(source_id, "alignment", func_for_stage(source_id, "alignment"), depends_on=[ingest])
+
+
+class TestStageScheduler:
+    """Test StageScheduler execution semantics."""
+
+    @pytest.mark.unit
+    def test_dependencies_run_before_dependents(self):
+        """Test that each stage runs after the stage it depends on."""
+        events = []
+        lock = threading.Lock()
+
+        def record(source_id, stage):
+            def _run():
+                with lock:
+                    events.append((source_id, stage))
+            return _run
+
+        scheduler = StageScheduler(max_workers=4)
+        for source_id in ("a", "b", "c"):
+            _add_source(scheduler, source_id, record)
+        scheduler.run()
+
+        for source_id in ("a", "b", "c"):
+            fetch = events.index((source_id, "fetch"))
+            ingest = events.index((source_id, "ingest"))
+            align = events.index((source_id, "alignment"))
+            assert fetch < ingest < align
+
+    @pytest.mark.unit
+    def test_single_worker_runs_stage_by_stage(self):
+        """Test that one worker reproduces the sequential stage ordering."""
+        events = []
+
+        def record(source_id, stage):
+            return lambda: events.append((source_id, stage))
+
+        scheduler = StageScheduler(max_workers=1)
+        for source_id in ("a", "b"):
+            _add_source(scheduler, source_id, record)
+        scheduler.run()
+
+        assert events == [
+            ("a", "fetch"), ("b", "fetch"),
+            ("a", "ingest"), ("b", "ingest"),
+            ("a", "alignment"), ("b", "alignment"),
+        ]
+
+    @pytest.mark.unit
+    def test_sources_overlap_with_multiple_workers(self):
+        """Test that one source can ingest while another is aligning."""
+        a_aligning = threading.Event()
+        b_ingested_during_a_alignment = threading.Event()
+
+        def stage_func(source_id, stage):
+            def _run():
+                if (source_id, stage) == ("a", "alignment"):
+                    a_aligning.set()
+                    # Wait for b's ingest to happen concurrently
+                    assert b_ingested_during_a_alignment.wait(timeout=5)
+                if (source_id, stage) == ("b", "ingest"):
+                    assert a_aligning.wait(timeout=5)
+                    b_ingested_during_a_alignment.set()
+            return _run
+
+        scheduler = StageScheduler(max_workers=2)
+        scheduler.add_task("a", "fetch", stage_func("a", "fetch"))
+        scheduler.add_task("a", "ingest", stage_func("a", "ingest"), depends_on=[("a", "fetch")])
+        scheduler.add_task("a", "alignment", stage_func("a", "alignment"), depends_on=[("a", "ingest")])
+        scheduler.add_task("b", "fetch", stage_func("b", "fetch"), depends_on=[("a", "ingest")])
+        scheduler.add_task("b", "ingest", stage_func("b", "ingest"), depends_on=[("b", "fetch")])
+
+        scheduler.run()
+
+        assert b_ingested_during_a_alignment.is_set()
+
+    @pytest.mark.unit
+    def test_returns_results_by_key(self):
+        """Test that task return values are collected by key."""
+        scheduler = StageScheduler(max_workers=2)
+        scheduler.add_task("a", "fetch", lambda: "fetched-a")
+        scheduler.add_task("a", "ingest", lambda: "ingested-a", depends_on=[("a", "fetch")])
+
+        results = scheduler.run()
+
+        assert results == {("a", "fetch"): "fetched-a", ("a", "ingest"): "ingested-a"}
+
+    @pytest.mark.unit
+    def test_failure_stops_dependents_and_reraises(self):
+        """Test that a failing task re-raises and its dependents never run."""
+        ran = []
+
+        def fail():
+            raise RuntimeError("boom")
+
+        scheduler = StageScheduler(max_workers=1)
+        scheduler.add_task("a", "fetch", fail)
+        scheduler.add_task("a", "ingest", lambda: ran.append("a-ingest"), depends_on=[("a", "fetch")])
+
+        with pytest.raises(RuntimeError, match="boom"):
+            scheduler.run()
+
+        assert ran == []
+
+    @pytest.mark.unit
+    def test_unknown_dependency_rejected(self):
+        """Test that dependencies must be registered first."""
+        scheduler = StageScheduler()
+
+        with pytest.raises(ValueError, match="unknown task"):
+            scheduler.add_task("a", "ingest", lambda: None, depends_on=[("a", "fetch")])
+
+    @pytest.mark.unit
+    def test_duplicate_task_rejected(self):
+        """Test that a (source, stage) pair can only be registered once."""
+        scheduler = StageScheduler()
+        scheduler.add_task("a", "fetch", lambda: None)
+
+        with pytest.raises(ValueError, match="Duplicate task"):
+            scheduler.add_task("a", "fetch", lambda: None)
+
+    @pytest.mark.unit
+    def test_invalid_worker_count(self):
+        """Test that the pool needs at least one worker."""
+        with pytest.raises(ValueError):
+            StageScheduler(max_workers=0)
+
+
+class TestResolveWorkerCount:
+    """Test worker pool sizing."""
+
+    @pytest.mark.unit
+    def test_sequential_when_parallel_disabled(self):
+        """Test that disabling parallelism forces one worker."""
+        assert resolve_worker_count(False, max_workers=8) == 1
+
+    @pytest.mark.unit
+    def test_explicit_max_workers(self):
+        """Test that an explicit pool size is honored."""
+        assert resolve_worker_count(True, max_workers=6) == 6
+
+    @pytest.mark.unit
+    def test_default_pool_is_bounded(self):
+        """Test that the default pool size is capped."""
+        assert 1 <= resolve_worker_count(True) <= 32
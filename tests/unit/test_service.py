@@ -0,0 +1,211 @@
+"""
+Unit tests for the orchestrator service and CLI.
+
+Tests cover:
+- Priority ordering of queued jobs
+- Job status, failures and cancellation
+- Warm meta-ontologies shared across jobs
+- HTTP job API
+- CLI subcommand dispatch
+"""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from graph_mesh_orchestrator import batch
+from graph_mesh_orchestrator import service as service_module
+from graph_mesh_orchestrator.cli import main as cli_main
+from graph_mesh_orchestrator.errors import JobNotFoundError, ManifestValidationError, PipelineStateError
+from graph_mesh_orchestrator.service import JobStatus, OrchestratorService, ServiceHTTPServer
+
+
+def _write_manifest(directory: Path, name: str = "svc") -> Path:
+    schema = directory / f"{name}.json"
+    schema.write_text(json.dumps({"title": "Thing", "type": "object",
+                                  "properties": {"id": {"type": "string"}}}))
+    manifest = directory / f"{name}.yaml"
+    manifest.write_text(yaml.safe_dump({
+        "name": name,
+        "matchers": ["LogMap"],
+        "sources": [{"id": name, "fetch": {"type": "local", "path": str(schema)}, "convert": {"type": "json"}}],
+    }))
+    return manifest
+
+
+@pytest.fixture
+def service(temp_dir):
+    svc = OrchestratorService(temp_dir / "service", concurrency=1)
+    yield svc
+    svc.stop()
+
+
+class TestJobQueue:
+    """Test job scheduling."""
+
+    @pytest.mark.unit
+    def test_priority_order(self, temp_dir, service):
+        """Test that higher-priority jobs run before earlier, lower-priority ones."""
+        manifest = _write_manifest(temp_dir)
+        order = []
+
+        def fake_orchestrate(manifest_path, workdir, **kwargs):
+            order.append(workdir.parent.name)
+
+        low = service.submit(manifest_path=manifest, priority=0)
+        high = service.submit(manifest_path=manifest, priority=5)
+        mid = service.submit(manifest_path=manifest, priority=1)
+        with patch.object(service_module, "orchestrate", side_effect=fake_orchestrate):
+            service.start()
+            for job in (low, high, mid):
+                assert service.wait(job.id, timeout=30).status == JobStatus.COMPLETED
+
+        assert order == [high.id, mid.id, low.id]
+
+    @pytest.mark.unit
+    def test_failed_job_recorded(self, temp_dir, service):
+        """Test that a failing pipeline marks the job failed with its error."""
+        manifest = _write_manifest(temp_dir)
+        with patch.object(service_module, "orchestrate", side_effect=RuntimeError("boom")):
+            service.start()
+            job = service.wait(service.submit(manifest_path=manifest).id, timeout=30)
+
+        assert job.status == JobStatus.FAILED
+        assert job.error == "boom"
+
+    @pytest.mark.unit
+    def test_cancel_queued_job(self, temp_dir, service):
+        """Test that queued jobs can be cancelled and are then skipped."""
+        manifest = _write_manifest(temp_dir)
+        job = service.submit(manifest_path=manifest)
+
+        assert service.cancel(job.id).status == JobStatus.CANCELLED
+        with pytest.raises(PipelineStateError):
+            service.cancel(job.id)
+        with patch.object(service_module, "orchestrate") as orchestrate:
+            service.start()
+            service.stop()
+        orchestrate.assert_not_called()
+
+    @pytest.mark.unit
+    def test_invalid_manifest_rejected(self, temp_dir, service):
+        """Test that invalid manifests fail at submission."""
+        with pytest.raises(ManifestValidationError):
+            service.submit(manifest_yaml="name: broken\n")
+        with pytest.raises(ManifestValidationError):
+            service.submit(manifest_path=temp_dir / "missing.yaml")
+        with pytest.raises(JobNotFoundError):
+            service.get("nope")
+
+    @pytest.mark.unit
+    def test_meta_ontology_built_once(self, temp_dir, service):
+        """Test that jobs reuse the warm meta-ontology."""
+        manifest = _write_manifest(temp_dir)
+        with patch("graph_mesh_orchestrator.pipeline.run_alignment", return_value=[]), \
+                patch.object(batch, "prepare_meta_ontology", wraps=batch.prepare_meta_ontology) as build:
+            service.start()
+            first = service.wait(service.submit(manifest_path=manifest).id, timeout=60)
+            second = service.wait(service.submit(manifest_yaml=manifest.read_text()).id, timeout=60)
+
+        assert first.status == JobStatus.COMPLETED, first.error
+        assert second.status == JobStatus.COMPLETED, second.error
+        assert build.call_count == 1
+        assert second.artifacts.merged_graph.exists()
+
+
+class TestHTTPApi:
+    """Test the JSON HTTP front end."""
+
+    @pytest.fixture
+    def base_url(self, service):
+        server = ServiceHTTPServer(("127.0.0.1", 0), service)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+
+    def _request(self, url, method="GET", body=None):
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(url, data=data, method=method,
+                                         headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    @pytest.mark.unit
+    def test_submit_and_poll(self, temp_dir, service, base_url):
+        """Test submitting a job and reading its status."""
+        manifest = _write_manifest(temp_dir)
+        status, job = self._request(f"{base_url}/jobs", "POST", {"manifest": str(manifest), "priority": 3})
+
+        assert status == 202
+        assert job["status"] == "queued"
+        assert job["priority"] == 3
+
+        status, fetched = self._request(f"{base_url}/jobs/{job['id']}")
+        assert status == 200
+        assert fetched["id"] == job["id"]
+
+        status, listing = self._request(f"{base_url}/jobs")
+        assert [j["id"] for j in listing["jobs"]] == [job["id"]]
+
+        status, cancelled = self._request(f"{base_url}/jobs/{job['id']}", "DELETE")
+        assert cancelled["status"] == "cancelled"
+
+    @pytest.mark.unit
+    def test_errors(self, base_url):
+        """Test error responses."""
+        assert self._request(f"{base_url}/jobs/unknown")[0] == 404
+        assert self._request(f"{base_url}/nowhere")[0] == 404
+        status, body = self._request(f"{base_url}/jobs", "POST", {"manifest_yaml": "name: x\n"})
+        assert status == 400
+        assert body["error"]["error_type"] == "ManifestValidationError"
+
+    @pytest.mark.unit
+    def test_health(self, base_url):
+        """Test the health endpoint."""
+        status, body = self._request(f"{base_url}/health")
+
+        assert status == 200
+        assert body["status"] == "ok"
+
+
+class TestCli:
+    """Test CLI dispatch."""
+
+    @pytest.mark.unit
+    def test_bare_manifest_runs_pipeline(self):
+        """Test that `graph-mesh manifest.yaml` still runs the pipeline."""
+        with patch("graph_mesh_orchestrator.pipeline.main") as run_main:
+            cli_main(["manifest.yaml", "--incremental"])
+
+        run_main.assert_called_once_with("manifest.yaml", workdir=None, resume=False, incremental=True,
+                                         trace=None, profile_stage=None, deadline_minutes=None)
+
+    @pytest.mark.unit
+    def test_unknown_profile_stage_rejected(self, capsys):
+        """Test that `run --profile-stage` only accepts pipeline stage names."""
+        with patch("graph_mesh_orchestrator.pipeline.main") as run_main, pytest.raises(SystemExit) as excinfo:
+            cli_main(["run", "manifest.yaml", "--profile-stage", "align"])
+
+        assert excinfo.value.code == 2
+        assert "invalid choice: 'align'" in capsys.readouterr().err
+        run_main.assert_not_called()
+
+    @pytest.mark.unit
+    def test_serve_subcommand(self):
+        """Test that `graph-mesh serve` starts the service with its options."""
+        with patch("graph_mesh_orchestrator.service.serve") as serve:
+            cli_main(["serve", "--port", "9000", "--concurrency", "4"])
+
+        assert serve.call_args.kwargs["port"] == 9000
+        assert serve.call_args.kwargs["concurrency"] == 4
@@ -0,0 +1,178 @@
+"""
+Unit tests for streaming graph fusion.
+
+Tests cover:
+- Statement deduplication in memory and on disk
+- N-Triples output parseable by rdflib, including escaped literals
+- N-Quads provenance via named graphs
+- Blank node isolation between inputs
+- Error handling
+"""
+
+from pathlib import Path
+
+import pytest
+from rdflib import BNode, Dataset, Graph, Literal, Namespace
+from rdflib.namespace import OWL, RDF, RDFS, XSD
+
+from graph_mesh_orchestrator.errors import FusionError
+from graph_mesh_orchestrator.streaming_fusion import (
+    META_GRAPH_NAME,
+    StatementDeduplicator,
+    stream_fuse_graphs,
+)
+
+EX = Namespace("http://example.org/")
+
+
+def _write_graph(path: Path, *classes: str, label_bnode: bool = False) -> Path:
+    graph = Graph()
+    for name in classes:
+        graph.add((EX[name], RDF.type, OWL.Class))
+    if label_bnode:
+        node = BNode()
+        graph.add((node, RDFS.label, Literal(path.stem)))
+    graph.serialize(destination=str(path), format="turtle")
+    return path
+
+
+@pytest.fixture
+def meta_graph():
+    graph = Graph()
+    graph.add((EX.Thing, RDF.type, OWL.Class))
+    return graph
+
+
+class TestStatementDeduplicator:
+    """Test digest-based duplicate tracking."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("mode", ["memory", "disk"])
+    def test_reports_first_occurrence_only(self, mode, temp_dir):
+        """Test that a statement is new exactly once."""
+        with StatementDeduplicator(mode, spill_dir=temp_dir) as seen:
+            assert seen.add("<a> <b> <c> .")
+            assert not seen.add("<a> <b> <c> .")
+            assert seen.add("<a> <b> <d> .")
+
+    @pytest.mark.unit
+    def test_disk_state_removed_on_close(self, temp_dir):
+        """Test that the spill directory is cleaned up."""
+        with StatementDeduplicator("disk", spill_dir=temp_dir) as seen:
+            seen.add("<a> <b> <c> .")
+
+        assert list(temp_dir.iterdir()) == []
+
+    @pytest.mark.unit
+    def test_invalid_mode(self):
+        """Test that unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            StatementDeduplicator("bogus")
+
+
+class TestStreamFuseGraphs:
+    """Test stream_fuse_graphs output."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("dedupe", ["memory", "disk"])
+    def test_overlapping_inputs_deduplicated(self, dedupe, meta_graph, temp_dir):
+        """Test that shared statements are written once."""
+        a = _write_graph(temp_dir / "a.ttl", "A", "Shared", "Thing")
+        b = _write_graph(temp_dir / "b.ttl", "B", "Shared")
+
+        result = stream_fuse_graphs([a, b], meta_graph, temp_dir / "merged.nt",
+                                    dedupe=dedupe, spill_dir=temp_dir)
+
+        merged = Graph().parse(str(result.output_path), format="nt")
+        assert len(merged) == 4
+        assert result.statement_count == 4
+        assert result.duplicate_count == 2
+        assert result.graph_count == 2
+
+    @pytest.mark.unit
+    def test_matches_in_memory_union(self, meta_graph, temp_dir):
+        """Test that the streamed output equals the union of the inputs."""
+        a = _write_graph(temp_dir / "a.ttl", "A", "B")
+        b = _write_graph(temp_dir / "b.ttl", "B", "C")
+        expected = Graph()
+        for path in (a, b):
+            expected.parse(str(path))
+        expected += meta_graph
+
+        result = stream_fuse_graphs([a, b], meta_graph, temp_dir / "merged.nt")
+
+        merged = Graph().parse(str(result.output_path), format="nt")
+        assert set(merged) == set(expected)
+
+    @pytest.mark.unit
+    def test_nquads_records_provenance(self, meta_graph, temp_dir):
+        """Test that each input lands in its own named graph."""
+        a = _write_graph(temp_dir / "a.ttl", "A")
+        b = _write_graph(temp_dir / "b.ttl", "A")
+
+        result = stream_fuse_graphs([a, b], meta_graph, temp_dir / "merged.nq",
+                                    output_format="nquads")
+
+        dataset = Dataset()
+        dataset.parse(str(result.output_path), format="nquads")
+        names = {str(g.identifier) for g in dataset.graphs() if len(g)}
+        assert names == {META_GRAPH_NAME, a.resolve().as_uri(), b.resolve().as_uri()}
+        # The same triple from two sources is kept once per named graph
+        assert result.duplicate_count == 0
+
+    @pytest.mark.unit
+    def test_blank_nodes_do_not_collide(self, meta_graph, temp_dir):
+        """Test that blank nodes from different inputs stay distinct."""
+        a = _write_graph(temp_dir / "a.ttl", label_bnode=True)
+        b = _write_graph(temp_dir / "b.ttl", label_bnode=True)
+
+        result = stream_fuse_graphs([a, b], meta_graph, temp_dir / "merged.nt")
+
+        merged = Graph().parse(str(result.output_path), format="nt")
+        labelled = set(merged.subjects(RDFS.label, None))
+        assert len(labelled) == 2
+
+    @pytest.mark.unit
+    def test_accepts_parsed_graphs(self, meta_graph, temp_dir):
+        """Test that in-memory graphs can be fused alongside files."""
+        graph = Graph()
+        graph.add((EX.A, RDF.type, OWL.Class))
+
+        result = stream_fuse_graphs([graph], meta_graph, temp_dir / "merged.nt")
+
+        merged = Graph().parse(str(result.output_path), format="nt")
+        assert (EX.A, RDF.type, OWL.Class) in merged
+
+    @pytest.mark.unit
+    def test_literals_round_trip(self, meta_graph, temp_dir):
+        """Test that escaped, language-tagged and typed literals survive N-Triples output."""
+        graph = Graph()
+        literals = [Literal('two\nlines with "quotes" and \\'), Literal("étiquette", lang="fr"),
+                    Literal(3), Literal("2024-01-01", datatype=XSD.date)]
+        for literal in literals:
+            graph.add((EX.A, RDFS.comment, literal))
+
+        result = stream_fuse_graphs([graph], meta_graph, temp_dir / "merged.nt")
+
+        merged = Graph().parse(str(result.output_path), format="nt")
+        assert set(merged.objects(EX.A, RDFS.comment)) == set(literals)
+        assert len(result.output_path.read_text(encoding="utf-8").splitlines()) == result.statement_count
+
+    @pytest.mark.unit
+    def test_unsupported_format(self, meta_graph, temp_dir):
+        """Test that non-streaming formats are rejected."""
+        with pytest.raises(FusionError, match="Unsupported"):
+            stream_fuse_graphs([], meta_graph, temp_dir / "merged.ttl", output_format="turtle")
+
+    @pytest.mark.unit
+    def test_parse_failure_leaves_no_output(self, meta_graph, temp_dir):
+        """Test that a failed fusion does not leave a partial file behind."""
+        broken = temp_dir / "broken.ttl"
+        broken.write_text("this is not turtle <<<")
+        output = temp_dir / "merged.nt"
+
+        with pytest.raises(FusionError):
+            stream_fuse_graphs([broken], meta_graph, output)
+
+        assert not output.exists()
+        assert not (temp_dir / "merged.nt.partial").exists()
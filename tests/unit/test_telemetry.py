@@ -0,0 +1,176 @@
+"""
+Unit tests for per-stage performance telemetry.
+
+Tests cover:
+- Unit measurement and nesting
+- No-op behavior without an active recorder
+- Counts reported via annotate
+- JSON and Prometheus textfile output
+- Matcher units recorded by run_alignment
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from graph_mesh_aligner.matchers import run_alignment
+from graph_mesh_core.telemetry import MetricsRecorder, active_recorder, annotate, measure
+
+
+@dataclass
+class StubMatcher:
+    """Matcher stub that writes a two-row SSSOM file."""
+
+    name: str = "Stub"
+    output_filename: str = "stub.sssom.tsv"
+
+    def align(self, source_ontology: Path, target_ontology: Path, output_dir: Path) -> Path:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        mapping = output_dir / self.output_filename
+        mapping.write_text("# curie_map: {}\nsubject_id\tobject_id\nex:A\tex:B\nex:C\tex:D\n")
+        return mapping
+
+
+class TestMeasure:
+    """Test unit measurement."""
+
+    @pytest.mark.unit
+    def test_records_wall_and_cpu_time(self):
+        """Test that a unit records elapsed time and resource counters."""
+        recorder = MetricsRecorder()
+
+        with recorder.measure("ingest", source_id="users") as unit:
+            sum(i * i for i in range(200_000))
+            time.sleep(0.01)
+
+        assert recorder.units == [unit]
+        assert unit.source_id == "users"
+        assert unit.wall_seconds >= 0.01
+        assert unit.cpu_seconds > 0
+        assert unit.status == "ok"
+
+    @pytest.mark.unit
+    def test_nested_units_inherit_source(self):
+        """Test that nested module-level measure() calls reach the recorder."""
+        recorder = MetricsRecorder()
+
+        with recorder.measure("alignment", source_id="users"):
+            with measure("matcher", matcher="LogMap") as inner:
+                annotate(mapping_count=3)
+
+        assert inner.source_id == "users"
+        assert inner.matcher == "LogMap"
+        assert inner.extra == {"mapping_count": 3}
+        assert [u.stage for u in recorder.units] == ["matcher", "alignment"]
+
+    @pytest.mark.unit
+    def test_noop_without_recorder(self):
+        """Test that library instrumentation does nothing outside a recorder."""
+        assert active_recorder() is None
+        with measure("matcher") as unit:
+            annotate(triple_count=5)
+
+        assert unit is None
+
+    @pytest.mark.unit
+    def test_annotate_sets_triple_count(self):
+        """Test that annotate attaches counts to the innermost unit."""
+        recorder = MetricsRecorder()
+
+        with recorder.activate():
+            with measure("fusion") as unit:
+                annotate(triple_count=42, duplicates_skipped=2)
+
+        assert unit.triple_count == 42
+        assert unit.extra == {"duplicates_skipped": 2}
+
+    @pytest.mark.unit
+    def test_failed_unit_recorded(self):
+        """Test that a unit raising an exception is still recorded as an error."""
+        recorder = MetricsRecorder()
+
+        with pytest.raises(RuntimeError):
+            with recorder.measure("fetch", source_id="s"):
+                raise RuntimeError("boom")
+
+        assert recorder.units[0].status == "error"
+
+    @pytest.mark.unit
+    def test_concurrent_units(self):
+        """Test that units measured on worker threads are all recorded."""
+        recorder = MetricsRecorder()
+
+        def work(source_id):
+            with recorder.measure("ingest", source_id=source_id):
+                time.sleep(0.001)
+
+        threads = [threading.Thread(target=work, args=(f"s{i}",)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(u.source_id for u in recorder.units) == sorted(f"s{i}" for i in range(8))
+
+
+class TestOutput:
+    """Test metrics exporters."""
+
+    @pytest.mark.unit
+    def test_write_json(self, temp_dir):
+        """Test that run_metrics.json holds units and per-stage totals."""
+        recorder = MetricsRecorder()
+        with recorder.measure("ingest", source_id="a"):
+            annotate(triple_count=10)
+        with recorder.measure("ingest", source_id="b"):
+            pass
+
+        path = recorder.write_json(temp_dir / "run_metrics.json", pipeline="demo", status="completed")
+        data = json.loads(path.read_text())
+
+        assert data["run"]["pipeline"] == "demo"
+        assert data["summary"]["stages"]["ingest"]["count"] == 2
+        assert {u["source_id"] for u in data["units"]} == {"a", "b"}
+        assert data["units"][0]["triple_count"] == 10
+
+    @pytest.mark.unit
+    def test_write_prometheus(self, temp_dir):
+        """Test that the textfile uses the Prometheus exposition format."""
+        recorder = MetricsRecorder()
+        with recorder.measure("matcher", source_id='we"ird', matcher="LogMap"):
+            annotate(triple_count=7)
+
+        path = recorder.write_prometheus(temp_dir / "graph_mesh.prom", pipeline="demo")
+        text = path.read_text()
+
+        assert "# TYPE graph_mesh_unit_wall_seconds gauge" in text
+        assert ('graph_mesh_unit_triples{pipeline="demo",stage="matcher",source="we\\"ird",'
+                'matcher="LogMap",status="ok"} 7') in text
+        assert "graph_mesh_run_wall_seconds" in text
+        assert text.endswith("\n")
+
+
+class TestAlignmentTelemetry:
+    """Test matcher units recorded by run_alignment."""
+
+    @pytest.mark.unit
+    def test_matcher_units_recorded(self, temp_dir):
+        """Test that each matcher is measured with its mapping count."""
+        source = temp_dir / "source.owl"
+        target = temp_dir / "target.ttl"
+        source.write_text("source")
+        target.write_text("target")
+        recorder = MetricsRecorder()
+
+        with recorder.measure("alignment", source_id="users"):
+            run_alignment([StubMatcher()], source, target, temp_dir / "out")
+
+        matcher_unit = recorder.units[0]
+        assert matcher_unit.stage == "matcher"
+        assert matcher_unit.matcher == "Stub"
+        assert matcher_unit.source_id == "users"
+        assert matcher_unit.extra["mapping_count"] == 2
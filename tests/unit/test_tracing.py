@@ -0,0 +1,231 @@
+"""
+Unit tests for span tracing and timeline export.
+
+Tests cover:
+- Span nesting, source inheritance and error status
+- No-op behavior without an active tracer
+- Merging spans recorded in another process
+- Chrome Trace Event and span table output
+- Telemetry units and ingest workers appearing as spans
+- trace.json and trace_spans.tsv written by a traced pipeline run
+"""
+
+import csv
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from graph_mesh_core.telemetry import MetricsRecorder
+from graph_mesh_core.tracing import (
+    SPAN_TABLE_COLUMNS,
+    Tracer,
+    active_tracer,
+    span,
+    span_dicts,
+    traced,
+)
+from graph_mesh_orchestrator import pipeline
+from graph_mesh_orchestrator.ingest import IngestPool
+from graph_mesh_orchestrator.pipeline import orchestrate
+
+
+def _write_schema(path, title):
+    path.write_text(json.dumps({"title": title, "type": "object",
+                                "properties": {"id": {"type": "string"}}}))
+    return path
+
+
+class TestSpans:
+    """Test span recording."""
+
+    @pytest.mark.unit
+    def test_nesting_and_source_inheritance(self):
+        """Test that nested spans record their parent and inherit the source."""
+        tracer = Tracer()
+
+        with tracer.activate():
+            with span("ingest", "source", source_id="users") as outer:
+                with span("parse", "converter", path="users.json") as inner:
+                    pass
+
+        assert tracer.spans == [outer, inner]
+        assert inner.parent_id == outer.span_id
+        assert inner.source_id == "users"
+        assert inner.args == {"path": "users.json"}
+        assert inner.pid == os.getpid()
+        assert outer.duration_ns >= inner.duration_ns
+
+    @pytest.mark.unit
+    def test_noop_without_tracer(self):
+        """Test that span() and traced functions run untraced without a tracer."""
+        @traced("work")
+        def work():
+            return 42
+
+        with span("orphan") as current:
+            assert current is None
+        assert work() == 42
+        assert active_tracer() is None
+
+    @pytest.mark.unit
+    def test_failed_span(self):
+        """Test that an exception marks the span as failed and propagates."""
+        tracer = Tracer()
+
+        with tracer.activate(), pytest.raises(ValueError):
+            with span("fusion", "stage"):
+                raise ValueError("bad graph")
+
+        failed = tracer.spans[0]
+        assert failed.status == "error"
+        assert failed.args["error"] == "ValueError: bad graph"
+
+    @pytest.mark.unit
+    def test_traced_decorator(self):
+        """Test that a decorated function records a span per call."""
+        @traced("voting", "fusion")
+        def vote(mappings):
+            return len(mappings)
+
+        tracer = Tracer()
+        with tracer.activate():
+            vote([1, 2])
+            vote([])
+
+        assert [(s.name, s.category) for s in tracer.spans] == [("voting", "fusion")] * 2
+
+    @pytest.mark.unit
+    def test_add_spans_remaps_ids(self):
+        """Test that merged spans get fresh ids under the given parent."""
+        worker = Tracer()
+        with worker.activate():
+            with span("convert", "converter"):
+                with span("parse", "converter"):
+                    pass
+        tracer = Tracer()
+
+        with tracer.activate():
+            with span("ingest", "source", source_id="orders") as parent:
+                tracer.add_spans(span_dicts(worker), parent=parent)
+
+        by_name = {s.name: s for s in tracer.spans}
+        assert len({s.span_id for s in tracer.spans}) == 3
+        assert by_name["convert"].parent_id == parent.span_id
+        assert by_name["parse"].parent_id == by_name["convert"].span_id
+        assert by_name["parse"].source_id == "orders"
+
+    @pytest.mark.unit
+    def test_telemetry_units_are_spans(self):
+        """Test that measured units appear on the timeline with their counts."""
+        tracer = Tracer()
+        recorder = MetricsRecorder()
+
+        with tracer.activate(), recorder.measure("alignment", source_id="users", matcher="LogMap") as unit:
+            unit.triple_count = 7
+
+        recorded = tracer.spans[0]
+        assert (recorded.name, recorded.category, recorded.source_id) == ("alignment:LogMap", "matcher", "users")
+        assert recorded.args["triple_count"] == 7
+
+
+class TestExport:
+    """Test trace output formats."""
+
+    @pytest.fixture
+    def tracer(self):
+        tracer = Tracer()
+        with tracer.activate():
+            with span("sources", "stage"):
+                with span("ingest", "source", source_id="users", note="a\tb"):
+                    pass
+        return tracer
+
+    @pytest.mark.unit
+    def test_chrome_trace(self, tracer, temp_dir):
+        """Test complete events and track metadata in the Chrome trace."""
+        path = tracer.write_chrome_trace(temp_dir / "trace.json", manifest="demo")
+
+        trace = json.loads(path.read_text())
+        complete = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        metadata = {event["name"] for event in trace["traceEvents"] if event["ph"] == "M"}
+        assert [event["name"] for event in complete] == ["sources", "ingest [users]"]
+        assert all(event["ts"] >= 0 and event["dur"] >= 0 for event in complete)
+        assert complete[1]["args"]["source_id"] == "users"
+        assert metadata == {"process_name", "thread_name"}
+        assert trace["otherData"]["manifest"] == "demo"
+
+    @pytest.mark.unit
+    def test_span_table(self, tracer, temp_dir):
+        """Test one tab-separated row per span with JSON args."""
+        path = tracer.write_span_table(temp_dir / "trace_spans.tsv")
+
+        with path.open() as handle:
+            rows = list(csv.DictReader(handle, delimiter="\t", quoting=csv.QUOTE_NONE, escapechar="\\"))
+        assert tuple(rows[0]) == SPAN_TABLE_COLUMNS
+        assert [row["name"] for row in rows] == ["sources", "ingest"]
+        assert rows[1]["parent_id"] == rows[0]["span_id"]
+        assert json.loads(rows[1]["args"]) == {"note": "a\tb"}
+
+
+class TestWorkerSpans:
+    """Test spans recorded in ingest worker processes."""
+
+    @pytest.mark.unit
+    def test_worker_spans_merged(self, temp_dir):
+        """Test that converter spans from a worker are merged under the worker span."""
+        from graph_mesh_ingest.json_to_owl import convert_jsonschema_to_owl
+
+        schema = _write_schema(temp_dir / "users.json", "Users")
+        pool = IngestPool(max_workers=1, timeout_seconds=30)
+        tracer = Tracer()
+        try:
+            with tracer.activate():
+                pool.convert("json", convert_jsonschema_to_owl, str(schema), temp_dir / "users.owl", "users")
+        finally:
+            pool.shutdown()
+
+        by_name = {s.name: s for s in tracer.spans}
+        assert by_name["convert"].parent_id == by_name["ingest.worker"].span_id
+        assert by_name["convert"].pid == by_name["ingest.worker"].args["worker_pid"] != os.getpid()
+        assert {"parse", "serialize"} <= set(by_name)
+
+
+class TestPipelineTrace:
+    """Test orchestrate() with tracing enabled."""
+
+    @pytest.mark.unit
+    def test_trace_files_written(self, temp_dir):
+        """Test that a traced run writes both exports covering every stage."""
+        sources = [{"id": source_id, "fetch": {"type": "local",
+                                               "path": str(_write_schema(temp_dir / f"{source_id}.json", source_id))},
+                    "convert": {"type": "json"}} for source_id in ("users", "orders")]
+        manifest = temp_dir / "manifest.yaml"
+        manifest.write_text(yaml.safe_dump({"name": "traced", "matchers": ["LogMap"], "sources": sources,
+                                            "pipeline": {"trace": True}}))
+        workdir = temp_dir / "work"
+
+        with patch.object(pipeline, "run_alignment", return_value=[]):
+            orchestrate(manifest, workdir=workdir, skip_preflight=True)
+
+        trace = json.loads((workdir / "trace.json").read_text())
+        names = {event["name"] for event in trace["traceEvents"] if event["ph"] == "X"}
+        assert {"pipeline", "meta_ontology", "sources", "fusion", "ingest [users]",
+                "parse [orders]", "serialize [orders]", "fusion.input"} <= names
+        assert (workdir / "trace_spans.tsv").read_text().startswith("span_id\tparent_id")
+
+    @pytest.mark.unit
+    def test_untraced_run_writes_nothing(self, temp_dir):
+        """Test that tracing is off by default."""
+        schema = _write_schema(temp_dir / "users.json", "Users")
+        manifest = temp_dir / "manifest.yaml"
+        manifest.write_text(yaml.safe_dump({"name": "plain", "matchers": ["LogMap"], "sources": [
+            {"id": "users", "fetch": {"type": "local", "path": str(schema)}, "convert": {"type": "json"}}]}))
+        workdir = temp_dir / "work"
+
+        with patch.object(pipeline, "run_alignment", return_value=[]):
+            orchestrate(manifest, workdir=workdir, skip_preflight=True)
+
+        assert not (workdir / "trace.json").exists()
@@ -0,0 +1,240 @@
+"""
+Unit tests for warm matcher containers.
+
+Tests cover:
+- Reusing one running container for consecutive alignments
+- Job staging and moving the mapping to the output directory
+- Batch jobs with one source/output pair per source
+- Recycling idle, failed, timed-out and worn-out containers
+- Warm matchers from the manifest
+"""
+
+import threading
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from graph_mesh_aligner.matchers import ContainerMatcher
+from graph_mesh_aligner.warm import JOBS_MOUNT, KEEPALIVE_COMMAND, WARM_LABEL, WarmContainerPool
+from graph_mesh_orchestrator.models import PipelineManifest
+from graph_mesh_orchestrator.pipeline import select_matchers
+
+MATCHER = ContainerMatcher(name="LogMap", image="test/logmap:latest",
+                           output_filename="logmap.sssom.tsv", warm=True)
+
+
+def make_client(staging_dir: Path, exit_code: int = 0) -> MagicMock:
+    """Docker client whose containers write the requested output files on exec."""
+    client = MagicMock()
+    client.started = []
+    client.images.get.return_value.attrs = {"Config": {"Entrypoint": ["/usr/local/bin/logmap"]}}
+
+    def start(**kwargs):
+        container = MagicMock()
+        container.id = kwargs["name"]
+
+        def exec_run(command):
+            for index, arg in enumerate(command):
+                if arg == "--output":
+                    output = Path(command[index + 1])
+                    (staging_dir / output.relative_to(JOBS_MOUNT)).write_text("mapping")
+            return MagicMock(exit_code=exit_code, output=b"done")
+
+        container.exec_run.side_effect = exec_run
+        client.started.append(container)
+        return container
+
+    client.containers.run.side_effect = start
+    return client
+
+
+@pytest.fixture
+def ontologies(temp_dir):
+    (temp_dir / "source.owl").write_text("source")
+    (temp_dir / "meta.ttl").write_text("meta")
+    return temp_dir / "source.owl", temp_dir / "meta.ttl"
+
+
+class TestWarmContainerPool:
+    """Test running alignments in warm containers."""
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_container_is_reused(self, temp_dir, ontologies):
+        """Test that consecutive alignments run in the same container."""
+        staging = temp_dir / "staging"
+        client = make_client(staging)
+        pool = WarmContainerPool(client=client, staging_dir=staging)
+
+        for name in ("a", "b"):
+            output_dir = temp_dir / name
+            output_dir.mkdir()
+            assert pool.run(MATCHER, *ontologies, output_dir) == b"done"
+            assert (output_dir / "logmap.sssom.tsv").read_text() == "mapping"
+
+        client.containers.run.assert_called_once()
+        run_kwargs = client.containers.run.call_args[1]
+        assert run_kwargs["entrypoint"] == KEEPALIVE_COMMAND
+        assert run_kwargs["labels"] == {WARM_LABEL: "1"}
+        assert run_kwargs["volumes"] == {str(staging.resolve()): {"bind": JOBS_MOUNT, "mode": "rw"}}
+        assert pool.stats() == {"started": 1, "reused": 1, "recycled": 0, "idle": 1, "busy": 0}
+        assert list(staging.iterdir()) == []
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_exec_uses_image_entrypoint(self, temp_dir, ontologies):
+        """Test that the alignment is executed with the image's entrypoint."""
+        staging = temp_dir / "staging"
+        client = make_client(staging)
+        pool = WarmContainerPool(client=client, staging_dir=staging)
+
+        pool.run(MATCHER, *ontologies, temp_dir)
+
+        command = client.started[0].exec_run.call_args[0][0]
+        assert command[0] == "/usr/local/bin/logmap"
+        assert command[command.index("--source") + 1].startswith(f"{JOBS_MOUNT}/")
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_batch_moves_each_mapping(self, temp_dir, ontologies):
+        """Test that a batch runs as one exec and each source's mapping reaches its directory."""
+        source, target = ontologies
+        staging = temp_dir / "staging"
+        client = make_client(staging)
+        pool = WarmContainerPool(client=client, staging_dir=staging)
+        output_dirs = {name: temp_dir / name for name in ("a", "b")}
+        for output_dir in output_dirs.values():
+            output_dir.mkdir()
+
+        pool.run_batch(MATCHER, {"a": source, "b": source}, target, output_dirs)
+
+        command = client.started[0].exec_run.call_args[0][0]
+        assert command.count("--target") == 1 and command.count("--source") == 2
+        assert client.started[0].exec_run.call_count == 1
+        for output_dir in output_dirs.values():
+            assert (output_dir / "logmap.sssom.tsv").read_text() == "mapping"
+        assert list(staging.iterdir()) == []
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_different_limits_use_different_containers(self, temp_dir, ontologies):
+        """Test that containers are only shared by matchers with the same limits."""
+        client = make_client(temp_dir / "staging")
+        pool = WarmContainerPool(client=client, staging_dir=temp_dir / "staging")
+
+        pool.run(MATCHER, *ontologies, temp_dir)
+        pool.run(replace(MATCHER, memory_mb=4096), *ontologies, temp_dir)
+
+        assert client.containers.run.call_count == 2
+        assert client.containers.run.call_args[1]["mem_limit"] == "4096m"
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_failed_alignment_retires_container(self, temp_dir, ontologies):
+        """Test that a non-zero exit raises and the container is removed."""
+        client = make_client(temp_dir / "staging", exit_code=1)
+        pool = WarmContainerPool(client=client, staging_dir=temp_dir / "staging")
+
+        with pytest.raises(RuntimeError, match="exited with status 1"):
+            pool.run(MATCHER, *ontologies, temp_dir)
+
+        client.started[0].kill.assert_called_once()
+        assert pool.stats()["idle"] == 0
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_hung_alignment_times_out(self, temp_dir, ontologies):
+        """Test that a job past the matcher's timeout kills its container and frees the slot."""
+        client = make_client(temp_dir / "staging")
+        pool = WarmContainerPool(client=client, staging_dir=temp_dir / "staging")
+        pool.run(MATCHER, *ontologies, temp_dir)
+        killed = threading.Event()
+        hung = client.started[0]
+        hung.exec_run.side_effect = lambda command: killed.wait(5)
+        hung.kill.side_effect = lambda: killed.set()
+
+        with pytest.raises(TimeoutError, match="timed out after 0.1s"):
+            pool.run(replace(MATCHER, timeout=0.1), *ontologies, temp_dir)
+
+        hung.kill.assert_called_once()
+        assert pool.stats()["busy"] == 0 and pool.stats()["idle"] == 0
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_container_replaced_after_max_jobs(self, temp_dir, ontologies):
+        """Test that a container is recycled after max_jobs alignments."""
+        client = make_client(temp_dir / "staging")
+        pool = WarmContainerPool(client=client, staging_dir=temp_dir / "staging", max_jobs=2)
+
+        for _ in range(3):
+            pool.run(MATCHER, *ontologies, temp_dir)
+
+        assert client.containers.run.call_count == 2
+        assert pool.stats()["recycled"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_idle_containers_are_reaped(self, temp_dir, ontologies):
+        """Test that containers idle past their timeout are stopped."""
+        client = make_client(temp_dir / "staging")
+        pool = WarmContainerPool(client=client, staging_dir=temp_dir / "staging")
+        pool.run(replace(MATCHER, warm_idle_seconds=60), *ontologies, temp_dir)
+
+        assert pool.reap_idle() == 0
+        with patch("graph_mesh_aligner.warm.time.monotonic", return_value=10**9):
+            assert pool.reap_idle() == 1
+        assert pool.stats()["idle"] == 0
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_close_stops_idle_containers(self, temp_dir, ontologies):
+        """Test that closing the pool stops its containers and refuses new work."""
+        client = make_client(temp_dir / "staging")
+        pool = WarmContainerPool(client=client, staging_dir=temp_dir / "staging")
+        pool.run(MATCHER, *ontologies, temp_dir)
+
+        pool.close()
+
+        assert pool.stats()["idle"] == 0
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.run(MATCHER, *ontologies, temp_dir)
+
+    @pytest.mark.unit
+    def test_max_jobs_must_be_positive(self):
+        """Test that a pool needs at least one job per container."""
+        with pytest.raises(ValueError):
+            WarmContainerPool(max_jobs=0)
+
+
+class TestWarmMatcher:
+    """Test warm matchers and manifest configuration."""
+
+    @pytest.mark.unit
+    @pytest.mark.docker
+    def test_align_uses_default_pool(self, temp_dir, ontologies):
+        """Test that a warm matcher runs through the process-wide pool."""
+        pool = MagicMock()
+        pool.run.return_value = b"done"
+        with patch("graph_mesh_aligner.matchers.default_warm_pool", return_value=pool):
+            mapping = replace(MATCHER, health_check_enabled=False).align(*ontologies, temp_dir / "output")
+
+        assert mapping == (temp_dir / "output" / "logmap.sssom.tsv").resolve()
+        pool.run.assert_called_once()
+        assert pool.run.call_args[0][0].name == "LogMap"
+
+    @pytest.mark.unit
+    def test_manifest_enables_warm_matchers(self):
+        """Test that pipeline.warm_matchers makes the selected matchers warm."""
+        manifest = PipelineManifest.model_validate({
+            "name": "warm",
+            "matchers": ["LogMap", "AML"],
+            "pipeline": {"warm_matchers": True, "warm_matcher_idle_seconds": 30},
+            "sources": [{"id": "users", "fetch": {"type": "local", "path": "u.json"},
+                         "convert": {"type": "json"}}],
+        })
+
+        matchers = select_matchers(manifest)
+
+        assert all(m.warm and m.warm_idle_seconds == 30 for m in matchers)
@@ -0,0 +1,182 @@
+"""
+Unit tests for the distributed work queue.
+
+Tests cover:
+- Claim order and per-source stage dependencies
+- Completing, failing and retrying items; failures cascading to dependents
+- Lease expiry, reclamation and heartbeats
+- Exclusive claims from concurrent workers
+- Run metadata, counts and clearing
+"""
+
+import threading
+import time
+
+import pytest
+
+from graph_mesh_orchestrator.errors import WorkQueueError
+from graph_mesh_orchestrator.workqueue import WorkQueue
+
+
+def _source_items(*source_ids):
+    return [item for source_id in source_ids for item in (
+        (source_id, "fetch", None), (source_id, "ingest", "fetch"), (source_id, "alignment", "ingest"))]
+
+
+@pytest.fixture
+def queue(temp_dir):
+    queue = WorkQueue(temp_dir / "workqueue.sqlite", lease_seconds=60)
+    queue.enqueue(_source_items("users", "orders"))
+    return queue
+
+
+class TestClaim:
+    """Test claiming items."""
+
+    @pytest.mark.unit
+    def test_dependencies_gate_claims(self, queue):
+        """Test that a stage is claimable only once the stage it depends on is done."""
+        first = queue.claim("w1")
+        second = queue.claim("w2")
+
+        assert (first.key, second.key) == (("users", "fetch"), ("orders", "fetch"))
+        assert queue.claim("w3") is None
+
+        assert queue.complete(first, {"fetched": "/data/users.json"})
+        ingest = queue.claim("w3")
+        assert ingest.key == ("users", "ingest")
+        assert queue.get("users", "fetch").result == {"fetched": "/data/users.json"}
+
+    @pytest.mark.unit
+    def test_enqueue_is_idempotent(self, queue):
+        """Test that enqueueing an existing item keeps it and its state."""
+        queue.complete(queue.claim("w1"), {})
+
+        assert queue.enqueue(_source_items("users", "invoices")) == 3
+        assert queue.get("users", "fetch").status == "done"
+        assert [item.source_id for item in queue.items()][-1] == "invoices"
+
+    @pytest.mark.unit
+    def test_concurrent_claims_are_exclusive(self, temp_dir):
+        """Test that concurrent workers never claim the same item."""
+        queue = WorkQueue(temp_dir / "workqueue.sqlite")
+        queue.enqueue((f"s{i}", "fetch", None) for i in range(40))
+        claimed = []
+        lock = threading.Lock()
+
+        def work(worker_id):
+            while (item := queue.claim(worker_id)) is not None:
+                with lock:
+                    claimed.append(item.key)
+                queue.complete(item, {})
+
+        threads = [threading.Thread(target=work, args=(f"w{n}",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(claimed) == sorted((f"s{i}", "fetch") for i in range(40))
+        assert queue.counts()["done"] == 40
+
+
+class TestFailures:
+    """Test failed items."""
+
+    @pytest.mark.unit
+    def test_failure_cascades(self, queue):
+        """Test that a failed stage fails every later stage of its source."""
+        item = queue.claim("w1")
+
+        queue.fail(item, "not found")
+
+        statuses = {i.key: (i.status, i.error) for i in queue.items() if i.source_id == "users"}
+        assert statuses[("users", "fetch")] == ("failed", "not found")
+        assert statuses[("users", "alignment")] == ("failed", "ingest failed: fetch failed: not found")
+        assert queue.get("orders", "fetch").status == "pending"
+
+    @pytest.mark.unit
+    def test_retry_until_attempts_exhausted(self, temp_dir):
+        """Test that retryable failures requeue the item up to max_attempts claims."""
+        queue = WorkQueue(temp_dir / "workqueue.sqlite", max_attempts=2)
+        queue.enqueue([("users", "fetch", None)])
+
+        queue.fail(queue.claim("w1"), "timeout", retry=True)
+        assert queue.get("users", "fetch").status == "pending"
+        queue.fail(queue.claim("w1"), "timeout", retry=True)
+
+        assert queue.get("users", "fetch").status == "failed"
+        assert queue.retry_failed() == 1
+        assert queue.claim("w1").attempts == 1
+
+
+class TestLeases:
+    """Test lease expiry and heartbeats."""
+
+    @pytest.mark.unit
+    def test_expired_lease_is_reclaimed(self, temp_dir):
+        """Test that a dead worker's item goes to another worker, which alone may complete it."""
+        queue = WorkQueue(temp_dir / "workqueue.sqlite", lease_seconds=0.05)
+        queue.enqueue([("users", "fetch", None)])
+        stale = queue.claim("dead")
+        time.sleep(0.1)
+
+        fresh = queue.claim("alive")
+
+        assert fresh.key == stale.key and fresh.attempts == 2
+        assert not queue.complete(stale, {"from": "dead"})
+        assert queue.complete(fresh, {"from": "alive"})
+        assert queue.get("users", "fetch").result == {"from": "alive"}
+
+    @pytest.mark.unit
+    def test_heartbeat_keeps_lease(self, temp_dir):
+        """Test that renewed leases are not reclaimed."""
+        queue = WorkQueue(temp_dir / "workqueue.sqlite", lease_seconds=0.2)
+        queue.enqueue([("users", "fetch", None), ("orders", "fetch", None)])
+        queue.register_worker("w1")
+        queue.claim("w1")
+        time.sleep(0.12)
+
+        assert queue.heartbeat("w1") == 1
+        time.sleep(0.12)
+
+        assert queue.claim("w2").key == ("orders", "fetch")
+        assert queue.get("users", "fetch").worker_id == "w1"
+
+    @pytest.mark.unit
+    def test_abandoned_after_max_attempts(self, temp_dir):
+        """Test that an item whose leases keep expiring fails."""
+        queue = WorkQueue(temp_dir / "workqueue.sqlite", lease_seconds=0.01, max_attempts=1)
+        queue.enqueue(_source_items("users"))
+        queue.claim("dead")
+        time.sleep(0.05)
+
+        assert queue.claim("alive") is None
+        assert queue.drained()
+        assert "Lease expired 1 times" in queue.get("users", "fetch").error
+
+
+class TestMetadata:
+    """Test run metadata and inspection."""
+
+    @pytest.mark.unit
+    def test_meta_counts_and_clear(self, queue):
+        """Test metadata round trips and clear() empties the queue."""
+        queue.set_meta(state="open", lease_seconds=60)
+        queue.register_worker("w1")
+
+        assert queue.meta() == {"state": "open", "lease_seconds": 60}
+        assert queue.counts() == {"pending": 6, "leased": 0, "done": 0, "failed": 0}
+        assert queue.workers()[0]["worker_id"] == "w1"
+
+        queue.clear()
+        assert queue.meta() == {} and queue.items() == [] and queue.drained()
+
+    @pytest.mark.unit
+    def test_unusable_database(self, temp_dir):
+        """Test that a corrupt queue file raises WorkQueueError."""
+        path = temp_dir / "workqueue.sqlite"
+        path.write_text("not a database" * 100)
+
+        with pytest.raises(WorkQueueError):
+            WorkQueue(path)